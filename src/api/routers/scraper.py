@@ -17,7 +17,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from src.sites.betb2b import store
+from src.sites.betb2b import store, store_pool
 from src.sites.betb2b.service import ScraperService
 
 router = APIRouter()
@@ -106,9 +106,8 @@ def trigger_run(req: RunRequest) -> JobOut:
         skin=req.skin, action=action, sport=req.sport,
         subgames=req.subgames, count=req.count, created_by="api",
     )
-    conn = store.init_db(service.path)
-    row = store.get_job(conn, job_id)
-    conn.close()
+    with store_pool.get_pool(service.path).reader() as conn:
+        row = store.get_job(conn, job_id)
     return JobOut.from_row(row)
 
 
@@ -118,18 +117,16 @@ def list_runs(
     limit: int = Query(50, ge=1, le=200),
     status: Optional[str] = Query(None, description="Filter: queued/running/succeeded/failed"),
 ) -> List[JobOut]:
-    conn = store.init_db(service.path)
-    rows = store.list_jobs(conn, limit=limit, status=status)
-    conn.close()
+    with store_pool.get_pool(service.path).reader() as conn:
+        rows = store.list_jobs(conn, limit=limit, status=status)
     return [JobOut.from_row(r) for r in rows]
 
 
 @router.get("/runs/{job_id}", response_model=JobOut,
             dependencies=[Depends(require_api_key)])
 def get_run(job_id: int) -> JobOut:
-    conn = store.init_db(service.path)
-    row = store.get_job(conn, job_id)
-    conn.close()
+    with store_pool.get_pool(service.path).reader() as conn:
+        row = store.get_job(conn, job_id)
     if row is None:
         raise HTTPException(status_code=404, detail=f"job {job_id} not found")
     return JobOut.from_row(row)
@@ -150,11 +147,8 @@ def list_sports() -> dict:
 @router.get("/counts", dependencies=[Depends(require_api_key)])
 def store_counts() -> dict:
     """Row counts per table — quick coverage/health of the odds store."""
-    conn = store.init_db(service.path)
-    try:
+    with store_pool.get_pool(service.path).reader() as conn:
         return store.counts(conn)
-    finally:
-        conn.close()
 
 
 @router.get("/odds/{event_id}", dependencies=[Depends(require_api_key)])
@@ -163,9 +157,6 @@ def latest_event_odds(
     skin: Optional[str] = Query(None, description="Restrict to one skin."),
 ) -> dict:
     """Most recent odds snapshot per selection for an event (cross-skin)."""
-    conn = store.init_db(service.path)
-    try:
+    with store_pool.get_pool(service.path).reader() as conn:
         rows = store.latest_odds(conn, event_id, skin=skin)
         return {"event_id": event_id, "odds": [dict(r) for r in rows]}
-    finally:
-        conn.close()
@@ -16,6 +16,8 @@ from .session import BrowserSession, SessionStatus
 from .manager import BrowserManager, get_browser_manager
 from .config import BrowserConfiguration, BrowserType
 from .monitoring import ResourceMetrics
+from .pool import BrowserPool, BrowserPoolConfig, ContextLease
+from .resource_router import ResourceRouter, ResourceRouterMetrics, StaticStubCache
 
 __all__ = [
     "BrowserSession",
@@ -24,5 +26,11 @@ __all__ = [
     "get_browser_manager",
     "BrowserConfiguration",
     "BrowserType",
-    "ResourceMetrics"
+    "ResourceMetrics",
+    "BrowserPool",
+    "BrowserPoolConfig",
+    "ContextLease",
+    "ResourceRouter",
+    "ResourceRouterMetrics",
+    "StaticStubCache"
 ]
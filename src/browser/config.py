@@ -93,6 +93,33 @@ class BrowserConfiguration:
             "context_options": self.context_options
         }
     
+    def build_context_options(self, **overrides: Any) -> Dict[str, Any]:
+        """Merge ``context_options`` with ``overrides``, then apply the stealth settings on top."""
+        options = {**self.context_options, **overrides}
+        
+        if self.stealth.viewport:
+            options["viewport"] = self.stealth.viewport
+        
+        if self.stealth.locale:
+            options["locale"] = self.stealth.locale
+        
+        if self.stealth.timezone:
+            options["timezone_id"] = self.stealth.timezone
+        
+        if self.stealth.user_agent:
+            options["user_agent"] = self.stealth.user_agent
+        
+        if self.stealth.geolocation:
+            options["geolocation"] = self.stealth.geolocation
+            options["permissions"] = self.stealth.permissions
+        
+        if self.stealth.extra_http_headers:
+            options["extra_http_headers"] = self.stealth.extra_http_headers
+        
+        options["bypass_csp"] = self.stealth.bypass_csp
+        options["ignore_https_errors"] = self.stealth.ignore_https_errors
+        return options
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BrowserConfiguration":
         """Create configuration from dictionary."""
@@ -42,7 +42,13 @@ class SessionStatistics:
 class BrowserManager:
     """Centralized browser session management with concurrent access."""
     
-    def __init__(self, site_id: str = 'unknown'):
+    def __init__(self, site_id: str = 'unknown', browser_pool=None):
+        """
+        Args:
+            site_id: Site context for hierarchical storage
+            browser_pool: Optional started ``BrowserPool``; sessions then borrow
+                its warm browsers and contexts instead of launching their own
+        """
         self._logger = get_logger("browser_manager")
         self._storage = get_storage_adapter()
         self._sessions: Dict[str, BrowserSession] = {}
@@ -52,6 +58,7 @@ class BrowserManager:
         self._cleanup_interval = 60  # 1 minute
         self._max_concurrent_sessions = 50
         self._site_id = site_id  # Store site context for hierarchical storage
+        self._browser_pool = browser_pool
     
     async def initialize(self) -> None:
         """Initialize the browser manager."""
@@ -93,6 +100,8 @@ class BrowserManager:
                 configuration=configuration or BrowserConfiguration(),
                 site=getattr(self, '_site_id', 'unknown')  # Pass site context for hierarchical storage
             )
+            if self._browser_pool is not None:
+                session.set_browser_pool(self._browser_pool)
             
             # Add to manager
             self._sessions[session.session_id] = session
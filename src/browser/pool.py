@@ -0,0 +1,410 @@
+"""
+Warm browser pool.
+
+``BrowserSession.initialize`` starts Playwright and launches a new browser
+process for every session, so nothing can be handed out faster than a cold
+browser start (seconds). ``BrowserPool`` keeps N browsers launched and M
+contexts pre-created, with the stealth context options and an optional warm-up
+hook (fingerprint script, consent cookies) already applied, and leases them out
+in milliseconds.
+
+Contexts go back to the pool when a lease is released and are recycled after
+``max_context_uses`` leases. A browser whose memory use crosses the resource
+monitor's threshold is retired: it takes no new contexts, a replacement is
+launched, and it is closed once its last leased context comes back. Refilling
+happens in a background task, off the lease path. Memory is read through CDP
+``SystemInfo.getProcessInfo`` (the browser, renderer and GPU process ids),
+so the default probe only measures Chromium; pass ``memory_probe`` otherwise.
+
+The pool is opt-in: nothing constructs one implicitly. Start it and hand it
+to ``BrowserManager(browser_pool=...)`` or a site scraper's ``browser_pool``.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import psutil
+
+from .config import BrowserConfiguration
+from .monitoring import get_resource_monitor
+from src.observability.logger import get_logger
+from src.utils.exceptions import BrowserManagerError
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Sizing and recycling policy for a BrowserPool."""
+    browsers: int = 1                   # N launched browsers
+    warm_contexts: int = 2              # M idle, pre-created contexts
+    max_context_uses: int = 20          # K leases before a context is recycled
+    memory_threshold_mb: Optional[float] = None  # None: the resource monitor's threshold
+    check_interval: float = 5.0         # seconds between background memory checks
+
+    def __post_init__(self):
+        """Validate pool parameters."""
+        if self.browsers < 1:
+            raise ValueError("browsers must be >= 1")
+        if self.warm_contexts < 0:
+            raise ValueError("warm_contexts must be >= 0")
+        if self.max_context_uses < 1:
+            raise ValueError("max_context_uses must be >= 1")
+        if self.check_interval <= 0:
+            raise ValueError("check_interval must be > 0")
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Any
+    live_contexts: int = 0
+    borrowers: int = 0                  # callers of BrowserPool.browser() not yet returned
+    retired: bool = False
+    launched_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _PooledContext:
+    context: Any
+    owner: _PooledBrowser
+    uses: int = 0
+
+
+class ContextLease:
+    """A pooled browser context on loan; release it (or use ``async with``) when done."""
+
+    def __init__(self, pool: "BrowserPool", entry: _PooledContext, warm: bool):
+        self._pool = pool
+        self._entry = entry
+        self._pages: List[Any] = []
+        self.warm = warm
+        self.released = False
+
+    @property
+    def context(self) -> Any:
+        return self._entry.context
+
+    @property
+    def browser(self) -> Any:
+        return self._entry.owner.browser
+
+    async def new_page(self) -> Any:
+        """Open a page in the leased context; it is closed on release."""
+        page = await self._entry.context.new_page()
+        self._pages.append(page)
+        return page
+
+    async def release(self, recycle: bool = False) -> None:
+        """
+        Return the context to the pool.
+
+        Args:
+            recycle: Close the context instead of reusing it (e.g. its cookies
+                must not leak into the next lease)
+        """
+        if self.released:
+            return
+        self.released = True
+        await self._pool._release(self._entry, self._pages, recycle)
+
+    async def __aenter__(self) -> "ContextLease":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release(recycle=exc_type is not None)
+
+
+class BrowserPool:
+    """Pre-launched browsers and pre-warmed contexts, leased on demand."""
+
+    def __init__(
+        self,
+        configuration: Optional[BrowserConfiguration] = None,
+        pool_config: Optional[BrowserPoolConfig] = None,
+        *,
+        context_options: Optional[Dict[str, Any]] = None,
+        warmup: Optional[Callable[[Any], Awaitable[None]]] = None,
+        launcher: Optional[Callable[[], Awaitable[Any]]] = None,
+        memory_probe: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Args:
+            configuration: Browser type, launch and stealth settings
+            pool_config: Pool sizing and recycling policy
+            context_options: ``new_context`` kwargs used verbatim (default:
+                ``configuration.build_context_options()``)
+            warmup: Awaited with every new context before it is pooled, e.g.
+                to apply a fingerprint script or consent state
+            launcher: Returns a launched browser (default: Playwright launch
+                per ``configuration``)
+            memory_probe: Resident memory of a browser in MB, or None when
+                unknown; may be async (default: RSS of the processes CDP
+                reports for the browser)
+        """
+        self.configuration = configuration or BrowserConfiguration()
+        self.pool_config = pool_config or BrowserPoolConfig()
+        self._context_options = (
+            dict(context_options) if context_options is not None
+            else self.configuration.build_context_options()
+        )
+        self._warmup = warmup
+        self._launcher = launcher or self._launch_browser
+        self._memory_probe = memory_probe or self._process_memory_mb
+        self._logger = get_logger("browser_pool")
+
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        self._idle: List[_PooledContext] = []
+        self._leased = 0
+        self._wakeup = asyncio.Event()
+        self._replenish_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats = {
+            "leases": 0,
+            "warm_leases": 0,
+            "cold_leases": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "browsers_launched": 0,
+            "browsers_recycled": 0,
+        }
+
+    @property
+    def memory_threshold_mb(self) -> float:
+        if self.pool_config.memory_threshold_mb is not None:
+            return self.pool_config.memory_threshold_mb
+        return get_resource_monitor().memory_threshold_mb
+
+    async def start(self) -> None:
+        """Launch the browsers, warm the contexts and start background replenishment."""
+        if self._running:
+            return
+        self._running = True
+        await self._replenish()
+        self._replenish_task = asyncio.create_task(self._replenish_loop())
+        self._logger.info(
+            "browser_pool_started",
+            browsers=len(self._browsers),
+            warm_contexts=len(self._idle)
+        )
+
+    async def acquire(self, fresh: bool = False) -> ContextLease:
+        """
+        Lease a context, warm if one is idle, otherwise created on the spot.
+
+        Args:
+            fresh: Only hand out a context that has never been leased before
+        """
+        if not self._running:
+            raise BrowserManagerError("browser_pool_not_running", "Browser pool is not started")
+
+        entry = None
+        for i, candidate in enumerate(self._idle):
+            if not fresh or candidate.uses == 0:
+                entry = self._idle.pop(i)
+                break
+        warm = entry is not None
+        if entry is None:
+            entry = await self._create_context()
+        self._leased += 1
+        self._stats["leases"] += 1
+        self._stats["warm_leases" if warm else "cold_leases"] += 1
+        self._wakeup.set()
+        return ContextLease(self, entry, warm)
+
+    async def browser(self) -> Any:
+        """
+        Borrow a launched browser (the least loaded) for a caller managing its own contexts.
+
+        Hand it back with ``return_browser``; the pool, not the caller, closes it.
+        """
+        if not self._running:
+            raise BrowserManagerError("browser_pool_not_running", "Browser pool is not started")
+        pb = await self._pick_browser()
+        pb.borrowers += 1
+        return pb.browser
+
+    async def return_browser(self, browser: Any) -> None:
+        """Hand back a browser obtained from ``browser``."""
+        for pb in self._browsers:
+            if pb.browser is browser:
+                pb.borrowers = max(0, pb.borrowers - 1)
+        await self._close_drained_browsers()
+
+    async def close(self) -> None:
+        """Stop replenishing and close every pooled context and browser."""
+        self._running = False
+        if self._replenish_task:
+            self._replenish_task.cancel()
+            try:
+                await self._replenish_task
+            except asyncio.CancelledError:
+                pass
+            self._replenish_task = None
+        idle, self._idle = self._idle, []
+        browsers, self._browsers = self._browsers, []
+        for entry in idle:
+            await self._close_quietly(entry.context)
+        for pb in browsers:
+            await self._close_quietly(pb.browser)
+        if self._playwright is not None:
+            playwright, self._playwright = self._playwright, None
+            await playwright.stop()
+        self._logger.info("browser_pool_closed", **self._stats)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy and lease/recycle counters."""
+        return {
+            **self._stats,
+            "browsers": len(self._live_browsers()),
+            "retired_browsers": len(self._browsers) - len(self._live_browsers()),
+            "idle_contexts": len(self._idle),
+            "leased_contexts": self._leased,
+        }
+
+    # State is only mutated between awaits, so no lock is needed; a lease
+    # never waits behind a browser launch in the background task.
+
+    async def _release(self, entry: _PooledContext, pages: List[Any], recycle: bool) -> None:
+        self._leased -= 1
+        entry.uses += 1
+        if (recycle or not self._running or entry.owner.retired
+                or entry.uses >= self.pool_config.max_context_uses):
+            self._stats["contexts_recycled"] += 1
+            await self._discard(entry)
+            await self._close_drained_browsers()
+        else:
+            for page in pages:
+                await self._close_quietly(page)
+            self._idle.append(entry)
+        self._wakeup.set()
+
+    async def _replenish_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.pool_config.check_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self._retire_over_threshold()
+                await self._replenish()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning("browser_pool_replenish_failed", error=str(e))
+
+    async def _replenish(self) -> None:
+        """Top up to N live browsers and M idle contexts."""
+        while self._running and len(self._live_browsers()) < self.pool_config.browsers:
+            await self._add_browser()
+        while self._running and len(self._idle) < self.pool_config.warm_contexts:
+            self._idle.append(await self._create_context())
+
+    async def _retire_over_threshold(self) -> None:
+        """Retire browsers above the memory threshold; their idle contexts go with them."""
+        threshold = self.memory_threshold_mb
+        doomed: List[_PooledContext] = []
+        for pb in self._live_browsers():
+            memory_mb = self._memory_probe(pb.browser)
+            if inspect.isawaitable(memory_mb):
+                memory_mb = await memory_mb
+            if memory_mb is None or memory_mb < threshold:
+                continue
+            pb.retired = True
+            self._stats["browsers_recycled"] += 1
+            self._logger.info(
+                "browser_pool_browser_retired",
+                memory_mb=memory_mb,
+                threshold_mb=threshold,
+                live_contexts=pb.live_contexts,
+                borrowers=pb.borrowers
+            )
+            doomed.extend(e for e in self._idle if e.owner is pb)
+        if doomed:
+            self._idle = [e for e in self._idle if e not in doomed]
+            self._stats["contexts_recycled"] += len(doomed)
+            for entry in doomed:
+                await self._discard(entry)
+        await self._close_drained_browsers()
+
+    def _live_browsers(self) -> List[_PooledBrowser]:
+        return [pb for pb in self._browsers if not pb.retired]
+
+    async def _pick_browser(self) -> _PooledBrowser:
+        live = self._live_browsers()
+        if not live:
+            return await self._add_browser()
+        return min(live, key=lambda pb: pb.live_contexts + pb.borrowers)
+
+    async def _add_browser(self) -> _PooledBrowser:
+        pb = _PooledBrowser(browser=await self._launcher())
+        self._browsers.append(pb)
+        self._stats["browsers_launched"] += 1
+        return pb
+
+    async def _create_context(self) -> _PooledContext:
+        owner = await self._pick_browser()
+        owner.live_contexts += 1
+        try:
+            context = await owner.browser.new_context(**self._context_options)
+        except Exception:
+            owner.live_contexts -= 1
+            raise
+        if self._warmup is not None:
+            try:
+                await self._warmup(context)
+            except Exception:
+                owner.live_contexts -= 1
+                await self._close_quietly(context)
+                raise
+        self._stats["contexts_created"] += 1
+        return _PooledContext(context=context, owner=owner)
+
+    async def _discard(self, entry: _PooledContext) -> None:
+        entry.owner.live_contexts -= 1
+        await self._close_quietly(entry.context)
+
+    async def _close_drained_browsers(self) -> None:
+        drained = [pb for pb in self._browsers
+                   if pb.retired and pb.live_contexts <= 0 and pb.borrowers <= 0]
+        for pb in drained:
+            self._browsers.remove(pb)
+        for pb in drained:
+            await self._close_quietly(pb.browser)
+
+    async def _launch_browser(self) -> Any:
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        launch_args = {"headless": self.configuration.headless, **self.configuration.launch_options}
+        launch_args.pop("user_agent", None)
+        browser_type = getattr(self._playwright, self.configuration.browser_type.value)
+        return await browser_type.launch(**launch_args)
+
+    @staticmethod
+    async def _process_memory_mb(browser: Any) -> Optional[float]:
+        # Playwright exposes no browser pid; CDP lists every process of the
+        # browser, which psutil then measures (the browser runs locally).
+        try:
+            cdp = await browser.new_browser_cdp_session()
+            try:
+                info = await cdp.send("SystemInfo.getProcessInfo")
+            finally:
+                await cdp.detach()
+        except Exception:
+            return None                 # not Chromium, or the browser is gone
+        rss = 0
+        for pid in {p.get("id") for p in info.get("processInfo", ())}:
+            try:
+                rss += psutil.Process(pid).memory_info().rss
+            except (psutil.Error, TypeError, ValueError):
+                continue
+        return rss / (1024 * 1024) if rss else None
+
+    async def _close_quietly(self, closable: Any) -> None:
+        try:
+            await closable.close()
+        except Exception as e:
+            self._logger.debug("browser_pool_close_error", error=str(e))
@@ -0,0 +1,283 @@
+"""
+Resource-blocking request router.
+
+Scraping navigations download images, fonts, media, ads and analytics scripts
+that no extractor ever reads. ``ResourceRouter`` installs a context-wide
+``context.route`` handler that decides per request:
+
+- **continue** — anything matching ``allow_url_patterns`` or the site's
+  interception patterns (the API responses ``NetworkInterceptor`` captures),
+  every ``document`` request, and whatever no rule blocks. These fall back to
+  the next route handler (or the network), so page-level routes and the
+  interceptor's ``response`` listener see them unchanged;
+- **block** — requests whose resource type is in ``block_resource_types`` or
+  whose URL matches ``block_url_patterns`` are aborted;
+- **stub** — with ``stub_static``, scripts and stylesheets are fetched once
+  and later requests for the same URL are fulfilled from a shared in-memory
+  ``StaticStubCache``. Routing disables the browser's HTTP cache, so this also
+  wins back repeat navigations.
+
+Rules come from the site's ``resource_blocking`` section in ``config.yaml``
+(``ResourceBlockingConfig``). ``ResourceRouterMetrics`` counts blocked and
+stubbed requests and the bytes they saved: exact for stubs, a per-type
+estimate for aborted requests, whose size is never seen.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.network.interception.patterns import match_url
+from src.observability.logger import get_logger
+
+# Never blocked: aborting the navigation request breaks the page
+PROTECTED_RESOURCE_TYPES = frozenset({"document"})
+STUB_RESOURCE_TYPES = frozenset({"script", "stylesheet"})
+
+# Typical transfer sizes, used to estimate bytes saved by aborted requests
+ESTIMATED_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 35_000,
+    "script": 30_000,
+    "stylesheet": 15_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "ping": 500,
+    "other": 5_000,
+}
+
+CONTINUE = "continue"
+BLOCK = "block"
+STUB = "stub"
+
+# Response headers that would no longer describe a fulfilled body
+_DROP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class ResourceRouterMetrics:
+    """Request routing counters for one ResourceRouter."""
+    requests: int = 0
+    continued: int = 0
+    blocked: int = 0
+    stubbed: int = 0
+    stub_misses: int = 0
+    bytes_saved_stubbed: int = 0          # exact: cached bodies served
+    bytes_saved_estimated: int = 0        # ESTIMATED_BYTES per aborted request
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_saved_stubbed + self.bytes_saved_estimated
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to dictionary for logging and serialization."""
+        return {
+            "requests": self.requests,
+            "continued": self.continued,
+            "blocked": self.blocked,
+            "stubbed": self.stubbed,
+            "stub_misses": self.stub_misses,
+            "bytes_saved": self.bytes_saved,
+            "bytes_saved_stubbed": self.bytes_saved_stubbed,
+            "bytes_saved_estimated": self.bytes_saved_estimated,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+
+class StaticStubCache:
+    """Size-bounded LRU of static responses: url -> (status, headers, body)."""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[int, Dict[str, str], bytes]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """Store a response; returns False when it is larger than the whole cache."""
+        if len(body) > self.max_bytes:
+            return False
+        previous = self._entries.pop(url, None)
+        if previous is not None:
+            self._bytes -= len(previous[2])
+        headers = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        self._entries[url] = (status, headers, body)
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+_stub_caches: Dict[str, StaticStubCache] = {}
+
+
+def _site_stub_cache(site: Optional[str], max_bytes: int) -> StaticStubCache:
+    """One StaticStubCache per site, shared by every session of the process."""
+    if not site:
+        return StaticStubCache(max_bytes)
+    cache = _stub_caches.get(site)
+    if cache is None:
+        cache = _stub_caches[site] = StaticStubCache(max_bytes)
+    return cache
+
+
+class ResourceRouter:
+    """Blocks, stubs or continues every request of the contexts it is attached to."""
+
+    def __init__(
+        self,
+        block_resource_types: Iterable[str] = ("image", "media", "font"),
+        block_url_patterns: Iterable[str] = (),
+        allow_url_patterns: Iterable[str] = (),
+        capture_patterns: Iterable[str] = (),
+        stub_cache: Optional[StaticStubCache] = None,
+        site: Optional[str] = None,
+    ):
+        """
+        Args:
+            block_resource_types: Playwright resource types to abort
+            block_url_patterns: URL patterns to abort regardless of type
+            allow_url_patterns: URL patterns always continued
+            capture_patterns: The site's interception patterns; always
+                continued so ``NetworkInterceptor`` sees their responses
+            stub_cache: Serve scripts/stylesheets from this cache (None: no
+                stubbing). Share one cache between routers of the same site.
+            site: Site name, for logging
+        """
+        self.block_resource_types = frozenset(block_resource_types) - PROTECTED_RESOURCE_TYPES
+        self.block_url_patterns = list(block_url_patterns)
+        # Capture patterns go first: they are the responses we are here for
+        self.allow_url_patterns = list(dict.fromkeys([*capture_patterns, *allow_url_patterns]))
+        self.stub_cache = stub_cache
+        self.site = site
+        self.metrics = ResourceRouterMetrics()
+        self._attached: Dict[int, Any] = {}
+        self._logger = get_logger("resource_router")
+
+    @classmethod
+    def from_site_config(cls, site_config: Any, site: Optional[str] = None) -> Optional["ResourceRouter"]:
+        """
+        Build the router a ``SiteConfig`` declares.
+
+        Returns None when the site has no enabled ``resource_blocking`` section.
+        """
+        blocking = site_config.get_resource_blocking_config()
+        if blocking is None or not blocking.enabled:
+            return None
+        site = site or site_config.site_name or None
+        capture = []
+        if site_config.intercepted is not None:
+            capture.extend(site_config.intercepted.url_patterns)
+        if site_config.hybrid is not None:
+            capture.extend(site_config.hybrid.intercept_patterns)
+        return cls(
+            block_resource_types=blocking.block_resource_types,
+            block_url_patterns=blocking.block_url_patterns,
+            allow_url_patterns=blocking.allow_url_patterns,
+            capture_patterns=capture,
+            stub_cache=_site_stub_cache(site, blocking.stub_cache_max_bytes) if blocking.stub_static else None,
+            site=site,
+        )
+
+    @classmethod
+    def for_site(cls, site: Optional[str]) -> Optional["ResourceRouter"]:
+        """The router declared in ``src/sites/<site>/config.yaml``, or None."""
+        if not site:
+            return None
+        from src.sites.base.site_config import load_site_config_or_none
+
+        site_config = load_site_config_or_none(site)
+        if site_config is None:
+            return None
+        return cls.from_site_config(site_config, site=site)
+
+    def decide(self, url: str, resource_type: str) -> str:
+        """Return CONTINUE, BLOCK or STUB for a request."""
+        if resource_type in PROTECTED_RESOURCE_TYPES:
+            return CONTINUE
+        if self.allow_url_patterns and match_url(self.allow_url_patterns, url):
+            return CONTINUE
+        if resource_type in self.block_resource_types:
+            return BLOCK
+        if self.block_url_patterns and match_url(self.block_url_patterns, url):
+            return BLOCK
+        if self.stub_cache is not None and resource_type in STUB_RESOURCE_TYPES:
+            return STUB
+        return CONTINUE
+
+    async def attach(self, context: Any) -> None:
+        """Route every request of ``context`` through this router (idempotent)."""
+        if id(context) in self._attached:
+            return
+        await context.route("**/*", self._handle)
+        self._attached[id(context)] = context
+
+    async def detach(self, context: Any) -> None:
+        """Remove the route from ``context``, e.g. before it goes back to a pool."""
+        if self._attached.pop(id(context), None) is None:
+            return
+        try:
+            await context.unroute("**/*", self._handle)
+        except Exception as e:
+            self._logger.debug("resource_router_detach_error", error=str(e))
+
+    def is_attached(self, context: Any) -> bool:
+        return id(context) in self._attached
+
+    async def _handle(self, route: Any, request: Any) -> None:
+        url = request.url
+        resource_type = request.resource_type
+        self.metrics.requests += 1
+        decision = self.decide(url, resource_type)
+
+        if decision == BLOCK:
+            self.metrics.blocked += 1
+            self.metrics.blocked_by_type[resource_type] = (
+                self.metrics.blocked_by_type.get(resource_type, 0) + 1
+            )
+            self.metrics.bytes_saved_estimated += ESTIMATED_BYTES.get(
+                resource_type, ESTIMATED_BYTES["other"]
+            )
+            await route.abort("blockedbyclient")
+            return
+
+        if decision == STUB and request.method == "GET":
+            cached = self.stub_cache.get(url)
+            if cached is not None:
+                status, headers, body = cached
+                self.metrics.stubbed += 1
+                self.metrics.bytes_saved_stubbed += len(body)
+                await route.fulfill(status=status, headers=headers, body=body)
+                return
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception as e:
+                # Let the browser try on its own; a failed fetch is not ours to report
+                self._logger.debug("resource_router_stub_fetch_failed", url=url, error=str(e))
+                self.metrics.continued += 1
+                await route.fallback()
+                return
+            self.metrics.stub_misses += 1
+            if response.status == 200:
+                self.stub_cache.put(url, response.status, dict(response.headers), body)
+            await route.fulfill(response=response, body=body)
+            return
+
+        self.metrics.continued += 1
+        await route.fallback()
@@ -17,6 +17,7 @@ from playwright.async_api import Error as PlaywrightError
 from .config import BrowserConfiguration
 from .models.enums import SessionStatus
 from .monitoring import ResourceMetrics, get_resource_monitor
+from .resource_router import ResourceRouter
 from src.observability.logger import get_logger
 from src.observability.events import (
     publish_browser_session_created,
@@ -85,6 +86,16 @@ class BrowserSession:
         # it is the single authority for this session's context proxy.
         self._proxy_manager = None
 
+        # Optional warm BrowserPool: the browser is borrowed rather than
+        # launched, and default contexts are leased pre-warmed
+        self._browser_pool = None
+        self._context_leases: Dict[int, Any] = {}
+
+        # Resource-blocking router; resolved from the site config on first
+        # use unless set_resource_router() was called
+        self._resource_router: Optional[ResourceRouter] = None
+        self._resource_router_resolved = False
+
         # Track subprocess handles for cleanup
         self._subprocess_handles = []
         
@@ -102,6 +113,31 @@ class BrowserSession:
         """
         self._proxy_manager = proxy_manager
 
+    def set_resource_router(self, router: Optional[ResourceRouter]) -> None:
+        """Route requests of the contexts this session creates through ``router``.
+
+        By default the router declared in the site's ``config.yaml``
+        (``resource_blocking``) is used. Pass ``None`` to disable blocking.
+        """
+        self._resource_router = router
+        self._resource_router_resolved = True
+
+    @property
+    def resource_router(self) -> Optional[ResourceRouter]:
+        """The session's ResourceRouter, or None when the site declares none."""
+        if not self._resource_router_resolved:
+            self._resource_router = ResourceRouter.for_site(self.site)
+            self._resource_router_resolved = True
+        return self._resource_router
+
+    def set_browser_pool(self, browser_pool) -> None:
+        """Draw the browser and default contexts from a warm ``BrowserPool``.
+
+        Must be set before :meth:`initialize`. The pool keeps ownership of the
+        browser; :meth:`close` hands leased contexts and the browser back.
+        """
+        self._browser_pool = browser_pool
+
     def _cleanup_subprocess_handles(self) -> None:
         """Clean up subprocess handles with Windows-specific handling."""
         for handle in self._subprocess_handles:
@@ -212,6 +248,10 @@ class BrowserSession:
                 correlation_id=self._correlation_id
             )
             
+            if self._browser_pool is not None:
+                await self._initialize_from_pool()
+                return
+            
             # Prepare launch arguments
             launch_args = {
                 "headless": self.configuration.headless,
@@ -309,6 +349,27 @@ class BrowserSession:
                 {"session_id": self.session_id, "error": str(e)}
             )
     
+    async def _initialize_from_pool(self) -> None:
+        """Borrow an already-launched browser instead of starting one."""
+        self.browser = await self._browser_pool.browser()
+        self.status = SessionStatus.ACTIVE
+        self.last_activity = datetime.utcnow()
+        
+        await publish_browser_session_initialized(
+            self.session_id,
+            None,
+            self._correlation_id
+        )
+        
+        self._logger.info(
+            "browser_session_initialized_from_pool",
+            session_id=self.session_id,
+            browser_type=self.configuration.browser_type.value,
+            correlation_id=self._correlation_id
+        )
+        
+        await self.persist_state()
+    
     def register_shutdown_cleanup(self, shutdown_coordinator) -> None:
         """Register cleanup functions with the shutdown coordinator."""
         if shutdown_coordinator is None or ShutdownCoordinator is None:
@@ -392,7 +453,7 @@ class BrowserSession:
         """Cleanup all contexts for shutdown."""
         for context in self.contexts:
             try:
-                await context.close()
+                await self._close_context(context)
             except Exception as e:
                 self._logger.warning(
                     "context_cleanup_error",
@@ -415,35 +476,14 @@ class BrowserSession:
                 "Browser instance not available"
             )
         
+        if (self._browser_pool is not None and not context_options
+                and self._proxy_manager is None):
+            return await self._lease_context()
+        
         try:
-            # Merge configuration context options with provided options
-            final_options = {
-                **self.configuration.context_options,
-                **context_options
-            }
-            
-            # Add stealth settings
-            if self.configuration.stealth.viewport:
-                final_options["viewport"] = self.configuration.stealth.viewport
-            
-            if self.configuration.stealth.locale:
-                final_options["locale"] = self.configuration.stealth.locale
-            
-            if self.configuration.stealth.timezone:
-                final_options["timezone_id"] = self.configuration.stealth.timezone
-            
-            if self.configuration.stealth.user_agent:
-                final_options["user_agent"] = self.configuration.stealth.user_agent
-            
-            if self.configuration.stealth.geolocation:
-                final_options["geolocation"] = self.configuration.stealth.geolocation
-                final_options["permissions"] = self.configuration.stealth.permissions
-            
-            if self.configuration.stealth.extra_http_headers:
-                final_options["extra_http_headers"] = self.configuration.stealth.extra_http_headers
-            
-            final_options["bypass_csp"] = self.configuration.stealth.bypass_csp
-            final_options["ignore_https_errors"] = self.configuration.stealth.ignore_https_errors
+            # Merge configuration context options with provided options,
+            # stealth settings on top
+            final_options = self.configuration.build_context_options(**context_options)
 
             # Apply proxy from the canonical manager, if one is injected. Only
             # override when the caller didn't already pass an explicit proxy.
@@ -454,6 +494,8 @@ class BrowserSession:
                     final_options["proxy"] = proxy_dict
 
             context = await self.browser.new_context(**final_options)
+            if self.resource_router is not None:
+                await self.resource_router.attach(context)
             self.contexts.append(context)
             
             # Record metrics
@@ -489,6 +531,45 @@ class BrowserSession:
                 {"session_id": self.session_id, "error": str(e)}
             )
     
+    async def _lease_context(self) -> BrowserContext:
+        """Lease a pre-warmed default context from the browser pool."""
+        lease = await self._browser_pool.acquire()
+        context = lease.context
+        self._context_leases[id(context)] = lease
+        if self.resource_router is not None:
+            await self.resource_router.attach(context)
+        self.contexts.append(context)
+        
+        self._metrics_collector.record_context_created(self.session_id)
+        self.last_activity = datetime.utcnow()
+        
+        await publish_browser_context_created(
+            self.session_id,
+            str(id(context)),
+            self._correlation_id
+        )
+        
+        self._logger.info(
+            "browser_context_leased",
+            session_id=self.session_id,
+            warm=lease.warm,
+            context_count=len(self.contexts),
+            correlation_id=self._correlation_id
+        )
+        
+        return context
+    
+    async def _close_context(self, context: BrowserContext) -> None:
+        """Close a context, or hand it back to the pool if it was leased."""
+        lease = self._context_leases.pop(id(context), None)
+        if lease is not None:
+            # The pooled context may next be leased for another site
+            if self._resource_router is not None:
+                await self._resource_router.detach(context)
+            await lease.release()
+        else:
+            await context.close()
+    
     async def create_page(self, context: Optional[BrowserContext] = None) -> Page:
         """Create a new page in the specified context."""
         if not context and self.contexts:
@@ -640,7 +721,7 @@ class BrowserSession:
             # Close all contexts
             for context in self.contexts:
                 try:
-                    await context.close()
+                    await self._close_context(context)
                 except Exception as e:
                     self._logger.warning(
                         "context_close_error",
@@ -650,8 +731,11 @@ class BrowserSession:
             
             self.contexts.clear()
             
+            # A pooled browser goes back to the pool, which owns it
+            if self.browser and self._browser_pool is not None:
+                await self._browser_pool.return_browser(self.browser)
             # Close browser - ensure transport cleanup completes
-            if self.browser:
+            elif self.browser:
                 try:
                     self._logger.info(
                         "closing_browser_transport",
@@ -701,7 +785,13 @@ class BrowserSession:
                     total_pages=final_metrics.total_pages_created,
                     peak_memory_mb=final_metrics.peak_memory_mb
                 )
-            
+            if self._resource_router is not None and self._resource_router.metrics.requests:
+                self._logger.info(
+                    "resource_router_metrics",
+                    session_id=self.session_id,
+                    **self._resource_router.metrics.to_dict()
+                )
+
             # Publish session closed event
             await publish_browser_session_closed(
                 self.session_id,
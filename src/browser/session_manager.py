@@ -31,6 +31,7 @@ from ..core.snapshot.manager import SnapshotManager
 from .exceptions import BrowserError, BrowserSessionError
 from .lifecycle import ModuleState, lifecycle_manager
 from .resilience import resilience_manager
+from .resource_router import ResourceRouter
 from ..config.settings import get_config
 
 
@@ -44,6 +45,7 @@ class BrowserSessionManager(IBrowserSession):
         state_manager: Optional[StateManager] = None,
         snapshot_manager: Optional[SnapshotManager] = None,
         proxy_manager: Optional["ProxyManager"] = None,
+        resource_router: Optional[ResourceRouter] = None,
     ):
         self.session = session
         self._playwright_browser = playwright_browser
@@ -53,6 +55,11 @@ class BrowserSessionManager(IBrowserSession):
         # context's proxy; when None we fall back to the session's flat proxy_*
         # fields so existing callers are unaffected.
         self._proxy_manager = proxy_manager
+        # Resource-blocking router; when None, the one declared in the site's
+        # config.yaml (if any) is used
+        self._resource_router = resource_router or ResourceRouter.for_site(
+            getattr(session, "site", None)
+        )
         
         # Managers
         self.state_manager = state_manager or StateManager()
@@ -134,6 +141,8 @@ class BrowserSessionManager(IBrowserSession):
             
             # Create Playwright page if context available
             if self._playwright_context and Page:
+                if self._resource_router is not None:
+                    await self._resource_router.attach(self._playwright_context)
                 page = await self._playwright_context.new_page()
                 tab_context._playwright_page = page
                 tab_context._playwright_context = self._playwright_context
@@ -29,6 +29,7 @@ class SelectorEngineConfig:
     max_concurrent_resolutions: int = 10
     max_strategies_per_selector: int = 10
     strategy_timeout: float = 5000.0  # milliseconds per strategy
+    quality_sample_rate: float = 0.1  # share of successful resolutions quality-evaluated
     
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -51,6 +52,11 @@ class SelectorEngineConfig:
                 "selector_engine", "max_concurrent_resolutions",
                 "Must be >= 1", self.max_concurrent_resolutions
             )
+        if not 0.0 <= self.quality_sample_rate <= 1.0:
+            raise ConfigurationError(
+                "selector_engine", "quality_sample_rate",
+                "Must be between 0.0 and 1.0", self.quality_sample_rate
+            )
 
 
 @dataclass
@@ -354,6 +360,7 @@ class ConfigManager:
             "SCOREWISE_CACHE_TTL": ("selector_engine", "cache_ttl"),
             "SCOREWISE_PARALLEL_RESOLUTION": ("selector_engine", "parallel_resolution"),
             "SCOREWISE_MAX_CONCURRENT": ("selector_engine", "max_concurrent_resolutions"),
+            "SCOREWISE_QUALITY_SAMPLE_RATE": ("selector_engine", "quality_sample_rate"),
             
             # Snapshots
             "SCOREWISE_SNAPSHOT_COMPRESSION": ("snapshots", "compression_enabled"),
@@ -72,6 +72,8 @@ from .exceptions import (
 )
 
 from .storage import SnapshotStorage, AtomicFileWriter
+from .catalog import SnapshotCatalog, CatalogEntry
+from .blobstore import BlobStore
 from .capture import SnapshotCapture
 from .triggers import (
     TriggerManager,
@@ -153,6 +155,9 @@ __all__ = [
     # Storage
     "SnapshotStorage",
     "AtomicFileWriter",
+    "SnapshotCatalog",
+    "CatalogEntry",
+    "BlobStore",
     
     # Capture
     "SnapshotCapture",
@@ -0,0 +1,360 @@
+"""
+Content-addressed, compressed artifact store shared by all snapshot bundles.
+
+Repeated captures of the same page differ in a few fragments (odds, clocks,
+session tokens), so storing each bundle's HTML, screenshots and logs as plain
+files writes nearly the same bytes again and again. ``BlobStore`` splits each
+artifact into content-defined chunks, compresses every chunk once and stores
+it under its SHA-256, so an unchanged region of a page costs one index row
+per capture instead of a full copy.
+
+Layout under the store root (``<snapshots>/.blobs`` by default)::
+
+    index.sqlite3           chunk, blob and reference tables
+    chunks/ab/<sha256>      one compressed chunk; first byte names the codec
+
+A *blob* is one artifact's bytes (addressed by the SHA-256 of the whole
+content) described as a list of chunks. Bundles hold *references* to blobs,
+keyed by owner (the bundle's catalog key) and artifact name. Releasing an
+owner drops its references; ``collect_garbage`` then deletes blobs nobody
+references and chunks no blob uses, inside one write transaction so a
+concurrent ``put`` can never reuse a chunk that is being removed.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.observability.logger import get_logger
+from .models import SnapshotError
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+BLOB_DIRNAME = ".blobs"
+
+# Codec markers (first byte of every chunk file)
+CODEC_RAW = b"r"
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"Z"
+
+# Chunk boundaries are only considered after a line end or a closing tag
+# bracket, so cuts fall between markup tokens and realign after an edit.
+_BOUNDARY_ANCHOR = re.compile(rb"[\n>]")
+_BOUNDARY_WINDOW = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    refs INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    chunks TEXT NOT NULL,
+    refs INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS refs (
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    PRIMARY KEY (owner, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_blobs_unreferenced ON blobs(refs) WHERE refs <= 0;
+CREATE INDEX IF NOT EXISTS idx_chunks_unreferenced ON chunks(refs) WHERE refs <= 0;
+"""
+
+
+def iter_chunks(data: bytes, min_size: int = 8192, max_size: int = 65536,
+                boundary_mask: int = 0x1F) -> Iterator[bytes]:
+    """
+    Split ``data`` into content-defined chunks.
+
+    A candidate boundary is any anchor byte at least ``min_size`` bytes into
+    the current chunk; it becomes a cut when the CRC-32 of the preceding
+    ``_BOUNDARY_WINDOW`` bytes has all ``boundary_mask`` bits clear. Because
+    the decision depends only on nearby content, inserting or removing bytes
+    moves the cuts of the chunk it happens in and the following cuts line up
+    with the previous version again. A chunk never exceeds ``max_size``.
+    """
+    start = 0
+    length = len(data)
+    while length - start > min_size:
+        limit = min(start + max_size, length)
+        cut = limit
+        for match in _BOUNDARY_ANCHOR.finditer(data, start + min_size, limit):
+            end = match.end()
+            if zlib.crc32(data[end - _BOUNDARY_WINDOW:end]) & boundary_mask == 0:
+                cut = end
+                break
+        if cut == length:
+            break
+        yield data[start:cut]
+        start = cut
+    if start < length or length == 0:
+        yield data[start:]
+
+
+class BlobStore:
+    """Deduplicating chunk store with reference counting."""
+
+    def __init__(self, root: Path, compression: Optional[str] = None, level: Optional[int] = None,
+                 min_chunk_size: int = 8192, max_chunk_size: int = 65536, boundary_mask: int = 0x1F):
+        """
+        Open (or create) a store.
+
+        Args:
+            root: Store directory
+            compression: ``"zstd"``, ``"zlib"`` or ``"none"``; defaults to zstd
+                when the ``zstandard`` package is installed, zlib otherwise
+            level: Compression level (codec default when omitted)
+            min_chunk_size: Smallest chunk cut by content
+            max_chunk_size: Forced cut when no content boundary is found
+            boundary_mask: CRC bits that must be clear at a boundary; more
+                bits give larger chunks
+        """
+        self.root = Path(root)
+        self.chunk_dir = self.root / "chunks"
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.boundary_mask = boundary_mask
+
+        compression = compression or ("zstd" if ZSTD_AVAILABLE else "zlib")
+        if compression == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise SnapshotError("zstd compression requires the 'zstandard' package")
+            self._codec = CODEC_ZSTD
+            self._compress = zstandard.ZstdCompressor(level=3 if level is None else level).compress
+        elif compression == "zlib":
+            self._codec = CODEC_ZLIB
+            zlib_level = 6 if level is None else level
+            self._compress = lambda chunk: zlib.compress(chunk, zlib_level)
+        elif compression == "none":
+            self._codec = CODEC_RAW
+            self._compress = None
+        else:
+            raise SnapshotError(f"Unknown blob compression: {compression}")
+        self.compression = compression
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.sqlite3"), check_same_thread=False,
+                                     timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # Writes
+
+    def put(self, owner: str, name: str, data: bytes) -> str:
+        """
+        Store ``data`` as artifact ``name`` of ``owner``.
+
+        Only chunks the store has never seen are compressed and written;
+        content that is already stored costs one reference row.
+
+        Returns:
+            The blob hash (SHA-256 of ``data``)
+        """
+        blob_hash = hashlib.sha256(data).hexdigest()
+        with self._lock, self._transaction():
+            row = self._conn.execute(
+                "SELECT blob FROM refs WHERE owner = ? AND name = ?", (owner, name)).fetchone()
+            if row and row[0] == blob_hash:
+                return blob_hash
+            if row:
+                self._conn.execute("UPDATE blobs SET refs = refs - 1 WHERE hash = ?", (row[0],))
+
+            if self._conn.execute(
+                    "UPDATE blobs SET refs = refs + 1 WHERE hash = ?", (blob_hash,)).rowcount == 0:
+                chunk_hashes = [self._put_chunk(chunk) for chunk in iter_chunks(
+                    data, self.min_chunk_size, self.max_chunk_size, self.boundary_mask)]
+                self._conn.execute(
+                    "INSERT INTO blobs (hash, size, chunks, refs) VALUES (?, ?, ?, 1)",
+                    (blob_hash, len(data), ",".join(chunk_hashes)))
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refs (owner, name, blob) VALUES (?, ?, ?)",
+                (owner, name, blob_hash))
+        return blob_hash
+
+    def release(self, owner: str) -> int:
+        """
+        Drop every reference held by ``owner``; the data stays until the
+        next ``collect_garbage``.
+
+        Returns:
+            Number of references dropped
+        """
+        with self._lock, self._transaction():
+            rows = self._conn.execute("SELECT blob FROM refs WHERE owner = ?", (owner,)).fetchall()
+            self._conn.executemany(
+                "UPDATE blobs SET refs = refs - 1 WHERE hash = ?", rows)
+            self._conn.execute("DELETE FROM refs WHERE owner = ?", (owner,))
+        return len(rows)
+
+    def collect_garbage(self) -> Dict[str, int]:
+        """
+        Delete unreferenced blobs and the chunks only they used.
+
+        Returns:
+            Counts of deleted blobs and chunks and the bytes freed on disk
+        """
+        with self._lock, self._transaction():
+            blobs = self._conn.execute(
+                "SELECT hash, chunks FROM blobs WHERE refs <= 0").fetchall()
+            for _, chunk_list in blobs:
+                self._conn.executemany(
+                    "UPDATE chunks SET refs = refs - 1 WHERE hash = ?",
+                    [(chunk_hash,) for chunk_hash in chunk_list.split(",") if chunk_hash])
+            self._conn.executemany("DELETE FROM blobs WHERE hash = ?", [(h,) for h, _ in blobs])
+
+            chunks = self._conn.execute(
+                "SELECT hash, stored_size FROM chunks WHERE refs <= 0").fetchall()
+            for chunk_hash, _ in chunks:
+                self._chunk_path(chunk_hash).unlink(missing_ok=True)
+            self._conn.executemany("DELETE FROM chunks WHERE hash = ?", [(h,) for h, _ in chunks])
+
+        result = {
+            "blobs_deleted": len(blobs),
+            "chunks_deleted": len(chunks),
+            "bytes_freed": sum(size for _, size in chunks),
+        }
+        if blobs:
+            logger.info("Blob store garbage collected", **result)
+        return result
+
+    # Reads
+
+    def get(self, blob_hash: str) -> bytes:
+        """Content of a blob; raises ``SnapshotError`` when it is missing or corrupt."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT chunks FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+        if row is None:
+            raise SnapshotError(f"Blob not found: {blob_hash}")
+        data = b"".join(self._read_chunk(h) for h in row[0].split(",") if h)
+        if hashlib.sha256(data).hexdigest() != blob_hash:
+            raise SnapshotError(f"Blob content does not match its hash: {blob_hash}")
+        return data
+
+    def read(self, owner: str, name: str) -> Optional[bytes]:
+        """Content of artifact ``name`` of ``owner``, or None when it has none."""
+        blob_hash = self.lookup(owner, name)
+        return self.get(blob_hash) if blob_hash else None
+
+    def lookup(self, owner: str, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob FROM refs WHERE owner = ? AND name = ?", (owner, name)).fetchone()
+        return row[0] if row else None
+
+    def references(self, owner: str) -> Dict[str, str]:
+        """``{artifact name: blob hash}`` of every artifact ``owner`` holds."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, blob FROM refs WHERE owner = ? ORDER BY name", (owner,)).fetchall()
+        return dict(rows)
+
+    def contains(self, blob_hash: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM blobs WHERE hash = ?", (blob_hash,)).fetchone() is not None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Logical (as referenced) versus stored sizes."""
+        with self._lock:
+            logical = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM refs r JOIN blobs b ON b.hash = r.blob"
+            ).fetchone()
+            blobs = self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            chunks, raw, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM chunks"
+            ).fetchone()
+        return {
+            "references": logical[0],
+            "logical_bytes": logical[1],
+            "blobs": blobs,
+            "chunks": chunks,
+            "unique_bytes": raw,
+            "stored_bytes": stored,
+            "reduction_ratio": logical[1] / stored if stored else 0.0,
+            "compression": self.compression,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Private methods
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Write transaction taking the database lock up front (shared across processes)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _chunk_path(self, chunk_hash: str) -> Path:
+        return self.chunk_dir / chunk_hash[:2] / chunk_hash
+
+    def _put_chunk(self, chunk: bytes) -> str:
+        """Reference a chunk, writing it when new; runs inside ``put``'s transaction."""
+        chunk_hash = hashlib.sha256(chunk).hexdigest()
+        if self._conn.execute(
+                "UPDATE chunks SET refs = refs + 1 WHERE hash = ?", (chunk_hash,)).rowcount:
+            return chunk_hash
+
+        payload, codec = chunk, CODEC_RAW
+        if self._compress is not None:
+            compressed = self._compress(chunk)
+            if len(compressed) < len(chunk):
+                payload, codec = compressed, self._codec
+
+        path = self._chunk_path(chunk_hash)
+        path.parent.mkdir(exist_ok=True)
+        temp_path = path.with_name(f".tmp_{chunk_hash}_{os.getpid()}_{threading.get_ident()}")
+        with open(temp_path, "wb") as f:
+            f.write(codec)
+            f.write(payload)
+        os.replace(temp_path, path)
+
+        self._conn.execute(
+            "INSERT INTO chunks (hash, size, stored_size, refs) VALUES (?, ?, ?, 1)",
+            (chunk_hash, len(chunk), len(payload) + 1))
+        return chunk_hash
+
+    def _read_chunk(self, chunk_hash: str) -> bytes:
+        try:
+            with open(self._chunk_path(chunk_hash), "rb") as f:
+                stored = f.read()
+        except OSError as e:
+            raise SnapshotError(f"Blob chunk missing: {chunk_hash}: {e}") from e
+        codec, payload = stored[:1], stored[1:]
+        if codec == CODEC_RAW:
+            return payload
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise SnapshotError("Reading zstd-compressed chunks requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        raise SnapshotError(f"Unknown chunk codec {codec!r}: {chunk_hash}")
@@ -20,7 +20,7 @@ from .models import (
     SnapshotConfig, SnapshotContext, SnapshotBundle, SnapshotMode, EnumEncoder,
     ContentDeduplicator, ArtifactCaptureError, SnapshotError
 )
-from .storage import SnapshotStorage, AtomicFileWriter
+from .storage import SnapshotStorage
 
 logger = get_logger(__name__)
 
@@ -149,8 +149,8 @@ class SnapshotCapture:
             # Get page HTML
             html_content = await page.content()
             
-            # Check deduplication
-            if self.deduplicator:
+            # Check deduplication (the blob store deduplicates across bundles itself)
+            if self.deduplicator and not self.storage.blob_store:
                 existing_hash = self.deduplicator.is_duplicate(html_content)
                 if existing_hash:
                     return f"html/fullpage_{existing_hash}.html"
@@ -158,13 +158,12 @@ class SnapshotCapture:
             # Generate filename
             content_hash = hashlib.md5(html_content.encode()).hexdigest()[:8]
             filename = f"fullpage_{content_hash}.html"
-            file_path = html_dir / filename
             
             # Write atomically
-            await AtomicFileWriter.write_text(file_path, html_content)
+            await self.storage.write_artifact(html_dir.parent, f"html/{filename}", html_content)
             
             # Add to deduplicator
-            if self.deduplicator:
+            if self.deduplicator and not self.storage.blob_store:
                 self.deduplicator.add_content(html_content)
             
             return f"html/{filename}"
@@ -188,8 +187,8 @@ class SnapshotCapture:
             
             logger.debug("Successfully captured element HTML", content_length=len(html_content))
             
-            # Check deduplication
-            if self.deduplicator:
+            # Check deduplication (the blob store deduplicates across bundles itself)
+            if self.deduplicator and not self.storage.blob_store:
                 existing_hash = self.deduplicator.is_duplicate(html_content)
                 if existing_hash:
                     return f"html/element_{existing_hash}.html"
@@ -197,15 +196,14 @@ class SnapshotCapture:
             # Generate filename
             content_hash = hashlib.md5(html_content.encode()).hexdigest()[:8]
             filename = f"element_{content_hash}.html"
-            file_path = html_dir / filename
             
-            logger.debug("Saving element HTML", file_path=str(file_path))
+            logger.debug("Saving element HTML", file_path=str(html_dir / filename))
             
             # Write atomically
-            await AtomicFileWriter.write_text(file_path, html_content)
+            await self.storage.write_artifact(html_dir.parent, f"html/{filename}", html_content)
             
             # Add to deduplicator
-            if self.deduplicator:
+            if self.deduplicator and not self.storage.blob_store:
                 self.deduplicator.add_content(html_content)
             
             result = f"html/{filename}"
@@ -225,10 +223,9 @@ class SnapshotCapture:
             # Generate filename
             timestamp = datetime.now().strftime("%H%M%S")
             filename = f"viewport_{timestamp}.png"
-            file_path = screenshots_dir / filename
             
             # Write atomically
-            await AtomicFileWriter.write_bytes(file_path, screenshot_bytes)
+            await self.storage.write_artifact(screenshots_dir.parent, f"screenshots/{filename}", screenshot_bytes)
             
             return f"screenshots/{filename}"
             
@@ -266,10 +263,10 @@ class SnapshotCapture:
             # Generate filename
             timestamp = datetime.now().strftime("%H%M%S")
             filename = f"console_{timestamp}.json"
-            file_path = logs_dir / filename
             
             # Write atomically
-            await AtomicFileWriter.write_text(file_path, json.dumps(logs, indent=2, cls=EnumEncoder))
+            await self.storage.write_artifact(logs_dir.parent, f"logs/{filename}",
+                                              json.dumps(logs, indent=2, cls=EnumEncoder))
             
             return f"logs/{filename}"
             
@@ -304,10 +301,10 @@ class SnapshotCapture:
             # Generate filename
             timestamp = datetime.now().strftime("%H%M%S")
             filename = f"network_{timestamp}.json"
-            file_path = logs_dir / filename
             
             # Write atomically
-            await AtomicFileWriter.write_text(file_path, json.dumps(network_logs, indent=2, cls=EnumEncoder))
+            await self.storage.write_artifact(logs_dir.parent, f"logs/{filename}",
+                                              json.dumps(network_logs, indent=2, cls=EnumEncoder))
             
             return f"logs/{filename}"
             
@@ -0,0 +1,322 @@
+"""
+SQLite catalog of snapshot bundles.
+
+Listing and retention used to walk the whole snapshot tree and parse every
+``metadata.json``; the catalog keeps one indexed row per bundle (site, module,
+component, capture time, write time, size, tags and the serialized metadata)
+so those queries never touch bundle directories. ``SnapshotStorage`` updates
+it on every bundle write and delete; ``rebuild`` re-derives it from the
+metadata files on disk, for a catalog that has never indexed the whole tree
+(recorded in ``catalog_meta``) or after out-of-band changes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.observability.logger import get_logger
+from .models import EnumEncoder, SnapshotBundle
+
+logger = get_logger(__name__)
+
+CATALOG_FILENAME = ".catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bundles (
+    path TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    module TEXT NOT NULL,
+    component TEXT NOT NULL,
+    session_id TEXT,
+    captured_at REAL NOT NULL,
+    written_at REAL NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    content_hash TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bundles_captured ON bundles(captured_at);
+CREATE INDEX IF NOT EXISTS idx_bundles_site ON bundles(site, captured_at);
+CREATE INDEX IF NOT EXISTS idx_bundles_module ON bundles(site, module, captured_at);
+CREATE INDEX IF NOT EXISTS idx_bundles_component ON bundles(site, module, component, captured_at);
+CREATE INDEX IF NOT EXISTS idx_bundles_written ON bundles(written_at);
+CREATE TABLE IF NOT EXISTS bundle_tags (
+    tag TEXT NOT NULL,
+    path TEXT NOT NULL REFERENCES bundles(path) ON DELETE CASCADE,
+    PRIMARY KEY (tag, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_bundle_tags_path ON bundle_tags(path);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """One catalogued bundle."""
+    path: Path
+    site: str
+    module: str
+    component: str
+    session_id: Optional[str]
+    captured_at: datetime
+    written_at: datetime
+    size_bytes: int
+    content_hash: Optional[str]
+    tags: List[str]
+    metadata: Dict[str, Any]
+
+    def to_bundle(self) -> SnapshotBundle:
+        """Rebuild the bundle from the catalogued metadata (no disk access)."""
+        return SnapshotBundle.from_dict(self.metadata)
+
+
+def bundle_tags(bundle: SnapshotBundle) -> List[str]:
+    """Tags of a bundle: ``metadata["tags"]`` plus the context's ``additional_metadata["tags"]``."""
+    tags: List[str] = []
+    for source in (bundle.metadata, bundle.context.additional_metadata):
+        value = source.get("tags") if isinstance(source, dict) else None
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, (list, tuple, set)):
+            tags.extend(str(tag) for tag in value)
+    return sorted(set(tags))
+
+
+def directory_size(path: Path) -> int:
+    """Total size of the files under ``path``."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return total
+
+
+class SnapshotCatalog:
+    """Indexed catalog of the bundles under one snapshot base path."""
+
+    def __init__(self, base_path: Path, db_path: Optional[Path] = None):
+        self.base_path = Path(base_path)
+        self.db_path = Path(db_path) if db_path else self.base_path / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        # Not "the file is new": a process that only saved bundles leaves a
+        # catalog without the ones already on disk. Only a full rebuild marks
+        # the tree as indexed.
+        self.is_new = self._conn.execute(
+            "SELECT 1 FROM catalog_meta WHERE key = 'indexed_at'").fetchone() is None
+
+    def key(self, bundle_path: Any) -> str:
+        """Catalog key of a bundle directory: its path relative to the base path."""
+        path = Path(bundle_path)
+        try:
+            return path.resolve().relative_to(self.base_path.resolve()).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def path(self, key: str) -> Path:
+        path = Path(key)
+        return path if path.is_absolute() else self.base_path / path
+
+    # Maintenance
+
+    def upsert(self, bundle: SnapshotBundle, bundle_path: Optional[Path] = None,
+               size_bytes: Optional[int] = None, written_at: Optional[float] = None) -> None:
+        """Add or replace the row of a bundle."""
+        bundle_path = Path(bundle_path or bundle.bundle_path)
+        if size_bytes is None:
+            size_bytes = directory_size(bundle_path)
+        with self._lock, self._conn:
+            self._upsert(self.key(bundle_path), bundle, size_bytes,
+                         time.time() if written_at is None else written_at)
+
+    def remove(self, bundle_path: Any) -> None:
+        """Drop the row of a bundle (no-op when it is not catalogued)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bundles WHERE path = ?", (self.key(bundle_path),))
+
+    def rebuild(self, root: Optional[Path] = None) -> int:
+        """
+        Re-index every bundle under ``root`` (default: the whole base path)
+        from its ``metadata.json``; rows under ``root`` without one are dropped.
+
+        Returns:
+            Number of bundles indexed
+        """
+        root = Path(root) if root else self.base_path
+        rows: List[Tuple[str, SnapshotBundle, int, float]] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Skip directories mid-creation or mid-deletion and the blob store
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            if "metadata.json" not in filenames:
+                continue
+            metadata_path = Path(dirpath) / "metadata.json"
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    bundle = SnapshotBundle.from_dict(json.load(f))
+                written_at = metadata_path.stat().st_mtime
+            except Exception as e:
+                logger.warning("Skipping unreadable bundle metadata",
+                               metadata_path=str(metadata_path), error=str(e))
+                continue
+            rows.append((self.key(dirpath), bundle, directory_size(Path(dirpath)), written_at))
+
+        prefix = self.key(root)
+        full = root == self.base_path or prefix == "."
+        with self._lock, self._conn:
+            if full:
+                self._conn.execute("DELETE FROM bundles")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('indexed_at', ?)",
+                    (str(time.time()),))
+            else:
+                self._conn.execute(
+                    "DELETE FROM bundles WHERE path = ? OR substr(path, 1, ?) = ?",
+                    (prefix, len(prefix) + 1, prefix + "/"),
+                )
+            for key, bundle, size_bytes, written_at in rows:
+                self._upsert(key, bundle, size_bytes, written_at)
+        if full:
+            self.is_new = False
+        logger.info("Snapshot catalog rebuilt", root=str(root), bundles=len(rows))
+        return len(rows)
+
+    # Queries
+
+    def query(self,
+              site: Optional[str] = None,
+              module: Optional[str] = None,
+              component: Optional[str] = None,
+              tags: Optional[Iterable[str]] = None,
+              since: Optional[datetime] = None,
+              until: Optional[datetime] = None,
+              written_before: Optional[float] = None,
+              limit: Optional[int] = 100,
+              offset: int = 0,
+              newest_first: bool = True) -> List[CatalogEntry]:
+        """
+        Catalogued bundles matching every given filter, ordered by capture
+        time (by write time for ``written_before`` retention queries).
+        """
+        where, params = self._where(site, module, component, tags, since, until, written_before)
+        column = "captured_at" if written_before is None else "written_at"
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT * FROM bundles{where} ORDER BY {column} {order}, path {order}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            tags_by_path = self._tags_for([row["path"] for row in rows])
+        return [self._entry(row, tags_by_path.get(row["path"], [])) for row in rows]
+
+    def count(self,
+              site: Optional[str] = None,
+              module: Optional[str] = None,
+              component: Optional[str] = None,
+              tags: Optional[Iterable[str]] = None,
+              since: Optional[datetime] = None,
+              until: Optional[datetime] = None) -> int:
+        """Number of catalogued bundles matching the filters."""
+        where, params = self._where(site, module, component, tags, since, until, None)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM bundles{where}", params).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Private methods
+
+    def _upsert(self, key: str, bundle: SnapshotBundle, size_bytes: int, written_at: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO bundles (path, site, module, component, session_id, captured_at,"
+            " written_at, size_bytes, content_hash, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                bundle.context.site,
+                bundle.context.module,
+                bundle.context.component,
+                bundle.context.session_id,
+                bundle.timestamp.timestamp(),
+                written_at,
+                size_bytes,
+                bundle.content_hash,
+                json.dumps(bundle.to_dict(), separators=(",", ":"), cls=EnumEncoder),
+            ),
+        )
+        # INSERT OR REPLACE deletes the old row, cascading to its tags
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO bundle_tags (tag, path) VALUES (?, ?)",
+            [(tag, key) for tag in bundle_tags(bundle)],
+        )
+
+    @staticmethod
+    def _where(site, module, component, tags, since, until, written_before) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("site", site), ("module", module), ("component", component)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("captured_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("captured_at <= ?")
+            params.append(until.timestamp())
+        if written_before is not None:
+            clauses.append("written_at < ?")
+            params.append(written_before)
+        tags = sorted(set(tags or ()))
+        if tags:
+            # Bundles carrying every requested tag
+            clauses.append(
+                "path IN (SELECT path FROM bundle_tags WHERE tag IN (%s)"
+                " GROUP BY path HAVING COUNT(*) = ?)" % ", ".join("?" * len(tags))
+            )
+            params.extend(tags)
+            params.append(len(tags))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _tags_for(self, paths: List[str]) -> Dict[str, List[str]]:
+        tags: Dict[str, List[str]] = {}
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            for path, tag in self._conn.execute(
+                "SELECT path, tag FROM bundle_tags WHERE path IN (%s) ORDER BY tag"
+                % ", ".join("?" * len(chunk)),
+                chunk,
+            ):
+                tags.setdefault(path, []).append(tag)
+        return tags
+
+    def _entry(self, row: sqlite3.Row, tags: List[str]) -> CatalogEntry:
+        return CatalogEntry(
+            path=self.path(row["path"]),
+            site=row["site"],
+            module=row["module"],
+            component=row["component"],
+            session_id=row["session_id"],
+            captured_at=datetime.fromtimestamp(row["captured_at"]),
+            written_at=datetime.fromtimestamp(row["written_at"]),
+            size_bytes=row["size_bytes"],
+            content_hash=row["content_hash"],
+            tags=tags,
+            metadata=json.loads(row["metadata"]),
+        )
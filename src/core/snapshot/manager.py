@@ -346,10 +346,13 @@ class SnapshotManager:
                           site: Optional[str] = None,
                           module: Optional[str] = None,
                           component: Optional[str] = None,
-                          limit: int = 100) -> List[SnapshotBundle]:
-        """List bundles with optional filtering."""
+                          limit: int = 100,
+                          offset: int = 0,
+                          tags: Optional[List[str]] = None) -> List[SnapshotBundle]:
+        """List bundles with optional filtering, newest first."""
         try:
-            return await self.storage.list_bundles(site, module, component, limit)
+            return await self.storage.list_bundles(site, module, component, limit,
+                                                   offset=offset, tags=tags)
         except Exception as e:
             logger.error("Error listing bundles", error=str(e))
             return []
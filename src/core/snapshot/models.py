@@ -144,13 +144,16 @@ class SnapshotBundle:
         """
         
         def make_serializable(obj):
+            # Enums hash by value, as they are stored in metadata.json
             try:
-                json.dumps(obj)
+                json.dumps(obj, cls=EnumEncoder)
                 return obj
             except (TypeError, ValueError):
                 return repr(obj)
 
         bundle_dict = self.to_dict()
+        # The hash covers everything but itself (as when it was first computed)
+        bundle_dict["content_hash"] = None
 
         # Sanitize artifacts recursively
         def sanitize(value):
@@ -163,7 +166,7 @@ class SnapshotBundle:
 
         safe_bundle = sanitize(bundle_dict)
 
-        content = json.dumps(safe_bundle, sort_keys=True, separators=(",", ":"))
+        content = json.dumps(safe_bundle, sort_keys=True, separators=(",", ":"), cls=EnumEncoder)
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -230,10 +233,11 @@ class SnapshotBundle:
         if not os.path.exists(self.bundle_path):
             return False
         
-        # Check if all artifacts exist
+        # Check if all artifacts exist, as files or in the blob store
+        blob_artifacts = self.metadata.get("blob_artifacts") or {}
         for artifact in self.artifacts:
             artifact_path = os.path.join(self.bundle_path, artifact)
-            if not os.path.exists(artifact_path):
+            if not os.path.exists(artifact_path) and artifact not in blob_artifacts:
                 return False
         
         # Validate content hash
@@ -6,15 +6,16 @@ partitioning, and content management.
 """
 
 import json
-import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Union
 from datetime import datetime
 import asyncio
 
 from src.observability.logger import get_logger
+from .blobstore import BLOB_DIRNAME, BlobStore
+from .catalog import CatalogEntry, SnapshotCatalog, directory_size
 from .models import SnapshotBundle, SnapshotContext, BundleCorruptionError, SnapshotError, EnumEncoder
 from .exceptions import PartialSnapshotBundle
 
@@ -23,12 +24,27 @@ logger = get_logger(__name__)
 
 
 class SnapshotStorage:
-    """Manages hierarchical storage of snapshot bundles."""
+    """
+    Manages hierarchical storage of snapshot bundles.
     
-    def __init__(self, base_path: str = "data/snapshots"):
+    Every bundle write and delete also updates the SQLite catalog
+    (``SnapshotCatalog``), which answers listing and retention queries
+    without walking the tree. A catalog that has never indexed the whole
+    tree is rebuilt from disk on first use; call ``rebuild_catalog`` after changing bundles by hand.
+    
+    Artifacts written through ``write_artifact`` go to the shared,
+    deduplicating ``BlobStore`` instead of the bundle directory; the bundle
+    metadata lists them under ``blob_artifacts`` and ``read_artifact`` reads
+    either kind. Deleting a bundle releases its blobs and retention cleanup
+    garbage-collects the ones no bundle uses any more.
+    """
+    
+    def __init__(self, base_path: str = "data/snapshots", use_blob_store: bool = True):
         """Initialize storage with base path."""
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.catalog = SnapshotCatalog(self.base_path)
+        self.blob_store = BlobStore(self.base_path / BLOB_DIRNAME) if use_blob_store else None
         
         # Storage configuration
         self.max_files_per_directory = 1000
@@ -89,6 +105,7 @@ class SnapshotStorage:
         try:
             bundle_path = Path(bundle.bundle_path)
             metadata_path = bundle_path / "metadata.json"
+            self._attach_blob_artifacts(bundle, bundle_path)
             
             # Save to temporary file first
             temp_path = metadata_path.with_suffix(".tmp")
@@ -104,6 +121,8 @@ class SnapshotStorage:
             # Atomic rename
             temp_path.rename(metadata_path)
             
+            self.catalog.upsert(bundle, bundle_path)
+            
             logger.debug("Successfully saved metadata", metadata_path=str(metadata_path))
             return True
             
@@ -129,6 +148,7 @@ class SnapshotStorage:
             logger.debug("SAVE_BUNDLE_METADATA COMPLETED")
             
             # Save artifacts - artifacts can be strings (file paths) or objects with content
+            saved_artifacts = False
             for artifact in bundle.artifacts:
                 # Handle both string paths and artifact objects
                 if isinstance(artifact, str):
@@ -140,6 +160,11 @@ class SnapshotStorage:
                     # Artifact is an object with filename/content
                     artifact_path = bundle_path / artifact.filename
                     await self._save_artifact(artifact, artifact_path)
+                    saved_artifacts = True
+            
+            if saved_artifacts:
+                # Re-index with the artifacts counted in the bundle size
+                self.catalog.upsert(bundle, bundle_path)
             
             return True
             
@@ -160,6 +185,9 @@ class SnapshotStorage:
                 artifact_path = bundle_path / artifact.filename
                 await self._save_artifact(artifact, artifact_path)
             
+            if partial_bundle.artifacts:
+                self.catalog.upsert(partial_bundle, bundle_path)
+            
             return True
             
         except Exception as e:
@@ -200,6 +228,9 @@ class SnapshotStorage:
             # Validate bundle integrity
             if not bundle.validate():
                 raise BundleCorruptionError(f"Bundle validation failed: {bundle_path}")
+            for artifact, blob_hash in bundle.metadata.get("blob_artifacts", {}).items():
+                if self.blob_store is None or not self.blob_store.contains(blob_hash):
+                    raise BundleCorruptionError(f"Missing blob for {artifact}: {bundle_path}")
             
             return bundle
             
@@ -212,6 +243,9 @@ class SnapshotStorage:
         """Delete bundle directory atomically."""
         try:
             bundle_path = Path(bundle_path)
+            self.catalog.remove(bundle_path)
+            if self.blob_store:
+                self.blob_store.release(self.catalog.key(bundle_path))
             
             if not bundle_path.exists():
                 return True
@@ -232,44 +266,42 @@ class SnapshotStorage:
                           site: Optional[str] = None,
                           module: Optional[str] = None,
                           component: Optional[str] = None,
-                          limit: int = 100) -> List[SnapshotBundle]:
-        """List bundles with optional filtering."""
-        bundles = []
-        
+                          limit: int = 100,
+                          offset: int = 0,
+                          tags: Optional[Iterable[str]] = None,
+                          since: Optional[datetime] = None,
+                          until: Optional[datetime] = None) -> List[SnapshotBundle]:
+        """List bundles with optional filtering, newest first, one page at a time."""
         try:
-            # Build search path
-            search_path = self.base_path
-            if site:
-                search_path = search_path / site
-            if module:
-                search_path = search_path / module
-            if component:
-                search_path = search_path / component
-            
-            if not search_path.exists():
-                return bundles
-            
-            # Walk through directories
-            for root, dirs, files in os.walk(search_path):
-                if "metadata.json" in files:
-                    try:
-                        bundle = await self.load_bundle(root)
-                        if bundle:
-                            bundles.append(bundle)
-                            if len(bundles) >= limit:
-                                break
-                    except Exception:
-                        # Skip corrupted bundles
-                        continue
-            
-            # Sort by timestamp (newest first)
-            bundles.sort(key=lambda b: b.timestamp, reverse=True)
-            
+            entries = await self.query_catalog(site=site, module=module, component=component,
+                                               tags=tags, since=since, until=until,
+                                               limit=limit, offset=offset)
+            bundles = []
+            for entry in entries:
+                try:
+                    bundles.append(entry.to_bundle())
+                except Exception:
+                    # Skip corrupted catalog rows
+                    continue
             return bundles
             
         except Exception as e:
             raise SnapshotError(f"Failed to list bundles: {e}")
     
+    async def query_catalog(self, **filters: Any) -> List[CatalogEntry]:
+        """Catalog entries (path, size, tags, metadata) matching ``SnapshotCatalog.query`` filters."""
+        self._ensure_catalog()
+        return self.catalog.query(**filters)
+    
+    async def count_bundles(self, **filters: Any) -> int:
+        """Number of bundles matching ``SnapshotCatalog.count`` filters."""
+        self._ensure_catalog()
+        return self.catalog.count(**filters)
+    
+    async def rebuild_catalog(self) -> int:
+        """Re-index every bundle from its metadata.json; returns the bundle count."""
+        return self.catalog.rebuild()
+    
     async def cleanup_old_bundles(self, 
                                  days_to_keep: int = 30,
                                  dry_run: bool = False) -> Dict[str, Any]:
@@ -280,29 +312,28 @@ class SnapshotStorage:
             total_size_freed = 0
             errors = []
             
-            for root, dirs, files in os.walk(self.base_path):
-                if "metadata.json" in files:
-                    try:
-                        metadata_path = Path(root) / "metadata.json"
-                        stat = metadata_path.stat()
-                        
-                        if stat.st_mtime < cutoff_date:
-                            # Calculate directory size
-                            dir_size = self._get_directory_size(root)
-                            
-                            if not dry_run:
-                                await self.delete_bundle(root)
-                            
-                            deleted_count += 1
-                            total_size_freed += dir_size
-                            
-                    except Exception as e:
-                        errors.append(f"Error processing {root}: {e}")
+            self._ensure_catalog()
+            expired = self.catalog.query(written_before=cutoff_date, limit=None, newest_first=False)
+            for entry in expired:
+                try:
+                    if not dry_run:
+                        await self.delete_bundle(str(entry.path))
+                    
+                    deleted_count += 1
+                    total_size_freed += entry.size_bytes
+                    
+                except Exception as e:
+                    errors.append(f"Error processing {entry.path}: {e}")
+            
+            blobs_freed = 0
+            if deleted_count and not dry_run:
+                blobs_freed = (await self.collect_garbage())["bytes_freed"]
             
             return {
                 "deleted_count": deleted_count,
                 "size_freed_bytes": total_size_freed,
                 "size_freed_mb": total_size_freed / (1024 * 1024),
+                "blob_bytes_freed": blobs_freed,
                 "errors": errors,
                 "dry_run": dry_run
             }
@@ -310,17 +341,79 @@ class SnapshotStorage:
         except Exception as e:
             raise SnapshotError(f"Failed to cleanup old bundles: {e}")
     
+    async def write_artifact(self, bundle_path: Union[str, Path], artifact: str,
+                             content: Union[str, bytes]) -> str:
+        """
+        Store one artifact of a bundle, in the blob store when enabled and as
+        a file under the bundle directory otherwise.
+        
+        Returns:
+            The bundle-relative artifact path, e.g. ``html/fullpage_ab12cd34.html``
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        try:
+            if self.blob_store:
+                self.blob_store.put(self.catalog.key(bundle_path), artifact, data)
+            else:
+                await AtomicFileWriter.write_bytes(Path(bundle_path) / artifact, data)
+        except SnapshotError:
+            raise
+        except Exception as e:
+            raise SnapshotError(f"Failed to write artifact {artifact}: {e}")
+        return artifact
+    
+    async def read_artifact(self, bundle_path: Union[str, Path], artifact: str) -> Optional[bytes]:
+        """Content of a bundle artifact, from its file or the blob store; None if absent."""
+        file_path = Path(bundle_path) / artifact
+        if file_path.is_file():
+            with open(file_path, 'rb') as f:
+                return f.read()
+        if self.blob_store:
+            return self.blob_store.read(self.catalog.key(bundle_path), artifact)
+        return None
+    
+    async def materialize_artifacts(self, bundle_path: Union[str, Path]) -> List[str]:
+        """
+        Write the blob-stored artifacts of a bundle out as plain files, e.g.
+        to open a captured page in a browser. The blobs stay referenced.
+        
+        Returns:
+            Artifacts written
+        """
+        if not self.blob_store:
+            return []
+        written = []
+        for artifact, blob_hash in self.blob_store.references(self.catalog.key(bundle_path)).items():
+            file_path = Path(bundle_path) / artifact
+            if not file_path.exists():
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                await AtomicFileWriter.write_bytes(file_path, self.blob_store.get(blob_hash))
+                written.append(artifact)
+        return written
+    
+    async def collect_garbage(self) -> Dict[str, int]:
+        """Delete blobs and chunks no bundle references any more."""
+        if not self.blob_store:
+            return {"blobs_deleted": 0, "chunks_deleted": 0, "bytes_freed": 0}
+        return self.blob_store.collect_garbage()
+    
+    def _attach_blob_artifacts(self, bundle: SnapshotBundle, bundle_path: Path) -> None:
+        """Record the bundle's blob-stored artifacts in its metadata."""
+        if not self.blob_store or not isinstance(bundle, SnapshotBundle):
+            return
+        blobs = self.blob_store.references(self.catalog.key(bundle_path))
+        if blobs and bundle.metadata.get("blob_artifacts") != blobs:
+            bundle.metadata["blob_artifacts"] = blobs
+            bundle.content_hash = bundle._calculate_content_hash()
+    
+    def _ensure_catalog(self) -> None:
+        """Index the existing tree the first time a never-indexed catalog is queried."""
+        if self.catalog.is_new:
+            self.catalog.rebuild()
+    
     def _get_directory_size(self, path: str) -> int:
         """Calculate total size of directory."""
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except OSError:
-                    continue
-        return total_size
+        return directory_size(Path(path))
     
     async def check_partitioning(self, directory_path: str) -> bool:
         """Check if directory needs partitioning."""
@@ -361,6 +454,9 @@ class SnapshotStorage:
                     new_path = partition_path / item.name
                     item.rename(new_path)
             
+            # The moved bundles are catalogued under their old paths
+            self.catalog.rebuild(path)
+            
             return True
             
         except Exception as e:
@@ -374,7 +470,7 @@ class SnapshotStorage:
             site_stats = {}
             
             for site_dir in self.base_path.iterdir():
-                if site_dir.is_dir():
+                if site_dir.is_dir() and not site_dir.name.startswith("."):
                     site_size = self._get_directory_size(str(site_dir))
                     site_bundles = len(list(site_dir.rglob("metadata.json")))
                     
@@ -393,6 +489,7 @@ class SnapshotStorage:
                 "total_size_mb": total_size / (1024 * 1024),
                 "total_size_gb": total_size / (1024 * 1024 * 1024),
                 "site_statistics": site_stats,
+                "blob_store": self.blob_store.get_statistics() if self.blob_store else None,
                 "base_path": str(self.base_path)
             }
             
@@ -34,7 +34,9 @@ from src.network.direct_api.client import (
     AsyncHttpClient,
     PreparedRequest,
     gather_requests,
+    stream_requests,
 )
+from src.network.direct_api.http_cache import CacheStats, CacheStatus, HttpCache
 from src.network.direct_api.interfaces import (
     AuthConfig,
     HttpResponseProtocol,
@@ -48,6 +50,10 @@ __all__ = [
     "AsyncHttpClient",
     "PreparedRequest",
     "gather_requests",
+    "stream_requests",
+    "HttpCache",
+    "CacheStats",
+    "CacheStatus",
     "AuthConfig",
     "HttpResponseProtocol",
     "RequestBuilderProtocol",
@@ -8,9 +8,10 @@ from typing import Any
 
 import httpx
 
+from src.network.direct_api.http_cache import HttpCache
 from src.network.direct_api.rate_limiting import RateLimiter, TokenBucket
 from src.network.direct_api.request_builder import RequestBuilder
-from src.network.direct_api.concurrency import gather_requests
+from src.network.direct_api.concurrency import gather_requests, stream_requests
 from src.network.direct_api.prepared_request import PreparedRequest
 from src.network.credentials import check_verbose_logging_warning
 
@@ -32,6 +33,8 @@ class AsyncHttpClient:
         rate_limit: float = 10.0,
         rate_capacity: float = 10.0,
         proxy: "Any | None" = None,
+        cache: HttpCache | None = None,
+        recorder: "Any | None" = None,
     ) -> None:
         """Initialize the async HTTP client.
 
@@ -42,11 +45,19 @@ class AsyncHttpClient:
             proxy: Optional proxy. Accepts a ``src.network.proxy.ProxyEndpoint``
                 (rendered via ``to_httpx_proxy()``) or a proxy URL string. A
                 DIRECT endpoint or ``None`` means an un-proxied client.
+            cache: Optional HttpCache. GET/HEAD responses are then served
+                from it and revalidated with ETag/Last-Modified (see
+                src.network.direct_api.http_cache).
+            recorder: Optional ``src.telemetry.collector.TimingRecorder``. Every
+                response that came from the network (not a fresh cache hit) is
+                then passed to its ``record_network``.
         """
         self._base_url = base_url
         proxy_url = proxy.to_httpx_proxy() if hasattr(proxy, "to_httpx_proxy") else proxy
         self._client = httpx.AsyncClient(**({"proxy": proxy_url} if proxy_url else {}))
         self._rate_limiter = RateLimiter(rate=rate_limit, capacity=rate_capacity)
+        self._cache = cache
+        self._recorder = recorder
         
         # Check for verbose logging and warn about potential credential exposure
         check_verbose_logging_warning()
@@ -79,8 +90,10 @@ class AsyncHttpClient:
 # Re-export for backwards compatibility and clean imports
 __all__ = [
     "AsyncHttpClient",
+    "HttpCache",
     "PreparedRequest",
     "gather_requests",
+    "stream_requests",
     "TokenBucket",
     "RateLimiter",
     "RequestBuilder",
@@ -1,7 +1,16 @@
 """Concurrent request execution utilities.
 
 This module provides the gather_requests function for executing
-multiple HTTP requests concurrently.
+multiple HTTP requests concurrently, and stream_requests, which yields
+each result as soon as its request completes.
+
+## Bounded Concurrency
+
+Both accept ``max_concurrency``: at most that many requests are in flight,
+and the next one starts as soon as a slot frees up. stream_requests also
+consumes its input lazily, so fanning out thousands of PreparedRequests
+keeps only ``max_concurrency`` requests and unconsumed results in memory.
+Per-domain rate limiting (RateLimiter) applies to every request either way.
 
 ## Raw Response Pattern
 
@@ -16,6 +25,7 @@ to differentiate.
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Iterable
 
 import httpx
 
@@ -24,8 +34,49 @@ from src.network.direct_api.prepared_request import PreparedRequest
 from src.network.direct_api.metadata import ResponseMetadata
 
 
+async def _execute(
+    request: PreparedRequest,
+    index: int,
+) -> tuple[int, tuple[httpx.Response, ResponseMetadata] | NetworkError]:
+    """Execute a single request with error handling, returning index and result."""
+    try:
+        response = await request.execute()
+        return (index, response)
+    except asyncio.CancelledError:
+        # Don't convert CancelledError to NetworkError - let it propagate
+        # so the caller knows the request was cancelled
+        raise
+    except httpx.HTTPError as e:
+        # Extract status code if available (use getattr for type safety)
+        status_code = None
+        response = getattr(e, "response", None)
+        if response is not None:
+            status_code = response.status_code
+        # Create NetworkError for HTTP errors
+        error = NetworkError(
+            module="direct_api",
+            operation=request._method.lower(),
+            url=request._url,
+            status_code=status_code,
+            detail=str(e),
+            retryable=Retryable.RETRYABLE,
+        )
+        return (index, error)
+    except Exception as e:
+        # Create NetworkError for other errors
+        error = NetworkError(
+            module="direct_api",
+            operation=request._method.lower(),
+            url=request._url,
+            detail=str(e),
+            retryable=Retryable.TERMINAL,
+        )
+        return (index, error)
+
+
 async def gather_requests(
     *requests: PreparedRequest,
+    max_concurrency: int | None = None,
 ) -> list[tuple[httpx.Response, ResponseMetadata] | NetworkError]:
     """Execute multiple requests concurrently using asyncio.gather().
 
@@ -34,6 +85,8 @@ async def gather_requests(
 
     Args:
         *requests: Variable number of PreparedRequest objects to execute
+        max_concurrency: Maximum number of requests in flight at once.
+            None (default) starts every request immediately.
 
     Returns:
         list[tuple[httpx.Response, ResponseMetadata] | NetworkError]: List of
@@ -42,56 +95,32 @@ async def gather_requests(
             model instance rather than raising an exception. This allows partial
             success handling - some requests may succeed while others fail.
 
+    Raises:
+        ValueError: If max_concurrency is less than 1.
+
     Note:
-        If the calling task is cancelled, in-flight requests will continue running
-        to completion rather than being cancelled immediately.
+        Without max_concurrency, if the calling task is cancelled, in-flight
+        requests will continue running to completion rather than being
+        cancelled immediately. With max_concurrency, in-flight requests are
+        cancelled along with the caller (see stream_requests).
     """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
     if not requests:
         return []
 
-    async def execute_with_error_handling(
-        request: PreparedRequest,
-        index: int,
-    ) -> tuple[int, tuple[httpx.Response, ResponseMetadata] | NetworkError]:
-        """Execute a single request with error handling, returning index and result."""
-        try:
-            response = await request.execute()
-            return (index, response)
-        except asyncio.CancelledError:
-            # Don't convert CancelledError to NetworkError - let it propagate
-            # so the caller knows the request was cancelled
-            raise
-        except httpx.HTTPError as e:
-            # Extract status code if available (use getattr for type safety)
-            status_code = None
-            response = getattr(e, "response", None)
-            if response is not None:
-                status_code = response.status_code
-            # Create NetworkError for HTTP errors
-            error = NetworkError(
-                module="direct_api",
-                operation=request._method.lower(),
-                url=request._url,
-                status_code=status_code,
-                detail=str(e),
-                retryable=Retryable.RETRYABLE,
-            )
-            return (index, error)
-        except Exception as e:
-            # Create NetworkError for other errors
-            error = NetworkError(
-                module="direct_api",
-                operation=request._method.lower(),
-                url=request._url,
-                detail=str(e),
-                retryable=Retryable.TERMINAL,
-            )
-            return (index, error)
+    if max_concurrency is not None:
+        ordered: list[tuple[httpx.Response, ResponseMetadata] | NetworkError | None] = (
+            [None] * len(requests)
+        )
+        async for index, result in stream_requests(requests, max_concurrency=max_concurrency):
+            ordered[index] = result
+        return ordered  # type: ignore[return-value]
 
     # Execute all requests concurrently with return_exceptions=True to handle
     # partial failures gracefully (but not CancelledError - we want that to propagate)
     results = await asyncio.gather(
-        *[execute_with_error_handling(req, i) for i, req in enumerate(requests)],
+        *[_execute(req, i) for i, req in enumerate(requests)],
         return_exceptions=True,
     )
 
@@ -119,3 +148,63 @@ async def gather_requests(
 
     # Return just the results (not indices)
     return [result for _, result in processed_results]
+
+
+async def stream_requests(
+    requests: Iterable[PreparedRequest],
+    *,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[tuple[int, tuple[httpx.Response, ResponseMetadata] | NetworkError]]:
+    """Execute requests concurrently, yielding each result as it completes.
+
+    ``requests`` is consumed lazily: a new request is only taken from it
+    when a slot frees up, so it can be a generator over thousands of
+    PreparedRequest objects. Freed slots are refilled before results are
+    yielded, so requests keep running while the caller processes one.
+
+    Args:
+        requests: PreparedRequest objects to execute (any iterable)
+        max_concurrency: Maximum number of requests in flight at once.
+            None (default) starts every request immediately.
+
+    Yields:
+        tuple[int, tuple[httpx.Response, ResponseMetadata] | NetworkError]:
+            The request's position in ``requests`` and its result, in
+            completion order. Failures are yielded as NetworkError, as in
+            gather_requests.
+
+    Raises:
+        ValueError: If max_concurrency is less than 1.
+
+    Note:
+        Closing the iterator early (``break``) or cancelling the consumer
+        cancels the requests still in flight; requests not yet started are
+        never started.
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    pending_requests = enumerate(requests)
+    in_flight: set[asyncio.Task] = set()
+
+    def fill() -> None:
+        while max_concurrency is None or len(in_flight) < max_concurrency:
+            try:
+                index, request = next(pending_requests)
+            except StopIteration:
+                return
+            in_flight.add(asyncio.ensure_future(_execute(request, index)))
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            fill()
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
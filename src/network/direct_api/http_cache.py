@@ -0,0 +1,518 @@
+"""HTTP response cache with conditional revalidation.
+
+This module provides HttpCache, an optional caching layer for
+AsyncHttpClient (and DirectApi) aimed at endpoints that are polled
+repeatedly - public APIs, sports list feeds - where most polls return
+the same document.
+
+## Behaviour
+
+- Only GET and HEAD responses are cached. Any other method on a URL
+  evicts that URL's cached entries.
+- Entries are keyed by method, URL (including query parameters) and the
+  request headers the response names in ``Vary``. ``Vary: *`` is never
+  cached.
+- ``Cache-Control`` is honoured on both sides:
+  - ``no-store`` on the request or the response bypasses the cache.
+  - ``no-cache`` or ``max-age=0`` on the request forces revalidation.
+  - A response is fresh for ``max-age`` seconds (else until
+    ``Expires``), minus its ``Age``. ``no-cache`` makes it always stale.
+- A fresh entry is served without touching the network or the rate
+  limiter.
+- A stale entry with a validator is revalidated: the request is sent
+  with ``If-None-Match`` (ETag) and/or ``If-Modified-Since``
+  (Last-Modified). A 304 refreshes the entry and is answered from
+  cache. Stale entries without a validator are simply re-fetched.
+- Requests that already carry conditional headers bypass the cache, so
+  callers managing their own validators see the server's 304 directly.
+
+## Storage
+
+A bounded in-memory LRU (``max_entries`` / ``max_bytes``) in front of an
+optional on-disk store (``directory`` / ``max_disk_bytes``). Disk entries
+survive restarts and are promoted into memory on lookup. Bodies are kept
+decoded, so ``Content-Encoding`` is dropped from stored headers.
+
+## Raw Response Pattern
+
+Cached answers are rebuilt as plain httpx.Response objects with the
+stored status, headers and body, so callers cannot tell a cache hit from
+a network response except through ResponseMetadata.cache_status.
+
+Example usage::
+
+    cache = HttpCache(directory=".cache/http")
+    async with AsyncHttpClient(cache=cache) as client:
+        response, metadata = await client.get("https://api.example.com").execute()
+        print(metadata.cache_status, metadata.cache_hits)
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.network.direct_api.metadata import ResponseMetadata
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+CACHEABLE_STATUS = frozenset({200, 203, 300, 301, 308, 404, 410})
+
+# Headers that describe the wire encoding rather than the stored body
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+class CacheStatus(str, Enum):
+    """How a response was produced with respect to the cache."""
+
+    HIT = "hit"
+    REVALIDATED = "revalidated"
+    MISS = "miss"
+    BYPASS = "bypass"
+
+
+@dataclass
+class CacheStats:
+    """Cumulative cache counters.
+
+    Attributes:
+        hits: Responses served from a fresh entry without a request
+        revalidations: Responses served from cache after a 304
+        misses: Cacheable requests answered by a full network response
+    """
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+
+
+@dataclass
+class CacheEntry:
+    """A stored response.
+
+    Attributes:
+        status_code: HTTP status code of the stored response
+        headers: Response headers as (name, value) pairs
+        body: Decoded response body
+        stored_at: Wall-clock time the entry was stored or last revalidated
+        vary: Request header values named by the response's Vary header
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    stored_at: float
+    vary: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Approximate memory cost of the entry in bytes."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def header(self, name: str) -> str | None:
+        """Return the first value of a response header, or None."""
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a Cache-Control header into a directive mapping.
+
+    Args:
+        value: The raw header value, or None
+
+    Returns:
+        dict[str, str | None]: Lower-cased directive names mapped to their
+            argument (unquoted), or None for directives without one
+    """
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: str | None) -> float | None:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpCache:
+    """Bounded memory + disk cache of HTTP responses with revalidation.
+
+    Args:
+        max_entries: Maximum number of entries kept in memory (default: 256)
+        max_bytes: Maximum total size of in-memory entries (default: 32 MiB)
+        directory: Optional directory for the on-disk store. None keeps the
+            cache in memory only.
+        max_disk_bytes: Maximum total size of the on-disk store
+            (default: 256 MiB)
+        clock: Wall-clock source, seconds since the epoch (default: time.time)
+
+    Note:
+        Disk reads and writes are synchronous. Entries are small compared to
+        a network round trip, so the cache does not off-load them to a thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        directory: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        # primary key (method + URL) -> request header names from Vary
+        self._vary: dict[str, tuple[str, ...]] = {}
+        self._directory = Path(directory) if directory is not None else None
+        self._disk_sizes: OrderedDict[Path, int] = OrderedDict()
+        self._disk_bytes = 0
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    # -- request flow -----------------------------------------------------
+
+    async def send(
+        self,
+        send: Callable[..., Awaitable[httpx.Response]],
+        acquire: Callable[[], Awaitable[None]],
+        request_kwargs: dict[str, Any],
+    ) -> tuple[httpx.Response, CacheStatus]:
+        """Answer a request from cache, revalidating or fetching as needed.
+
+        Args:
+            send: Coroutine function performing the request
+                (``httpx.AsyncClient.request``)
+            acquire: Coroutine acquiring a rate limit token; only awaited
+                when the request goes to the network
+            request_kwargs: Keyword arguments for ``send``. Not mutated.
+
+        Returns:
+            tuple[httpx.Response, CacheStatus]: The response and how it
+                was produced
+        """
+        method = request_kwargs["method"].upper()
+        url = str(httpx.URL(request_kwargs["url"]).copy_merge_params(request_kwargs.get("params") or {}))
+        headers = httpx.Headers(request_kwargs.get("headers") or {})
+        request_cc = parse_cache_control(headers.get("cache-control"))
+
+        if method not in CACHEABLE_METHODS:
+            self.invalidate(url)
+            await acquire()
+            return await send(**request_kwargs), CacheStatus.BYPASS
+        if "no-store" in request_cc or any(h in headers for h in _CONDITIONAL_HEADERS):
+            await acquire()
+            return await send(**request_kwargs), CacheStatus.BYPASS
+
+        primary = f"{method} {url}"
+        entry = self._lookup(primary, headers)
+        force_revalidate = "no-cache" in request_cc or request_cc.get("max-age") == "0"
+        if entry is not None and not force_revalidate and self._is_fresh(entry):
+            self.stats.hits += 1
+            return self._build_response(entry, method, url), CacheStatus.HIT
+
+        conditional = dict(request_kwargs)
+        if entry is not None:
+            validators = self._conditional_headers(entry)
+            if validators:
+                conditional["headers"] = {**dict(request_kwargs.get("headers") or {}), **validators}
+            else:
+                entry = None
+
+        await acquire()
+        response = await send(**conditional)
+
+        if entry is not None and response.status_code == 304:
+            self._refresh(primary, entry, response)
+            self.stats.revalidations += 1
+            return self._build_response(entry, method, url), CacheStatus.REVALIDATED
+
+        self.stats.misses += 1
+        self.store(primary, headers, response)
+        return response, CacheStatus.MISS
+
+    def annotate(self, metadata: ResponseMetadata, status: CacheStatus | None) -> ResponseMetadata:
+        """Copy the cache status and cumulative counters onto response metadata."""
+        metadata.cache_status = status.value if status is not None else None
+        metadata.cache_hits = self.stats.hits
+        metadata.cache_revalidations = self.stats.revalidations
+        metadata.cache_misses = self.stats.misses
+        return metadata
+
+    # -- storage ----------------------------------------------------------
+
+    def store(self, primary: str, request_headers: httpx.Headers, response: httpx.Response) -> bool:
+        """Store a response if its status and headers allow it.
+
+        Args:
+            primary: Cache key without Vary, ``"<METHOD> <URL>"``
+            request_headers: Headers of the request that produced ``response``
+            response: The network response
+
+        Returns:
+            bool: True if the response was stored
+        """
+        cc = parse_cache_control(response.headers.get("cache-control"))
+        vary_header = response.headers.get("vary", "")
+        vary_names = tuple(sorted({v.strip().lower() for v in vary_header.split(",") if v.strip()}))
+        if (
+            response.status_code not in CACHEABLE_STATUS
+            or "no-store" in cc
+            or "*" in vary_names
+        ):
+            self._forget(primary)
+            return False
+        entry = CacheEntry(
+            status_code=response.status_code,
+            headers=[(k, v) for k, v in response.headers.multi_items() if k.lower() not in _HOP_HEADERS],
+            body=response.content,
+            stored_at=self._clock(),
+            vary={name: request_headers.get(name, "") for name in vary_names},
+        )
+        if self._lifetime(entry) <= 0 and not self._conditional_headers(entry):
+            self._forget(primary)
+            return False
+        if self._vary.get(primary, vary_names) != vary_names:
+            self._forget(primary)
+        self._vary[primary] = vary_names
+        key = self._key(primary, entry.vary)
+        self._remember(key, entry)
+        self._write_disk(primary, key, entry)
+        return True
+
+    def invalidate(self, url: str) -> None:
+        """Drop every cached entry for ``url`` (all methods and variants)."""
+        for method in CACHEABLE_METHODS:
+            self._forget(f"{method} {url}")
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        self._vary.clear()
+        for path in list(self._disk_sizes):
+            self._unlink(path)
+        if self._directory is not None:
+            for path in self._directory.glob("*.vary"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    # -- freshness --------------------------------------------------------
+
+    def _lifetime(self, entry: CacheEntry) -> float:
+        cc = parse_cache_control(entry.header("cache-control"))
+        if "no-cache" in cc:
+            return 0.0
+        max_age = _seconds(cc.get("max-age"))
+        if max_age is not None:
+            return max_age
+        expires = _http_date(entry.header("expires"))
+        if expires is not None:
+            date = _http_date(entry.header("date")) or entry.stored_at
+            return max(0.0, expires - date)
+        return 0.0
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        age = (_seconds(entry.header("age")) or 0.0) + max(0.0, self._clock() - entry.stored_at)
+        return age < self._lifetime(entry)
+
+    @staticmethod
+    def _conditional_headers(entry: CacheEntry) -> dict[str, str]:
+        headers = {}
+        etag = entry.header("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = entry.header("last-modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _refresh(self, primary: str, entry: CacheEntry, response: httpx.Response) -> None:
+        """Merge a 304's headers into ``entry`` and restart its freshness clock."""
+        updated = {k.lower() for k, _ in response.headers.multi_items() if k.lower() not in _HOP_HEADERS}
+        entry.headers = [(k, v) for k, v in entry.headers if k.lower() not in updated] + [
+            (k, v) for k, v in response.headers.multi_items() if k.lower() in updated
+        ]
+        entry.stored_at = self._clock()
+        key = self._key(primary, entry.vary)
+        self._remember(key, entry)
+        self._write_disk(primary, key, entry)
+
+    @staticmethod
+    def _build_response(entry: CacheEntry, method: str, url: str) -> httpx.Response:
+        headers = [(k, v) for k, v in entry.headers if k.lower() != "date"]
+        headers.append(("date", formatdate(usegmt=True)))
+        return httpx.Response(
+            entry.status_code,
+            headers=headers,
+            content=entry.body,
+            request=httpx.Request(method, url),
+        )
+
+    # -- keys and tiers ---------------------------------------------------
+
+    @staticmethod
+    def _key(primary: str, vary: dict[str, str]) -> str:
+        if not vary:
+            return primary
+        return primary + "\n" + "\n".join(f"{k}:{v}" for k, v in sorted(vary.items()))
+
+    def _lookup(self, primary: str, request_headers: httpx.Headers) -> CacheEntry | None:
+        vary_names = self._vary.get(primary)
+        if vary_names is None:
+            vary_names = self._read_disk_vary(primary)
+            if vary_names is None:
+                return None
+            self._vary[primary] = vary_names
+        key = self._key(primary, {name: request_headers.get(name, "") for name in vary_names})
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.size
+        if entry.size > self.max_bytes:
+            return
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+        while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+
+    def _forget(self, primary: str) -> None:
+        self._vary.pop(primary, None)
+        for key in [k for k in self._memory if k == primary or k.startswith(primary + "\n")]:
+            self._memory_bytes -= self._memory.pop(key).size
+        if self._directory is not None:
+            vary_path = self._path(primary, ".vary")
+            for path in [p for p in self._disk_sizes if p.name.startswith(vary_path.stem + "-")]:
+                self._unlink(path)
+            vary_path.unlink(missing_ok=True)
+
+    # -- disk store -------------------------------------------------------
+    #
+    # One "<sha(primary)>.vary" file per URL holds the Vary header names;
+    # each variant is "<sha(primary)>-<sha(key)>.entry": a JSON header line
+    # followed by the raw body.
+
+    def _path(self, primary: str, suffix: str, key: str | None = None) -> Path:
+        assert self._directory is not None
+        name = hashlib.sha256(primary.encode()).hexdigest()[:32]
+        if key is not None:
+            name += "-" + hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self._directory / (name + suffix)
+
+    def _load_disk_index(self) -> None:
+        assert self._directory is not None
+        files = sorted(self._directory.glob("*.entry"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            self._disk_sizes[path] = path.stat().st_size
+        self._disk_bytes = sum(self._disk_sizes.values())
+
+    def _read_disk_vary(self, primary: str) -> tuple[str, ...] | None:
+        if self._directory is None:
+            return None
+        try:
+            return tuple(json.loads(self._path(primary, ".vary").read_text()))
+        except (OSError, ValueError):
+            return None
+
+    def _read_disk(self, key: str) -> CacheEntry | None:
+        if self._directory is None:
+            return None
+        primary = key.split("\n", 1)[0]
+        path = self._path(primary, ".entry", key)
+        try:
+            raw = path.read_bytes()
+            head, _, body = raw.partition(b"\n")
+            meta = json.loads(head)
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key:
+            return None
+        if path in self._disk_sizes:
+            self._disk_sizes.move_to_end(path)
+        return CacheEntry(
+            status_code=meta["status_code"],
+            headers=[tuple(h) for h in meta["headers"]],
+            body=body,
+            stored_at=meta["stored_at"],
+            vary=meta["vary"],
+        )
+
+    def _write_disk(self, primary: str, key: str, entry: CacheEntry) -> None:
+        if self._directory is None:
+            return
+        meta = {
+            "key": key,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+            "vary": entry.vary,
+        }
+        data = json.dumps(meta).encode() + b"\n" + entry.body
+        if len(data) > self.max_disk_bytes:
+            return
+        path = self._path(primary, ".entry", key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self._path(primary, ".vary").write_text(json.dumps(sorted(entry.vary)))
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._disk_bytes -= self._disk_sizes.pop(path, 0)
+        self._disk_sizes[path] = len(data)
+        self._disk_bytes += len(data)
+        while self._disk_bytes > self.max_disk_bytes:
+            self._unlink(next(iter(self._disk_sizes)))
+
+    def _unlink(self, path: Path) -> None:
+        self._disk_bytes -= self._disk_sizes.pop(path, 0)
+        path.unlink(missing_ok=True)
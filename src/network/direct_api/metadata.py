@@ -26,10 +26,20 @@ class ResponseMetadata:
             if the date header is not available.
         retry_count: Number of retries attempted for this request (for future
             resilience integration).
+        cache_status: How the client's HttpCache produced the response
+            ("hit", "revalidated", "miss" or "bypass"), or None when the
+            client has no cache.
+        cache_hits: Cumulative fresh-entry hits of the client's cache.
+        cache_revalidations: Cumulative 304 revalidations of the client's cache.
+        cache_misses: Cumulative full network responses for cacheable requests.
     """
 
     timestamp: Optional[datetime] = None
     retry_count: int = 0
+    cache_status: Optional[str] = None
+    cache_hits: int = 0
+    cache_revalidations: int = 0
+    cache_misses: int = 0
 
 
 def extract_timestamp(response: httpx.Response) -> Optional[datetime]:
@@ -49,8 +49,12 @@ class PreparedRequest:
         parsed_url = httpx.URL(self._url)
         domain = parsed_url.host or ""
 
-        # Acquire rate limit token
-        await self._client._rate_limiter.acquire(domain)
+        # Acquire rate limit token (the cache does so itself, and only when
+        # the request actually goes to the network)
+        cache = self._client._cache
+        cache_status = None
+        if cache is None:
+            await self._client._rate_limiter.acquire(domain)
 
         # Prepare request kwargs
         request_kwargs = {
@@ -67,7 +71,14 @@ class PreparedRequest:
 
         # Make the request with error handling
         try:
-            response = await self._client._client.request(**request_kwargs)
+            if cache is None:
+                response = await self._client._client.request(**request_kwargs)
+            else:
+                response, cache_status = await cache.send(
+                    self._client._client.request,
+                    lambda: self._client._rate_limiter.acquire(domain),
+                    request_kwargs,
+                )
         except httpx.HTTPStatusError as e:
             # HTTP errors (4xx, 5xx) - extract status code
             status_code = e.response.status_code if e.response else None
@@ -98,8 +109,11 @@ class PreparedRequest:
                 retryable=Retryable.TERMINAL,
             )
 
-        # Attach metadata with timestamp
-        return get_response_with_metadata(response)
+        # Attach metadata with timestamp (and cache counters, if caching)
+        result = get_response_with_metadata(response)
+        if cache is not None:
+            cache.annotate(result[1], cache_status)
+        return result
 
     def _classify_error(self, status_code: int | None) -> Retryable:
         """Classify error as retryable or terminal based on HTTP status code.
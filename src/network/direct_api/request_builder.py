@@ -18,6 +18,7 @@ The caller decides how to handle the content:
 
 import json
 import os
+import time
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -155,8 +156,12 @@ class RequestBuilder:
         parsed_url = httpx.URL(self._url)
         domain = parsed_url.host or ""
 
-        # Acquire rate limit token
-        await self._client._rate_limiter.acquire(domain)
+        # Acquire rate limit token (the cache does so itself, and only when
+        # the request actually goes to the network)
+        cache = self._client._cache
+        cache_status = None
+        if cache is None:
+            await self._client._rate_limiter.acquire(domain)
 
         # Prepare request kwargs
         request_kwargs = {
@@ -175,11 +180,21 @@ class RequestBuilder:
             request_kwargs["content"] = self._body
 
         # Make the request with error handling
+        started = time.perf_counter()
         try:
-            response = await self._client._client.request(**request_kwargs)
+            if cache is None:
+                response = await self._client._client.request(**request_kwargs)
+            else:
+                response, cache_status = await cache.send(
+                    self._client._client.request,
+                    lambda: self._client._rate_limiter.acquire(domain),
+                    request_kwargs,
+                )
         except httpx.HTTPStatusError as e:
             # HTTP errors (4xx, 5xx) - extract status code
             status_code = e.response.status_code if e.response else None
+            if e.response is not None:
+                self._record_timing(e.response, started)
             return NetworkError(
                 module="direct_api",
                 operation=self._method.lower(),
@@ -207,11 +222,34 @@ class RequestBuilder:
                 retryable=Retryable.TERMINAL,
             )
 
+        if cache_status != "hit":
+            self._record_timing(response, started)
+
         # Log response with redaction
         self._log_response(response)
 
-        # Attach metadata with timestamp
-        return get_response_with_metadata(response)
+        # Attach metadata with timestamp (and cache counters, if caching)
+        result = get_response_with_metadata(response)
+        if cache is not None:
+            cache.annotate(result[1], cache_status)
+        return result
+
+    def _record_timing(self, response: httpx.Response, started: float) -> None:
+        """Hand the request's timing to the client's recorder, if it has one."""
+        recorder = self._client._recorder
+        if recorder is None:
+            return
+        try:
+            recorder.record_network(
+                self._method,
+                self._url,
+                response.status_code,
+                (time.perf_counter() - started) * 1000,
+                response_bytes=len(response.content),
+            )
+        except Exception:
+            # Telemetry must never fail a request
+            pass
 
     def _classify_error(self, status_code: int | None) -> Retryable:
         """Classify error as retryable or terminal based on HTTP status code.
@@ -65,6 +65,7 @@ from typing import Any, TypedDict
 import httpx
 
 from src.network.direct_api.client import AsyncHttpClient
+from src.network.direct_api.http_cache import HttpCache
 from src.network.direct_api.interfaces import AuthConfig
 from src.network.direct_api.metadata import ResponseMetadata
 from src.network.errors import NetworkError
@@ -107,6 +108,9 @@ class DirectApi:
         pretty: Whether to pretty-print JSON output (default: False)
         include_headers: Whether to include headers in output (default: False)
         verbose: Whether to enable verbose logging (default: False)
+        cache: Optional HttpCache shared by every request (default: None).
+            Survives re-entering the context manager, so polling loops keep
+            their entries and counters.
 
     Example:
         >>> api = DirectApi()
@@ -124,6 +128,7 @@ class DirectApi:
     pretty: bool = False
     include_headers: bool = False
     verbose: bool = False
+    cache: HttpCache | None = None
 
     # Internal client instance
     _client: AsyncHttpClient | None = field(default=None, init=False, repr=False)
@@ -168,6 +173,7 @@ class DirectApi:
             base_url=self.base_url,
             rate_limit=self.rate_limit,
             rate_capacity=self.rate_capacity,
+            cache=self.cache,
         )
         await self._client.__aenter__()
         return self
@@ -7,6 +7,7 @@ by the Scorewise Constitution for production resilience.
 
 import asyncio
 import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -17,6 +18,7 @@ from src.models.selector_models import (
     SelectorResult, ConfidenceMetrics, PerformanceTrend, TrendDirection
 )
 from src.observability.logger import get_logger, CorrelationContext
+from src.observability.quantiles import DEFAULT_PERCENTILES, QuantileSketch, WindowedQuantiles
 from src.utils.exceptions import PerformanceError
 
 
@@ -46,11 +48,26 @@ class MetricAggregates:
 
 
 class MetricsCollector:
-    """Collects and stores performance metrics."""
+    """
+    Collects and stores performance metrics.
     
-    def __init__(self, max_points: int = 10000):
+    Besides the last ``max_points`` raw points, every metric feeds a
+    lifetime ``QuantileSketch`` and per-window sketches (``sketch_window``
+    wide, the last ``sketch_retention`` windows), so percentiles cover every
+    sample ever recorded in constant memory.
+    """
+    
+    def __init__(self, max_points: int = 10000,
+                 sketch_window: timedelta = timedelta(minutes=5),
+                 sketch_retention: int = 288):
         self._max_points = max_points
         self._metrics: Dict[str, Dict[str, deque]] = defaultdict(lambda: defaultdict(deque))
+        self._sketch_window = sketch_window
+        self._sketch_retention = sketch_retention
+        self._lifetime: Dict[str, Dict[str, QuantileSketch]] = defaultdict(
+            lambda: defaultdict(QuantileSketch))
+        self._windowed: Dict[str, Dict[str, WindowedQuantiles]] = defaultdict(
+            lambda: defaultdict(lambda: WindowedQuantiles(sketch_window, sketch_retention)))
         self._logger = get_logger("metrics_collector")
     
     async def record_metric(self, selector_name: str, metric_type: str, 
@@ -71,6 +88,9 @@ class MetricsCollector:
             if len(selector_metrics) > self._max_points:
                 selector_metrics.popleft()
             
+            self._lifetime[selector_name][metric_type].add(value)
+            self._windowed[selector_name][metric_type].add(value, point.timestamp)
+            
             self._logger.debug(
                 "metric_recorded",
                 selector_name=selector_name,
@@ -93,13 +113,11 @@ class MetricsCollector:
             if selector_name not in self._metrics or metric_type not in self._metrics[selector_name]:
                 return []
             
+            # Points are appended in timestamp order: bisect instead of scanning
             metrics = self._metrics[selector_name][metric_type]
-            filtered_metrics = [
-                point for point in metrics
-                if time_range[0] <= point.timestamp <= time_range[1]
-            ]
-            
-            return filtered_metrics
+            lo = bisect_left(metrics, time_range[0], key=lambda p: p.timestamp)
+            hi = bisect_right(metrics, time_range[1], lo=lo, key=lambda p: p.timestamp)
+            return [metrics[i] for i in range(lo, hi)]
             
         except Exception as e:
             self._logger.error(
@@ -177,6 +195,28 @@ class MetricsCollector:
                 "aggregates", "calculation", f"Failed to calculate aggregates: {e}"
             )
     
+    def get_sketch(self, selector_name: str, metric_type: str,
+                   time_range: Optional[Tuple[datetime, datetime]] = None) -> QuantileSketch:
+        """
+        Quantile sketch of a metric: every sample ever recorded, or the windows
+        overlapping ``time_range`` (whole ``sketch_window`` granularity).
+        
+        The result is a copy; merge sketches from other collectors or processes
+        into it (``QuantileSketch.merge`` / ``from_dict``) for fleet-wide
+        percentiles.
+        """
+        if selector_name not in self._lifetime or metric_type not in self._lifetime[selector_name]:
+            return QuantileSketch()
+        if time_range is None:
+            return QuantileSketch().merge(self._lifetime[selector_name][metric_type])
+        return self._windowed[selector_name][metric_type].sketch(*time_range)
+    
+    def get_percentiles(self, selector_name: str, metric_type: str,
+                        time_range: Optional[Tuple[datetime, datetime]] = None,
+                        percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Estimated percentiles of a metric, e.g. ``{"p50": ..., "p95": ..., "p99": ...}``."""
+        return self.get_sketch(selector_name, metric_type, time_range).percentiles(percentiles)
+    
     def get_all_selectors(self) -> List[str]:
         """Get all selector names that have metrics."""
         return list(self._metrics.keys())
@@ -272,6 +312,9 @@ class PerformanceMonitor:
         self.collector = MetricsCollector()
         self._storage_path = Path("data/metrics")
         self._storage_path.mkdir(parents=True, exist_ok=True)
+        self._batch_stats: Dict[str, Any] = {
+            "batches": 0, "selectors": 0, "successes": 0, "total_resolution_time": 0.0
+        }
         
         self._logger.info("PerformanceMonitor initialized")
     
@@ -329,6 +372,28 @@ class PerformanceMonitor:
                 error=str(e)
             )
     
+    async def record_batch_performance(self, selector_count: int, total_resolution_time: float,
+                                       success_rate: float) -> None:
+        """Record the outcome of a batch resolution (kept apart from per-selector metrics)."""
+        stats = self._batch_stats
+        stats["batches"] += 1
+        stats["selectors"] += selector_count
+        stats["successes"] += round(success_rate * selector_count)
+        stats["total_resolution_time"] += total_resolution_time
+        
+        self._logger.debug(
+            "batch_recorded",
+            selector_count=selector_count,
+            total_resolution_time=total_resolution_time,
+            success_rate=success_rate
+        )
+    
+    def get_batch_summary(self) -> Dict[str, Any]:
+        """Totals over every recorded batch resolution."""
+        stats = dict(self._batch_stats)
+        stats["success_rate"] = stats["successes"] / stats["selectors"] if stats["selectors"] else 0.0
+        return stats
+    
     async def record_confidence_metrics(self, selector_name: str, confidence_score: float,
                                      resolution_time: float, validation_score: float,
                                      strategy_used: str, quality_passed: bool,
@@ -667,6 +732,8 @@ class PerformanceMonitor:
                     "success_rate": metrics.success_rate,
                     "avg_confidence": metrics.avg_confidence,
                     "avg_resolution_time": metrics.avg_resolution_time,
+                    "resolution_time_percentiles": self.collector.get_percentiles(
+                        selector_name, "resolution_time", time_range),
                     "confidence_trend": metrics.confidence_trend.value,
                     "min_confidence": metrics.min_confidence,
                     "max_confidence": metrics.max_confidence
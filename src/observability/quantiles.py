@@ -0,0 +1,248 @@
+"""
+Streaming quantile sketches for latency percentiles.
+
+``QuantileSketch`` is a merging t-digest: values are buffered, then folded into
+a bounded list of centroids whose size near the median is larger than at the
+tails, so p50/p95/p99 stay accurate while memory stays constant (fewer than
+``compression`` centroids; ~120 at the default, with p99 within about 1% on
+skewed latency data) no matter how many samples a long-running scraper
+records. Sketches merge exactly like their inputs would have, so per-window
+and per-process sketches can be combined, and ``to_dict``/``from_dict`` carry
+them between processes.
+
+``WindowedQuantiles`` keeps one sketch per fixed time window and answers
+percentile queries over any range of windows by merging them.
+"""
+
+import math
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_COMPRESSION = 200.0
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0)
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class QuantileSketch:
+    """Mergeable, constant-memory quantile estimator (merging t-digest)."""
+
+    __slots__ = ("compression", "_means", "_weights", "_buffer", "_buffer_limit",
+                 "count", "total", "min", "max")
+
+    def __init__(self, compression: float = DEFAULT_COMPRESSION):
+        if compression < 10:
+            raise ValueError("compression must be >= 10")
+        self.compression = float(compression)
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[Tuple[float, float]] = []
+        self._buffer_limit = int(5 * compression)
+        self.count = 0.0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def of(cls, values: Iterable[float], compression: float = DEFAULT_COMPRESSION) -> "QuantileSketch":
+        """Build a sketch from a batch of values."""
+        sketch = cls(compression)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Record ``value`` (``weight`` times)."""
+        if weight <= 0 or math.isnan(value):
+            return
+        value = float(value)
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.total += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold ``other`` into this sketch (``other`` is left unchanged); returns self."""
+        if other.count == 0:
+            return self
+        other._compress()
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimated value at quantile ``q`` (0..1); 0.0 for an empty sketch."""
+        if self.count == 0:
+            return 0.0
+        self._compress()
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        means, weights = self._means, self._weights
+        if len(means) == 1:
+            return means[0]
+
+        target = q * self.count
+        # Centroid i covers [cumulative, cumulative + weight); its mean sits at the middle
+        cumulative = 0.0
+        previous_center, previous_mean = 0.0, self.min
+        for mean, weight in zip(means, weights):
+            center = cumulative + weight / 2
+            if target < center:
+                if center == previous_center:
+                    return mean
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        if cumulative == previous_center:
+            return self.max
+        fraction = (target - previous_center) / (cumulative - previous_center)
+        return previous_mean + fraction * (self.max - previous_mean)
+
+    def percentile(self, p: float) -> float:
+        """Estimated value at percentile ``p`` (0..100)."""
+        return self.quantile(p / 100.0)
+
+    def percentiles(self, ps: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """``{"p50": ..., "p95": ..., "p99": ...}`` for ``ps``."""
+        return {f"p{p:g}": self.percentile(p) for p in ps}
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def centroid_count(self) -> int:
+        self._compress()
+        return len(self._means)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for merging in another process."""
+        self._compress()
+        return {
+            "compression": self.compression,
+            "means": list(self._means),
+            "weights": list(self._weights),
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch serialized with :meth:`to_dict`."""
+        sketch = cls(data.get("compression", DEFAULT_COMPRESSION))
+        sketch._means = [float(m) for m in data.get("means", [])]
+        sketch._weights = [float(w) for w in data.get("weights", [])]
+        sketch.count = float(data.get("count", sum(sketch._weights)))
+        sketch.total = float(data.get("total", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+    def _compress(self) -> None:
+        """Fold the buffer into the centroids under the k1 scale function."""
+        if not self._buffer:
+            return
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+        total = self.count
+        means: List[float] = []
+        weights: List[float] = []
+        k_scale = self.compression / (2 * math.pi)
+
+        def k(q: float) -> float:
+            return k_scale * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+        merged_weight = 0.0                  # weight of everything before the open centroid
+        k_left = k(0.0)
+        current_mean, current_weight = points[0]
+        for mean, weight in points[1:]:
+            proposed = current_weight + weight
+            if k((merged_weight + proposed) / total) - k_left <= 1.0:
+                current_mean += (mean - current_mean) * weight / proposed
+                current_weight = proposed
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                merged_weight += current_weight
+                k_left = k(merged_weight / total)
+                current_mean, current_weight = mean, weight
+        means.append(current_mean)
+        weights.append(current_weight)
+        self._means, self._weights = means, weights
+
+
+class WindowedQuantiles:
+    """One QuantileSketch per fixed time window, for a bounded number of windows."""
+
+    def __init__(self, window: timedelta = timedelta(minutes=1), retention: int = 60,
+                 compression: float = DEFAULT_COMPRESSION):
+        """
+        Args:
+            window: Width of each window
+            retention: Number of most recent windows kept; older ones are dropped
+            compression: Compression of every window's sketch
+        """
+        if window.total_seconds() <= 0:
+            raise ValueError("window must be positive")
+        if retention < 1:
+            raise ValueError("retention must be >= 1")
+        self.window = window
+        self.retention = retention
+        self.compression = compression
+        self._starts: List[datetime] = []         # sorted window starts
+        self._sketches: Dict[datetime, QuantileSketch] = {}
+
+    def window_start(self, timestamp: datetime) -> datetime:
+        """Start of the window containing ``timestamp`` (aligned to the Unix epoch)."""
+        epoch = _EPOCH if timestamp.tzinfo is None else _EPOCH_UTC
+        return timestamp - (timestamp - epoch) % self.window
+
+    def add(self, value: float, timestamp: datetime) -> None:
+        """Record ``value`` in the window containing ``timestamp``."""
+        self._sketch_for(self.window_start(timestamp)).add(value)
+
+    def merge_window(self, start: datetime, sketch: QuantileSketch) -> None:
+        """Fold a sketch (e.g. from another process) into the window starting at ``start``."""
+        self._sketch_for(self.window_start(start)).merge(sketch)
+
+    def sketch(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> QuantileSketch:
+        """Merged sketch of every window overlapping [start, end] (all windows by default)."""
+        merged = QuantileSketch(self.compression)
+        lo = 0 if start is None else bisect_left(self._starts, self.window_start(start))
+        for window_start in self._starts[lo:]:
+            if end is not None and window_start > end:
+                break
+            merged.merge(self._sketches[window_start])
+        return merged
+
+    def windows(self) -> List[Tuple[datetime, QuantileSketch]]:
+        return [(s, self._sketches[s]) for s in self._starts]
+
+    def _sketch_for(self, start: datetime) -> QuantileSketch:
+        sketch = self._sketches.get(start)
+        if sketch is None:
+            if self._starts and len(self._starts) >= self.retention and start < self._starts[0]:
+                return QuantileSketch(self.compression)       # older than retention: dropped
+            sketch = self._sketches[start] = QuantileSketch(self.compression)
+            index = bisect_left(self._starts, start)
+            self._starts.insert(index, start)
+            while len(self._starts) > self.retention:
+                del self._sketches[self._starts.pop(0)]
+        return sketch
@@ -3,6 +3,15 @@ Checkpoint Manager
 
 Manages checkpoint creation, loading, validation, and lifecycle management
 with JSON serialization, compression, encryption, and integrity validation.
+
+Checkpoints of a job form delta chains: a FULL checkpoint holds the whole
+job state, and each following INCREMENTAL checkpoint only the top-level keys
+of the progress/state/configuration/metrics sections that changed since the
+previous checkpoint (plus artifact changes). Every ``compaction_interval``
+deltas, or once the deltas outgrow ``compaction_ratio`` of the base, a new
+FULL checkpoint starts the next chain. Loading a delta replays the chain
+from its base. Sequence numbers come from a per-job counter file
+(``<job_id>.seq``) instead of a listing of the job's checkpoints.
 """
 
 import asyncio
@@ -10,7 +19,8 @@ import os
 import json
 import gzip
 import hashlib
-from typing import Dict, Any, Optional, List, Callable
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from cryptography.fernet import Fernet
@@ -32,6 +42,63 @@ from ..exceptions import (
 )
 
 
+# Sections of CheckpointData diffed key by key; "artifacts" is a list
+DELTA_SECTIONS = ("progress", "state", "configuration", "metrics")
+
+SEQUENCE_SUFFIX = ".seq"
+
+# Shared canonical encoder (json.dumps builds a new one per call with these options)
+_STATE_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'), default=str)
+
+
+@dataclass
+class DeltaChain:
+    """What the next delta of a job is computed against."""
+    base_id: str
+    base_size_bytes: int
+    last_id: str
+    digests: Dict[str, Dict[str, bytes]]
+    artifacts: List[str]
+    deltas: int = 0
+    delta_size_bytes: int = 0
+
+
+def encode_state(data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Canonical JSON text of every top-level key of each delta section."""
+    encoded = {}
+    for section in DELTA_SECTIONS:
+        values = data.get(section) or {}
+        encode = _STATE_ENCODER.encode
+        encoded[section] = {str(key): encode(value) for key, value in values.items()}
+    return encoded
+
+
+def digest_state(encoded: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, bytes]]:
+    """Short digests of ``encode_state`` output, kept to detect changed keys."""
+    return {
+        section: {
+            key: hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            for key, text in values.items()
+        }
+        for section, values in encoded.items()
+    }
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply one delta checkpoint's changes to a checkpoint data dict in place."""
+    for section, changes in delta.items():
+        if section == "artifacts":
+            if "replace" in changes:
+                state["artifacts"] = list(changes["replace"])
+            else:
+                state.setdefault("artifacts", []).extend(changes.get("append", []))
+            continue
+        values = state.setdefault(section, {})
+        values.update(changes.get("set", {}))
+        for key in changes.get("unset", []):
+            values.pop(key, None)
+
+
 class CheckpointManager(ICheckpointManager, IResilienceManager):
     """Manages checkpoint operations with serialization, compression, and encryption."""
     
@@ -54,6 +121,8 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
         
         self._initialized = False
         self._active_checkpoints: Dict[str, Checkpoint] = {}
+        self._chains: Dict[str, DeltaChain] = {}
+        self._sequences: Dict[str, int] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
     
     async def initialize(self) -> None:
@@ -123,15 +192,21 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
         self,
         job_id: str,
         data: Dict[str, Any],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        full: bool = False
     ) -> str:
         """
         Create a new checkpoint for the specified job.
         
+        Writes a delta against the job's previous checkpoint when the job
+        has a delta chain in this process and it is not due for compaction,
+        and a FULL checkpoint otherwise.
+        
         Args:
             job_id: Unique identifier for the scraping job
             data: Job state data to checkpoint
             metadata: Optional metadata about the checkpoint
+            full: Always write a FULL checkpoint
             
         Returns:
             Checkpoint ID if successful
@@ -154,11 +229,20 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             # Get configuration
             config = get_configuration()
             
+            # Encode once: the delta, the sizes and the next diff all use it
+            encoded = encode_state(data)
+            digests = digest_state(encoded)
+            artifacts = list(data.get("artifacts", []))
+            
+            chain = self._chains.get(job_id)
+            if full or not config.checkpoint.delta_enabled or self._needs_compaction(chain, config):
+                chain = None
+            
             # Create checkpoint
             checkpoint = Checkpoint(
                 job_id=job_id,
                 sequence_number=await self._get_next_sequence_number(job_id),
-                checkpoint_type=CheckpointType.FULL,
+                checkpoint_type=CheckpointType.INCREMENTAL if chain else CheckpointType.FULL,
                 compression=CheckpointCompression.GZIP,
                 encryption_enabled=config.checkpoint.encryption_enabled,
                 schema_version="1.0.0"
@@ -168,36 +252,48 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             if metadata:
                 checkpoint.update_metadata(**metadata)
             
-            # Set data
-            checkpoint.data = CheckpointData(
-                progress=data.get("progress", {}),
-                state=data.get("state", {}),
-                configuration=data.get("configuration", {}),
-                metrics=data.get("metrics", {}),
-                artifacts=data.get("artifacts", [])
-            )
-            
-            # Calculate checksum
-            checkpoint_data = checkpoint.data.to_dict()
-            checkpoint.checksum = calculate_checksum(checkpoint_data)
-            
-            # Serialize and compress data
-            serialized_data = self.serializer.serialize(
-                checkpoint_data,
-                checkpoint.schema_version,
-                checkpoint.compression == CheckpointCompression.GZIP
-            )
-            
-            # Encrypt if enabled
-            if checkpoint.encryption_enabled:
-                serialized_data = self.cipher.encrypt(serialized_data)
-            
-            # Calculate sizes
-            checkpoint.size_bytes = len(json.dumps(checkpoint_data).encode('utf-8'))
-            checkpoint.compressed_size_bytes = len(serialized_data)
-            
-            # Save to file
-            await self._save_checkpoint_to_file(checkpoint)
+            if chain:
+                # Delta: only what changed since the previous checkpoint
+                checkpoint.parent_checkpoint_id = chain.last_id
+                checkpoint.base_checkpoint_id = chain.base_id
+                checkpoint.delta, checkpoint.size_bytes = self._compute_delta(
+                    chain, encoded, digests, artifacts
+                )
+                checkpoint.checksum = calculate_checksum(checkpoint.delta)
+            else:
+                # Set data (decoded from the encoding, so later changes to
+                # the caller's objects do not leak into the checkpoint)
+                checkpoint.data = CheckpointData(
+                    artifacts=artifacts,
+                    **{
+                        section: {key: json.loads(text) for key, text in values.items()}
+                        for section, values in encoded.items()
+                    }
+                )
+                checkpoint.base_checkpoint_id = checkpoint.id
+                checkpoint.size_bytes = sum(
+                    len(text) for values in encoded.values() for text in values.values()
+                )
+                checkpoint.checksum = calculate_checksum(checkpoint.data.to_dict())
+            
+            # Save to file (serialized and compressed once)
+            checkpoint.compressed_size_bytes = await self._save_checkpoint_to_file(checkpoint)
+            
+            # Continue (or start) the job's delta chain from this checkpoint
+            if chain:
+                chain.last_id = checkpoint.id
+                chain.digests = digests
+                chain.artifacts = artifacts
+                chain.deltas += 1
+                chain.delta_size_bytes += checkpoint.size_bytes
+            else:
+                self._chains[job_id] = DeltaChain(
+                    base_id=checkpoint.id,
+                    base_size_bytes=checkpoint.size_bytes,
+                    last_id=checkpoint.id,
+                    digests=digests,
+                    artifacts=artifacts
+                )
             
             # Add to active checkpoints
             self._active_checkpoints[checkpoint.id] = checkpoint
@@ -212,6 +308,7 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                 job_id=job_id,
                 context={
                     "sequence_number": checkpoint.sequence_number,
+                    "checkpoint_type": checkpoint.checkpoint_type.value,
                     "size_bytes": checkpoint.size_bytes,
                     "compression": checkpoint.compression.value,
                     "encryption": checkpoint.encryption_enabled
@@ -227,6 +324,8 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                     "checkpoint_id": checkpoint.id,
                     "job_id": job_id,
                     "sequence_number": checkpoint.sequence_number,
+                    "checkpoint_type": checkpoint.checkpoint_type.value,
+                    "base_checkpoint_id": checkpoint.base_checkpoint_id,
                     "size_bytes": checkpoint.size_bytes,
                     "compression_ratio": checkpoint.get_compression_ratio()
                 },
@@ -262,6 +361,8 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             # Check active checkpoints first
             if checkpoint_id in self._active_checkpoints:
                 checkpoint = self._active_checkpoints[checkpoint_id]
+                if checkpoint.checkpoint_type == CheckpointType.INCREMENTAL:
+                    return await self._replay_chain(checkpoint)
                 if checkpoint.data:
                     return checkpoint.data.to_dict()
                 else:
@@ -279,6 +380,11 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             # Add to active checkpoints
             self._active_checkpoints[checkpoint_id] = checkpoint
             
+            if checkpoint.checkpoint_type == CheckpointType.INCREMENTAL:
+                state = await self._replay_chain(checkpoint)
+            else:
+                state = checkpoint.data.to_dict() if checkpoint.data else None
+            
             # Publish event
             await publish_checkpoint_event(
                 action="loaded",
@@ -304,7 +410,7 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                 component="checkpoint_manager"
             )
             
-            return checkpoint.data.to_dict() if checkpoint.data else None
+            return state
             
         except CheckpointCorruptionError:
             raise
@@ -330,22 +436,8 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             await self.initialize()
         
         try:
-            # Get all checkpoint files for the job
-            job_checkpoints = []
-            
-            # Check active checkpoints
-            for checkpoint in self._active_checkpoints.values():
-                if checkpoint.job_id == job_id:
-                    job_checkpoints.append(checkpoint)
-            
-            # Load from file system
-            checkpoint_files = list(self.storage_path.glob(f"{job_id}_*.json"))
-            for file_path in checkpoint_files:
-                checkpoint_id = file_path.stem
-                if checkpoint_id not in [cp.id for cp in job_checkpoints]:
-                    checkpoint = await self._load_checkpoint_from_file(checkpoint_id)
-                    if checkpoint:
-                        job_checkpoints.append(checkpoint)
+            # Active checkpoints and the job's checkpoint files
+            job_checkpoints = await self._job_checkpoints(job_id)
             
             # Sort by sequence number (descending)
             job_checkpoints.sort(key=lambda cp: cp.sequence_number, reverse=True)
@@ -394,6 +486,10 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
         """
         Delete a checkpoint.
         
+        A checkpoint that a later delta replays from (its parent) is kept:
+        deleting it would leave that delta unloadable. Delete the chain
+        newest first instead.
+        
         Args:
             checkpoint_id: Unique checkpoint identifier
             
@@ -404,10 +500,29 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             await self.initialize()
         
         try:
+            checkpoint = await self._get_checkpoint(checkpoint_id)
+            if checkpoint is not None:
+                dependents = [
+                    cp.id for cp in await self._job_checkpoints(checkpoint.job_id)
+                    if cp.parent_checkpoint_id == checkpoint_id
+                ]
+                if dependents:
+                    self.logger.warning(
+                        f"Checkpoint {checkpoint_id} not deleted: later deltas depend on it",
+                        event_type="checkpoint_delete_refused",
+                        correlation_id=get_correlation_id(),
+                        context={"checkpoint_id": checkpoint_id, "dependents": dependents},
+                        component="checkpoint_manager"
+                    )
+                    return False
+            
             # Remove from active checkpoints
-            if checkpoint_id in self._active_checkpoints:
-                checkpoint = self._active_checkpoints[checkpoint_id]
-                del self._active_checkpoints[checkpoint_id]
+            self._active_checkpoints.pop(checkpoint_id, None)
+            
+            # The next checkpoint of a job whose chain this belonged to is FULL
+            for job_id, chain in list(self._chains.items()):
+                if checkpoint_id in (chain.base_id, chain.last_id):
+                    del self._chains[job_id]
             
             # Delete file
             file_path = self.storage_path / f"{checkpoint_id}.json"
@@ -418,7 +533,7 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                 await publish_checkpoint_event(
                     action="deleted",
                     checkpoint_id=checkpoint_id,
-                    job_id=checkpoint.job_id if 'checkpoint' in locals() else "unknown",
+                    job_id=checkpoint.job_id if checkpoint else "unknown",
                     context={},
                     component="checkpoint_manager"
                 )
@@ -557,15 +672,7 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             cleaned_count = 0
             
             # Check active checkpoints
-            expired_ids = []
-            for checkpoint_id, checkpoint in self._active_checkpoints.items():
-                if checkpoint.is_expired():
-                    expired_ids.append(checkpoint_id)
-            
-            # Delete expired checkpoints
-            for checkpoint_id in expired_ids:
-                if await self.delete_checkpoint(checkpoint_id):
-                    cleaned_count += 1
+            expired = [cp for cp in self._active_checkpoints.values() if cp.is_expired()]
             
             # Check file system for expired checkpoints
             for file_path in self.storage_path.glob("*.json"):
@@ -574,11 +681,16 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                     if checkpoint_id not in self._active_checkpoints:
                         checkpoint = await self._load_checkpoint_from_file(checkpoint_id)
                         if checkpoint and checkpoint.is_expired():
-                            if await self.delete_checkpoint(checkpoint_id):
-                                cleaned_count += 1
+                            expired.append(checkpoint)
                 except Exception:
                     continue
             
+            # Newest first, so a chain's deltas go before what they replay from
+            expired.sort(key=lambda cp: cp.sequence_number, reverse=True)
+            for checkpoint in expired:
+                if await self.delete_checkpoint(checkpoint.id):
+                    cleaned_count += 1
+            
             if cleaned_count > 0:
                 self.logger.info(
                     f"Cleaned up {cleaned_count} expired checkpoints",
@@ -600,20 +712,24 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             )
             return 0
     
-    async def _save_checkpoint_to_file(self, checkpoint: Checkpoint) -> None:
-        """Save checkpoint to file."""
+    async def _save_checkpoint_to_file(self, checkpoint: Checkpoint) -> int:
+        """Save checkpoint to file atomically; returns the bytes written."""
         file_path = self.storage_path / f"{checkpoint.id}.json"
         
         # Prepare checkpoint data for saving
-        checkpoint_data = checkpoint.to_dict()
-        
-        # Save to file
-        self.file_serializer.save_to_file(
-            file_path,
-            checkpoint_data,
+        serialized = self.serializer.serialize(
+            checkpoint.to_dict(),
             checkpoint.schema_version,
             checkpoint.compression == CheckpointCompression.GZIP
         )
+        
+        # Save to file
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = file_path.with_suffix(".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(serialized)
+        os.replace(temp_path, file_path)
+        return len(serialized)
     
     async def _load_checkpoint_from_file(self, checkpoint_id: str) -> Optional[Checkpoint]:
         """Load checkpoint from file."""
@@ -630,15 +746,18 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
                 True  # Auto-detect compression
             )
             
-            # Decrypt if needed
-            if checkpoint_data.get("encryption_enabled", False):
+            # Decrypt if needed (encrypted payloads are stored as tokens)
+            if checkpoint_data.get("encryption_enabled", False) and isinstance(checkpoint_data.get("data"), str):
                 checkpoint_data["data"] = json.loads(
                     self.cipher.decrypt(
                         checkpoint_data["data"].encode('utf-8')
                     ).decode('utf-8')
                 )
             
-            return Checkpoint.from_dict(checkpoint_data)
+            checkpoint = Checkpoint.from_dict(checkpoint_data)
+            # The file size is only known after the checkpoint was serialized
+            checkpoint.compressed_size_bytes = checkpoint.compressed_size_bytes or file_path.stat().st_size
+            return checkpoint
             
         except Exception as e:
             self.logger.error(
@@ -657,6 +776,11 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
     async def _validate_checkpoint_integrity(self, checkpoint: Checkpoint) -> bool:
         """Validate checkpoint integrity."""
         try:
+            if checkpoint.checkpoint_type == CheckpointType.INCREMENTAL:
+                if checkpoint.delta is None or not checkpoint.checksum:
+                    return False
+                return calculate_checksum(checkpoint.delta) == checkpoint.checksum
+            
             if not checkpoint.data or not checkpoint.checksum:
                 return False
             
@@ -680,20 +804,130 @@ class CheckpointManager(ICheckpointManager, IResilienceManager):
             return False
     
     async def _get_next_sequence_number(self, job_id: str) -> int:
-        """Get next sequence number for a job."""
+        """Allocate the next sequence number from the job's persisted counter."""
+        sequence = self._sequences.get(job_id)
+        if sequence is None:
+            sequence = await self._read_sequence_counter(job_id)
+        sequence += 1
+        self._sequences[job_id] = sequence
+        
+        # Persist before the checkpoint is written, so numbers are never reused
+        counter_path = self.storage_path / f"{job_id}{SEQUENCE_SUFFIX}"
+        temp_path = counter_path.with_name(counter_path.name + ".tmp")
+        temp_path.write_text(str(sequence), encoding='utf-8')
+        os.replace(temp_path, counter_path)
+        return sequence
+    
+    async def _read_sequence_counter(self, job_id: str) -> int:
+        """Last sequence number allocated for a job (0 if none)."""
+        counter_path = self.storage_path / f"{job_id}{SEQUENCE_SUFFIX}"
         try:
-            # List existing checkpoints for the job
-            checkpoints = await self.list_checkpoints(job_id)
-            
-            if not checkpoints:
-                return 1
-            
-            # Find highest sequence number
-            max_sequence = max(cp.get("sequence_number", 0) for cp in checkpoints)
-            return max_sequence + 1
-            
-        except Exception:
-            return 1
+            return int(counter_path.read_text(encoding='utf-8').strip())
+        except (OSError, ValueError):
+            # No counter (first run after an upgrade, or a lost file): seed it
+            # once from the job's checkpoints, on disk included
+            return max(
+                (cp.sequence_number for cp in await self._job_checkpoints(job_id)),
+                default=0
+            )
+    
+    async def _job_checkpoints(self, job_id: str) -> List[Checkpoint]:
+        """Every checkpoint of a job, in memory or on disk.
+        
+        Files are named by checkpoint id alone, so each one is opened.
+        """
+        found = {cp.id: cp for cp in self._active_checkpoints.values() if cp.job_id == job_id}
+        for file_path in self.storage_path.glob("*.json"):
+            checkpoint_id = file_path.stem
+            if checkpoint_id in found or checkpoint_id in self._active_checkpoints:
+                continue
+            checkpoint = await self._load_checkpoint_from_file(checkpoint_id)
+            if checkpoint and checkpoint.job_id == job_id:
+                found[checkpoint_id] = checkpoint
+        return list(found.values())
+    
+    @staticmethod
+    def _needs_compaction(chain: Optional[DeltaChain], config: Any) -> bool:
+        """Whether the next checkpoint must be FULL instead of another delta."""
+        if chain is None:
+            return True
+        if chain.deltas >= config.checkpoint.compaction_interval:
+            return True
+        return chain.delta_size_bytes > chain.base_size_bytes * config.checkpoint.compaction_ratio
+    
+    @staticmethod
+    def _compute_delta(
+        chain: DeltaChain,
+        encoded: Dict[str, Dict[str, str]],
+        digests: Dict[str, Dict[str, bytes]],
+        artifacts: List[str]
+    ) -> Tuple[Dict[str, Any], int]:
+        """Changes from the chain's last checkpoint; returns (delta, size in bytes)."""
+        delta: Dict[str, Any] = {}
+        size = 0
+        for section, values in encoded.items():
+            previous = chain.digests.get(section, {})
+            current = digests[section]
+            changed = {key: text for key, text in values.items() if previous.get(key) != current[key]}
+            removed = [key for key in previous if key not in current]
+            if changed or removed:
+                delta[section] = {
+                    "set": {key: json.loads(text) for key, text in changed.items()},
+                    "unset": removed
+                }
+                size += sum(len(key) + len(text) for key, text in changed.items())
+                size += sum(len(key) for key in removed)
+        
+        if artifacts != chain.artifacts:
+            previous_count = len(chain.artifacts)
+            if artifacts[:previous_count] == chain.artifacts:
+                delta["artifacts"] = {"append": artifacts[previous_count:]}
+            else:
+                delta["artifacts"] = {"replace": artifacts}
+            size += len(json.dumps(delta["artifacts"]))
+        return delta, size
+    
+    async def _get_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
+        """Checkpoint from memory or, failing that, from its file."""
+        checkpoint = self._active_checkpoints.get(checkpoint_id)
+        if checkpoint is None:
+            checkpoint = await self._load_checkpoint_from_file(checkpoint_id)
+            if checkpoint:
+                self._active_checkpoints[checkpoint_id] = checkpoint
+        return checkpoint
+    
+    async def _replay_chain(self, checkpoint: Checkpoint) -> Dict[str, Any]:
+        """Rebuild the data of a delta checkpoint: its FULL base plus every delta up to it."""
+        deltas = [checkpoint]
+        current = checkpoint
+        while current.checkpoint_type == CheckpointType.INCREMENTAL:
+            parent_id = current.parent_checkpoint_id
+            parent = await self._get_checkpoint(parent_id) if parent_id else None
+            if parent is None:
+                raise CheckpointCorruptionError(
+                    f"Delta chain of {checkpoint.id} is broken: parent {parent_id} not found"
+                )
+            if not await self._validate_checkpoint_integrity(parent):
+                raise CheckpointCorruptionError(
+                    f"Delta chain of {checkpoint.id} is broken: {parent_id} failed validation"
+                )
+            if parent.checkpoint_type == CheckpointType.INCREMENTAL:
+                if len(deltas) > checkpoint.sequence_number:
+                    raise CheckpointCorruptionError(f"Delta chain of {checkpoint.id} does not end")
+                deltas.append(parent)
+            current = parent
+        
+        if current.id != checkpoint.base_checkpoint_id:
+            raise CheckpointCorruptionError(
+                f"Delta chain of {checkpoint.id} ends at {current.id}, "
+                f"expected base {checkpoint.base_checkpoint_id}"
+            )
+        
+        # Replay onto a copy of the base, oldest delta first
+        state = json.loads(json.dumps(current.data.to_dict(), default=str))
+        for delta_checkpoint in reversed(deltas):
+            apply_delta(state, delta_checkpoint.delta)
+        return state
     
     async def _cleanup_loop(self) -> None:
         """Background cleanup loop for expired checkpoints."""
@@ -22,6 +22,9 @@ class CheckpointConfiguration:
     encryption_enabled: bool = True  # Enable encryption for sensitive data
     storage_path: str = "./data/checkpoints"  # Checkpoint storage directory
     validation_enabled: bool = True  # Enable checksum validation
+    delta_enabled: bool = True  # Write delta checkpoints between full ones
+    compaction_interval: int = 20  # Deltas written before the next full checkpoint
+    compaction_ratio: float = 0.5  # Full checkpoint once deltas exceed this fraction of the base size
 
 
 @dataclass
@@ -143,6 +146,9 @@ class ConfigurationLoader:
                 'encryption_enabled': config.checkpoint.encryption_enabled,
                 'storage_path': config.checkpoint.storage_path,
                 'validation_enabled': config.checkpoint.validation_enabled,
+                'delta_enabled': config.checkpoint.delta_enabled,
+                'compaction_interval': config.checkpoint.compaction_interval,
+                'compaction_ratio': config.checkpoint.compaction_ratio,
             },
             'retry': {
                 'enabled': config.retry.enabled,
@@ -129,6 +129,7 @@ class Checkpoint:
     # Data and metadata
     metadata: Optional[CheckpointMetadata] = None
     data: Optional[CheckpointData] = None
+    delta: Optional[Dict[str, Any]] = None  # Changes since the parent (INCREMENTAL only)
     
     # Integrity and validation
     checksum: str = ""
@@ -137,6 +138,7 @@ class Checkpoint:
     
     # Lifecycle management
     parent_checkpoint_id: Optional[str] = None
+    base_checkpoint_id: Optional[str] = None  # Full checkpoint a delta chain starts from
     child_checkpoint_ids: List[str] = field(default_factory=list)
     expires_at: Optional[datetime] = None
     
@@ -188,10 +190,12 @@ class Checkpoint:
             "schema_version": self.schema_version,
             "metadata": self.metadata.to_dict() if self.metadata else None,
             "data": self.data.to_dict() if self.data else None,
+            "delta": self.delta,
             "checksum": self.checksum,
             "size_bytes": self.size_bytes,
             "compressed_size_bytes": self.compressed_size_bytes,
             "parent_checkpoint_id": self.parent_checkpoint_id,
+            "base_checkpoint_id": self.base_checkpoint_id,
             "child_checkpoint_ids": self.child_checkpoint_ids,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
             "description": self.description,
@@ -236,10 +240,12 @@ class Checkpoint:
             schema_version=data.get("schema_version", "1.0.0"),
             metadata=metadata,
             data=checkpoint_data,
+            delta=data.get("delta"),
             checksum=data.get("checksum", ""),
             size_bytes=data.get("size_bytes", 0),
             compressed_size_bytes=data.get("compressed_size_bytes", 0),
             parent_checkpoint_id=data.get("parent_checkpoint_id"),
+            base_checkpoint_id=data.get("base_checkpoint_id"),
             child_checkpoint_ids=data.get("child_checkpoint_ids", []),
             expires_at=expires_at,
             description=data.get("description", ""),
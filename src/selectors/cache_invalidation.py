@@ -6,8 +6,10 @@ DOM state changes, navigation events, and context transitions.
 """
 
 import asyncio
+import inspect
 import logging
 import re
+import weakref
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Any, Callable
 from dataclasses import dataclass, field
@@ -44,9 +46,9 @@ class InvalidationRule:
 @dataclass
 class InvalidationEvent:
     """Represents a cache invalidation event."""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
     rule_name: str
     strategy: InvalidationStrategy
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     keys_invalidated: List[str] = field(default_factory=list)
     keys_affected: int = 0
     reason: str = ""
@@ -752,3 +754,72 @@ def get_invalidation_manager(cache_id: str = "default") -> CacheInvalidationMana
         logger.info(f"Created invalidation manager for cache: {cache_id}")
     
     return _invalidation_managers[cache_id]
+
+
+# Selector definition invalidation
+#
+# Caches derived from selector *definitions* (e.g. the engine's memoized
+# validation results) are keyed by content hash, so a changed definition never
+# hits a stale entry; these listeners let them drop superseded entries when the
+# YAML is reloaded instead of growing without bound.
+_definition_listeners: List[Any] = []  # callables, or weak refs to bound methods
+
+
+def _listener_ref(callback: Callable[[Optional[List[str]]], None]) -> Any:
+    # Bound methods are held weakly so registering does not keep an engine alive
+    return weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+
+
+def _resolve_listener(ref: Any) -> Optional[Callable[[Optional[List[str]]], None]]:
+    return ref() if isinstance(ref, weakref.WeakMethod) else ref
+
+
+def register_definition_listener(callback: Callable[[Optional[List[str]]], None]) -> None:
+    """
+    Register a callback run when selector definitions are invalidated.
+    
+    Args:
+        callback: Called with the invalidated selector names, or None for all
+    """
+    if callback not in [_resolve_listener(ref) for ref in _definition_listeners]:
+        _definition_listeners.append(_listener_ref(callback))
+
+
+def unregister_definition_listener(callback: Callable[[Optional[List[str]]], None]) -> None:
+    """Remove a callback added with register_definition_listener."""
+    _definition_listeners[:] = [
+        ref for ref in _definition_listeners if _resolve_listener(ref) != callback
+    ]
+
+
+def invalidate_selector_definitions(selector_names: Optional[List[str]] = None,
+                                    reason: str = "") -> int:
+    """
+    Notify definition caches that selectors changed.
+    
+    Args:
+        selector_names: Changed selector names, or None when all may have changed
+        reason: Why, for the log
+        
+    Returns:
+        int: Number of listeners notified
+    """
+    names = list(selector_names) if selector_names is not None else None
+    notified = 0
+    for ref in list(_definition_listeners):
+        callback = _resolve_listener(ref)
+        if callback is None:
+            _definition_listeners.remove(ref)
+            continue
+        try:
+            callback(names)
+            notified += 1
+        except Exception as e:
+            logger.error(f"Selector definition invalidation listener failed: {e}")
+    
+    logger.debug(
+        f"Invalidated selector definitions "
+        f"({'all' if names is None else len(names)}; {reason or 'no reason given'}), "
+        f"{notified} listener(s)"
+    )
+    return notified
@@ -6,21 +6,27 @@ context-aware scoping, and integration with all strategy patterns as specified i
 """
 
 import asyncio
+import contextvars
+import hashlib
+import json
+import random
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from src.models.selector_models import (
-    SemanticSelector, SelectorResult, StrategyPattern, ValidationRule,
+    SemanticSelector, SelectorResult, StrategyPattern, StrategyType, ValidationRule,
     ConfidenceMetrics, SnapshotType, DOMSnapshot, SnapshotMetadata
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import StrategyFactory
+from src.selectors.strategies.snapshot import first_match_handles, snapshot_first_matches
 from src.selectors.confidence.thresholds import get_threshold_manager
 from src.selectors.validation import get_validation_engine
 from src.selectors.quality.control import get_quality_control_manager
 from src.selectors.interfaces import ISelectorEngine, IStrategyPattern
 from src.selectors.registry import get_selector_registry
+from src.selectors.cache_invalidation import register_definition_listener
 from src.observability.logger import get_logger, CorrelationContext
 from src.observability.events import publish_selector_resolved, publish_selector_failed
 from src.observability.metrics import get_performance_monitor
@@ -32,6 +38,12 @@ from src.utils.exceptions import (
 from src.config.settings import get_config
 
 
+# Set inside background quality evaluations, whose own resolutions are not sampled
+_in_quality_evaluation: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "in_quality_evaluation", default=False
+)
+
+
 @dataclass
 class ResolutionAttempt:
     """Information about a single resolution attempt."""
@@ -74,6 +86,18 @@ class SelectorEngine(ISelectorEngine):
         # Configuration
         self._config = get_config()
         
+        # Memoized validate_selector results, keyed by selector content hash
+        self._validation_cache: Dict[str, List[str]] = {}
+        self._validation_keys: Dict[str, str] = {}  # selector name -> current hash
+        self._validation_cache_hits = 0
+        self._validation_cache_misses = 0
+        register_definition_listener(self._on_definitions_invalidated)
+        
+        # Sampled, asynchronous quality-gate evaluation
+        self._quality_sample_rate = self._config.selector_engine.quality_sample_rate
+        self._quality_tasks: Set[asyncio.Task] = set()
+        self._quality_stats = {"sampled": 0, "skipped": 0, "completed": 0, "failed": 0}
+        
         # Lifecycle hooks - Story 7.4: Registration Automation
         self._hooks: Dict[str, List[Callable]] = {
             self.HOOK_EVENT_INIT: [],
@@ -220,51 +244,9 @@ class SelectorEngine(ISelectorEngine):
             # Update metrics
             await self._performance_monitor.record_resolution(result)
             
-            # Quality control evaluation
+            # Quality control evaluation: sampled, off the hot path
             if result.success:
-                try:
-                    # Determine quality gate based on environment
-                    gate_name = self._determine_quality_gate(context)
-                    
-                    # Create a mock selector for quality evaluation
-                    quality_selector = SemanticSelector(
-                        name=selector_name,
-                        description=f"Quality evaluation for {selector_name}",
-                        context="quality_check",
-                        strategies=selector.strategies,
-                        validation_rules=selector.validation_rules,
-                        confidence_threshold=selector.confidence_threshold
-                    )
-                    
-                    # Evaluate quality
-                    quality_result = await self._quality_control_manager.evaluate_quality(
-                        quality_selector, context, gate_name
-                    )
-                    
-                    # Log quality result
-                    self._logger.info(
-                        "quality_evaluation_completed",
-                        selector_name=selector_name,
-                        gate_name=gate_name,
-                        quality_passed=quality_result.passed,
-                        confidence_score=quality_result.confidence_score,
-                        violations=len(quality_result.violations)
-                    )
-                    
-                    # Add quality metadata to result
-                    if hasattr(result, 'metadata'):
-                        result.metadata['quality_passed'] = quality_result.passed
-                        result.metadata['quality_confidence'] = quality_result.confidence_score
-                        result.metadata['quality_violations'] = len(quality_result.violations)
-                        result.metadata['quality_gate'] = gate_name
-                    
-                except Exception as e:
-                    # Log quality evaluation error but don't fail the resolution
-                    self._logger.warning(
-                        "quality_evaluation_failed",
-                        selector_name=selector_name,
-                        error=str(e)
-                    )
+                self._schedule_quality_evaluation(selector, context)
             
             # Publish events
             if result.success:
@@ -311,14 +293,18 @@ class SelectorEngine(ISelectorEngine):
     
     async def resolve_batch(self, selector_names: List[str], context: DOMContext) -> List[SelectorResult]:
         """
-        Resolve multiple selectors in parallel.
+        Resolve multiple selectors with one in-page probe.
+        
+        The primary (lowest priority number) CSS/XPath strategy of every
+        selector is evaluated in a single script; only selectors it misses go
+        through the full per-selector ``resolve`` fallback chain, concurrently.
         
         Args:
             selector_names: List of selector names
             context: DOM context for resolution
             
         Returns:
-            List of selector results
+            List of selector results, in input order
         """
         # Set correlation context
         correlation_id = CorrelationContext.get_correlation_id()
@@ -327,6 +313,7 @@ class SelectorEngine(ISelectorEngine):
         
         try:
             # Validate all selectors first
+            selectors = []
             for selector_name in selector_names:
                 selector = self.get_selector(selector_name)
                 if not selector:
@@ -335,47 +322,51 @@ class SelectorEngine(ISelectorEngine):
                 validation_issues = await self.validate_selector(selector)
                 if validation_issues:
                     raise ValidationError(f"Selector '{selector_name}' validation failed: {validation_issues}")
+                selectors.append(selector)
             
-            # Resolve selectors in parallel
-            tasks = []
-            for selector_name in selector_names:
-                task = asyncio.create_task(
-                    self.resolve(selector_name, context)
+            # One script evaluation for every primary strategy
+            final_results: List[Optional[SelectorResult]] = await self._resolve_batch_primary(
+                selectors, context
+            )
+            
+            # Fall back per selector, in parallel, only for the misses
+            misses = [i for i, result in enumerate(final_results) if result is None]
+            if misses:
+                fallback = await asyncio.gather(
+                    *(self.resolve(selector_names[i], context) for i in misses),
+                    return_exceptions=True
                 )
-                tasks.append(task)
-            
-            # Wait for all resolutions to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            final_results = []
-            for i, result in results:
-                if isinstance(result, Exception):
-                    # Create failure result for exceptions
-                    selector_name = selector_names[i]
-                    error = result
-                    failure_result = SelectorResult(
-                        selector_name=selector_name,
-                        strategy_used="none",
-                        element_info=None,
-                        confidence_score=0.0,
-                        resolution_time=0.0,
-                        validation_results=[],
-                        success=False,
-                        timestamp=datetime.utcnow(),
-                        failure_reason=str(error)
-                    )
-                    final_results.append(failure_result)
-                else:
-                    final_results.append(result)
+                for i, result in zip(misses, fallback):
+                    if isinstance(result, Exception):
+                        # Create failure result for exceptions
+                        result = SelectorResult(
+                            selector_name=selector_names[i],
+                            strategy_used="none",
+                            element_info=None,
+                            confidence_score=0.0,
+                            resolution_time=0.0,
+                            validation_results=[],
+                            success=False,
+                            timestamp=datetime.utcnow(),
+                            failure_reason=str(result)
+                        )
+                    final_results[i] = result
             
-            # Update batch metrics
-            await self._performance_monitor.record_batch_performance(
-                len(selector_names), 
-                sum(r.resolution_time for r in final_results),
-                sum(1 for r in final_results if r.success) / len(final_results)
+            self._logger.debug(
+                "batch_resolution_completed",
+                selector_count=len(selector_names),
+                primary_hits=len(selector_names) - len(misses),
+                fallbacks=len(misses)
             )
             
+            # Update batch metrics
+            if final_results:
+                await self._performance_monitor.record_batch_performance(
+                    len(selector_names), 
+                    sum(r.resolution_time for r in final_results),
+                    sum(1 for r in final_results if r.success) / len(final_results)
+                )
+            
             return final_results
             
         except Exception as e:
@@ -545,7 +536,60 @@ class SelectorEngine(ISelectorEngine):
             return all_selectors
     
     async def validate_selector(self, selector: SemanticSelector) -> List[str]:
-        """Validate selector definition, return list of issues."""
+        """
+        Validate selector definition, return list of issues.
+        
+        Results are memoized by selector content hash, so an unchanged
+        definition is validated once; YAML reloads drop superseded entries
+        through ``cache_invalidation.invalidate_selector_definitions``.
+        """
+        key = self._selector_content_hash(selector)
+        issues = self._validation_cache.get(key)
+        if issues is not None:
+            self._validation_cache_hits += 1
+            return list(issues)
+        
+        self._validation_cache_misses += 1
+        issues = self._validate_selector_definition(selector)
+        previous = self._validation_keys.get(selector.name)
+        if previous is not None and previous != key:
+            self._validation_cache.pop(previous, None)
+        self._validation_cache[key] = issues
+        self._validation_keys[selector.name] = key
+        return list(issues)
+    
+    @staticmethod
+    def _selector_content_hash(selector: SemanticSelector) -> str:
+        """Stable hash of everything validate_selector looks at."""
+        content = {
+            "name": selector.name,
+            "context": selector.context,
+            "confidence_threshold": selector.confidence_threshold,
+            "strategies": [
+                [s.id, getattr(s.type, "value", s.type), s.priority, s.config, s.is_active]
+                for s in selector.strategies
+            ],
+            "validation_rules": [
+                [getattr(r.type, "value", r.type), r.pattern, r.required, r.weight]
+                for r in selector.validation_rules
+            ],
+        }
+        encoded = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()
+    
+    def _on_definitions_invalidated(self, selector_names: Optional[List[str]]) -> None:
+        """Drop memoized validation for reloaded selector definitions."""
+        if selector_names is None:
+            self._validation_cache.clear()
+            self._validation_keys.clear()
+            return
+        for name in selector_names:
+            key = self._validation_keys.pop(name, None)
+            if key is not None:
+                self._validation_cache.pop(key, None)
+    
+    def _validate_selector_definition(self, selector: SemanticSelector) -> List[str]:
+        """Uncached body of validate_selector."""
         issues = []
         
         # Basic validation
@@ -714,9 +758,19 @@ class SelectorEngine(ISelectorEngine):
                 "total_selectors": total_selectors,
                 "registered_selectors": registered_selectors,
                 "engine_type": "SelectorEngine",
-                "strategies_loaded": len(self._strategy_factory.list_strategies()),
+                "strategies_loaded": len(self._strategies),
                 "performance_monitor_active": self._performance_monitor is not None,
-                "validation_engine_active": self._validation_engine is not None
+                "validation_engine_active": self._validation_engine is not None,
+                "validation_cache": {
+                    "hits": self._validation_cache_hits,
+                    "misses": self._validation_cache_misses,
+                    "entries": len(self._validation_cache)
+                },
+                "quality_evaluation": {
+                    "sample_rate": self._quality_sample_rate,
+                    "in_flight": len(self._quality_tasks),
+                    **self._quality_stats
+                }
             }
             
             # Add performance metrics if available
@@ -823,6 +877,145 @@ class SelectorEngine(ISelectorEngine):
         
         return False
     
+    def _schedule_quality_evaluation(self, selector: SemanticSelector, context: DOMContext) -> None:
+        """
+        Queue a quality-gate evaluation for a sampled share of resolutions.
+        
+        Evaluation re-resolves the selector, so it runs as a background task
+        after the result has been returned, and resolutions made on its behalf
+        are never themselves sampled.
+        """
+        if _in_quality_evaluation.get():
+            return
+        if self._quality_sample_rate <= 0.0 or random.random() >= self._quality_sample_rate:
+            self._quality_stats["skipped"] += 1
+            return
+        
+        self._quality_stats["sampled"] += 1
+        task = asyncio.create_task(self._evaluate_quality(selector, context))
+        self._quality_tasks.add(task)
+        task.add_done_callback(self._quality_tasks.discard)
+    
+    async def _evaluate_quality(self, selector: SemanticSelector, context: DOMContext) -> None:
+        """Background body of a sampled quality evaluation."""
+        _in_quality_evaluation.set(True)
+        try:
+            # Determine quality gate based on environment
+            gate_name = self._determine_quality_gate(context)
+            
+            quality_result = await self._quality_control_manager.evaluate_quality(
+                selector, context, gate_name
+            )
+            self._quality_stats["completed"] += 1
+            
+            # Log quality result
+            self._logger.info(
+                "quality_evaluation_completed",
+                selector_name=selector.name,
+                gate_name=gate_name,
+                quality_passed=quality_result.passed,
+                confidence_score=quality_result.confidence_score,
+                violations=len(quality_result.violations)
+            )
+            
+        except Exception as e:
+            # Log quality evaluation error; the resolution has already returned
+            self._quality_stats["failed"] += 1
+            self._logger.warning(
+                "quality_evaluation_failed",
+                selector_name=selector.name,
+                error=str(e)
+            )
+    
+    async def drain_quality_evaluations(self) -> None:
+        """Wait for in-flight background quality evaluations to finish."""
+        while self._quality_tasks:
+            await asyncio.gather(*list(self._quality_tasks), return_exceptions=True)
+    
+    async def _resolve_batch_primary(self, selectors: List[SemanticSelector],
+                                     context: DOMContext) -> List[Optional[SelectorResult]]:
+        """
+        Probe the primary strategy of each selector in a single page evaluation.
+        
+        Only CSS and XPath primaries are probed: they report a fixed confidence
+        of 1.0, so a match in the page is the same outcome ``resolve`` would
+        reach. Text/attribute/role strategies score candidates against each
+        other and go through the normal fallback path instead.
+        
+        Returns:
+            One entry per selector; ``None`` where the selector must fall back.
+        """
+        results: List[Optional[SelectorResult]] = [None] * len(selectors)
+        page = context.page
+        if page is None:
+            return results
+        
+        probes: List[Tuple[str, str]] = []
+        probed: List[Tuple[int, StrategyPattern]] = []
+        for i, selector in enumerate(selectors):
+            strategies = [s for s in selector.get_strategies_by_priority() if s.is_active]
+            if not strategies:
+                continue
+            primary = strategies[0]
+            query = (primary.config or {}).get("selector")
+            if primary.type not in (StrategyType.CSS, StrategyType.XPATH) or not query:
+                continue
+            probes.append(("xpath" if primary.type == StrategyType.XPATH else "css", query))
+            probed.append((i, primary))
+        if not probes:
+            return results
+        
+        start_time = datetime.utcnow()
+        try:
+            snapshots = await snapshot_first_matches(page, probes)
+            hits = [n for n, snapshot in enumerate(snapshots) if snapshot is not None]
+            handles = await first_match_handles(page, [probes[n] for n in hits]) if hits else []
+        except Exception as e:
+            self._logger.warning(
+                "batch_probe_failed",
+                selector_count=len(probes),
+                error=str(e)
+            )
+            return results
+        # The probe's cost is shared by every selector it answered (seconds,
+        # like the strategies' own results)
+        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        per_selector = elapsed / max(1, len(hits))
+        
+        for n, handle in zip(hits, handles):
+            i, strategy = probed[n]
+            kind, query = probes[n]
+            selector = selectors[i]
+            if handle is None:
+                continue
+            snapshot = snapshots[n]
+            snapshot.element = handle
+            result = SelectorResult(
+                selector_name=selector.name,
+                strategy_used=strategy.id,
+                element_info=snapshot.to_element_info(
+                    dom_path=f"xpath:{query}" if kind == "xpath" else query,
+                    rendered=True
+                ),
+                confidence_score=1.0,
+                resolution_time=per_selector,
+                validation_results=[],
+                success=True,
+                timestamp=datetime.utcnow()
+            )
+            await self._performance_monitor.record_resolution(result)
+            await publish_selector_resolved(
+                selector_name=selector.name,
+                strategy=result.strategy_used,
+                confidence=result.confidence_score,
+                resolution_time=result.resolution_time,
+                correlation_id=CorrelationContext.get_correlation_id()
+            )
+            self._log_resolution_completion(selector.name, result)
+            results[i] = result
+        
+        return results
+    
     async def _resolve_with_strategies(self, selector: SemanticSelector, 
                                    context: DOMContext, 
                                    attempt: ResolutionAttempt) -> SelectorResult:
@@ -11,6 +11,14 @@ from .text_anchor import TextAnchorStrategy
 from .attribute_match import AttributeMatchStrategy
 from .dom_relationship import DOMRelationshipStrategy
 from .role_based import RoleBasedStrategy
+from .snapshot import (
+    ElementSnapshot,
+    first_match_handles,
+    snapshot_element,
+    snapshot_elements,
+    snapshot_first_matches,
+    snapshot_selector,
+)
 from .converter import (
     LegacyStrategy,
     LegacyStrategyType,
@@ -29,6 +37,13 @@ __all__ = [
     "AttributeMatchStrategy",
     "DOMRelationshipStrategy",
     "RoleBasedStrategy",
+    # Element snapshot primitive
+    "ElementSnapshot",
+    "first_match_handles",
+    "snapshot_element",
+    "snapshot_elements",
+    "snapshot_first_matches",
+    "snapshot_selector",
     # Converter exports
     "LegacyStrategy",
     "LegacyStrategyType",
@@ -15,6 +15,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import BaseStrategyPattern
+from src.selectors.strategies.snapshot import ElementSnapshot, snapshot_elements
 from src.utils.exceptions import StrategyExecutionError
 
 
@@ -74,18 +75,18 @@ class AttributeMatchStrategy(BaseStrategyPattern):
                 )
             
             # Find element using attribute matching
-            element = await self._find_element_by_attribute(
+            snapshot = await self._find_element_by_attribute(
                 context, attribute, value_pattern, element_tag, case_sensitive
             )
             
-            if not element:
+            if not snapshot:
                 return self._create_failure_result(
                     selector.name, f"No element found with {attribute}='{value_pattern}'",
                     datetime.utcnow() - start_time
                 )
             
-            # Extract element information
-            element_info = await self._extract_element_info(element)
+            # Element information was collected with the search
+            element_info = snapshot.to_element_info(strip_text=True)
             
             # Calculate confidence
             validation_results = await self._validate_element_content(element_info, selector.validation_rules)
@@ -166,7 +167,7 @@ class AttributeMatchStrategy(BaseStrategyPattern):
                                          attribute: str,
                                          value_pattern: str,
                                          element_tag: Optional[str] = None,
-                                         case_sensitive: bool = False) -> Optional[Any]:
+                                         case_sensitive: bool = False) -> Optional[ElementSnapshot]:
         """Find element by attribute matching."""
         try:
             # Build CSS selector
@@ -175,38 +176,38 @@ class AttributeMatchStrategy(BaseStrategyPattern):
             else:
                 base_selector = "*"
             
-            # Find all elements with the specified attribute
+            # Find all elements with the specified attribute and snapshot
+            # them (attributes, visibility, ...) in one evaluate
             elements = await context.page.query_selector_all(f"{base_selector}[{attribute}]")
+            snapshots = await snapshot_elements(
+                context.page, elements, all_attributes=True, dom_path=True
+            )
             
-            best_element = None
+            best_snapshot = None
             best_score = 0.0
             
             use_regex = self._config.get("use_regex", False)
             
-            for element in elements:
-                try:
-                    # Get attribute value
-                    attr_value = await element.get_attribute(attribute)
-                    if attr_value is None:
-                        continue
-                    
-                    # Check if attribute value matches pattern
-                    match_score = self._calculate_attribute_match_score(
-                        attr_value, value_pattern, case_sensitive, use_regex
-                    )
-                    
-                    if match_score > 0:
-                        # Validate element is usable
-                        if await self._validate_element_found(element):
-                            # Update best match
-                            if match_score > best_score:
-                                best_score = match_score
-                                best_element = element
+            for snapshot in snapshots:
+                if snapshot is None:
+                    continue
+                
+                # Get attribute value
+                attr_value = snapshot.get_attribute(attribute)
+                if attr_value is None:
+                    continue
+                
+                # Check if attribute value matches pattern
+                match_score = self._calculate_attribute_match_score(
+                    attr_value, value_pattern, case_sensitive, use_regex
+                )
                 
-                except Exception:
-                    continue  # Skip elements that can't be evaluated
+                # Only visible elements are usable; update best match
+                if match_score > 0 and snapshot.visible and match_score > best_score:
+                    best_score = match_score
+                    best_snapshot = snapshot
             
-            return best_element
+            return best_snapshot
             
         except Exception as e:
             self._logger.error(
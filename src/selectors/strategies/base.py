@@ -18,6 +18,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.interfaces import IStrategyPattern
+from src.selectors.strategies.snapshot import snapshot_element
 from src.observability.logger import get_logger
 from src.utils.exceptions import (
     StrategyExecutionError, ValidationError, ConfigurationError
@@ -170,40 +171,10 @@ class BaseStrategyPattern(IStrategyPattern):
     async def _extract_element_info(self, element: ElementHandle) -> ElementInfo:
         """Extract comprehensive element information."""
         try:
-            # Basic element properties
-            tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
-            text_content = await element.evaluate("el => el.textContent || ''")
-            
-            # Attributes
-            attributes = await element.evaluate("""
-                el => {
-                    const attrs = {};
-                    for (const attr of el.attributes) {
-                        attrs[attr.name] = attr.value;
-                    }
-                    return attrs;
-                }
-            """)
-            
-            # CSS classes
-            class_list = await element.evaluate("el => Array.from(el.classList)")
-            
-            # DOM path
-            dom_path = await self._get_dom_path(element)
-            
-            # Visibility and interactability
-            visibility = await self._is_visible(element)
-            interactable = await self._is_interactable(element)
-            
-            return ElementInfo(
-                tag_name=tag_name,
-                text_content=text_content.strip(),
-                attributes=attributes,
-                css_classes=class_list,
-                dom_path=dom_path,
-                visibility=visibility,
-                interactable=interactable
-            )
+            # Tag, text, attributes, classes, DOM path, visibility and
+            # interactability in a single evaluate
+            snapshot = await snapshot_element(element)
+            return snapshot.to_element_info(strip_text=True)
             
         except Exception as e:
             self._logger.error(
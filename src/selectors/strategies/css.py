@@ -16,6 +16,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import BaseStrategyPattern
+from src.selectors.strategies.snapshot import snapshot_selector
 from src.utils.exceptions import StrategyExecutionError
 
 
@@ -85,12 +86,12 @@ class CSSStrategy(BaseStrategyPattern):
             
             # Execute CSS selector with timeout protection
             # First, wait for the element to appear (with short timeout)
-            # Then query all matching elements
+            # Then snapshot all matching elements in a single evaluate
             try:
                 # Wait for at least one element to appear (2 second timeout)
                 wait_timeout = 2.0
                 try:
-                    await asyncio.wait_for(
+                    first_pw_element = await asyncio.wait_for(
                         page.wait_for_selector(css_selector, state="attached", timeout=wait_timeout * 1000),
                         timeout=wait_timeout + 1
                     )
@@ -107,9 +108,10 @@ class CSSStrategy(BaseStrategyPattern):
                         failure_reason=f"Element not found within {wait_timeout}s: {css_selector}"
                     )
                 
-                # Now query all matching elements
-                elements = await asyncio.wait_for(
-                    page.query_selector_all(css_selector),
+                # Tag, text, classes, attributes and visibility of every match
+                # in one round trip (the wait above already returned the first handle)
+                snapshots = await asyncio.wait_for(
+                    snapshot_selector(page, css_selector),
                     timeout=2.0  # Short timeout since element should already be there
                 )
             except asyncio.TimeoutError:
@@ -124,7 +126,7 @@ class CSSStrategy(BaseStrategyPattern):
                     failure_reason=f"CSS selector query timed out after 10s: {css_selector}"
                 )
             
-            if not elements:
+            if not snapshots:
                 return SelectorResult(
                     selector_name=selector.name,
                     strategy_used=self.id,
@@ -136,59 +138,10 @@ class CSSStrategy(BaseStrategyPattern):
                     failure_reason=f"No elements found for CSS selector: {css_selector}"
                 )
             
-            # Create element info for first element and store all elements in metadata
-            playwright_elements = []  # Store actual Playwright element handles
-            
-            for element in elements:
-                try:
-                    playwright_elements.append(element)
-                except Exception:
-                    continue
-            
-            if not playwright_elements:
-                return SelectorResult(
-                    selector_name=selector.name,
-                    strategy_used=self.id,
-                    element_info=None,
-                    confidence_score=0.0,
-                    resolution_time=(datetime.utcnow() - start_time).total_seconds(),
-                    validation_results=[],
-                    success=False,
-                    failure_reason="Failed to extract element information"
-                )
-            
-            # Build ElementInfo for the first element using correct dataclass fields
-            first_pw_element = playwright_elements[0]
-            try:
-                text = await first_pw_element.text_content()
-                tag_name = await first_pw_element.evaluate('el => el.tagName.toLowerCase()')
-                css_classes_str = await first_pw_element.get_attribute("class") or ""
-                css_classes = css_classes_str.split() if css_classes_str else []
-                # Get a few attributes for the attributes dict
-                attrs = {}
-                for attr_name in ["class", "id", "data-testid", "href"]:
-                    val = await first_pw_element.get_attribute(attr_name)
-                    if val is not None:
-                        attrs[attr_name] = val
-                
-                visibility = await first_pw_element.is_visible()
-            except Exception:
-                text = ""
-                tag_name = "unknown"
-                css_classes = []
-                attrs = {}
-                visibility = True
-            
-            first_element = ElementInfo(
-                tag_name=tag_name,
-                text_content=text or "",
-                attributes=attrs,
-                css_classes=css_classes,
-                dom_path=css_selector,
-                visibility=visibility,
-                interactable=visibility,
-                element=first_pw_element,  # Store Playwright handle for find()
-            )
+            # Build ElementInfo for the first element; keep the Playwright handle for find()
+            first_snapshot = snapshots[0]
+            first_snapshot.element = first_pw_element
+            first_element = first_snapshot.to_element_info(dom_path=css_selector, rendered=True)
             
             # Return successful result with first element
             return SelectorResult(
@@ -14,6 +14,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import BaseStrategyPattern
+from src.selectors.strategies.snapshot import ElementSnapshot, snapshot_elements
 from src.utils.exceptions import StrategyExecutionError
 
 
@@ -67,18 +68,18 @@ class RoleBasedStrategy(BaseStrategyPattern):
                 )
             
             # Find element using role-based matching
-            element = await self._find_element_by_role(
+            snapshot = await self._find_element_by_role(
                 context, role, semantic_attribute, expected_value, element_tag
             )
             
-            if not element:
+            if not snapshot:
                 return self._create_failure_result(
                     selector.name, f"No element found with role='{role}'",
                     datetime.utcnow() - start_time
                 )
             
-            # Extract element information
-            element_info = await self._extract_element_info(element)
+            # Element information was collected with the search
+            element_info = snapshot.to_element_info(strip_text=True)
             
             # Calculate confidence
             validation_results = await self._validate_element_content(element_info, selector.validation_rules)
@@ -172,7 +173,7 @@ class RoleBasedStrategy(BaseStrategyPattern):
                                    role: str,
                                    semantic_attribute: Optional[str] = None,
                                    expected_value: Optional[str] = None,
-                                   element_tag: Optional[str] = None) -> Optional[Any]:
+                                   element_tag: Optional[str] = None) -> Optional[ElementSnapshot]:
         """Find element by role and optional semantic attribute."""
         try:
             # Build CSS selector for role-based search
@@ -186,31 +187,31 @@ class RoleBasedStrategy(BaseStrategyPattern):
                 # Only role specified
                 role_selector = f"{element_tag if element_tag else '*'}[role='{role}']"
             
+            # Query candidates and snapshot them in one evaluate
             elements = await context.page.query_selector_all(role_selector)
+            snapshots = await snapshot_elements(
+                context.page, elements, all_attributes=True, dom_path=True
+            )
             
-            best_element = None
+            best_snapshot = None
             best_score = 0.0
             
-            for element in elements:
-                try:
-                    # Validate element is usable
-                    if not await self._validate_element_found(element):
-                        continue
-                    
-                    # Calculate role match score
-                    match_score = self._calculate_role_match_score(
-                        element, role, semantic_attribute, expected_value
-                    )
-                    
-                    # Update best match
-                    if match_score > best_score:
-                        best_score = match_score
-                        best_element = element
+            for snapshot in snapshots:
+                # Validate element is usable
+                if snapshot is None or not snapshot.visible:
+                    continue
+                
+                # Calculate role match score
+                match_score = self._calculate_role_match_score(
+                    snapshot, role, semantic_attribute, expected_value
+                )
                 
-                except Exception:
-                    continue  # Skip elements that can't be evaluated
+                # Update best match
+                if match_score > best_score:
+                    best_score = match_score
+                    best_snapshot = snapshot
             
-            return best_element
+            return best_snapshot
             
         except Exception as e:
             self._logger.error(
@@ -224,7 +225,7 @@ class RoleBasedStrategy(BaseStrategyPattern):
             )
             return None
     
-    def _calculate_role_match_score(self, element: Any, role: str,
+    def _calculate_role_match_score(self, element: ElementSnapshot, role: str,
                                    semantic_attribute: Optional[str] = None,
                                    expected_value: Optional[str] = None) -> float:
         """Calculate match score for role-based search."""
@@ -0,0 +1,337 @@
+"""
+Element snapshot primitive for Selector Engine strategies.
+
+Materializing an ElementInfo property by property costs one Playwright round
+trip per property (text_content, tagName, each get_attribute, is_visible, ...),
+per element. On a remote browser every round trip is a network RTT, so a
+single resolution paid seven or more RTTs for the first match alone.
+
+The helpers here collect tag, text, class list, attributes, visibility,
+interactability, bounding box and (optionally) DOM path for *all* matched
+elements in one ``evaluate`` call. Optional in-page filters (text contains,
+proximity selector) keep the payload small when a strategy scans broadly.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.models.selector_models import ElementInfo
+
+
+# Attributes collected when a strategy does not ask for all of them.
+DEFAULT_ATTRIBUTES = ("class", "id", "data-testid", "href")
+
+_SNAPSHOT_FN = """
+function (elements, opts) {
+    const wanted = opts.attributes || [];
+    const needle = opts.textContains == null ? null
+        : (opts.caseSensitive ? opts.textContains : opts.textContains.toLowerCase());
+    const safeMatches = (node, sel) => {
+        try { return !!node && node.nodeType === 1 && node.matches(sel); } catch (e) { return false; }
+    };
+    const near = (el, sel) => safeMatches(el, sel) || safeMatches(el.parentElement, sel) ||
+        Array.from(el.parentElement ? el.parentElement.children : []).some(s => safeMatches(s, sel));
+    const domPath = (el) => {
+        const path = [];
+        let current = el;
+        while (current && current !== document.body && current.nodeType === 1) {
+            let selector = current.tagName.toLowerCase();
+            if (current.id) {
+                selector += '#' + current.id;
+            } else if (typeof current.className === 'string' && current.className) {
+                const classes = current.className.split(' ').filter(c => c);
+                if (classes.length > 0) selector += '.' + classes[0];
+            }
+            const siblings = Array.from(current.parentNode ? current.parentNode.children : []);
+            const sameTag = siblings.filter(s => s.tagName === current.tagName);
+            if (sameTag.length > 1) selector += `:nth-child(${sameTag.indexOf(current) + 1})`;
+            path.unshift(selector);
+            current = current.parentNode;
+        }
+        return 'body' + (path.length > 0 ? ' > ' + path.join(' > ') : '');
+    };
+    const list = opts.limit ? elements.slice(0, opts.limit) : elements;
+    return list.map((el) => {
+        if (!el || el.nodeType !== 1) return null;
+        const text = el.textContent || '';
+        if (needle !== null && !(opts.caseSensitive ? text : text.toLowerCase()).includes(needle)) return null;
+        if (opts.near && !near(el, opts.near)) return null;
+        const attrs = {};
+        if (opts.allAttributes) {
+            for (const a of el.attributes) attrs[a.name] = a.value;
+        } else {
+            for (const name of wanted) {
+                const v = el.getAttribute(name);
+                if (v !== null) attrs[name] = v;
+            }
+        }
+        const style = window.getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        const hasBox = rect.width > 0 && rect.height > 0;
+        // ElementHandle.is_visible(): a non-empty box and not visibility:hidden
+        const visible = hasBox && style.visibility !== 'hidden';
+        const styleVisible = style.display !== 'none' && style.visibility !== 'hidden' &&
+            style.opacity !== '0';
+        const interactable = styleVisible && hasBox && !el.disabled &&
+            el.getAttribute('aria-disabled') !== 'true' && (
+            ['A', 'BUTTON', 'INPUT', 'SELECT', 'TEXTAREA'].includes(el.tagName) ||
+            ['button', 'link', 'menuitem', 'option'].includes(el.getAttribute('role')) ||
+            el.onclick !== null || el.style.cursor === 'pointer');
+        return {
+            tag: el.tagName.toLowerCase(),
+            text: text,
+            classes: Array.from(el.classList || []),
+            attributes: attrs,
+            visible: visible,
+            styleVisible: styleVisible,
+            interactable: interactable,
+            box: visible ? {x: rect.x, y: rect.y, width: rect.width, height: rect.height} : null,
+            domPath: opts.domPath ? domPath(el) : null,
+        };
+    });
+}
+"""
+
+_PAGE_SCRIPT = f"([elements, opts]) => ({_SNAPSHOT_FN})(elements, opts)"
+_SELECTOR_SCRIPT = f"(elements, opts) => ({_SNAPSHOT_FN})(elements, opts)"
+_HANDLE_SCRIPT = f"(el, opts) => ({_SNAPSHOT_FN})([el], opts)[0]"
+
+# First match of each (kind, query) probe; kind is "css" or "xpath". A query
+# that throws (invalid selector) counts as a miss rather than failing the batch.
+_FIRST_MATCH_FN = """
+function (probes) {
+    return probes.map((p) => {
+        try {
+            if (p.kind === 'xpath') {
+                return document.evaluate(p.query, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return document.querySelector(p.query);
+        } catch (e) {
+            return null;
+        }
+    });
+}
+"""
+_FIRST_MATCHES_SCRIPT = (
+    f"([probes, opts]) => ({_SNAPSHOT_FN})(({_FIRST_MATCH_FN})(probes), opts)"
+)
+_FIRST_MATCH_HANDLES_SCRIPT = f"(probes) => ({_FIRST_MATCH_FN})(probes)"
+
+
+@dataclass
+class ElementSnapshot:
+    """
+    Properties of one matched element, materialized in a single round trip.
+
+    The visibility flags keep the semantics of the per-element calls they
+    replace: ``visible`` is Playwright's ``ElementHandle.is_visible()`` (a
+    non-empty box, not ``visibility: hidden`` — ``opacity: 0`` still counts),
+    while ``style_visible`` and ``interactable`` are the computed-style and
+    tag/role checks of ``BaseStrategyPattern._is_visible`` and
+    ``_is_interactable``.
+    """
+    index: int
+    tag_name: str
+    text_content: str
+    css_classes: List[str]
+    attributes: Dict[str, str]
+    visible: bool
+    interactable: bool
+    bounding_box: Optional[Dict[str, float]] = None
+    style_visible: bool = False
+    dom_path: Optional[str] = None
+    element: Any = field(default=None, repr=False)  # Playwright ElementHandle, if known
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Attribute value, or None when absent or not collected."""
+        return self.attributes.get(name)
+
+    def to_element_info(self, dom_path: Optional[str] = None, strip_text: bool = False,
+                        rendered: bool = False) -> ElementInfo:
+        """
+        Convert to the ElementInfo the strategies return.
+
+        By default visibility and interactability are the computed-style and
+        tag/role checks (``BaseStrategyPattern._extract_element_info``);
+        ``rendered=True`` reports ``is_visible()`` for both, as the CSS and
+        XPath strategies always have.
+        """
+        if rendered:
+            visibility = interactable = self.visible
+        else:
+            visibility, interactable = self.style_visible, self.interactable
+        return ElementInfo(
+            tag_name=self.tag_name,
+            text_content=self.text_content.strip() if strip_text else self.text_content,
+            attributes=dict(self.attributes),
+            css_classes=list(self.css_classes),
+            dom_path=dom_path if dom_path is not None else (self.dom_path or ""),
+            visibility=visibility,
+            interactable=interactable,
+            element=self.element,
+        )
+
+
+def _options(attributes: Optional[Sequence[str]], all_attributes: bool, dom_path: bool,
+             text_contains: Optional[str], case_sensitive: bool, near: Optional[str],
+             limit: Optional[int]) -> Dict[str, Any]:
+    return {
+        "attributes": list(attributes if attributes is not None else DEFAULT_ATTRIBUTES),
+        "allAttributes": all_attributes,
+        "domPath": dom_path,
+        "textContains": text_contains,
+        "caseSensitive": case_sensitive,
+        "near": near or None,
+        "limit": limit or 0,
+    }
+
+
+def _from_raw(index: int, raw: Dict[str, Any], element: Any = None) -> ElementSnapshot:
+    return ElementSnapshot(
+        index=index,
+        tag_name=raw.get("tag") or "unknown",
+        text_content=raw.get("text") or "",
+        css_classes=list(raw.get("classes") or []),
+        attributes=dict(raw.get("attributes") or {}),
+        visible=bool(raw.get("visible")),
+        interactable=bool(raw.get("interactable")),
+        bounding_box=raw.get("box"),
+        style_visible=bool(raw.get("styleVisible")),
+        dom_path=raw.get("domPath"),
+        element=element,
+    )
+
+
+async def snapshot_elements(page: Any, handles: Sequence[Any], *,
+                            attributes: Optional[Sequence[str]] = None,
+                            all_attributes: bool = False,
+                            dom_path: bool = False,
+                            text_contains: Optional[str] = None,
+                            case_sensitive: bool = False,
+                            near: Optional[str] = None) -> List[Optional[ElementSnapshot]]:
+    """
+    Snapshot already-queried element handles in one ``page.evaluate``.
+
+    Args:
+        page: Playwright page the handles belong to
+        handles: Element handles (e.g. from ``query_selector_all``)
+        attributes: Attribute names to collect (default: DEFAULT_ATTRIBUTES)
+        all_attributes: Collect every attribute instead
+        dom_path: Also compute a CSS-like DOM path per element
+        text_contains: Only keep elements whose textContent contains this
+        case_sensitive: Case sensitivity for ``text_contains``
+        near: Only keep elements that match, or whose parent or a sibling
+            matches, this CSS selector
+
+    Returns:
+        One entry per handle, in order; ``None`` where a filter rejected the
+        element. Each snapshot carries its handle in ``element``.
+    """
+    if not handles:
+        return []
+    opts = _options(attributes, all_attributes, dom_path, text_contains, case_sensitive, near, None)
+    raw = await page.evaluate(_PAGE_SCRIPT, [list(handles), opts])
+    return [
+        _from_raw(i, item, handles[i]) if item is not None else None
+        for i, item in enumerate(raw)
+    ]
+
+
+async def snapshot_selector(page: Any, selector: str, *,
+                            attributes: Optional[Sequence[str]] = None,
+                            all_attributes: bool = False,
+                            dom_path: bool = False,
+                            limit: Optional[int] = None) -> List[ElementSnapshot]:
+    """
+    Query and snapshot every match of ``selector`` in one ``eval_on_selector_all``.
+
+    No element handles are created; callers that need one for the first match
+    already have it from ``wait_for_selector`` or fetch it with ``query_selector``.
+
+    Args:
+        page: Playwright page
+        selector: Any Playwright selector (CSS, ``xpath=...``, ...)
+        attributes: Attribute names to collect (default: DEFAULT_ATTRIBUTES)
+        all_attributes: Collect every attribute instead
+        dom_path: Also compute a CSS-like DOM path per element
+        limit: Snapshot at most this many matches (document order)
+
+    Returns:
+        Snapshots in document order
+    """
+    opts = _options(attributes, all_attributes, dom_path, None, False, None, limit)
+    raw = await page.eval_on_selector_all(selector, _SELECTOR_SCRIPT, opts)
+    return [_from_raw(i, item) for i, item in enumerate(raw) if item is not None]
+
+
+async def snapshot_first_matches(page: Any, probes: Sequence[Tuple[str, str]], *,
+                                 attributes: Optional[Sequence[str]] = None,
+                                 all_attributes: bool = False) -> List[Optional[ElementSnapshot]]:
+    """
+    Snapshot the first match of many queries in one ``page.evaluate``.
+
+    Args:
+        page: Playwright page
+        probes: ``(kind, query)`` pairs, ``kind`` being ``"css"`` or ``"xpath"``
+        attributes: Attribute names to collect (default: DEFAULT_ATTRIBUTES)
+        all_attributes: Collect every attribute instead
+
+    Returns:
+        One entry per probe, in order; ``None`` where nothing matched. No
+        element handles are created (see ``first_match_handles``).
+    """
+    if not probes:
+        return []
+    opts = _options(attributes, all_attributes, False, None, False, None, None)
+    payload = [{"kind": kind, "query": query} for kind, query in probes]
+    raw = await page.evaluate(_FIRST_MATCHES_SCRIPT, [payload, opts])
+    return [
+        _from_raw(i, item) if item is not None else None
+        for i, item in enumerate(raw)
+    ]
+
+
+async def first_match_handles(page: Any, probes: Sequence[Tuple[str, str]]) -> List[Any]:
+    """
+    Element handles for the first match of many queries.
+
+    One ``evaluate_handle`` plus one ``get_properties``, however many probes.
+
+    Returns:
+        One entry per probe, in order; ``None`` where nothing matched.
+    """
+    if not probes:
+        return []
+    payload = [{"kind": kind, "query": query} for kind, query in probes]
+    array = await page.evaluate_handle(_FIRST_MATCH_HANDLES_SCRIPT, payload)
+    try:
+        properties = await array.get_properties()
+        handles: List[Any] = [None] * len(probes)
+        for key, value in properties.items():
+            if key.isdigit() and int(key) < len(handles):
+                handles[int(key)] = value.as_element()
+        return handles
+    finally:
+        await array.dispose()
+
+
+async def snapshot_element(handle: Any, *,
+                           attributes: Optional[Sequence[str]] = None,
+                           all_attributes: bool = True,
+                           dom_path: bool = True) -> ElementSnapshot:
+    """
+    Snapshot a single element handle in one ``evaluate``.
+
+    Args:
+        handle: Playwright element handle
+        attributes: Attribute names to collect when not collecting all
+        all_attributes: Collect every attribute (default)
+        dom_path: Also compute the element's DOM path (default)
+
+    Returns:
+        The element's snapshot
+    """
+    opts = _options(attributes, all_attributes, dom_path, None, False, None, None)
+    raw = await handle.evaluate(_HANDLE_SCRIPT, opts)
+    return _from_raw(0, raw or {}, handle)
@@ -15,6 +15,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import BaseStrategyPattern
+from src.selectors.strategies.snapshot import ElementSnapshot, snapshot_elements
 from src.utils.exceptions import StrategyExecutionError
 
 
@@ -67,18 +68,18 @@ class TextAnchorStrategy(BaseStrategyPattern):
                 )
             
             # Find element using text anchor
-            element = await self._find_element_by_text_anchor(
+            snapshot = await self._find_element_by_text_anchor(
                 context, anchor_text, proximity_selector, case_sensitive
             )
             
-            if not element:
+            if not snapshot:
                 return self._create_failure_result(
                     selector.name, f"Anchor text '{anchor_text}' not found",
                     datetime.utcnow() - start_time
                 )
             
-            # Extract element information
-            element_info = await self._extract_element_info(element)
+            # Element information was collected with the search
+            element_info = snapshot.to_element_info(strip_text=True)
             
             # Calculate confidence
             validation_results = await self._validate_element_content(element_info, selector.validation_rules)
@@ -155,48 +156,41 @@ class TextAnchorStrategy(BaseStrategyPattern):
     async def _find_element_by_text_anchor(self, context: DOMContext, 
                                            anchor_text: str,
                                            proximity_selector: Optional[str] = None,
-                                           case_sensitive: bool = False) -> Optional[Any]:
+                                           case_sensitive: bool = False) -> Optional[ElementSnapshot]:
         """Find element by text anchor with optional proximity selector."""
         try:
-            # Search for anchor text in the page
-            page_content = await context.page.content()
-            
-            # Prepare search text
-            search_text = anchor_text if case_sensitive else anchor_text.lower()
-            
-            # Find all elements containing the anchor text
+            # Query candidates, then filter by anchor text (and proximity) and
+            # snapshot the survivors in a single in-page evaluate
             elements = await context.page.query_selector_all("*")
+            snapshots = await snapshot_elements(
+                context.page, elements,
+                all_attributes=True,
+                dom_path=True,
+                text_contains=anchor_text,
+                case_sensitive=case_sensitive,
+                near=proximity_selector
+            )
             
-            best_element = None
+            best_snapshot = None
             best_score = 0.0
             
-            for element in elements:
-                try:
-                    # Get element text content
-                    element_text = await element.evaluate("el => el.textContent || ''")
-                    search_content = element_text if case_sensitive else element_text.lower()
-                    
-                    # Check if anchor text is present
-                    if search_text in search_content:
-                        # Calculate match score based on text similarity
-                        match_score = self._calculate_text_similarity(search_text, anchor_text, case_sensitive)
-                        
-                        # Apply proximity selector if specified
-                        if proximity_selector:
-                            if await self._matches_proximity_selector(element, proximity_selector, context):
-                                match_score *= 1.2  # Boost score for proximity match
-                            else:
-                                continue  # Skip if doesn't match proximity
-                        
-                        # Update best match
-                        if match_score > best_score:
-                            best_score = match_score
-                            best_element = element
+            for snapshot in snapshots:
+                if snapshot is None:
+                    continue  # No anchor text, or not near the proximity selector
+                
+                # Calculate match score based on text similarity
+                match_score = self._calculate_text_similarity(
+                    snapshot.text_content.strip(), anchor_text, case_sensitive
+                )
+                if proximity_selector:
+                    match_score *= 1.2  # Boost score for proximity match
                 
-                except Exception:
-                    continue  # Skip elements that can't be evaluated
+                # Update best match
+                if match_score > best_score:
+                    best_score = match_score
+                    best_snapshot = snapshot
             
-            return best_element
+            return best_snapshot
             
         except Exception as e:
             self._logger.error(
@@ -237,30 +231,6 @@ class TextAnchorStrategy(BaseStrategyPattern):
         
         return 0.0
     
-    async def _matches_proximity_selector(self, element: Any, proximity_selector: str, context: DOMContext) -> bool:
-        """Check if element matches proximity selector criteria."""
-        try:
-            # Check if element itself matches
-            if await element.evaluate(f"el => el.matches('{proximity_selector}')"):
-                return True
-            
-            # Check if element is near an element that matches
-            parent = await element.evaluate("el => el.parentElement")
-            if parent:
-                if await parent.evaluate(f"el => el.matches('{proximity_selector}')"):
-                    return True
-            
-            # Check siblings
-            siblings = await element.evaluate("el => Array.from(el.parentElement?.children || [])")
-            for sibling in siblings:
-                if await sibling.evaluate(f"el => el.matches('{proximity_selector}')"):
-                    return True
-            
-            return False
-            
-        except Exception:
-            return False
-    
     async def _validate_element_content(self, element_info: ElementInfo, 
                                        validation_rules: List[ValidationRule]) -> List[ValidationResult]:
         """Validate element content against rules."""
@@ -16,6 +16,7 @@ from src.models.selector_models import (
 )
 from src.selectors.context import DOMContext
 from src.selectors.strategies.base import BaseStrategyPattern
+from src.selectors.strategies.snapshot import snapshot_selector
 from src.utils.exceptions import StrategyExecutionError
 
 
@@ -85,9 +86,9 @@ class XPathStrategy(BaseStrategyPattern):
             
             # Execute XPath expression with timeout protection
             try:
-                # Use asyncio.wait_for to prevent hanging
-                elements = await asyncio.wait_for(
-                    page.query_selector_all(f"xpath={xpath_expression}"),
+                # Snapshot every match in one round trip; use asyncio.wait_for to prevent hanging
+                snapshots = await asyncio.wait_for(
+                    snapshot_selector(page, f"xpath={xpath_expression}"),
                     timeout=10.0  # 10 second timeout
                 )
             except asyncio.TimeoutError:
@@ -102,7 +103,7 @@ class XPathStrategy(BaseStrategyPattern):
                     failure_reason=f"XPath query timed out after 10s: {xpath_expression}"
                 )
             
-            if not elements:
+            if not snapshots:
                 return SelectorResult(
                     selector_name=selector.name,
                     strategy_used=self.id,
@@ -114,36 +115,11 @@ class XPathStrategy(BaseStrategyPattern):
                     failure_reason=f"No elements found for XPath: {xpath_expression}"
                 )
             
-            # Create element info for first element
-            first_pw_element = elements[0]
-            try:
-                text = await first_pw_element.text_content()
-                tag_name = await first_pw_element.evaluate('el => el.tagName.toLowerCase()')
-                css_classes_str = await first_pw_element.get_attribute("class") or ""
-                css_classes = css_classes_str.split() if css_classes_str else []
-                attrs = {}
-                for attr_name in ["class", "id", "data-testid", "href"]:
-                    val = await first_pw_element.get_attribute(attr_name)
-                    if val is not None:
-                        attrs[attr_name] = val
-                visibility = await first_pw_element.is_visible()
-            except Exception:
-                text = ""
-                tag_name = "unknown"
-                css_classes = []
-                attrs = {}
-                visibility = True
-            
-            first_element = ElementInfo(
-                tag_name=tag_name,
-                text_content=text or "",
-                attributes=attrs,
-                css_classes=css_classes,
-                dom_path=f"xpath:{xpath_expression}",
-                visibility=visibility,
-                interactable=visibility,
-                element=first_pw_element,  # Store Playwright handle for find()
-            )
+            # Create element info for first element; one more round trip for its handle
+            first_snapshot = snapshots[0]
+            first_snapshot.element = await page.query_selector(f"xpath={xpath_expression}")
+            first_element = first_snapshot.to_element_info(dom_path=f"xpath:{xpath_expression}",
+                                                         rendered=True)
             
             # Return successful result with first element
             return SelectorResult(
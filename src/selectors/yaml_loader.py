@@ -58,6 +58,7 @@ from .exceptions import (
 from .validator import SelectorValidator
 from .config import get_config
 from .performance_monitor import get_performance_monitor, record_metric
+from .cache_invalidation import invalidate_selector_definitions
 from .strategies.converter import detect_format, convert_legacy_yaml, StrategyFormat
 
 logger = logging.getLogger(__name__)
@@ -317,6 +318,7 @@ class YAMLSelectorLoader:
                 )
             
             # Reload each selector
+            changed_names = []
             for selector_id, old_selector in selectors_to_reload:
                 try:
                     # Check if file has changed
@@ -338,6 +340,7 @@ class YAMLSelectorLoader:
                     # Reload from file
                     new_selector = self.load_selector_from_file(file_path)
                     reloaded_selectors.append(new_selector)
+                    changed_names.extend({old_selector.name, new_selector.name})
                     
                     self.logger.info(f"Reloaded selector: {selector_id}")
                     
@@ -347,6 +350,9 @@ class YAMLSelectorLoader:
                     failed_reloads.append(selector_id)
                     self.logger.error(error_msg)
             
+            if changed_names:
+                invalidate_selector_definitions(changed_names, reason="yaml reload")
+            
             # Create result
             success_count = len(reloaded_selectors)
             failed_count = len(failed_reloads)
@@ -388,7 +394,8 @@ class YAMLSelectorLoader:
         if current_mtime > cached_mtime:
             # File has changed, invalidate cache
             if file_path in self._selector_cache:
-                del self._selector_cache[file_path]
+                stale = self._selector_cache.pop(file_path)
+                invalidate_selector_definitions([stale.name], reason="yaml file changed")
             if file_path in self._file_timestamps:
                 del self._file_timestamps[file_path]
             return None
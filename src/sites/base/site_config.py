@@ -106,6 +106,54 @@ class HybridConfig(BaseModel):
     model_config = {"str_strip_whitespace": True}
 
 
+class ResourceBlockingConfig(BaseModel):
+    """Configuration for blocking unneeded browser requests.
+
+    Applied by ``src.browser.resource_router.ResourceRouter`` to every
+    context a browser session creates for the site. URL patterns use the
+    interception matching rules (prefix, substring, or regex when they
+    start with ``^``). URLs matching the site's interception patterns are
+    never blocked or stubbed.
+
+    Attributes:
+        enabled: Whether blocking is applied (default True)
+        block_resource_types: Playwright resource types to abort
+        block_url_patterns: URL patterns to abort regardless of type
+        allow_url_patterns: URL patterns always let through; wins over blocks
+        stub_static: Serve repeated script/stylesheet requests from an
+            in-memory cache instead of the network
+        stub_cache_max_bytes: Size bound of that cache
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether resource blocking is applied",
+    )
+    block_resource_types: list[str] = Field(
+        default_factory=lambda: ["image", "media", "font"],
+        description="Playwright resource types to abort",
+    )
+    block_url_patterns: list[str] = Field(
+        default_factory=list,
+        description="URL patterns to abort regardless of resource type",
+    )
+    allow_url_patterns: list[str] = Field(
+        default_factory=list,
+        description="URL patterns that are never blocked",
+    )
+    stub_static: bool = Field(
+        default=False,
+        description="Serve repeated static JS/CSS from an in-memory cache",
+    )
+    stub_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Maximum total size of cached static responses",
+    )
+
+    model_config = {"str_strip_whitespace": True}
+
+
 class SiteConfig(BaseModel):
     """
     Pydantic model for site configuration.
@@ -148,6 +196,10 @@ class SiteConfig(BaseModel):
         default=None,
         description="Configuration for hybrid extraction mode"
     )
+    resource_blocking: ResourceBlockingConfig | None = Field(
+        default=None,
+        description="Browser request blocking for the site's sessions"
+    )
 
     @field_validator("endpoint")
     @classmethod
@@ -194,6 +246,10 @@ class SiteConfig(BaseModel):
         """Get the hybrid mode configuration."""
         return self.hybrid
 
+    def get_resource_blocking_config(self) -> ResourceBlockingConfig | None:
+        """Get the browser resource blocking configuration."""
+        return self.resource_blocking
+
 
 class SiteConfigLoader:
     """
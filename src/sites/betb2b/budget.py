@@ -0,0 +1,247 @@
+"""Shared, priority-ordered request budget for concurrent scheduler passes.
+
+The scheduler's single-flight lock serialises whole passes, so a multi-hour
+prematch sweep (thousands of ``GetGameZip`` calls) holds the live pass off for
+minutes — exactly when odds move fastest. :class:`RequestBudget` moves the
+throttle from the *pass* to the *request*:
+
+* at most ``concurrency`` feed requests are in flight across **all** passes
+  (the ADR-17 semaphore, now shared instead of per-call);
+* an optional ``rate_per_minute`` token bucket keeps the combined request rate
+  under the skin's polite cap;
+* a free slot goes to the waiting request with the best :class:`Priority`
+  (live before prematch before results), FIFO within a priority — so a live
+  poll waits for at most one in-flight request, never for a queued sweep.
+
+A pass declares its priority once via :func:`pass_priority`; every request it
+makes (directly or via ``asyncio.gather`` children, which inherit the context)
+is queued at that priority.
+
+:class:`TokenBucket` is the plain (priority-less) rate limiter one
+:class:`~.client.BetB2BFeedClient` puts in front of its own requests; the
+budget's rate is one too, taken from without blocking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+__all__ = ["Priority", "RequestBudget", "TokenBucket", "current_priority", "pass_priority"]
+
+
+class Priority(IntEnum):
+    """Lower value is served first."""
+
+    LIVE = 0
+    SCHEDULED = 1
+    RESULTS = 2
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "betb2b_request_priority", default=Priority.SCHEDULED)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def pass_priority(priority: Priority):
+    """Queue every budget request made in this context at ``priority``."""
+    token = _priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestBudget:
+    """Priority-queued concurrency + rate budget shared by every pass."""
+
+    def __init__(self, concurrency: int, *, rate_per_minute: float = 0.0) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.concurrency = concurrency
+        self.rate_per_minute = rate_per_minute
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        # Burst = concurrency; a rate of 0 disables the bucket.
+        self._bucket = TokenBucket(rate_per_minute, burst=concurrency)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats: Dict[Priority, Dict[str, float]] = {
+            p: {"granted": 0, "waited_s": 0.0, "max_wait_s": 0.0, "max_depth": 0}
+            for p in Priority
+        }
+
+    # -- public API ------------------------------------------------------ #
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Optional[Priority] = None) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the ``async with`` body."""
+        prio = Priority(priority if priority is not None else _priority.get())
+        queued_at = time.monotonic()
+        await self._acquire(prio)
+        self._record(prio, time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._dispatch()
+
+    def depth(self) -> Dict[str, int]:
+        """Requests currently waiting for a slot, per priority."""
+        out = {p.name.lower(): 0 for p in Priority}
+        for prio, _, fut in self._waiters:
+            if not fut.done():
+                out[Priority(prio).name.lower()] += 1
+        return out
+
+    def stats(self) -> Dict[str, object]:
+        per = {}
+        for p, s in self._stats.items():
+            granted = int(s["granted"])
+            per[p.name.lower()] = {
+                "granted": granted, "max_depth": int(s["max_depth"]),
+                "mean_wait_s": round(s["waited_s"] / granted, 4) if granted else 0.0,
+                "max_wait_s": round(s["max_wait_s"], 4),
+            }
+        return {"concurrency": self.concurrency, "rate_per_minute": self.rate_per_minute,
+                "in_flight": self._in_flight, "depth": self.depth(), "priorities": per}
+
+    # -- internals ------------------------------------------------------- #
+    async def _acquire(self, prio: Priority) -> None:
+        if not self._waiters and self._try_take():
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(prio), next(self._seq), fut))
+        depth = sum(1 for p, _, f in self._waiters if p == prio and not f.done())
+        s = self._stats[prio]
+        s["max_depth"] = max(s["max_depth"], depth)
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted just as we were cancelled — hand the slot back.
+                self._in_flight -= 1
+                self._dispatch()
+            raise
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best waiters, in priority order."""
+        while self._waiters:
+            _, _, fut = self._waiters[0]
+            if fut.done():                      # cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take():
+                break
+            heapq.heappop(self._waiters)
+            fut.set_result(None)
+
+    def _try_take(self) -> bool:
+        if self._in_flight >= self.concurrency:
+            return False
+        due = self._bucket.try_acquire()
+        if due > 0:
+            self._schedule_refill(due)
+            return False
+        self._in_flight += 1
+        return True
+
+    def _schedule_refill(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+
+        def _fire() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(delay, _fire)
+
+    def _record(self, prio: Priority, waited: float) -> None:
+        s = self._stats[prio]
+        s["granted"] += 1
+        s["waited_s"] += waited
+        s["max_wait_s"] = max(s["max_wait_s"], waited)
+
+
+class TokenBucket:
+    """Async token bucket: ``rate_per_minute`` sustained, up to ``burst`` at once.
+
+    :meth:`acquire` refills and takes a token without yielding in between, and
+    a caller that finds the bucket empty *reserves* the next token (the count
+    goes negative) before it sleeps — so tasks gathered on one bucket queue
+    behind each other instead of all waking on the same token. A cancelled
+    waiter hands its reservation back. :meth:`try_acquire` is the non-blocking
+    form :class:`RequestBudget` dispatches on. ``rate_per_minute <= 0``
+    disables it.
+    """
+
+    def __init__(
+        self, rate_per_minute: float, *, burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate_per_minute = rate_per_minute
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._stats: Dict[str, float] = {"acquired": 0, "waited": 0, "waited_s": 0.0}
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until it is due; returns the seconds waited."""
+        if self.rate_per_minute <= 0:
+            return 0.0
+        rate = self._refill()
+        self._tokens -= 1.0
+        wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        self._stats["acquired"] += 1
+        if wait > 0:
+            self._stats["waited"] += 1
+            self._stats["waited_s"] += wait
+            try:
+                await self._sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens = min(float(self.burst), self._tokens + 1.0)
+                raise
+        return wait
+
+    def try_acquire(self) -> float:
+        """Take one token if one is available now.
+
+        Returns 0.0 when a token was taken, else the seconds until one is due
+        (nothing is reserved — the caller retries then).
+        """
+        if self.rate_per_minute <= 0:
+            return 0.0
+        rate = self._refill()
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / rate
+        self._tokens -= 1.0
+        self._stats["acquired"] += 1
+        return 0.0
+
+    def _refill(self) -> float:
+        now = self._clock()
+        rate = self.rate_per_minute / 60.0
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        return rate
+
+    def stats(self) -> Dict[str, object]:
+        s = self._stats
+        return {"rate_per_minute": self.rate_per_minute, "burst": self.burst,
+                "acquired": int(s["acquired"]), "waited": int(s["waited"]),
+                "waited_s": round(s["waited_s"], 3)}
@@ -81,6 +81,31 @@ def _resolve_skins(skin_token: str, *, all_skins: bool = False) -> List[str]:
     return list(seen) or ["linebet"]
 
 
+_PASS_INTERVAL_KWARGS = {
+    "scheduled": "scheduled_interval",
+    "live": "live_interval",
+    "results": "results_interval",
+}
+
+
+def _parse_skin_intervals(specs: List[str]) -> Dict[str, Dict[str, float]]:
+    """``["melbet:live=30", "22bet:scheduled=0"]`` → per-skin scheduler kwargs
+    (``{"melbet": {"live_interval": 30.0}, ...}``)."""
+    out: Dict[str, Dict[str, float]] = {}
+    for spec in specs:
+        skin, sep, rest = spec.partition(":")
+        pass_name, eq, value = rest.partition("=")
+        kwarg = _PASS_INTERVAL_KWARGS.get(pass_name.strip().lower())
+        if not (sep and eq and skin.strip() and kwarg):
+            raise ValueError(f"bad --skin-interval {spec!r} (want SKIN:PASS=SECONDS, "
+                             f"PASS one of {'/'.join(_PASS_INTERVAL_KWARGS)})")
+        try:
+            out.setdefault(skin.strip(), {})[kwarg] = float(value)
+        except ValueError:
+            raise ValueError(f"bad --skin-interval {spec!r}: {value!r} is not a number") from None
+    return out
+
+
 def _skins_dir() -> Path:
     return Path(__file__).resolve().parent.parent / "skins"
 
@@ -142,6 +167,9 @@ def _build_proxy_manager_from_env():
 class BetB2BCLI:
     def __init__(self) -> None:
         self.parser = self._build_parser()
+        # Set by the ``src.main`` dispatcher; the scheduler registers its
+        # write-behind flush with it so queued writes land on shutdown.
+        self.shutdown_coordinator: Any = None
 
     def _build_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(
@@ -287,11 +315,34 @@ class BetB2BCLI:
         view.add_argument("--decompress-to", default=None,
                           help="Instead of printing, write the decompressed JSON to this path")
 
+        # archive — retention tier for old fact rows (retention.py)
+        arc = sub.add_parser("archive",
+                             help="Move fact rows older than N days into per-day compressed "
+                                  "archive files (line_movement still reads them)")
+        arc.add_argument("--db", default="data/betb2b/odds.db",
+                         help="SQLite odds store path (default: data/betb2b/odds.db)")
+        arc.add_argument("--older-than-days", type=float, default=30.0,
+                         help="Archive rows captured before midnight UTC this many days "
+                              "ago (default: 30)")
+        arc.add_argument("--archive-dir", default=None,
+                         help="Archive directory (default: <db stem>_archive next to the store)")
+        arc.add_argument("--vacuum", action="store_true",
+                         help="VACUUM afterwards to return the freed space to the OS")
+
         # schedule — long-running state-aware scheduler (ADR-14/15)
         sch = sub.add_parser("schedule",
                              help="Run the state-aware scheduler: scheduled (prematch, skip-fresh) "
                                   "+ live passes on cadences. Browser+proxy-free (direct).")
-        sch.add_argument("skin", nargs="?", default="linebet", help="Skin (default: linebet)")
+        sch.add_argument("skin", nargs="?", default="linebet",
+                         help="Skin, or comma-list (linebet,melbet) to drive several skins "
+                              "in one process (default: linebet)")
+        sch.add_argument("--all-skins", action="store_true",
+                         help="Schedule every available skin in one process (shared HTTP "
+                              "pool, per-host budgets, one store writer)")
+        sch.add_argument("--skin-interval", action="append", default=[],
+                         metavar="SKIN:PASS=SECONDS",
+                         help="Per-skin cadence override, repeatable "
+                              "(e.g. melbet:live=30, 22bet:scheduled=0)")
         sch.add_argument("--sport", default="basketball", help="Sport slug (default: basketball)")
         sch.add_argument("--db", nargs="?", const="", default=None,
                          help="Store path (default: $BETB2B_DB_PATH / DATABASE_URL if set)")
@@ -306,6 +357,13 @@ class BetB2BCLI:
                          help="Re-scrape a prematch match only after this many seconds (default: 3h)")
         sch.add_argument("--no-direct", action="store_true",
                          help="Use the browser/proxy path instead of direct mode")
+        sch.add_argument("--concurrent-passes", action="store_true",
+                         help="Run passes concurrently on a shared, priority-ordered request "
+                              "budget (live > scheduled > results) instead of one lock")
+        sch.add_argument("--request-budget-per-minute", type=float, default=0.0,
+                         help="With --concurrent-passes: combined feed-request rate cap "
+                              "across passes; with several skins, the cap per host "
+                              "(default: 0 = concurrency limit only)")
 
         # compare-match
         cm = sub.add_parser("compare-match", help="Compare match page UI data vs API endpoints")
@@ -361,6 +419,8 @@ class BetB2BCLI:
             return await self._cmd_schedule(args)
         if args.command == "view":
             return self._cmd_view(args)
+        if args.command == "archive":
+            return self._cmd_archive(args)
         if args.command == "compare-match":
             return await self._cmd_compare_match(args)
 
@@ -486,12 +546,40 @@ class BetB2BCLI:
         from src.sites.betb2b.scheduler import BetB2BScheduler
 
         db = args.db if args.db else None  # "" (bare --db) or None → scheduler default
-        sched = BetB2BScheduler(
-            args.skin, sport=args.sport, db_path=db, direct=not args.no_direct,
+        skins = _resolve_skins(args.skin, all_skins=getattr(args, "all_skins", False))
+        try:
+            overrides = _parse_skin_intervals(getattr(args, "skin_interval", []))
+        except ValueError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+        common = dict(
+            sport=args.sport, db_path=db, direct=not args.no_direct,
             scheduled_interval=args.scheduled_interval, live_interval=args.live_interval,
             refresh_window=args.refresh_window, results_interval=args.results_interval,
+            shutdown_coordinator=self.shutdown_coordinator,
+            concurrent_passes=args.concurrent_passes,
+            request_budget_per_minute=args.request_budget_per_minute,
         )
-        print(f"scheduler: skin={args.skin} sport={args.sport} "
+        unknown = sorted(set(overrides) - set(skins))
+        if unknown:
+            print(f"ERROR: --skin-interval for skins not scheduled: {', '.join(unknown)}",
+                  file=sys.stderr)
+            return 2
+        if len(skins) > 1:
+            from src.sites.betb2b.runtime import MultiSkinScheduler
+
+            # Skins share one budget per host: the rate cap applies there.
+            host_rate = common.pop("request_budget_per_minute")
+            try:
+                sched = MultiSkinScheduler(skins, overrides=overrides,
+                                           host_rate_per_minute=host_rate, **common)
+            except (ValueError, FileNotFoundError) as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 2
+        else:
+            common.update(overrides.get(skins[0], {}))
+            sched = BetB2BScheduler(skins[0], **common)
+        print(f"scheduler: skin={','.join(skins)} sport={args.sport} "
               f"scheduled={args.scheduled_interval:.0f}s live={args.live_interval:.0f}s "
               f"(SIGTERM/Ctrl-C to stop)", file=sys.stderr)
         # As a Railway worker (ADR-18) this runs forever until the platform sends
@@ -513,6 +601,10 @@ class BetB2BCLI:
             await sched.run()
         except (KeyboardInterrupt, asyncio.CancelledError):
             sched.stop()
+        finally:
+            # The schedulers' store reads go through the process-wide pools
+            from src.sites.betb2b import store_pool
+            store_pool.close_pools()
         print("scheduler stopped", file=sys.stderr)
         return 0
 
@@ -699,6 +791,24 @@ class BetB2BCLI:
             print(json.dumps(probe_result, indent=2))
         return 0
 
+    def _cmd_archive(self, args: argparse.Namespace) -> int:
+        from src.sites.betb2b import retention, store
+
+        if os.environ.get("DATABASE_URL"):
+            print("ERROR: archive works on the SQLite store only (unset DATABASE_URL)",
+                  file=sys.stderr)
+            return 2
+        conn = store.init_db(args.db)
+        try:
+            moved = retention.archive_old_facts(
+                conn, older_than_days=args.older_than_days,
+                archive_dir=args.archive_dir, vacuum=args.vacuum)
+        finally:
+            conn.close()
+        for table, n in moved.items():
+            print(f"{table:16} {n:10d} rows archived")
+        return 0
+
     def _cmd_view(self, args: argparse.Namespace) -> int:
         from src.sites.betb2b.storage import decompress_file, load_json
 
@@ -789,8 +899,9 @@ class BetB2BMainCLI:
     ``python -m src.main betb2b …`` alongside the other sites.
 
     betb2b's own flags are unchanged — only the invocation path differs.
-    The interrupt/shutdown kwargs are accepted for signature compatibility;
-    the scraper manages its own async lifecycle via ``async with``.
+    The interrupt kwarg is accepted for signature compatibility; the scraper
+    manages its own async lifecycle via ``async with``. The shutdown
+    coordinator is handed to the scheduler (write-behind flush on shutdown).
     """
 
     def __init__(self) -> None:
@@ -805,6 +916,7 @@ class BetB2BMainCLI:
         interrupt_handler: Any = None,
         shutdown_coordinator: Any = None,
     ) -> int:
+        self._cli.shutdown_coordinator = shutdown_coordinator
         return await self._cli.run_args(args)
 
 # `python -m src.sites.betb2b.cli.main <cmd>` is the form documented in
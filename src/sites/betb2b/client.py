@@ -9,10 +9,18 @@ no browser per poll.
 All HTTP egress funnels through the canonical
 :class:`~src.network.proxy.ProxyManager` / :class:`ProxyEndpoint` so
 proxy routing, credentials, and health-checking are in one place.
+
+Requests are paced by one :class:`~.budget.TokenBucket` per client, so
+:meth:`BetB2BFeedClient.fetch_many` (and callers that ``gather`` many
+:meth:`~BetB2BFeedClient.fetch` calls) run concurrently up to ``concurrency``
+in flight while the sustained rate stays under ``rate_limit_per_minute``. The
+client speaks HTTP/2 to the skin host when the optional ``h2`` package is
+installed, so those concurrent requests multiplex over one connection.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -24,7 +32,10 @@ from src.network.session import SessionPackage
 
 from .config import BetB2BSkinConfig
 from .extraction.models import CapturedFeedResponse
+from .budget import TokenBucket
+from .extraction.decode import Projection
 from .extraction.rules import BetB2BExtractionRules
+from .http_pool import HostClientPool, http2_available
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +76,10 @@ class BetB2BFeedClient:
         rate_limit_per_minute: int = 30,
         user_agent: Optional[str] = None,
         direct: bool = False,
+        http_pool: Optional[HostClientPool] = None,
+        concurrency: int = 1,
+        rate_burst: Optional[int] = None,
+        http2: Optional[bool] = None,
     ) -> None:
         self.skin = skin
         self.session_manager = session_manager
@@ -80,11 +95,16 @@ class BetB2BFeedClient:
             "Mozilla/5.0 (X11; Linux x86_64) Chrome/124.0.0.0 Safari/537.36",
         )
 
+        # A shared HostClientPool (multi-skin runtime) lends the client; the
+        # pool, not this poller, closes it.
+        self.http_pool = http_pool
         self._client: Optional[httpx.AsyncClient] = None
-        self._last_request_at: Optional[float] = None
-        self._min_interval = (
-            60.0 / rate_limit_per_minute if rate_limit_per_minute > 0 else 0.0
-        )
+        # Requests in flight for fetch_many; the bucket's burst defaults to it,
+        # so a concurrent batch starts at once and then settles to the rate.
+        self.concurrency = max(1, concurrency)
+        self.http2 = http2_available() if http2 is None else http2
+        self.rate_limiter = TokenBucket(
+            rate_limit_per_minute, burst=rate_burst or self.concurrency)
 
     # ------------------------------------------------------------------ #
     # Lifecycle
@@ -100,27 +120,37 @@ class BetB2BFeedClient:
         if self._client is not None:
             return
         proxy_url = self.proxy.to_httpx_proxy() if self.proxy is not None else None
-        # httpx 0.28 uses `proxy=` (singular) for a single proxy URL.
-        self._client = httpx.AsyncClient(
-            proxy=proxy_url,
-            timeout=self.timeout,
-            follow_redirects=True,
-            # Only advertise encodings httpx can actually decode. `br` (brotli)
-            # requires the optional `brotli`/`brotlicffi` package; advertising it
-            # without that installed yields undecodable bodies → JSON parse fails
-            # → silently zero markets. Add "br" back only if brotli is available.
-            headers={"accept-encoding": _accept_encoding()},
-        )
+        if self.http_pool is not None:
+            self._client = self.http_pool.client(self.skin.base_url, proxy=proxy_url)
+        else:
+            # httpx 0.28 uses `proxy=` (singular) for a single proxy URL.
+            self._client = httpx.AsyncClient(
+                proxy=proxy_url,
+                timeout=self.timeout,
+                follow_redirects=True,
+                # One multiplexed HTTP/2 connection to the skin host when `h2`
+                # is installed; otherwise enough keep-alive sockets for a batch.
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=self.concurrency,
+                                    max_keepalive_connections=self.concurrency),
+                # Only advertise encodings httpx can actually decode. `br` (brotli)
+                # requires the optional `brotli`/`brotlicffi` package; advertising it
+                # without that installed yields undecodable bodies → JSON parse fails
+                # → silently zero markets. Add "br" back only if brotli is available.
+                headers={"accept-encoding": _accept_encoding()},
+            )
         logger.info(
-            "skin=%s feed client started (proxy=%s, rate=%d/min)",
+            "skin=%s feed client started (proxy=%s, rate=%d/min, burst=%d, http2=%s)",
             self.skin.name,
             self.proxy.id if self.proxy and not self.proxy.is_direct else "DIRECT",
-            self.rate_limit_per_minute,
+            self.rate_limit_per_minute, self.rate_limiter.burst,
+            self.http_pool.http2 if self.http_pool is not None else self.http2,
         )
 
     async def close(self) -> None:
         if self._client is not None:
-            await self._client.aclose()
+            if self.http_pool is None:
+                await self._client.aclose()
             self._client = None
 
     # ------------------------------------------------------------------ #
@@ -133,6 +163,7 @@ class BetB2BFeedClient:
         root: str = "live",
         extra_params: Optional[Dict[str, str]] = None,
         force_session_refresh: bool = False,
+        projection: Optional[Projection] = None,
     ) -> CapturedFeedResponse:
         """Fetch one feed endpoint and return a decoded capture.
 
@@ -142,6 +173,8 @@ class BetB2BFeedClient:
             extra_params: per-call query param overrides.
             force_session_refresh: re-bootstrap the session before this
                 request (use after a 401/403/419/440).
+            projection: keep only these keys of the decoded body (see
+                :func:`~src.sites.betb2b.extraction.decode.project`).
 
         Returns:
             :class:`CapturedFeedResponse` — decoded JSON ready for the
@@ -151,8 +184,8 @@ class BetB2BFeedClient:
             await self.start()
         assert self._client is not None
 
-        # Rate-limit politely.
-        await self._respect_rate_limit()
+        # Rate-limit politely (one bucket for every task using this client).
+        await self.rate_limiter.acquire()
 
         # Direct mode (ADR-15): the un-gated feeds work with no cookies, so skip
         # the browser session bootstrap entirely. Otherwise harvest a session.
@@ -212,6 +245,7 @@ class BetB2BFeedClient:
             status=resp.status_code,
             content_type=content_type,
             raw_bytes=resp.content,
+            projection=projection,
         )
 
     async def fetch_game(
@@ -264,6 +298,7 @@ class BetB2BFeedClient:
         *,
         root: str = "line",
         extra_params: Optional[Dict[str, str]] = None,
+        projection: Optional[Projection] = None,
     ) -> CapturedFeedResponse:
         """Fetch one league's game list via ``GetChampZip?champ=<champId>``.
 
@@ -277,17 +312,22 @@ class BetB2BFeedClient:
         Note: the skin default ``top=true`` filters GetChampZip to *featured*
         games only (returns 0 for a specific champ), so we override it to
         ``top=false`` to get the league's full slate.
+
+        Discovery only reads ``Value.G[].I``/``S``: pass
+        ``projection=CHAMP_PROJECTION`` to drop the rest after decoding.
         """
         params: Dict[str, str] = {"champ": str(champ_id), "top": "false"}
         if extra_params:
             params.update(extra_params)
-        return await self.fetch("champ", root=root, extra_params=params)
+        return await self.fetch("champ", root=root, extra_params=params,
+                                projection=projection)
 
     async def fetch_sports(
         self,
         *,
         root: str = "line",
         extra_params: Optional[Dict[str, str]] = None,
+        projection: Optional[Projection] = None,
     ) -> CapturedFeedResponse:
         """Fetch the full sports→leagues tree via ``GetSportsZip`` (ADR-15).
 
@@ -298,37 +338,39 @@ class BetB2BFeedClient:
 
         Note: like GetChampZip, ``top=true`` (the skin default) filters to only
         "top" leagues — override to ``top=false`` for the full league list.
+        ``projection=SPORTS_PROJECTION`` keeps just what that parser reads.
         """
         params: Dict[str, str] = {"top": "false"}
         if extra_params:
             params.update(extra_params)
-        return await self.fetch("sports_all", root=root, extra_params=params)
+        return await self.fetch("sports_all", root=root, extra_params=params,
+                                projection=projection)
 
     async def fetch_many(
         self,
         feeds: List[str],
         *,
         root: str = "live",
+        roots: Optional[List[str]] = None,
         extra_params: Optional[Dict[str, str]] = None,
     ) -> List[CapturedFeedResponse]:
-        """Fetch multiple feed endpoints sequentially (rate-limited)."""
-        out: List[CapturedFeedResponse] = []
-        for feed in feeds:
-            cap = await self.fetch(feed, root=root, extra_params=extra_params)
-            out.append(cap)
-        return out
+        """Fetch multiple feed endpoints concurrently; captures in ``feeds`` order.
+
+        ``roots`` (one per feed) overrides ``root`` — e.g. the same feed on
+        ``live`` and ``line``. At most ``concurrency`` requests are in flight,
+        and every request still takes a token from :attr:`rate_limiter` — a
+        batch is bounded by the rate limit, not by the sum of its round trips.
+        An HTTP error comes back as :meth:`fetch`'s empty capture, as for a
+        single call.
+        """
+        if roots is None:
+            roots = [root] * len(feeds)
+        elif len(roots) != len(feeds):
+            raise ValueError("roots must name one root per feed")
+        sem = asyncio.Semaphore(self.concurrency)
 
-    # ------------------------------------------------------------------ #
-    # Internals
-    # ------------------------------------------------------------------ #
-    async def _respect_rate_limit(self) -> None:
-        if self._min_interval <= 0 or self._last_request_at is None:
-            self._last_request_at = time.monotonic()
-            return
-        elapsed = time.monotonic() - self._last_request_at
-        wait = self._min_interval - elapsed
-        if wait > 0:
-            import asyncio
+        async def _one(feed: str, feed_root: str) -> CapturedFeedResponse:
+            async with sem:
+                return await self.fetch(feed, root=feed_root, extra_params=extra_params)
 
-            await asyncio.sleep(wait)
-        self._last_request_at = time.monotonic()
+        return list(await asyncio.gather(*(_one(f, r) for f, r in zip(feeds, roots))))
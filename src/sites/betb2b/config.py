@@ -156,6 +156,10 @@ class BetB2BSkinConfig:
             = allow any egress; direct mode works anywhere. list of ISO codes this skin accepts traffic
             from. Used to validate the proxy's egress country before
             bootstrapping.
+        cache_family: key under which statisticfeed enrichment is cached
+            (:mod:`betb2b.enrichment_cache`). Skins on one backend — same
+            event ids — may name the same family to share entries.
+            Defaults to ``name``.
     """
 
     # ----- identity -----
@@ -192,6 +196,7 @@ class BetB2BSkinConfig:
         default_factory=lambda: dict(DEFAULT_STEALTH_PROFILE)
     )
     session_ttl_seconds: int = DEFAULT_SESSION_TTL_SECONDS
+    cache_family: str = ""
 
     # ----- lookups -----
     market_groups: Dict[int, MarketGroup] = field(
@@ -233,6 +238,8 @@ class BetB2BSkinConfig:
     def __post_init__(self) -> None:
         if not self.base_url:
             self.base_url = f"https://{self.domain}"
+        if not self.cache_family:
+            self.cache_family = self.name
         # Always reflect the canonical identity fields back into the query
         # params + headers so callers can override `feed_query_params`
         # freely without losing partner/gr/country.
@@ -435,6 +442,7 @@ class BetB2BSkinConfig:
             "extra_headers": dict(self.extra_headers),
             "stealth_profile": dict(self.stealth_profile),
             "session_ttl_seconds": self.session_ttl_seconds,
+            "cache_family": self.cache_family,
             "market_groups_count": len(self.market_groups),
             "market_types_count": len(self.market_types),
             "sport_map_count": len(self.sport_map),
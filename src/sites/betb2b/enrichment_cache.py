@@ -0,0 +1,350 @@
+"""Persistent TTL cache for statisticfeed enrichment (H2H, statistics).
+
+The live pass re-runs :meth:`BetB2BScraper._enrich_with_h2h` and
+``_enrich_with_stats`` every ~15s, and without a cache each run re-fetches
+``statisticfeed`` for every live event — although a match's head-to-head
+history cannot change while it is being played. :class:`EnrichmentCache`
+answers those calls locally:
+
+* entries are keyed by **(skin family, event id, endpoint)** — skins that
+  share a backend (same event ids) can share entries by naming the same
+  ``family``;
+* every endpoint has its own TTL (:data:`DEFAULT_TTLS`): H2H lives for hours,
+  in-play statistics for a couple of minutes;
+* a ``204`` ("no data for this match") is cached too, as a *negative* entry
+  with its own TTL (:data:`DEFAULT_NEGATIVE_TTLS`), so minor-league matches are
+  not re-polled every pass;
+* an in-memory LRU sits in front of a SQLite file, so a restarted scheduler
+  starts warm. The file is opened on first use; writes are buffered and
+  committed in one transaction by :meth:`EnrichmentCache.flush` (the scraper
+  calls it once per enrichment batch);
+* expired rows are deleted by :meth:`EnrichmentCache.maybe_purge` (the
+  scheduler calls it after every pass; it runs at most once per
+  ``purge_interval``) and on :meth:`EnrichmentCache.close`;
+* :meth:`EnrichmentCache.stats` reports hits / negative hits / misses per
+  endpoint.
+
+Only the raw JSON payload is cached; callers re-run the (cheap) extraction
+rules on a hit, so a rule fix applies to cached payloads immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_NEGATIVE_TTLS",
+    "DEFAULT_TTLS",
+    "CacheEntry",
+    "EnrichmentCache",
+    "enrichment_cache_path",
+]
+
+CACHE_PATH_ENV = "BETB2B_ENRICHMENT_CACHE_PATH"
+DEFAULT_CACHE_PATH = "data/betb2b/enrichment_cache.db"
+
+# Seconds a fetched payload stays fresh, per endpoint. H2H is history — it does
+# not move during a match; in-play statistics do, so they expire quickly.
+DEFAULT_TTLS: Dict[str, float] = {
+    "h2h": 6 * 60 * 60,
+    "stats": 120.0,
+}
+
+# Seconds a 204 "no data" answer is trusted. A match without H2H stays without
+# it; a match without statistics may gain them once it kicks off.
+DEFAULT_NEGATIVE_TTLS: Dict[str, float] = {
+    "h2h": 6 * 60 * 60,
+    "stats": 10 * 60.0,
+}
+
+_FALLBACK_TTL = 300.0
+
+_Key = Tuple[str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrichment_cache (
+    family     TEXT NOT NULL,
+    event_id   TEXT NOT NULL,
+    endpoint   TEXT NOT NULL,
+    payload    TEXT,                -- JSON; NULL for a negative (204) entry
+    expires_at REAL NOT NULL,       -- unix seconds
+    PRIMARY KEY (family, event_id, endpoint)
+)
+"""
+
+
+def enrichment_cache_path(db_path: Optional[str] = None) -> str:
+    """Where the cache file lives: ``$BETB2B_ENRICHMENT_CACHE_PATH``, else next
+    to a SQLite store file, else :data:`DEFAULT_CACHE_PATH` (Postgres URLs)."""
+    env = os.environ.get(CACHE_PATH_ENV)
+    if env:
+        return env
+    if db_path and "://" not in db_path and db_path != ":memory:":
+        return str(Path(db_path).with_name("enrichment_cache.db"))
+    return DEFAULT_CACHE_PATH
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached statisticfeed answer; ``payload is None`` means "204, no data"."""
+
+    payload: Any
+    expires_at: float
+
+    @property
+    def negative(self) -> bool:
+        return self.payload is None
+
+
+class EnrichmentCache:
+    """LRU-fronted, SQLite-backed TTL cache of statisticfeed payloads."""
+
+    def __init__(
+        self, path: Optional[str] = None, *, max_entries: int = 4096,
+        ttls: Optional[Mapping[str, float]] = None,
+        negative_ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+        purge_interval: float = 3600.0,
+    ) -> None:
+        """
+        Args:
+            path: SQLite file (parents created on first use); ``None`` keeps
+                the cache in memory only.
+            max_entries: LRU capacity; evicted entries stay on disk.
+            ttls: per-endpoint TTL overrides, merged over :data:`DEFAULT_TTLS`.
+            negative_ttls: per-endpoint 204 TTL overrides, merged over
+                :data:`DEFAULT_NEGATIVE_TTLS`.
+            clock: wall-clock seconds (expiry must survive restarts).
+            purge_interval: seconds between the expired-row purges run by
+                :meth:`maybe_purge`.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttls = {**DEFAULT_NEGATIVE_TTLS, **(negative_ttls or {})}
+        self._clock = clock
+        self.purge_interval = purge_interval
+        self._purged_at = clock()
+        self._lru: "OrderedDict[_Key, CacheEntry]" = OrderedDict()
+        self._pending: Dict[_Key, CacheEntry] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        # _lock guards the in-memory state and is never held across disk I/O,
+        # so put() on the event loop never waits for a flush or purge running
+        # in a worker thread; _db_lock serialises use of the SQLite connection.
+        self._lock = threading.Lock()      # the scraper may run in several loops/threads
+        self._db_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # -- lookups ---------------------------------------------------------- #
+    def get(self, family: str, event_id: str, endpoint: str) -> Optional[CacheEntry]:
+        """The fresh entry for the key, or ``None`` (miss or expired)."""
+        key = (str(family), str(event_id), endpoint)
+        now = self._clock()
+        with self._lock:
+            entry = self._memory_entry(key)
+        loaded = self._load(key) if entry is None else None
+        with self._lock:
+            counters = self._counters(endpoint)
+            if loaded is not None:
+                # A put() may have landed while the disk was read; it wins.
+                entry = self._memory_entry(key)
+                if entry is None:
+                    entry = loaded
+                    counters["disk_hits"] += 1
+            if entry is not None:
+                self._remember(key, entry)
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    counters["expired"] += 1
+                    self._lru.pop(key, None)
+                counters["misses"] += 1
+                return None
+            self._lru.move_to_end(key)
+            counters["negative_hits" if entry.negative else "hits"] += 1
+            return entry
+
+    def get_many(self, family: str, event_ids: List[str],
+                 endpoint: str) -> Dict[str, Optional[CacheEntry]]:
+        """:meth:`get` for a batch of ids — one call to hand to a worker thread."""
+        return {str(eid): self.get(family, eid, endpoint) for eid in event_ids}
+
+    def put(self, family: str, event_id: str, endpoint: str, payload: Any) -> None:
+        """Cache a ``200`` payload (JSON-serialisable) for the endpoint's TTL."""
+        self._store((str(family), str(event_id), endpoint), payload,
+                    self.ttls.get(endpoint, _FALLBACK_TTL))
+
+    def put_negative(self, family: str, event_id: str, endpoint: str) -> None:
+        """Cache a ``204`` "no data" answer for the endpoint's negative TTL."""
+        self._store((str(family), str(event_id), endpoint), None,
+                    self.negative_ttls.get(endpoint, _FALLBACK_TTL))
+
+    def _store(self, key: _Key, payload: Any, ttl: float) -> None:
+        entry = CacheEntry(payload=payload, expires_at=self._clock() + ttl)
+        with self._lock:
+            self._counters(key[2])["writes"] += 1
+            self._remember(key, entry)
+            if self.path is not None:
+                self._pending[key] = entry
+
+    def _memory_entry(self, key: _Key) -> Optional[CacheEntry]:
+        entry = self._lru.get(key)
+        if entry is None:
+            entry = self._pending.get(key)         # evicted before its flush
+        return entry
+
+    def _remember(self, key: _Key, entry: CacheEntry) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _counters(self, endpoint: str) -> Dict[str, int]:
+        counters = self._stats.get(endpoint)
+        if counters is None:
+            counters = self._stats[endpoint] = {
+                "hits": 0, "negative_hits": 0, "misses": 0,
+                "expired": 0, "disk_hits": 0, "writes": 0,
+            }
+        return counters
+
+    # -- SQLite backing ---------------------------------------------------- #
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.path is None or self._disk_failed:
+            return None
+        if self._conn is None:
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_SCHEMA)
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as exc:
+                # A broken cache file must never break enrichment — run LRU-only.
+                logger.warning("enrichment cache %s unusable (%s) — memory only",
+                               self.path, exc)
+                self._disk_failed = True
+                return None
+        return self._conn
+
+    def _load(self, key: _Key) -> Optional[CacheEntry]:
+        with self._db_lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM enrichment_cache "
+                    "WHERE family = ? AND event_id = ? AND endpoint = ?", key,
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug("enrichment cache read failed: %s", exc)
+                return None
+        if row is None:
+            return None
+        payload = json.loads(row[0]) if row[0] is not None else None
+        return CacheEntry(payload=payload, expires_at=float(row[1]))
+
+    def flush(self) -> int:
+        """Commit buffered writes in one transaction; returns how many."""
+        with self._db_lock:
+            # Taken under _db_lock: a get() that misses these in memory then
+            # waits for the commit instead of reading the rows before it
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            conn = self._connection()
+            if conn is None:
+                return 0
+            rows: List[Tuple[Any, ...]] = [
+                (*key, None if e.negative else json.dumps(e.payload, separators=(",", ":")),
+                 e.expires_at)
+                for key, e in pending.items()
+            ]
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO enrichment_cache "
+                        "(family, event_id, endpoint, payload, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?)", rows,
+                    )
+            except sqlite3.Error as exc:
+                logger.warning("enrichment cache flush failed: %s", exc)
+                return 0
+            return len(rows)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from memory and disk; returns the disk count."""
+        now = self._clock()
+        self.flush()
+        with self._lock:
+            for key in [k for k, e in self._lru.items() if e.expires_at <= now]:
+                del self._lru[key]
+        with self._db_lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            try:
+                with conn:
+                    return conn.execute(
+                        "DELETE FROM enrichment_cache WHERE expires_at <= ?", (now,),
+                    ).rowcount
+            except sqlite3.Error as exc:
+                logger.warning("enrichment cache purge failed: %s", exc)
+                return 0
+
+    def maybe_purge(self) -> int:
+        """:meth:`purge_expired` if ``purge_interval`` has passed since the last
+        purge, else nothing. Cheap to call after every pass."""
+        with self._lock:
+            now = self._clock()
+            if now - self._purged_at < self.purge_interval:
+                return 0
+            self._purged_at = now
+        return self.purge_expired()
+
+    def close(self) -> None:
+        """Flush pending writes, purge expired entries and close the SQLite file."""
+        self.flush()
+        if self._conn is not None:
+            self.purge_expired()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- introspection ----------------------------------------------------- #
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint counters plus totals and the overall hit ratio."""
+        with self._lock:
+            endpoints = {name: dict(c) for name, c in self._stats.items()}
+            entries = len(self._lru)
+            pending = len(self._pending)
+        hits = sum(c["hits"] + c["negative_hits"] for c in endpoints.values())
+        misses = sum(c["misses"] for c in endpoints.values())
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "pending_writes": pending,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "endpoints": endpoints,
+            "path": self.path,
+        }
@@ -0,0 +1,108 @@
+"""JSON decoding and key projection for BetB2B feed bodies.
+
+``GetSportsZip`` / ``GetChampsZip`` / ``GetGameZip`` bodies run from tens of
+kilobytes to several megabytes, and decoding them used to cost three passes:
+``bytes.decode`` into a ``str`` copy, ``json.loads`` over that copy, then a
+full walk of the tree. This module trims that down:
+
+* :func:`loads` parses the response **bytes** directly — no intermediate
+  ``str`` — with the fastest backend available: ``orjson`` when it is
+  installed, the stdlib ``json`` otherwise (which also accepts bytes). Set
+  ``BETB2B_JSON_BACKEND=json`` to force the stdlib. A body that is not valid
+  UTF-8 falls back to the historical ``errors="replace"`` decode, so the
+  result never differs from what :meth:`decode_response` produced before;
+* :func:`project` keeps only the keys a caller reads, given as a nested
+  spec (``{"Value": {"G": {"I", "S"}}}``; ``True`` keeps a value whole, a
+  set keeps just those keys) applied through lists transparently. Champ discovery
+  uses :data:`CHAMP_PROJECTION`, which drops every game body but its id and
+  start time (<1% of the tree) right after parsing.
+
+Neither backend streams, so projection prunes after the parse rather than
+during it: it pays off when it drops whole subtrees (``GetChampZip`` games)
+and costs more than it saves when most of the tree survives, which is why
+:data:`SPORTS_PROJECTION` (~20% kept) is only for callers that retain the
+capture. ``GetGameZip`` bodies are not projected — the extractor reads most
+of an event's keys; its event walk skips the market subtrees instead.
+``scripts/bench_decode.py`` measures both paths over recorded payloads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Callable, Mapping, Union
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CHAMP_PROJECTION",
+    "SPORTS_PROJECTION",
+    "backend_name",
+    "loads",
+    "project",
+]
+
+Projection = Union[bool, set, frozenset, Mapping[str, Any]]
+
+#: ``GetSportsZip``: sport id + its leagues' id, game count and name.
+SPORTS_PROJECTION: Mapping[str, Any] = {
+    "Success": True, "Error": True, "Value": {"I": True, "L": {"LI", "GC", "L"}},
+}
+#: ``GetChampZip``: the league's game ids and start times.
+CHAMP_PROJECTION: Mapping[str, Any] = {
+    "Success": True, "Error": True, "Value": {"G": {"I", "S"}},
+}
+
+
+def _select_backend() -> "tuple[str, Callable[[bytes], Any]]":
+    wanted = os.environ.get("BETB2B_JSON_BACKEND", "").strip().lower()
+    if wanted != "json":
+        try:
+            import orjson  # type: ignore[import-not-found]
+        except ImportError:
+            if wanted == "orjson":
+                logger.warning("BETB2B_JSON_BACKEND=orjson but orjson is not installed")
+        else:
+            return "orjson", orjson.loads
+    return "json", json.loads
+
+
+_BACKEND, _loads = _select_backend()
+
+
+def backend_name() -> str:
+    """``"orjson"`` or ``"json"`` — the parser :func:`loads` uses."""
+    return _BACKEND
+
+
+def loads(raw: Union[bytes, bytearray, memoryview]) -> Any:
+    """Parse a JSON body straight from its bytes.
+
+    Raises ``ValueError`` (``json.JSONDecodeError`` and orjson's error both
+    subclass it) when the body is not JSON.
+    """
+    try:
+        return _loads(raw)
+    except (UnicodeDecodeError, ValueError):
+        # Invalid UTF-8 (or a BOM) — retry the lenient text decode the
+        # extractor always used, which replaces the bad bytes.
+        return json.loads(bytes(raw).decode("utf-8", errors="replace"))
+
+
+def project(node: Any, spec: Projection) -> Any:
+    """Keep only the keys named in ``spec``, recursing through lists.
+
+    ``spec`` is ``True`` (keep ``node`` whole), a set of keys (keep those
+    keys whole) or a mapping of key → sub-spec. Keys missing from ``node``
+    are skipped; non-container values are returned as-is.
+    """
+    if spec is True:
+        return node
+    if isinstance(node, list):
+        return [project(item, spec) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if isinstance(spec, (set, frozenset)):
+        return {k: node[k] for k in spec if k in node}
+    return {k: project(node[k], sub) for k, sub in spec.items() if k in node}
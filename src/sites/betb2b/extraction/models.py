@@ -194,9 +194,13 @@ class Event:
     # verified (G,T) core map has no entry. Exact exotic per-group labels stay
     # deferred (never guess). Empty when the feed carries no MEC.
     market_categories: List[Dict[str, Any]] = field(default_factory=list)
+    # Set by the scraper when this is the previous pass's parse of a
+    # byte-identical GetGameZip body (payload fingerprint match): nothing to
+    # persist. Emitted in ``to_dict`` only when True.
+    unchanged: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        d = {
             "event_id": self.event_id,
             "sport": self.sport.value,
             "competition": self.competition,
@@ -232,6 +236,9 @@ class Event:
             "sub_games": self.sub_games,
             "market_categories": self.market_categories,
         }
+        if self.unchanged:
+            d["unchanged"] = True
+        return d
 
 
 @dataclass
@@ -304,6 +311,7 @@ class CapturedFeedResponse:
     body_bytes: int
     decoded: Dict[str, Any]               # parsed JSON (empty dict if decode failed)
     captured_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    fingerprint: Optional[str] = None     # see rules.payload_fingerprint (None: no body)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
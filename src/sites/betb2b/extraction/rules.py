@@ -26,6 +26,7 @@ mid-scrape.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
@@ -34,6 +35,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from ..config import BetB2BSkinConfig
 from ..markets import lookup_market
 from ..sport_ids import lookup_sport
+from .decode import Projection, project
+from .decode import loads as decode_json
 from .models import (
     CapturedFeedResponse,
     Event,
@@ -49,6 +52,22 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+#: Event keys holding markets / scores / metadata — never nested events.
+_NO_EVENT_KEYS = frozenset({"E", "AE", "GE", "SC", "MEC", "MIO", "MIS", "WP"})
+
+
+def payload_fingerprint(raw_bytes: bytes) -> str:
+    """A 128-bit content hash of a feed body, for "has this game changed?".
+
+    The 1xbet envelope (``Id``/``Guid``/``Error``…) can differ between two
+    otherwise identical responses, so hashing starts at the ``"Value":`` key —
+    the feed serialises it last. If it is not last, the hash merely covers more
+    than it needs to; a changed ``Value`` always changes the fingerprint.
+    """
+    start = raw_bytes.find(b'"Value":')
+    body = raw_bytes[start:] if start >= 0 else raw_bytes
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # Coercion helpers
@@ -263,22 +282,27 @@ class BetB2BExtractionRules:
         status: int,
         content_type: str,
         raw_bytes: Optional[bytes],
+        *,
+        projection: Optional[Projection] = None,
     ) -> CapturedFeedResponse:
         """Decode a raw HTTP response into a :class:`CapturedFeedResponse`.
 
         ``raw_bytes`` may be ``None`` for bodyless responses (204, 304).
         Decode failures result in an empty ``decoded`` dict — the
         extractor will then return no events, but the scrape continues.
+        ``projection`` (see :func:`.decode.project`) keeps only the keys
+        the caller reads; it applies to the envelope, not ``_root_list``.
         """
         decoded: Dict[str, Any] = {}
         body_len = len(raw_bytes) if raw_bytes else 0
         if raw_bytes:
             try:
-                text = raw_bytes.decode("utf-8", errors="replace")
-                decoded = json.loads(text)
+                decoded = decode_json(raw_bytes)
                 if not isinstance(decoded, dict):
                     # Some payloads are top-level lists — wrap them.
                     decoded = {"_root_list": decoded}
+                elif projection is not None:
+                    decoded = project(decoded, projection)
             except (json.JSONDecodeError, ValueError) as exc:
                 logger.debug("Could not decode JSON from %s: %s", url, exc)
                 decoded = {}
@@ -289,6 +313,7 @@ class BetB2BExtractionRules:
             content_type=content_type,
             body_bytes=body_len,
             decoded=decoded,
+            fingerprint=payload_fingerprint(raw_bytes) if raw_bytes else None,
         )
 
     def extract_from_captured(self, captured: CapturedFeedResponse) -> List[Event]:
@@ -357,7 +382,9 @@ class BetB2BExtractionRules:
         """Flatten a nested Value structure into a list of event dicts.
 
         Some endpoints (e.g. ``GetSportsShortZip``) return
-        ``{"Value": [{"Sports": [{"Events": [...]}]}]}`` — walk it.
+        ``{"Value": [{"Sports": [{"Events": [...]}]}]}`` — walk it. Market
+        and score subtrees (:data:`_NO_EVENT_KEYS`) never hold events and
+        make up most of a GetGameZip body, so the walk skips them.
         """
         out: List[Dict[str, Any]] = []
 
@@ -365,8 +392,9 @@ class BetB2BExtractionRules:
             if isinstance(node, dict):
                 if self._looks_like_event(node):
                     out.append(node)
-                for v in node.values():
-                    walk(v)
+                for k, v in node.items():
+                    if k not in _NO_EVENT_KEYS:
+                        walk(v)
             elif isinstance(node, list):
                 for item in node:
                     walk(item)
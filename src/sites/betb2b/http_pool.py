@@ -0,0 +1,104 @@
+"""Per-host shared HTTP clients + request budgets for multi-skin runtimes.
+
+One :class:`BetB2BScraper` normally owns a long-lived feed client *and* opens a
+fresh ``httpx.AsyncClient`` for every H2H / stats / results batch. Ten skins in
+ten processes therefore hold ten pools plus a stream of short-lived ones. The
+:class:`HostClientPool` is shared by every scraper in a process:
+
+* **one client per (host, proxy)** — the feed and statisticfeed calls for a
+  skin reuse the same keep-alive connections; skins on the same host share
+  them too. HTTP/2 (multiplexed, so a handful of sockets per host) is used when
+  the optional ``h2`` package is installed, HTTP/1.1 keep-alive otherwise;
+* **one** :class:`~.budget.RequestBudget` **per host** — the concurrency cap
+  and token bucket apply to the origin, however many skins/passes hit it.
+
+Clients handed out by the pool belong to the pool: callers must not close
+them; :meth:`HostClientPool.aclose` does.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from .budget import RequestBudget
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["HostClientPool", "http2_available"]
+
+
+def http2_available() -> bool:
+    """httpx speaks HTTP/2 only with the optional ``h2`` package installed."""
+    try:
+        __import__("h2")
+        return True
+    except ImportError:
+        return False
+
+
+def _host(url: str) -> str:
+    parts = urlsplit(url if "//" in url else f"https://{url}")
+    return f"{parts.scheme or 'https'}://{parts.netloc.lower()}"
+
+
+class HostClientPool:
+    """Lazily-built ``httpx.AsyncClient`` and :class:`RequestBudget` per host."""
+
+    def __init__(
+        self, *, timeout: float = 20.0, http2: Optional[bool] = None,
+        max_connections_per_host: int = 16, concurrency: int = 8,
+        rate_per_minute: float = 0.0, headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.http2 = http2_available() if http2 is None else http2
+        self.max_connections_per_host = max_connections_per_host
+        self.concurrency = concurrency
+        self.rate_per_minute = rate_per_minute
+        self.headers = dict(headers or {})
+        self._clients: Dict[Tuple[str, Optional[str]], httpx.AsyncClient] = {}
+        self._budgets: Dict[str, RequestBudget] = {}
+
+    def client(self, url: str, *, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """The shared client for ``url``'s origin (and ``proxy``, if any)."""
+        key = (_host(url), proxy)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy, timeout=self.timeout, follow_redirects=True,
+                http2=self.http2, headers=self.headers,
+                limits=httpx.Limits(max_connections=self.max_connections_per_host,
+                                    max_keepalive_connections=self.max_connections_per_host),
+            )
+            self._clients[key] = client
+            logger.info("http pool: new client for %s (proxy=%s, http2=%s)",
+                        key[0], "yes" if proxy else "DIRECT", self.http2)
+        return client
+
+    def budget(self, url: str) -> RequestBudget:
+        """The request budget (concurrency + token bucket) for ``url``'s origin."""
+        host = _host(url)
+        budget = self._budgets.get(host)
+        if budget is None:
+            budget = self._budgets[host] = RequestBudget(
+                self.concurrency, rate_per_minute=self.rate_per_minute)
+        return budget
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "http2": self.http2,
+            "clients": len(self._clients),
+            "hosts": sorted({h for h, _ in self._clients} | set(self._budgets)),
+            "budgets": {h: b.stats() for h, b in self._budgets.items()},
+        }
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:  # noqa: BLE001 — closing must not mask shutdown
+                logger.debug("http pool: client close failed", exc_info=True)
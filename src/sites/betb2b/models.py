@@ -4,7 +4,8 @@ ADR-11 moves betb2b data from a file-SQLite (raw ``sqlite3``) store to a shared
 Railway PostgreSQL. The store's schema (ADR-6) is a clean relational model —
 ``sports``, ``countries``, ``leagues``, ``teams``, ``events``, ``markets``,
 ``scrape_runs``, ``event_states``, ``period_scores``, ``odds_snapshots``,
-``h2h_games``, ``h2h_period_scores``, ``statistics`` — kept deliberately
+``h2h_games``, ``h2h_period_scores``, ``statistics`` (+ the materialized
+``current_odds``) — kept deliberately
 "Postgres-portable". This module is that port: the same tables/columns/keys as
 ``store.py``'s ``SCHEMA`` string, but declared with SQLAlchemy types that
 compile cleanly on **both** SQLite (local/CI fallback) and PostgreSQL
@@ -50,6 +51,8 @@ from sqlalchemy import (
     Integer,
     Text,
     UniqueConstraint,
+    func,
+    literal_column,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from typing import Optional
@@ -240,6 +243,39 @@ class OddsSnapshot(Base):
     )
 
 
+class CurrentOdds(Base):
+    """Latest ``odds_snapshots`` row per odds key, upserted at ingest time.
+
+    ``selection_name``/``line`` may be NULL yet are part of the key, so
+    uniqueness is a COALESCE expression index (:data:`CURRENT_ODDS_KEY`) — the
+    same one the ``ON CONFLICT`` upsert targets on both backends.
+    """
+    __tablename__ = "current_odds"
+    id: Mapped[int] = mapped_column(SurrogatePK, primary_key=True, autoincrement=True)
+    event_id: Mapped[str] = mapped_column(Text, ForeignKey("events.event_id"), nullable=False)
+    skin: Mapped[str] = mapped_column(Text, nullable=False)
+    scope: Mapped[str] = mapped_column(Text, nullable=False, default="FULL_MATCH")
+    market_id: Mapped[int] = mapped_column(ForeignKey("markets.market_id"), nullable=False)
+    selection_name: Mapped[Optional[str]] = mapped_column(Text)
+    line: Mapped[Optional[float]] = mapped_column(Float)
+    price: Mapped[float] = mapped_column(Float, nullable=False)
+    is_suspended: Mapped[Optional[bool]] = mapped_column(Boolean)
+    raw_t: Mapped[Optional[int]] = mapped_column(Integer)
+    run_id: Mapped[int] = mapped_column(SurrogatePK, ForeignKey("scrape_runs.run_id"), nullable=False)
+    captured_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# The conflict key of current_odds (also the unique index below). Literal
+# sentinels, not bound parameters, so the upsert target matches the index.
+CURRENT_ODDS_KEY = (
+    CurrentOdds.__table__.c.event_id, CurrentOdds.__table__.c.skin,
+    CurrentOdds.__table__.c.scope, CurrentOdds.__table__.c.market_id,
+    func.coalesce(CurrentOdds.__table__.c.selection_name, literal_column("''")),
+    func.coalesce(CurrentOdds.__table__.c.line, literal_column("-1e9")),
+)
+Index("ux_current_odds", *CURRENT_ODDS_KEY, unique=True)
+
+
 class H2HGame(Base):
     __tablename__ = "h2h_games"
     id: Mapped[int] = mapped_column(SurrogatePK, primary_key=True, autoincrement=True)
@@ -0,0 +1,237 @@
+"""Compact in-memory snapshot of the latest stored odds/state per event.
+
+Change-only persistence (``store._persist_events_bulk``) used to re-read the
+previous ``event_states`` / ``period_scores`` / ``current_odds`` rows for every
+event of every pass, only to find that almost nothing moved in 15 seconds.
+:class:`OddsState` keeps that "last stored value" in the scheduler instead and
+diffs each pass in memory, so the writer receives **deltas only**:
+
+* one block per **(skin, event)** holds the event's selections in three
+  parallel, packed arrays — a sorted ``array('q')`` of 64-bit selection keys
+  (the hash of *scope, market name/type/G, selection, line*), an ``array('d')``
+  of prices and a ``bytearray`` of suspension flags — plus the last state tuple
+  and the per-period scores. That is ~17 bytes per tracked selection plus a
+  small per-event overhead (:meth:`OddsState.stats` reports the measured
+  footprint); lookups are a ``bisect`` over the key array;
+* :meth:`OddsState.diff` turns a ``BetB2BScrapeResult.to_dict()`` into the
+  same payload with only changed selections / period rows left and a
+  ``state_changed`` flag per event, marked ``deltas_only`` so the store skips
+  its own prefetches (``odds_skipped`` carries the in-memory skip count for
+  the persist log line);
+* the snapshot is rebuilt from the DB on start-up
+  (:func:`store.live_state_snapshot` for events seen within ``window``);
+  events first seen later are loaded on demand through the same writer queue,
+  so a block always starts from what the DB holds;
+* a failed write :meth:`forgets <OddsState.forget>` its events — the next
+  pass reloads them from the DB rather than trusting state that never landed.
+
+Selections absent from a pass stay tracked (``current_odds`` keeps them too),
+and blocks not seen for ``window`` seconds are pruned.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .store import _state_key
+from .store_bulk import as_int
+
+__all__ = ["OddsState", "selection_key"]
+
+DEFAULT_WINDOW = 6 * 60 * 60.0
+
+
+def selection_key(scope: Optional[str], market: Tuple[Any, Any, Any],
+                  selection: Any, line: Any) -> int:
+    """64-bit key of one odds row: ``market`` is ``(name, market_type, raw_g)``.
+
+    Mirrors the store's dedup key ``(scope, market_id, selection, line)`` with
+    the market's natural key in place of its surrogate id. Python's ``hash`` is
+    salted per process, which is fine: the snapshot is rebuilt every start.
+    """
+    return hash((scope or "FULL_MATCH", *market, selection, line))
+
+
+class _Block:
+    """The latest stored values for one (skin, event)."""
+
+    __slots__ = ("keys", "prices", "susp", "state", "periods", "seen")
+
+    def __init__(self, seen: float) -> None:
+        self.keys = array("q")
+        self.prices = array("d")
+        self.susp = bytearray()
+        self.state: Optional[tuple] = None
+        self.periods: Dict[Any, tuple] = {}
+        self.seen = seen
+
+    def merge(self, fresh: Mapping[int, Tuple[float, int]]) -> None:
+        """Add keys not tracked yet, keeping the arrays sorted by key."""
+        rows = sorted([*zip(self.keys, self.prices, self.susp),
+                       *((k, p, s) for k, (p, s) in fresh.items())])
+        self.keys = array("q", [r[0] for r in rows])
+        self.prices = array("d", [r[1] for r in rows])
+        self.susp = bytearray(r[2] for r in rows)
+
+    def nbytes(self) -> int:
+        return (sys.getsizeof(self) + sys.getsizeof(self.keys) + sys.getsizeof(self.prices)
+                + sys.getsizeof(self.susp) + sys.getsizeof(self.periods)
+                + (sys.getsizeof(self.state) if self.state is not None else 0))
+
+
+class OddsState:
+    """Latest persisted state/periods/odds per (skin, event), diffed in memory."""
+
+    def __init__(self, *, window: float = DEFAULT_WINDOW,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            window: seconds an event stays tracked after it was last seen; also
+                how far back the start-up rebuild reaches.
+            clock: monotonic seconds, for pruning.
+        """
+        self.window = window
+        self._clock = clock
+        self._blocks: Dict[Tuple[str, str], _Block] = {}
+        self._stats: Dict[str, int] = {
+            "selections_seen": 0, "selections_changed": 0,
+            "events_loaded": 0, "events_forgotten": 0, "events_pruned": 0,
+        }
+
+    # -- loading --------------------------------------------------------- #
+    def unknown(self, skin: str, event_ids: Iterable[str]) -> List[str]:
+        """The ids (deduplicated, in order) with no block yet for ``skin``."""
+        return [eid for eid in dict.fromkeys(event_ids) if (skin, eid) not in self._blocks]
+
+    def load(self, skin: str, snapshot: Mapping[str, Any],
+             event_ids: Sequence[str] = ()) -> int:
+        """Install blocks from a :func:`store.live_state_snapshot` answer.
+
+        ``event_ids`` are ids the snapshot was asked about: those the DB has
+        nothing for get an empty block (a brand-new event). Returns the number
+        of blocks installed.
+        """
+        now = self._clock()
+        states = snapshot.get("states") or {}
+        periods = snapshot.get("periods") or {}
+        odds = snapshot.get("odds") or {}
+        ids = dict.fromkeys([*event_ids, *states, *periods, *odds])
+        for eid in ids:
+            block = _Block(now)
+            block.state = states.get(eid)
+            block.periods = dict(periods.get(eid) or {})
+            block.merge({
+                selection_key(scope, market, sel, line): (float(price), 1 if susp else 0)
+                for scope, market, sel, line, price, susp in odds.get(eid) or ()
+            })
+            self._blocks[(skin, eid)] = block
+        self._stats["events_loaded"] += len(ids)
+        return len(ids)
+
+    def forget(self, skin: str, event_ids: Iterable[str]) -> None:
+        """Drop the blocks of events whose write failed (reloaded on next sight)."""
+        for eid in event_ids:
+            if self._blocks.pop((skin, eid), None) is not None:
+                self._stats["events_forgotten"] += 1
+
+    def prune(self) -> int:
+        """Drop blocks not seen within ``window``; returns how many."""
+        cutoff = self._clock() - self.window
+        stale = [k for k, b in self._blocks.items() if b.seen < cutoff]
+        for k in stale:
+            del self._blocks[k]
+        self._stats["events_pruned"] += len(stale)
+        return len(stale)
+
+    # -- diffing --------------------------------------------------------- #
+    def diff(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """The result with every event reduced to what changed since the last
+        :meth:`diff` (or load), marked ``deltas_only``. Updates the snapshot.
+
+        Events flagged ``unchanged`` pass through as-is (the store only advances
+        their ``last_seen``).
+        """
+        skin = result.get("skin") or ""
+        now = self._clock()
+        events = []
+        for ev in result.get("events") or []:
+            event_id = str(ev.get("event_id") or "").strip()
+            if not event_id:
+                events.append(ev)
+                continue
+            block = self._blocks.get((skin, event_id))
+            if block is None:
+                block = self._blocks[(skin, event_id)] = _Block(now)
+            block.seen = now
+            events.append(ev if ev.get("unchanged") else self._diff_event(block, ev))
+        return {**result, "events": events, "deltas_only": True}
+
+    def _diff_event(self, block: _Block, ev: Dict[str, Any]) -> Dict[str, Any]:
+        state = _state_key(ev)
+        state_changed = state != block.state
+        block.state = state
+
+        periods = []
+        for ps in ev.get("period_scores") or []:
+            pk = as_int(ps.get("period_key"))
+            row = (ps.get("period_name"), as_int(ps.get("home_score")), as_int(ps.get("away_score")))
+            if block.periods.get(pk) != row:
+                periods.append(ps)
+                block.periods[pk] = row
+
+        keys, prices, susp = block.keys, block.prices, block.susp
+        fresh: Dict[int, Tuple[float, int]] = {}
+        markets = []
+        seen = skipped = 0
+        for m in ev.get("markets") or []:
+            market = (m.get("name"), m.get("market_type"), as_int(m.get("raw_g")))
+            changed = []
+            for s in m.get("selections") or []:
+                price = s.get("price")
+                if price is None:
+                    continue
+                seen += 1
+                value = (float(price), 1 if s.get("is_suspended") else 0)
+                key = selection_key(m.get("scope"), market, s.get("name"), s.get("line"))
+                i = bisect_left(keys, key)
+                if i < len(keys) and keys[i] == key:
+                    if (prices[i], susp[i]) == value:
+                        skipped += 1
+                        continue
+                    prices[i], susp[i] = value
+                elif fresh.get(key) == value:
+                    skipped += 1
+                    continue
+                else:
+                    fresh[key] = value
+                changed.append(s)
+            if changed:
+                markets.append({**m, "selections": changed})
+        if fresh:
+            block.merge(fresh)
+
+        self._stats["selections_seen"] += seen
+        self._stats["selections_changed"] += seen - skipped
+        return {**ev, "markets": markets, "period_scores": periods,
+                "state_changed": state_changed, "odds_skipped": skipped}
+
+    # -- introspection --------------------------------------------------- #
+    def stats(self) -> Dict[str, Any]:
+        """Tracked events/selections, the measured footprint and diff counters."""
+        selections = sum(len(b.keys) for b in self._blocks.values())
+        nbytes = sys.getsizeof(self._blocks) + sum(
+            sys.getsizeof(k) + b.nbytes() for k, b in self._blocks.items())
+        s = self._stats
+        return {
+            "events": len(self._blocks),
+            "selections": selections,
+            "bytes": nbytes,
+            "bytes_per_selection": round(nbytes / selections, 1) if selections else 0.0,
+            "change_ratio": (round(s["selections_changed"] / s["selections_seen"], 3)
+                             if s["selections_seen"] else 0.0),
+            **s,
+        }
@@ -0,0 +1,341 @@
+"""Retention tier: roll old fact rows out of the hot SQLite store.
+
+``odds_snapshots``, ``event_states``, ``period_scores`` and ``statistics`` are
+append-only, so the store grows without bound — ADR-22's scheduled-only mode
+exists because the disk ran out. :func:`archive_old_facts` moves every row
+captured before ``older_than_days`` into **one compressed, columnar file per
+(table, day)**, and deletes it from the hot tables:
+
+* a partition file is gzip'd JSON holding one array per column; every text
+  column (event ids, skins, selection names, timestamps…) is
+  **dictionary-encoded** — distinct values once, then integer codes — which
+  is what makes the time-series compress well;
+* the ``archive_partitions`` table catalogues the files, so readers find them
+  from the connection alone. :func:`store.line_movement` merges the archived
+  points of a selection with the hot ones, so callers see one series;
+* change detection still reads the newest ``event_states`` row per (event,
+  skin) and ``period_scores`` row per (event, skin, period): those are never
+  archived, however old (nor is each table's highest row id, which keeps new
+  ids from colliding with archived ones). Current prices live in
+  ``current_odds``, which is not a fact table and is left alone;
+* each day is written (merged with an existing file, deduplicated on the
+  row id, swapped in atomically) *before* its rows are deleted and the
+  catalog committed, so a crash in between only re-archives the same rows.
+
+SQLite reuses the freed pages, so the store file stops growing once the hot
+window is full; ``vacuum=True`` also gives the space back to the OS. The ORM /
+Postgres path (ADR-13) has its own retention and is not handled here.
+
+    python -m src.sites.betb2b.cli.main archive --db data/betb2b/odds.db --older-than-days 14
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ARCHIVE_TABLES",
+    "Partition",
+    "archive_dir_for",
+    "archive_old_facts",
+    "archived_line_movement",
+    "load_partition",
+]
+
+FORMAT_VERSION = 1
+DEFAULT_OLDER_THAN_DAYS = 30.0
+
+#: table → (row id column, columns whose newest row is always kept hot).
+ARCHIVE_TABLES: Mapping[str, Tuple[str, Tuple[str, ...]]] = {
+    "odds_snapshots": ("snap_id", ()),
+    "event_states": ("state_id", ("event_id", "skin")),
+    "period_scores": ("id", ("event_id", "skin", "period_key")),
+    "statistics": ("id", ()),
+}
+
+_DELETE_CHUNK = 500
+
+
+def archive_dir_for(conn: sqlite3.Connection) -> Path:
+    """Default archive directory: ``<store stem>_archive/`` next to the store."""
+    db = _db_file(conn)
+    if db is None:
+        raise ValueError("an in-memory store has no archive directory; pass archive_dir")
+    return db.with_name(f"{db.stem}_archive")
+
+
+def archive_old_facts(
+    conn: sqlite3.Connection, *, older_than_days: float = DEFAULT_OLDER_THAN_DAYS,
+    archive_dir: Optional[os.PathLike] = None, now: Optional[datetime] = None,
+    tables: Iterable[str] = tuple(ARCHIVE_TABLES), vacuum: bool = False,
+) -> Dict[str, int]:
+    """Move fact rows captured before the cutoff day into the archive tier.
+
+    The cutoff is midnight UTC ``older_than_days`` before ``now``, so whole
+    days are archived at once. Returns rows archived per table.
+    """
+    if not isinstance(conn, sqlite3.Connection):
+        raise NotImplementedError("retention archiving is for the SQLite store only")
+    root = Path(archive_dir) if archive_dir is not None else archive_dir_for(conn)
+    now = now or datetime.now(timezone.utc)
+    cutoff = (now - timedelta(days=older_than_days)).strftime("%Y-%m-%d")
+    moved: Dict[str, int] = {}
+    for table in tables:
+        moved[table] = _archive_table(conn, table, cutoff, root)
+    if vacuum and any(moved.values()):
+        conn.execute("VACUUM")
+    if any(moved.values()):
+        logger.info("retention: archived %s (cutoff %s) into %s",
+                    ", ".join(f"{n} {t}" for t, n in moved.items() if n), cutoff, root)
+    return moved
+
+
+def _archive_table(conn: sqlite3.Connection, table: str, cutoff: str, root: Path) -> int:
+    pk, keep_by = ARCHIVE_TABLES[table]
+    # The table's highest row id always stays: ids are MAX+1, not AUTOINCREMENT,
+    # and an emptied table would hand out ids already in the archive.
+    keep = f" AND {pk} < (SELECT MAX({pk}) FROM {table})"
+    if keep_by:
+        keep += f" AND {pk} NOT IN (SELECT MAX({pk}) FROM {table} GROUP BY {', '.join(keep_by)})"
+    days = [r[0] for r in conn.execute(
+        f"SELECT DISTINCT substr(captured_at, 1, 10) FROM {table} WHERE captured_at < ?{keep}",
+        (cutoff,))]
+    total = 0
+    for day in sorted(days):
+        # One day per transaction: bounded memory, and the read is finished
+        # before that day's rows are deleted.
+        cur = conn.execute(
+            f"SELECT * FROM {table} WHERE substr(captured_at, 1, 10) = ? "
+            f"AND captured_at < ?{keep} ORDER BY {pk}", (day, cutoff))
+        columns = [d[0] for d in cur.description]
+        rows = [tuple(r) for r in cur.fetchall()]
+        if rows:
+            total += _flush_day(conn, table, pk, day, columns, rows, root)
+    return total
+
+
+def _flush_day(conn: sqlite3.Connection, table: str, pk: str, day: str,
+               columns: List[str], rows: List[tuple], root: Path) -> int:
+    path = root / table / f"{day or 'undated'}.json.gz"
+    merged = rows
+    if path.exists():
+        ids = {r[columns.index(pk)] for r in rows}
+        merged = [r for r in _remap_rows(load_partition(path), columns, path)
+                  if r[columns.index(pk)] not in ids] + rows
+    data = encode_partition(table, day, columns, merged)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+    ids = [r[columns.index(pk)] for r in rows]
+    for i in range(0, len(ids), _DELETE_CHUNK):
+        chunk = ids[i:i + _DELETE_CHUNK]
+        conn.execute(f"DELETE FROM {table} WHERE {pk} IN ({','.join('?' * len(chunk))})", chunk)
+    conn.execute(
+        "INSERT OR REPLACE INTO archive_partitions "
+        "(table_name, day, path, row_count, bytes, archived_at) VALUES (?,?,?,?,?,?)",
+        (table, day, _catalog_path(conn, path), len(merged), len(data),
+         datetime.now(timezone.utc).isoformat()))
+    conn.commit()
+    return len(rows)
+
+
+def _remap_rows(old: "Partition", columns: List[str], path: Path) -> List[tuple]:
+    """``old``'s rows laid out as ``columns``; columns added since are None.
+
+    A partition holding a column the table no longer has cannot be merged
+    without losing data, so that raises before anything is written or deleted.
+    """
+    if old.columns == columns:
+        return old.rows()
+    dropped = [c for c in old.columns if c not in columns]
+    if dropped:
+        raise ValueError(f"{path}: archived columns {dropped} are no longer in "
+                         f"{old.table}; refusing to overwrite the partition")
+    values = {c: old.column(c) for c in old.columns}
+    missing = [None] * old.size
+    return list(zip(*(values.get(c, missing) for c in columns))) if old.size else []
+
+
+# --------------------------------------------------------------------------- #
+# Partition files
+# --------------------------------------------------------------------------- #
+def encode_partition(table: str, day: str, columns: Sequence[str],
+                     rows: Sequence[Sequence[Any]]) -> bytes:
+    """Gzip'd columnar JSON; text columns as ``{"dict": [...], "codes": [...]}``."""
+    encoded: Dict[str, Any] = {}
+    for i, name in enumerate(columns):
+        values = [r[i] for r in rows]
+        if any(isinstance(v, str) for v in values):
+            index: Dict[Any, int] = {}
+            codes = [index.setdefault(v, len(index)) for v in values]
+            encoded[name] = {"dict": list(index), "codes": codes}
+        else:
+            encoded[name] = {"values": values}
+    doc = {"format": FORMAT_VERSION, "table": table, "day": day,
+           "columns": list(columns), "rows": len(rows), "data": encoded}
+    return gzip.compress(json.dumps(doc, separators=(",", ":")).encode("utf-8"), 6)
+
+
+class Partition:
+    """One decoded partition file; text columns stay dictionary-encoded."""
+
+    def __init__(self, doc: Mapping[str, Any]) -> None:
+        self.table: str = doc["table"]
+        self.day: str = doc["day"]
+        self.columns: List[str] = list(doc["columns"])
+        self.size: int = doc["rows"]
+        self._data: Mapping[str, Mapping[str, list]] = doc["data"]
+        self._by_event: Optional[Dict[int, List[int]]] = None
+
+    def column(self, name: str) -> List[Any]:
+        col = self._data[name]
+        if "values" in col:
+            return col["values"]
+        d = col["dict"]
+        return [d[c] for c in col["codes"]]
+
+    def rows(self) -> List[tuple]:
+        return list(zip(*(self.column(c) for c in self.columns))) if self.size else []
+
+    def _code(self, name: str, value: Any) -> Optional[int]:
+        col = self._data[name]
+        try:
+            return col["dict"].index(value) if "dict" in col else None
+        except ValueError:
+            return None
+
+    def select(self, want: Sequence[str], **where: Any) -> List[tuple]:
+        """``want`` columns of the rows matching every ``column=value``.
+
+        ``event_id`` is indexed on first use; other filters compare codes.
+        """
+        event_id = where.pop("event_id", None)
+        if event_id is not None:
+            code = self._code("event_id", event_id)
+            if code is None:
+                return []
+            if self._by_event is None:
+                self._by_event = {}
+                for i, c in enumerate(self._data["event_id"]["codes"]):
+                    self._by_event.setdefault(c, []).append(i)
+            candidates: Iterable[int] = self._by_event.get(code, ())
+        else:
+            candidates = range(self.size)
+        tests = []
+        for name, value in where.items():
+            col = self._data[name]
+            if "dict" in col:
+                code = self._code(name, value)
+                if code is None:
+                    return []
+                tests.append((col["codes"], code))
+            else:
+                tests.append((col["values"], value))
+        hits = [i for i in candidates if all(seq[i] == v for seq, v in tests)]
+        cols = [self._data[n] for n in want]
+        return [tuple(c["dict"][c["codes"][i]] if "dict" in c else c["values"][i]
+                      for c in cols) for i in hits]
+
+
+_cache: "OrderedDict[Tuple[str, int], Partition]" = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_SIZE = 16
+
+
+def load_partition(path: os.PathLike) -> Partition:
+    """Decode a partition file (LRU-cached on path + mtime)."""
+    p = Path(path)
+    key = (str(p), p.stat().st_mtime_ns)
+    with _cache_lock:
+        part = _cache.get(key)
+        if part is not None:
+            _cache.move_to_end(key)
+            return part
+    doc = json.loads(gzip.decompress(p.read_bytes()))
+    if doc.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{p}: unsupported archive format {doc.get('format')!r}")
+    part = Partition(doc)
+    with _cache_lock:
+        _cache[key] = part
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return part
+
+
+# --------------------------------------------------------------------------- #
+# Reads
+# --------------------------------------------------------------------------- #
+def archived_line_movement(conn: sqlite3.Connection, event_id: str, skin: str,
+                           market_name: str, selection_name: str) -> List[tuple]:
+    """Archived ``(captured_at, price, is_suspended)`` points of one selection.
+
+    Only partitions between the event's ``first_seen`` and ``last_seen`` days
+    are opened.
+    """
+    parts = conn.execute(
+        "SELECT day, path FROM archive_partitions WHERE table_name='odds_snapshots' "
+        "ORDER BY day").fetchall()
+    if not parts:
+        return []
+    seen = conn.execute("SELECT first_seen, last_seen FROM events WHERE event_id=?",
+                        (event_id,)).fetchone()
+    lo = str(seen[0])[:10] if seen and seen[0] else ""
+    hi = str(seen[1])[:10] if seen and seen[1] else "9999"
+    market_ids = {r[0] for r in conn.execute(
+        "SELECT market_id FROM markets WHERE name=?", (market_name,))}
+    if not market_ids:
+        return []
+    out: List[tuple] = []
+    for day, rel in parts:
+        if not lo <= day <= hi:
+            continue
+        path = _resolve(conn, rel)
+        if not path.exists():
+            logger.warning("retention: archive partition %s is missing", path)
+            continue
+        part = load_partition(path)
+        for market_id, *point in part.select(
+                ("market_id", "captured_at", "price", "is_suspended"),
+                event_id=str(event_id), skin=skin, selection_name=selection_name):
+            if market_id in market_ids:
+                out.append(tuple(point))
+    return out
+
+
+# --------------------------------------------------------------------------- #
+# Paths
+# --------------------------------------------------------------------------- #
+def _db_file(conn: sqlite3.Connection) -> Optional[Path]:
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return Path(row[2]) if row[2] else None
+    return None
+
+
+def _catalog_path(conn: sqlite3.Connection, path: Path) -> str:
+    db = _db_file(conn)
+    try:
+        return str(path.resolve().relative_to(db.parent.resolve())) if db else str(path)
+    except ValueError:
+        return str(path.resolve())
+
+
+def _resolve(conn: sqlite3.Connection, rel: str) -> Path:
+    p = Path(rel)
+    if p.is_absolute():
+        return p
+    db = _db_file(conn)
+    return (db.parent / p) if db else p
@@ -0,0 +1,134 @@
+"""Multi-skin scheduler runtime — many skins, one process (ADR-14/15 follow-up).
+
+``betb2b schedule`` used to drive exactly one skin, so covering the family
+(linebet, melbet, betwinner, 22bet, …) meant N worker processes, each with its
+own scraper, httpx pools and DB connection. :class:`MultiSkinScheduler` runs one
+:class:`~.scheduler.BetB2BScheduler` per skin inside a single event loop and
+shares the expensive pieces:
+
+* one :class:`~.http_pool.HostClientPool` — a keep-alive (HTTP/2 when ``h2`` is
+  installed) client per host, reused by the feed *and* statisticfeed calls;
+* one :class:`~.budget.RequestBudget` per host from that pool — the
+  concurrency cap and token bucket belong to the origin, not the skin;
+* one :class:`~.writer.StoreWriter` — a single write-behind connection that
+  every skin's passes enqueue on;
+* one :class:`~.enrichment_cache.EnrichmentCache` — H2H/stats answers, shared
+  between skins that name the same ``cache_family``.
+
+Each skin keeps its own cadence (``overrides``). Skins share event ids, so one
+store is also what powers cross-skin odds comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .cli.main import _load_skin
+from .client import _accept_encoding
+from .enrichment_cache import EnrichmentCache, enrichment_cache_path
+from .http_pool import HostClientPool
+from .scheduler import BetB2BScheduler, store_orm_db_path
+from .writer import StoreWriter
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["MultiSkinScheduler"]
+
+
+class MultiSkinScheduler:
+    """Drive several skins' schedulers on shared HTTP, budget and store plumbing."""
+
+    def __init__(
+        self, skins: Sequence[str], *, db_path: Optional[str] = None,
+        overrides: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        host_concurrency: Optional[int] = None,
+        host_rate_per_minute: float = 0.0,
+        persist_queue_size: int = 32,
+        shutdown_coordinator=None,
+        **scheduler_kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            skins: skin names (``linebet``, ``melbet``, …), de-duplicated in order.
+            db_path: shared store (default: ``$BETB2B_DB_PATH`` / ``DATABASE_URL``).
+            overrides: per-skin :class:`BetB2BScheduler` kwargs — e.g.
+                ``{"melbet": {"live_interval": 30}}`` — applied over
+                ``scheduler_kwargs``.
+            host_concurrency: in-flight requests per host (default:
+                ``$BETB2B_CONCURRENCY`` or 8, as for one scraper — ADR-17).
+            host_rate_per_minute: token-bucket rate per host (0 = concurrency only).
+            persist_queue_size: pending writes (all skins) before a pass waits.
+            scheduler_kwargs: common :class:`BetB2BScheduler` kwargs (sport,
+                cadences, ``concurrent_passes``, …).
+        """
+        self.skins: List[str] = list(dict.fromkeys(skins))
+        if not self.skins:
+            raise ValueError("at least one skin is required")
+        overrides = overrides or {}
+        # Every skin's passes draw on its host's shared budget, so a per-scheduler
+        # rate would be silently ignored.
+        if scheduler_kwargs.get("request_budget_per_minute") or any(
+                o.get("request_budget_per_minute") for o in overrides.values()):
+            raise ValueError("request_budget_per_minute does not apply to a multi-skin "
+                             "runtime; set host_rate_per_minute (per host) instead")
+        scheduler_kwargs.pop("request_budget_per_minute", None)
+        self.db_path = db_path or store_orm_db_path()
+        if host_concurrency is None:
+            try:
+                host_concurrency = int(os.environ.get("BETB2B_CONCURRENCY", "8"))
+            except ValueError:
+                host_concurrency = 8
+        self.pool = HostClientPool(
+            concurrency=max(1, min(host_concurrency, 32)),
+            rate_per_minute=host_rate_per_minute,
+            headers={"accept-encoding": _accept_encoding()},
+        )
+        self.writer = StoreWriter(self.db_path, maxsize=persist_queue_size)
+        self.writer.register_shutdown_cleanup(shutdown_coordinator)
+        self.enrichment_cache = EnrichmentCache(enrichment_cache_path(self.db_path))
+        unknown = set(overrides) - set(self.skins)
+        if unknown:
+            raise ValueError(f"overrides for skins not scheduled: {sorted(unknown)}")
+        self.schedulers: Dict[str, BetB2BScheduler] = {}
+        for name in self.skins:
+            kwargs = {**scheduler_kwargs, **overrides.get(name, {})}
+            self.schedulers[name] = BetB2BScheduler(
+                name, db_path=self.db_path, writer=self.writer, http_pool=self.pool,
+                enrichment_cache=self.enrichment_cache,
+                request_budget=self.pool.budget(_load_skin(name).base_url), **kwargs)
+
+    async def run(self) -> None:
+        """Run every skin's passes until :meth:`stop`; blocks."""
+        logger.info("multi-skin scheduler: %d skins (%s), %d host budget(s), http2=%s",
+                    len(self.skins), ",".join(self.skins), len(self.pool.stats()["budgets"]),
+                    self.pool.http2)
+        self.writer.start()
+        try:
+            results = await asyncio.gather(
+                *(s.run() for s in self.schedulers.values()), return_exceptions=True)
+            for name, res in zip(self.schedulers, results):
+                if isinstance(res, BaseException):
+                    logger.error("scheduler %s stopped with an error: %s", name, res,
+                                 exc_info=res)
+        finally:
+            try:
+                await self.writer.close()
+            finally:
+                await asyncio.to_thread(self.enrichment_cache.close)
+                await self.pool.aclose()
+
+    def stop(self) -> None:
+        for s in self.schedulers.values():
+            s.stop()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-skin pass metrics plus the shared pool and writer."""
+        return {
+            "skins": {name: s.metrics() for name, s in self.schedulers.items()},
+            "http_pool": self.pool.stats(),
+            "writer": self.writer.stats(),
+            "enrichment_cache": self.enrichment_cache.stats(),
+        }
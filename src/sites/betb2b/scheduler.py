@@ -11,8 +11,27 @@ is the bus):
     feeds drop a match once it ends, so this reads statisticfeed `v1/Game` for
     real matches past ~2.5h with no result yet and stamps score/winner on finish.
 
-Single-flight: passes share one lock, so only one scrape runs at a time (one
-httpx pool, no self-contention). Browser-free/proxy-free via direct mode.
+Single-flight (default): passes share one lock, so only one scrape runs at a
+time (one httpx pool, no self-contention). Browser-free/proxy-free via direct
+mode.
+
+Concurrent (``concurrent_passes=True``): passes run side by side and throttle
+per *request* instead, on one shared :class:`~.budget.RequestBudget` — at most
+``scraper.concurrency`` feed requests in flight (optionally also
+``request_budget_per_minute``), handed out live → scheduled → results. A 3h
+prematch sweep then delays a live poll by at most one in-flight request rather
+than by the whole sweep. :meth:`BetB2BScheduler.metrics` exposes per-pass
+latency / start lag and the budget's per-priority queue depth and wait, which
+is how to check the live cadence holds under a full sweep.
+
+Persistence is write-behind (:class:`~.writer.StoreWriter`): a pass enqueues its
+result and goes straight back to polling; one writer thread with a long-lived
+connection commits it. Store reads go through the same queue, so they see
+every write a previous pass enqueued.
+
+Change detection runs before the enqueue, against an in-memory
+:class:`~.odds_state.OddsState` rebuilt from the DB on start: the writer only
+receives the selections, period scores and states that moved.
 """
 
 from __future__ import annotations
@@ -20,13 +39,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 
-from . import store
+from . import store, store_pool
+from .budget import Priority, RequestBudget, pass_priority
 from .cli.main import _load_skin
+from .enrichment_cache import EnrichmentCache, enrichment_cache_path
 from .extraction.models import BetB2BScrapeResult
+from .http_pool import HostClientPool
+from .odds_state import DEFAULT_WINDOW, OddsState
 from .scraper import BetB2BScraper
+from .writer import StoreWriter
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +83,15 @@ class BetB2BScheduler:
         results_interval: float = 600.0,       # 10min — results pass cadence
         result_min_age: float = 9000.0,        # 2.5h — a match this old should be done
         read_only_backoff: float = 900.0,      # 15min — pause when the DB is read-only
+        persist_queue_size: int = 16,          # pending writes before a pass waits
+        shutdown_coordinator=None,
+        concurrent_passes: bool = False,       # per-request budget instead of one lock
+        request_budget_per_minute: float = 0.0,  # concurrent mode: combined rate cap (0 = none)
+        writer: Optional[StoreWriter] = None,  # shared writer (multi-skin runtime)
+        http_pool: Optional[HostClientPool] = None,
+        request_budget: Optional[RequestBudget] = None,
+        enrichment_cache: Optional[EnrichmentCache] = None,  # shared cache (multi-skin runtime)
+        odds_state_window: float = DEFAULT_WINDOW,  # 6h — in-memory change detection horizon
     ) -> None:
         self.skin_name = skin_name
         self.sport = sport
@@ -72,10 +105,29 @@ class BetB2BScheduler:
         self.results_interval = results_interval
         self.result_min_age = result_min_age
         self.read_only_backoff = read_only_backoff
+        self.concurrent_passes = concurrent_passes
+        self.request_budget_per_minute = request_budget_per_minute
         self._scraper: Optional[BetB2BScraper] = None
+        self._budget: Optional[RequestBudget] = None
         self._lock = asyncio.Lock()
+        self._pass_stats: Dict[str, Dict[str, float]] = {}
         self._stop = asyncio.Event()
         self._ro_warned_at: Dict[str, float] = {}   # per-pass warning throttle
+        self.http_pool = http_pool
+        # Shared pieces (writer, pool, budget) belong to whoever passed them in
+        # (see runtime.py); only a writer created here is closed by run().
+        self._owns_writer = writer is None
+        if writer is None:
+            writer = StoreWriter(self.db_path, maxsize=persist_queue_size)
+            writer.register_shutdown_cleanup(shutdown_coordinator)
+        self._writer = writer
+        self._shared_budget = request_budget
+        # H2H/stats answers survive restarts in a SQLite file next to the store.
+        self._owns_enrichment_cache = enrichment_cache is None
+        if enrichment_cache is None:
+            enrichment_cache = EnrichmentCache(enrichment_cache_path(self.db_path))
+        self.enrichment_cache = enrichment_cache
+        self.odds_state = OddsState(window=odds_state_window)
 
     # -- lifecycle ------------------------------------------------------- #
     async def start(self) -> None:
@@ -83,17 +135,43 @@ class BetB2BScheduler:
         self._scraper = BetB2BScraper(
             skin, sport=self.sport, direct=self.direct,
             rate_limit_per_minute=self.rate_limit_per_minute,
-            telemetry_enabled=False,
+            telemetry_enabled=False, http_pool=self.http_pool,
+            enrichment_cache=self.enrichment_cache,
         )
         await self._scraper.start()
+        if self._shared_budget is not None:
+            self._budget = self._shared_budget
+        elif self.concurrent_passes:
+            self._budget = RequestBudget(
+                self._scraper.concurrency, rate_per_minute=self.request_budget_per_minute)
+        self._scraper.budget = self._budget
+        self._writer.start()
+        await self._rebuild_odds_state()
+
+    async def _rebuild_odds_state(self) -> None:
+        """Seed the in-memory change detection with every event this skin
+        stored within the odds-state window (one read on the writer thread)."""
+        skin = self._scraper.skin.name
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.odds_state.window)
+        try:
+            snapshot = await self._writer.call(store.live_state_snapshot, skin, since=since)
+        except Exception as exc:             # noqa: BLE001 — events then load on first sight
+            logger.warning("scheduler %s: odds state rebuild failed: %s", skin, exc)
+            return
+        self.odds_state.load(skin, snapshot)
+        st = self.odds_state.stats()
+        logger.info("scheduler %s: odds state rebuilt — %d events, %d selections, "
+                    "%d bytes (%.1f B/selection)", skin, st["events"], st["selections"],
+                    st["bytes"], st["bytes_per_selection"])
 
     async def run(self) -> None:
         """Run the passes until stop(); blocks."""
         if self._scraper is None:
             await self.start()
-        logger.info("scheduler start: skin=%s sport=%s scheduled=%.0fs live=%.0fs results=%.0fs refresh=%.0fs",
-                    self.skin_name, self.sport, self.scheduled_interval,
-                    self.live_interval, self.results_interval, self.refresh_window)
+        logger.info("scheduler start: skin=%s sport=%s scheduled=%.0fs live=%.0fs results=%.0fs "
+                    "refresh=%.0fs mode=%s", self.skin_name, self.sport, self.scheduled_interval,
+                    self.live_interval, self.results_interval, self.refresh_window,
+                    "concurrent" if self.concurrent_passes else "single-flight")
         # A pass with interval <= 0 is DISABLED. The `live` pass is the dominant
         # data producer (15s polling of constantly-moving odds); disabling it
         # (SCHED_LIVE_INTERVAL=0) is the "scheduled-only" low-storage mode — see
@@ -111,18 +189,38 @@ class BetB2BScheduler:
         try:
             await asyncio.gather(*loops)
         finally:
-            if self._scraper is not None:
-                await self._scraper.close()
+            try:
+                if self._owns_writer:
+                    await self._writer.close()  # flush queued writes before exit
+                else:
+                    await self._writer.flush()  # shared: flush this skin's writes only
+            finally:
+                if self._owns_enrichment_cache:
+                    await asyncio.to_thread(self.enrichment_cache.close)
+                if self._scraper is not None:
+                    await self._scraper.close()
 
     def stop(self) -> None:
         self._stop.set()
 
     async def _loop(self, name: str, fn, interval: float) -> None:
+        # Every feed request this pass makes queues at its priority (concurrent mode).
+        with pass_priority(_PASS_PRIORITY.get(name, Priority.SCHEDULED)):
+            await self._loop_body(name, fn, interval)
+
+    async def _loop_body(self, name: str, fn, interval: float) -> None:
         while not self._stop.is_set():
             delay = interval
+            due = started = time.monotonic()
+            ok = False
             try:
-                async with self._lock:          # single-flight across passes
+                if self.concurrent_passes:
                     await fn()
+                else:
+                    async with self._lock:      # single-flight across passes
+                        started = time.monotonic()
+                        await fn()
+                ok = True
             except Exception as exc:             # noqa: BLE001 — a pass must never kill the loop
                 if store.is_read_only_error(exc):
                     # Supabase restricts an over-quota project to read-only (the
@@ -139,24 +237,70 @@ class BetB2BScheduler:
                             name, int(delay), int(interval))
                         self._ro_warned_at[name] = now
                 else:
-                    logger.exception("scheduler %s pass failed", name)
+                    logger.exception("scheduler %s/%s pass failed", self.skin_name, name)
+            finally:
+                self._record_pass(name, due, started, ok)
+            # Expired H2H/stats rows; a no-op until the cache's purge interval is up.
+            await asyncio.to_thread(self.enrichment_cache.maybe_purge)
             try:
                 await asyncio.wait_for(self._stop.wait(), timeout=delay)
             except asyncio.TimeoutError:
                 pass  # interval (or backoff) elapsed → run again
 
+    # -- metrics --------------------------------------------------------- #
+    def _record_pass(self, name: str, due: float, started: float, ok: bool) -> None:
+        now = time.monotonic()
+        s = self._pass_stats.setdefault(name, {
+            "runs": 0, "failures": 0, "total_s": 0.0, "max_s": 0.0,
+            "last_s": 0.0, "max_lag_s": 0.0, "last_lag_s": 0.0})
+        took, lag = now - started, started - due
+        s["runs"] += 1
+        s["failures"] += 0 if ok else 1
+        s["total_s"] += took
+        s["last_s"] = took
+        s["max_s"] = max(s["max_s"], took)
+        s["last_lag_s"] = lag
+        s["max_lag_s"] = max(s["max_lag_s"], lag)
+        depth = self._budget.depth() if self._budget is not None else {}
+        logger.info("scheduler %s/%s pass: %.2fs (lag %.2fs) budget queue=%s writer queue=%d",
+                    self.skin_name, name, took, lag, depth, self._writer.depth)
+
+    def metrics(self) -> Dict[str, object]:
+        """Per-pass latency and start lag (time waiting for the single-flight
+        lock), the request budget's per-priority depth/wait, and the writer
+        queue — the numbers that show whether the live cadence holds."""
+        passes = {}
+        for name, s in self._pass_stats.items():
+            runs = int(s["runs"])
+            passes[name] = {
+                "runs": runs, "failures": int(s["failures"]),
+                "mean_s": round(s["total_s"] / runs, 3) if runs else 0.0,
+                "max_s": round(s["max_s"], 3), "last_s": round(s["last_s"], 3),
+                "max_lag_s": round(s["max_lag_s"], 3), "last_lag_s": round(s["last_lag_s"], 3),
+            }
+        return {
+            "mode": "concurrent" if self.concurrent_passes else "single-flight",
+            "passes": passes,
+            "budget": self._budget.stats() if self._budget is not None else None,
+            "writer": self._writer.stats(),
+            "enrichment_cache": self.enrichment_cache.stats(),
+            "odds_state": self.odds_state.stats(),
+        }
+
     # -- passes ---------------------------------------------------------- #
     async def _scheduled_pass(self) -> None:
         sc = self._scraper
         pairs = await sc.discover_ids(is_live=False)          # [(id, start_epoch)]
-        to_fetch = self._filter_scheduled(pairs)
+        last_seen = await self._writer.call(store.events_last_seen, [i for i, _ in pairs])
+        to_fetch = self._filter_scheduled(pairs, last_seen)
         logger.info("scheduled: %d discovered → %d to fetch (new/stale, not started)",
                     len(pairs), len(to_fetch))
         if not to_fetch:
             return
         events = await sc.fetch_events(to_fetch, is_live=False)
         await self._enrich(events)
-        self._persist("list_prematch", events)
+        logger.info("scheduled: %d matches fetched, %s", len(events), _unchanged_summary(events))
+        await self._persist("list_prematch", events)
 
     async def _live_pass(self) -> None:
         sc = self._scraper
@@ -166,8 +310,8 @@ class BetB2BScheduler:
             return
         events = await sc.fetch_events(ids, is_live=True)
         await self._enrich(events)
-        logger.info("live: %d live matches fetched", len(events))
-        self._persist("list_live", events)
+        logger.info("live: %d live matches fetched, %s", len(events), _unchanged_summary(events))
+        await self._persist("list_live", events)
 
     async def _results_pass(self) -> None:
         """Capture finished-match final scores (ADR-16/20). State-driven: query
@@ -175,51 +319,47 @@ class BetB2BScheduler:
         each via statisticfeed `v1/Game` (by retained stat_game_id, else the event
         id), and write score/winner when `status==3`. No cross-scraper trigger."""
         sc = self._scraper
-        conn = store.init_db(self.db_path)
-        try:
-            pending = store.events_needing_results(conn, min_age_seconds=self.result_min_age)
-        finally:
-            conn.close()
+        self._raise_writer_error()
+        pending = await self._writer.call(
+            store.events_needing_results, min_age_seconds=self.result_min_age)
         if not pending:
             return
         sem = asyncio.Semaphore(sc.concurrency)
         out: List[Tuple[str, dict]] = []
 
         async def _one(eid: str, stat_id: Optional[str]) -> None:
-            async with sem:
+            async with sc._slot(sem):
                 res = await sc.fetch_result(stat_id or eid)   # prefer the retained id
             if res:
                 out.append((eid, res))
 
         await asyncio.gather(*[_one(eid, sid) for eid, sid in pending])
 
-        conn = store.init_db(self.db_path)
-        finished = 0
         at = datetime.now(timezone.utc).isoformat()
-        try:
+
+        def _record(conn) -> None:
             for eid, res in out:
                 store.record_result(
                     conn, eid, stat_game_id=res.get("stat_game_id"),
                     score_home=res.get("score_home"), score_away=res.get("score_away"),
                     winner=res.get("winner"), status=res.get("status"), at=at)
-                if res.get("status") == 3:
-                    finished += 1
-        finally:
-            conn.close()
+
+        self._track(await self._writer.submit(_record), "results")
+        finished = sum(1 for _, res in out if res.get("status") == 3)
         logger.info("results: %d pending → %d checked → %d finished captured",
                     len(pending), len(out), finished)
 
     # -- helpers --------------------------------------------------------- #
-    def _filter_scheduled(self, pairs: List[Tuple[str, object]]) -> List[str]:
+    def _filter_scheduled(self, pairs: List[Tuple[str, object]],
+                          last_seen: Optional[Dict[str, object]] = None) -> List[str]:
         """Skip conditions (deliberate): skip a discovered prematch match if it
         has already kicked off (→ the live pass owns it) or was scraped within
-        the refresh window. Keep new + stale."""
+        the refresh window. Keep new + stale. The pass hands in ``last_seen``
+        (read via the writer); without it a pooled reader connection is used."""
         now = time.time()
-        conn = store.init_db(self.db_path)
-        try:
-            last_seen = store.events_last_seen(conn, [i for i, _ in pairs])
-        finally:
-            conn.close()
+        if last_seen is None:
+            with store_pool.get_pool(self.db_path).reader() as conn:
+                last_seen = store.events_last_seen(conn, [i for i, _ in pairs])
         keep: List[str] = []
         for eid, start in pairs:
             try:
@@ -234,22 +374,76 @@ class BetB2BScheduler:
 
     async def _enrich(self, events) -> None:
         sc = self._scraper
+        # An unchanged event copies last pass's object — already enriched, no facts to persist.
+        events = [e for e in events if not e.unchanged]
         if events and sc.skin.features.get("h2h", True):
             await sc._enrich_with_h2h(events)
         if events and sc.skin.features.get("stats", True):
             await sc._enrich_with_stats(events)
 
-    def _persist(self, action: str, events) -> None:
+    async def _persist(self, action: str, events) -> None:
+        """Diff the pass's result against the in-memory odds state, enqueue the
+        deltas for the writer thread and return at once (waiting only if the
+        queue is full, or for the DB state of events not tracked yet)."""
+        self._raise_writer_error()
         sc = self._scraper
+        skin = sc.skin.name
         result = BetB2BScrapeResult(
-            skin=sc.skin.name, action=action, url=sc.skin.base_url, events=events,
+            skin=skin, action=action, url=sc.skin.base_url, events=events,
         ).to_dict()
-        conn = store.init_db(self.db_path)
-        try:
-            run_id = store.persist_result(result, self.db_path, conn=conn)
-        finally:
-            conn.close()
-        logger.info("%s: %d events persisted (run %s)", action, len(events), run_id)
+        ids = [str(e.get("event_id") or "").strip() for e in result["events"]]
+        ids = [i for i in ids if i]
+        unknown = self.odds_state.unknown(skin, ids)
+        if unknown:
+            # Queued behind earlier writes, so it reads what they stored.
+            snapshot = await self._writer.call(store.live_state_snapshot, skin, event_ids=unknown)
+            self.odds_state.load(skin, snapshot, unknown)
+        result = self.odds_state.diff(result)
+        self.odds_state.prune()
+        n = len(events)
+        fut = await self._writer.persist(result)
+        self._track(fut, action, lambda run_id: logger.info(
+            "%s: %d events persisted (run %s)", action, n, run_id),
+            on_error=lambda exc: self.odds_state.forget(skin, ids))
+
+    def _raise_writer_error(self) -> None:
+        """Surface a read-only DB seen by the writer thread in this pass, so
+        `_loop` backs off instead of enqueueing more doomed writes."""
+        err = self._writer.take_error()
+        if err is not None:
+            raise err
+
+    @staticmethod
+    def _track(fut, action: str, on_done=None, on_error=None) -> None:
+        def _done(f) -> None:
+            if f.cancelled():
+                if on_error:
+                    on_error(None)
+                return
+            exc = f.exception()
+            if exc is None:
+                if on_done:
+                    on_done(f.result())
+                return
+            if on_error:
+                on_error(exc)
+            if not store.is_read_only_error(exc):   # read-only → next pass backs off
+                logger.error("%s: persist failed: %s", action, exc, exc_info=exc)
+        fut.add_done_callback(_done)
+
+
+def _unchanged_summary(events) -> str:
+    """``"<n> unchanged (skip ratio x.xx)"`` for a pass's log line."""
+    unchanged = sum(1 for e in events if e.unchanged)
+    ratio = unchanged / len(events) if events else 0.0
+    return f"{unchanged} unchanged (skip ratio {ratio:.2f})"
+
+
+_PASS_PRIORITY = {
+    "live": Priority.LIVE,
+    "scheduled": Priority.SCHEDULED,
+    "results": Priority.RESULTS,
+}
 
 
 def store_orm_db_path() -> str:
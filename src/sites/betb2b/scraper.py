@@ -44,19 +44,25 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 
 from src.network.proxy import ProxyManager
 
+from .budget import RequestBudget
 from .client import BetB2BFeedClient
 from .config import BetB2BSkinConfig
+from .enrichment_cache import CacheEntry, EnrichmentCache
+from .extraction.decode import CHAMP_PROJECTION
 from .extraction.models import BetB2BScrapeResult, CapturedFeedResponse, Event, H2HData, Sport
 from .extraction.rules import BetB2BExtractionRules
+from .http_pool import HostClientPool
 from .session import BetB2BSessionManager
 from .sports import SportScraper, SportScraperContext, resolve_sport
 from .telemetry_integration import BetB2BTelemetry
@@ -111,6 +117,9 @@ class BetB2BScraper:
         sport: Optional[Union[str, int, Sport, SportScraper]] = None,
         direct: Optional[bool] = None,
         concurrency: Optional[int] = None,
+        http_pool: Optional[HostClientPool] = None,
+        browser_pool: Optional[Any] = None,
+        enrichment_cache: Optional[EnrichmentCache] = None,
     ) -> None:
         """Initialise the scraper for one skin + optional sport.
 
@@ -135,12 +144,26 @@ class BetB2BScraper:
                 or a :class:`SportScraper` instance/subclass. Resolved
                 via :func:`src.sites.betb2b.sports.resolve_sport`.
                 ``None`` means "all sports" (no ``sports=`` filter).
+            http_pool: a shared :class:`HostClientPool` (multi-skin runtime) —
+                feed and statisticfeed calls reuse its per-host clients
+                instead of opening their own.
+            browser_pool: a started :class:`src.browser.pool.BrowserPool`
+                (built with :meth:`BetB2BSessionManager.context_options`) —
+                cookie bootstrap and DOM-render lease warm contexts from it
+                instead of launching Chromium per call.
+            enrichment_cache: an :class:`EnrichmentCache` — H2H / stats
+                answers (including 204s) are served from it until their TTL
+                expires instead of being re-fetched every pass.
         """
         self.skin = skin
         self.proxy_manager = proxy_manager
         self.timeout = timeout
         self.rate_limit_per_minute = rate_limit_per_minute
         self.settle_seconds = settle_seconds
+        self.http_pool = http_pool
+        self.enrichment_cache = enrichment_cache
+        # fetch_events: root → event id → (GetGameZip fingerprint, parsed events).
+        self._game_fingerprints: Dict[str, Dict[str, Tuple[str, List[Event]]]] = {}
         # ADR-15 direct mode: browser+proxy-free discovery via GetSportsZip.
         # Param wins; otherwise the skin's `direct` feature flag.
         self._direct = bool(direct) if direct is not None else skin.features.get("direct", False)
@@ -174,16 +197,13 @@ class BetB2BScraper:
             skin=skin,
             proxy=self.proxy_endpoint,
             settle_seconds=settle_seconds,
+            browser_pool=browser_pool,
         )
         # Direct mode hits un-gated endpoints (no session to protect), so a
         # full card (100+ games) fits the timeout — bump the polite default.
-        # When concurrency > 1 the semaphore is the throttle (ADR-17), so the
-        # client's per-request serial spacing is disabled (rate 0) to let the
-        # gathered requests actually run in parallel.
-        if self.concurrency > 1:
-            feed_rate = 0
-        else:
-            feed_rate = max(rate_limit_per_minute, 120) if self._direct else rate_limit_per_minute
+        # The semaphore (ADR-17) caps requests in flight; the client's token
+        # bucket (burst = concurrency) caps the rate of a gathered pass too.
+        feed_rate = max(rate_limit_per_minute, 120) if self._direct else rate_limit_per_minute
         self.feed_client = BetB2BFeedClient(
             skin=skin,
             session_manager=self.session_manager,
@@ -191,6 +211,8 @@ class BetB2BScraper:
             timeout=timeout,
             rate_limit_per_minute=feed_rate,
             direct=self._direct,
+            http_pool=http_pool,
+            concurrency=self.concurrency,
         )
         self.extraction_rules = BetB2BExtractionRules(skin)
 
@@ -206,6 +228,11 @@ class BetB2BScraper:
 
         self._started = False
 
+        # Optional shared request budget — the concurrent scheduler sets this so
+        # every feed request from every pass queues on one priority-ordered
+        # budget instead of the per-call semaphores below (see budget.py).
+        self.budget: Optional[RequestBudget] = None
+
         # Optional progress hook — a caller (e.g. the control API's job runner)
         # sets this to receive live phase updates during a scrape. Best-effort:
         # never lets a progress callback break the scrape.
@@ -220,6 +247,25 @@ class BetB2BScraper:
         except Exception:  # noqa: BLE001 — progress must never break a scrape
             logger.debug("skin=%s progress callback failed", self.skin.name, exc_info=True)
 
+    def _slot(self, sem: Optional[asyncio.Semaphore] = None):
+        """The gate for one feed request: the shared budget when one is set,
+        else the caller's local semaphore (or nothing, for sequential calls)."""
+        if self.budget is not None:
+            return self.budget.slot()
+        return sem if sem is not None else contextlib.nullcontext()
+
+    @contextlib.asynccontextmanager
+    async def _statfeed_client(self, proxy_url: Optional[str]):
+        """An httpx client for statisticfeed calls: the shared per-host client
+        when a pool is set (left open), else a short-lived one."""
+        if self.http_pool is not None:
+            yield self.http_pool.client(self.skin.base_url, proxy=proxy_url)
+            return
+        async with httpx.AsyncClient(
+            proxy=proxy_url, timeout=15.0, follow_redirects=True,
+        ) as client:
+            yield client
+
     # ------------------------------------------------------------------ #
     # Lifecycle
     # ------------------------------------------------------------------ #
@@ -482,11 +528,9 @@ class BetB2BScraper:
             return captured, cap.url, dom_events
 
         if action == "list_all":
-            live_cap = await self.feed_client.fetch(
-                "events_top", root="live", extra_params=extra_params,
-            )
-            line_cap = await self.feed_client.fetch(
-                "events_top", root="line", extra_params=extra_params,
+            live_cap, line_cap = await self.feed_client.fetch_many(
+                ["events_top", "events_top"], roots=["live", "line"],
+                extra_params=extra_params,
             )
             captured.extend([live_cap, line_cap])
             if self._capture_failed(live_cap):
@@ -584,7 +628,8 @@ class BetB2BScraper:
             for i, cid in enumerate(champ_ids, 1):
                 self._emit_phase(f"discovering leagues ({i}/{len(champ_ids)})")
                 try:
-                    cap = await self.feed_client.fetch_champ(cid, root=root)
+                    cap = await self.feed_client.fetch_champ(
+                        cid, root=root, projection=CHAMP_PROJECTION)
                     value = (getattr(cap, "decoded", None) or {}).get("Value") or {}
                     for g in value.get("G") or []:
                         gi = g.get("I") if isinstance(g, dict) else None
@@ -686,7 +731,8 @@ class BetB2BScraper:
         )
         self._emit_phase("discovering sports")
         try:
-            cap = await self.feed_client.fetch_sports(root=root)
+            async with self._slot():
+                cap = await self.feed_client.fetch_sports(root=root)
         except Exception as exc:  # noqa: BLE001
             logger.warning("skin=%s GetSportsZip failed: %s", self.skin.name, exc)
             return []
@@ -697,7 +743,9 @@ class BetB2BScraper:
         for i, (li, _gc, _name) in enumerate(leagues, 1):
             self._emit_phase(f"discovering leagues ({i}/{len(leagues)})")
             try:
-                ccap = await self.feed_client.fetch_champ(str(li), root=root)
+                async with self._slot():
+                    ccap = await self.feed_client.fetch_champ(
+                        str(li), root=root, projection=CHAMP_PROJECTION)
                 value = (getattr(ccap, "decoded", None) or {}).get("Value") or {}
                 for g in value.get("G") or []:
                     gi = g.get("I") if isinstance(g, dict) else None
@@ -712,7 +760,13 @@ class BetB2BScraper:
     async def fetch_events(self, ids, *, is_live: bool = False) -> List[Event]:
         """GetGameZip a specific set of event ids → parsed :class:`Event`s
         (+ sub-games). The state-aware pass supplies the ids; discovery is
-        separate (:meth:`discover_ids`). No browser/cookies/proxy (ADR-15)."""
+        separate (:meth:`discover_ids`). No browser/cookies/proxy (ADR-15).
+
+        A game whose body fingerprint matches the one this scraper saw for it
+        in the previous call on the same root is not re-parsed: the previous
+        :class:`Event` objects (sub-games included) come back copied with
+        ``unchanged=True``, and ``store.persist_result`` writes no facts for
+        them (only their ``last_seen`` advances)."""
         root = "live" if is_live else "line"
         ids = [str(i) for i in ids][:int(getattr(self.skin, "max_harvest", 200) or 200)]
         total = len(ids)
@@ -720,17 +774,29 @@ class BetB2BScraper:
         # GetGameZip calls; the ids are gathered instead of looped serially.
         sem = asyncio.Semaphore(self.concurrency)
         done = 0
+        previous = self._game_fingerprints.get(root, {})
+        seen: Dict[str, Tuple[str, List[Event]]] = {}
 
         async def _one(eid: str) -> List[Event]:
             nonlocal done
             out: List[Event] = []
-            async with sem:
+            async with self._slot(sem):
                 try:
                     gcap = await self.feed_client.fetch_game(eid, root=root)
-                    game_events = self.extraction_rules.extract_from_captured(gcap)
-                    for ge in game_events:
-                        await self._enrich_with_subgames(ge, gcap, root=root)
-                    out = game_events
+                    fp = (getattr(gcap, "fingerprint", None)
+                          if getattr(gcap, "status", None) == 200 else None)
+                    prev = previous.get(eid)
+                    if fp is not None and prev is not None and prev[0] == fp:
+                        # Copies: last pass's objects may still be in flight
+                        # (write-behind queue, callers holding its result).
+                        out = [dataclasses.replace(ge, unchanged=True) for ge in prev[1]]
+                    else:
+                        game_events = self.extraction_rules.extract_from_captured(gcap)
+                        for ge in game_events:
+                            await self._enrich_with_subgames(ge, gcap, root=root)
+                        out = game_events
+                    if fp is not None and out:
+                        seen[eid] = (fp, out)
                 except Exception as exc:  # noqa: BLE001
                     logger.debug("skin=%s GetGameZip id=%s failed: %s", self.skin.name, eid, exc)
             done += 1                                   # single-threaded loop → no lock needed
@@ -738,6 +804,9 @@ class BetB2BScraper:
             return out
 
         results = await asyncio.gather(*[_one(eid) for eid in ids])
+        # Only this call's games are kept: bounded by one pass, and a game that
+        # dropped out of the feed is parsed afresh if it comes back.
+        self._game_fingerprints[root] = seen
         return [ev for sub in results for ev in sub]
 
     async def _discover_events_direct(self, *, is_live: bool) -> List[Event]:
@@ -910,9 +979,7 @@ class BetB2BScraper:
             "fcountry": str(self.skin.country), "gr": str(self.skin.gr),
         }
         try:
-            async with httpx.AsyncClient(
-                proxy=proxy_url, timeout=15.0, follow_redirects=True,
-            ) as client:
+            async with self._statfeed_client(proxy_url) as client:
                 resp = await client.get(url, params=params, headers=headers)
             if resp.status_code != 200 or not resp.text:
                 return None
@@ -939,6 +1006,31 @@ class BetB2BScraper:
         if not events:
             return
 
+        to_fetch: List[Event] = []
+        cached = await self._cached_enrichments(events, "h2h")
+        for ev in events:
+            eid = str(ev.event_id)
+            if not eid.isdigit():
+                logger.debug(
+                    "skin=%s H2H skip non-numeric event_id=%s",
+                    self.skin.name, eid,
+                )
+                continue
+            entry = cached.get(eid)
+            if entry is None:
+                to_fetch.append(ev)
+            elif not entry.negative:
+                try:
+                    self._apply_h2h(ev, entry.payload)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "skin=%s cached H2H parse error for event=%s: %s",
+                        self.skin.name, eid, exc,
+                    )
+        self._log_enrichment_cache("h2h", len(events), len(to_fetch))
+        if not to_fetch:
+            return
+
         # Direct mode (ADR-15): statisticfeed works cookie-less too — skip session.
         cookie_header = (
             None if self._direct
@@ -956,18 +1048,10 @@ class BetB2BScraper:
         url = f"{self.skin.base_url}/service-api/statisticfeed/api/v1/Game/h2h"
         sem = asyncio.Semaphore(self.concurrency)   # ADR-17: bounded concurrency
 
-        async with httpx.AsyncClient(
-            proxy=proxy_url, timeout=15.0, follow_redirects=True,
-        ) as client:
+        async with self._statfeed_client(proxy_url) as client:
             async def _one(ev: Event) -> None:
                 eid = str(ev.event_id)
-                if not eid.isdigit():
-                    logger.debug(
-                        "skin=%s H2H skip non-numeric event_id=%s",
-                        self.skin.name, eid,
-                    )
-                    return
-                async with sem:
+                async with self._slot(sem):
                     try:
                         params = {
                             "id": eid,
@@ -984,6 +1068,7 @@ class BetB2BScraper:
                                 "skin=%s H2H 204 (no data) for event=%s",
                                 self.skin.name, eid,
                             )
+                            self._remember_enrichment(eid, "h2h", None)
                             return
 
                         if resp.status_code != 200:
@@ -994,13 +1079,8 @@ class BetB2BScraper:
                             return
 
                         raw = resp.json()
-                        h2h_data = BetB2BExtractionRules.extract_h2h_data(raw)
-                        if h2h_data is not None:
-                            ev.h2h_data = h2h_data
-                            logger.debug(
-                                "skin=%s H2H enriched event=%s (%d game shorts)",
-                                self.skin.name, eid, len(h2h_data.game_shorts),
-                            )
+                        self._remember_enrichment(eid, "h2h", raw)
+                        self._apply_h2h(ev, raw)
 
                     except httpx.HTTPError as exc:
                         logger.warning(
@@ -1013,7 +1093,19 @@ class BetB2BScraper:
                             self.skin.name, eid, exc,
                         )
 
-            await asyncio.gather(*[_one(ev) for ev in events])
+            try:
+                await asyncio.gather(*[_one(ev) for ev in to_fetch])
+            finally:
+                await self._flush_enrichment_cache()
+
+    def _apply_h2h(self, ev: Event, raw: Any) -> None:
+        h2h_data = BetB2BExtractionRules.extract_h2h_data(raw)
+        if h2h_data is not None:
+            ev.h2h_data = h2h_data
+            logger.debug(
+                "skin=%s H2H enriched event=%s (%d game shorts)",
+                self.skin.name, ev.event_id, len(h2h_data.game_shorts),
+            )
 
     async def _enrich_with_stats(self, events: List[Event]) -> None:
         """Enrich events with match statistics from the statisticfeed endpoint.
@@ -1029,6 +1121,41 @@ class BetB2BScraper:
         if not events:
             return
 
+        enriched = 0
+        to_fetch: List[Event] = []
+        cached = await self._cached_enrichments(events, "stats")
+        for ev in events:
+            eid = str(ev.event_id)
+            if not eid.isdigit():
+                continue
+            entry = cached.get(eid)
+            if entry is None:
+                to_fetch.append(ev)
+            elif not entry.negative:
+                try:
+                    rows = BetB2BExtractionRules.extract_statistics_data(entry.payload)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "skin=%s cached stats parse error for event=%s: %s",
+                        self.skin.name, eid, exc,
+                    )
+                    continue
+                if rows:
+                    ev.statistics = rows
+                    enriched += 1
+        self._log_enrichment_cache("stats", len(events), len(to_fetch))
+
+        if to_fetch:
+            await self._fetch_stats(to_fetch)
+            enriched += sum(1 for ev in to_fetch if ev.statistics)
+
+        if enriched:
+            logger.info(
+                "skin=%s stats enrichment: %d/%d events carried statistics",
+                self.skin.name, enriched, len(events),
+            )
+
+    async def _fetch_stats(self, events: List[Event]) -> None:
         # Direct mode (ADR-15): statisticfeed works cookie-less too — skip session.
         cookie_header = (
             None if self._direct
@@ -1043,19 +1170,13 @@ class BetB2BScraper:
             else None
         )
 
-        enriched = 0
         url = f"{self.skin.base_url}/service-api/statisticfeed/api/v2/Game/statistic"
         sem = asyncio.Semaphore(self.concurrency)   # ADR-17: bounded concurrency
 
-        async with httpx.AsyncClient(
-            proxy=proxy_url, timeout=15.0, follow_redirects=True,
-        ) as client:
+        async with self._statfeed_client(proxy_url) as client:
             async def _one(ev: Event) -> None:
-                nonlocal enriched
                 eid = str(ev.event_id)
-                if not eid.isdigit():
-                    return
-                async with sem:
+                async with self._slot(sem):
                     try:
                         params = {
                             "id": eid,
@@ -1068,6 +1189,7 @@ class BetB2BScraper:
 
                         if resp.status_code == 204:
                             # 204 = no stats for this match (minor league).
+                            self._remember_enrichment(eid, "stats", None)
                             return
 
                         if resp.status_code != 200:
@@ -1077,10 +1199,11 @@ class BetB2BScraper:
                             )
                             return
 
-                        rows = BetB2BExtractionRules.extract_statistics_data(resp.json())
+                        raw = resp.json()
+                        self._remember_enrichment(eid, "stats", raw)
+                        rows = BetB2BExtractionRules.extract_statistics_data(raw)
                         if rows:
                             ev.statistics = rows
-                            enriched += 1
 
                     except httpx.HTTPError as exc:
                         logger.warning(
@@ -1093,13 +1216,45 @@ class BetB2BScraper:
                             self.skin.name, eid, exc,
                         )
 
-            await asyncio.gather(*[_one(ev) for ev in events])
+            try:
+                await asyncio.gather(*[_one(ev) for ev in events])
+            finally:
+                await self._flush_enrichment_cache()
+
+    # -- enrichment cache ------------------------------------------------- #
+    async def _cached_enrichments(
+        self, events: List[Event], endpoint: str,
+    ) -> Dict[str, Optional[CacheEntry]]:
+        """Fresh cache entries for the events' numeric ids. An LRU miss reads
+        the SQLite file, so the batch is looked up off the event loop."""
+        if self.enrichment_cache is None:
+            return {}
+        ids = [str(ev.event_id) for ev in events if str(ev.event_id).isdigit()]
+        if not ids:
+            return {}
+        return await asyncio.to_thread(
+            self.enrichment_cache.get_many, self.skin.cache_family, ids, endpoint)
 
-        if enriched:
-            logger.info(
-                "skin=%s stats enrichment: %d/%d events carried statistics",
-                self.skin.name, enriched, len(events),
-            )
+    def _remember_enrichment(self, eid: str, endpoint: str, payload: Any) -> None:
+        """Cache a 200 payload, or a 204 when ``payload`` is None."""
+        if self.enrichment_cache is None:
+            return
+        if payload is None:
+            self.enrichment_cache.put_negative(self.skin.cache_family, eid, endpoint)
+        else:
+            self.enrichment_cache.put(self.skin.cache_family, eid, endpoint, payload)
+
+    async def _flush_enrichment_cache(self) -> None:
+        if self.enrichment_cache is not None:
+            await asyncio.to_thread(self.enrichment_cache.flush)
+
+    def _log_enrichment_cache(self, endpoint: str, total: int, to_fetch: int) -> None:
+        if self.enrichment_cache is None or not total:
+            return
+        logger.info(
+            "skin=%s %s enrichment: %d/%d served from cache, %d to fetch",
+            self.skin.name, endpoint, total - to_fetch, total, to_fetch,
+        )
 
     # ------------------------------------------------------------------ #
     # Introspection
@@ -0,0 +1,165 @@
+"""Benchmark feed-body decoding: text + ``json.loads`` vs bytes + projection.
+
+For every payload, times the legacy decode (``bytes.decode`` into a ``str``,
+then stdlib ``json.loads``) against :meth:`BetB2BExtractionRules.decode_response`
+(bytes straight into the selected backend, plus the discovery projection for
+``GetSportsZip`` / ``GetChampZip`` bodies), then the consumer on top — event
+extraction for ``GetGameZip`` (legacy side: the full-tree event walk),
+league / game-id parsing for discovery — and reports MB/s.
+
+Payloads are the recorded bodies under ``src/sites/betb2b/snapshots``
+(``*.json`` / ``*.json.gz``) or ``--payload`` files. Without any, the
+recorded GetGameZip capture in ``tests/fixtures`` is fanned out into a
+1000-market game body, a 200-game champ body and a 40-sport
+sports tree.
+
+    python -m src.sites.betb2b.scripts.bench_decode
+    python -m src.sites.betb2b.scripts.bench_decode --payload body.json.gz --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ._common import ensure_repo_on_path, repo_root
+
+ensure_repo_on_path()
+
+_FIXTURE = repo_root() / "src/sites/betb2b/tests/fixtures/getgamezip_basketball.json"
+_SNAPSHOTS = repo_root() / "src/sites/betb2b/snapshots"
+
+
+def _read(path: Path) -> bytes:
+    data = path.read_bytes()
+    return gzip.decompress(data) if path.suffix == ".gz" else data
+
+
+def recorded_payloads() -> List[Tuple[str, bytes]]:
+    """``(name, body)`` for every recorded body under ``snapshots/``."""
+    paths = sorted([*_SNAPSHOTS.rglob("*.json"), *_SNAPSHOTS.rglob("*.json.gz")])
+    return [(str(p.relative_to(_SNAPSHOTS)), _read(p)) for p in paths]
+
+
+def synthetic_payloads() -> List[Tuple[str, bytes]]:
+    """Large game / champ / sports bodies fanned out from the fixture."""
+    envelope = json.loads(_FIXTURE.read_text(encoding="utf-8"))
+    game = copy.deepcopy(envelope)
+    markets = game["Value"].get("E") or []
+    game["Value"]["E"] = [{**m, "P": (m.get("P") or 0) + k * 0.5}
+                          for k in range(max(1, 1000 // max(1, len(markets))))
+                          for m in markets][:1000]
+    champ = copy.deepcopy(envelope)
+    champ["Value"] = {"LI": 1, "L": "League", "G": [
+        {**envelope["Value"], "I": envelope["Value"]["I"] + i} for i in range(200)]}
+    sports = copy.deepcopy(envelope)
+    sports["Value"] = [{"I": s, "N": f"Sport {s}", "C": 0, "L": [
+        {"LI": s * 1000 + lg, "GC": lg % 7, "L": f"League {lg}", "CI": 1, "LE": f"league-{lg}",
+         "T": 0, "SI": s, "SN": f"Sport {s}", "CID": 225, "CN": "Country",
+         "SC": [{"LI": lg, "L": "Sub"} for _ in range(3)]}
+        for lg in range(60)]} for s in range(40)]
+    return [(name, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+            for name, body in (("synthetic GetGameZip", game),
+                               ("synthetic GetChampZip", champ),
+                               ("synthetic GetSportsZip", sports))]
+
+
+def _kind(decoded: Any) -> str:
+    value = decoded.get("Value") if isinstance(decoded, dict) else None
+    if isinstance(value, list) and value and isinstance(value[0], dict) and "L" in value[0]:
+        return "sports"
+    if isinstance(value, dict) and isinstance(value.get("G"), list):
+        return "champ"
+    return "game"
+
+
+def _timed(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench(name: str, body: bytes, repeat: int) -> Dict[str, Any]:
+    from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+    from src.sites.betb2b.extraction.decode import CHAMP_PROJECTION, SPORTS_PROJECTION
+    from src.sites.betb2b.extraction import rules as rules_mod
+    from src.sites.betb2b.extraction.rules import BetB2BExtractionRules
+    from src.sites.betb2b.harvest import extract_leagues_from_sports
+
+    rules = BetB2BExtractionRules(DEFAULT_SKIN_CONFIG)
+    kind = _kind(json.loads(body))
+    projection: Optional[Dict[str, Any]] = {
+        "sports": SPORTS_PROJECTION, "champ": CHAMP_PROJECTION}.get(kind)
+    url = "https://linebet.com/service-api/LineFeed/Get" + {
+        "sports": "SportsZip", "champ": "ChampZip", "game": "GameZip"}[kind]
+
+    def consume(decoded: Dict[str, Any]) -> None:
+        if kind == "sports":
+            extract_leagues_from_sports(decoded)
+        elif kind == "champ":
+            [g.get("I") for g in decoded["Value"]["G"]]
+
+    def legacy() -> Dict[str, Any]:
+        return json.loads(body.decode("utf-8", errors="replace"))
+
+    def current() -> Any:
+        return rules.decode_response(url, 200, "application/json", body, projection=projection)
+
+    def extract(cap: Any) -> None:
+        if kind == "game":
+            rules.extract_from_captured(cap)
+        else:
+            consume(cap.decoded)
+
+    def extract_legacy(cap: Any) -> None:
+        skip, rules_mod._NO_EVENT_KEYS = rules_mod._NO_EVENT_KEYS, frozenset()
+        try:                                   # the pre-projection full-tree walk
+            extract(cap)
+        finally:
+            rules_mod._NO_EVENT_KEYS = skip
+
+    decoded_legacy = legacy()
+    cap = current()
+    legacy_cap = rules.decode_response(url, 200, "application/json", body)
+    legacy_cap.decoded = decoded_legacy
+    mb = len(body) / 1e6
+    t_old = _timed(legacy, repeat)
+    t_new = _timed(current, repeat)
+    t_old_all = t_old + _timed(lambda: extract_legacy(legacy_cap), repeat)
+    t_new_all = t_new + _timed(lambda: extract(cap), repeat)
+    return {"name": name, "kind": kind, "bytes": len(body),
+            "decode_old_mbps": mb / t_old, "decode_new_mbps": mb / t_new,
+            "total_old_ms": t_old_all * 1e3, "total_new_ms": t_new_all * 1e3,
+            "kept_ratio": len(json.dumps(cap.decoded)) / max(1, len(json.dumps(decoded_legacy)))}
+
+
+def main(argv=None) -> int:
+    from src.sites.betb2b.extraction.decode import backend_name
+
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--payload", type=Path, action="append", default=[],
+                    help="recorded feed body (.json or .json.gz); repeatable")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    payloads = ([(str(p), _read(p)) for p in args.payload] or recorded_payloads()
+                or synthetic_payloads())
+    print(f"json backend: {backend_name()}")
+    for name, body in payloads:
+        r = bench(name, body, args.repeat)
+        print(f"{r['name'][:32]:32} {r['kind']:6} {r['bytes'] / 1e6:7.2f} MB  "
+              f"decode {r['decode_old_mbps']:7.1f} → {r['decode_new_mbps']:7.1f} MB/s  "
+              f"decode+use {r['total_old_ms']:8.2f} → {r['total_new_ms']:8.2f} ms  "
+              f"kept {r['kept_ratio']:6.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
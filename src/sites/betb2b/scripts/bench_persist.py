@@ -0,0 +1,138 @@
+"""Benchmark ``store.persist_result``: row-at-a-time vs the set-based bulk path.
+
+Replays one recorded run through both writers on a fresh database and reports
+fact rows/sec. Each backend runs three passes over the same 500-event run — a
+cold insert (everything new), a warm pass with ~10% of prices moved (the live
+cadence), and an unchanged pass (pure change-detection) — so the numbers show
+both the write and the dedup-lookup cost.
+
+The payload is a saved ``BetB2BScrapeResult.to_dict()`` JSON (``--payload``).
+Without one, the recorded GetGameZip capture in ``tests/fixtures`` is parsed
+and fanned out to ``--events`` distinct events (ids, teams and leagues varied).
+
+    python -m src.sites.betb2b.scripts.bench_persist
+    python -m src.sites.betb2b.scripts.bench_persist --payload run.json --backend orm
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._common import ensure_repo_on_path, repo_root
+
+ensure_repo_on_path()
+
+_FIXTURE = repo_root() / "src/sites/betb2b/tests/fixtures/getgamezip_basketball.json"
+_FACTS = ("event_states", "period_scores", "odds_snapshots", "h2h_games",
+          "h2h_period_scores", "statistics")
+
+
+def recorded_payload(n_events: int = 500) -> Dict[str, Any]:
+    """A ``to_dict()`` run of ``n_events`` built from the recorded GetGameZip capture."""
+    from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+    from src.sites.betb2b.extraction.models import CapturedFeedResponse
+    from src.sites.betb2b.extraction.rules import BetB2BExtractionRules
+
+    decoded = json.loads(_FIXTURE.read_text(encoding="utf-8"))
+    captured = CapturedFeedResponse(
+        url="https://linebet.com/service-api/LineFeed/GetGameZip", status=200,
+        content_type="application/json", body_bytes=_FIXTURE.stat().st_size, decoded=decoded)
+    base = BetB2BExtractionRules(DEFAULT_SKIN_CONFIG).extract_from_captured(captured)[0].to_dict()
+    events = []
+    for i in range(n_events):
+        ev = copy.deepcopy(base)
+        ev.update(event_id=str(int(ev["event_id"]) + i), home=f"{ev['home']} {i // 2}",
+                  away=f"{ev['away']} {i}", league_id=(ev.get("league_id") or 0) + i % 40)
+        events.append(ev)
+    return {"skin": "linebet", "action": "list_live", "url": captured.url,
+            "extracted_at": "2026-07-21T12:00:00+00:00", "success": True,
+            "event_count": len(events), "events": events}
+
+
+def _moved(result: Dict[str, Any], at: str, every: int) -> Dict[str, Any]:
+    out = copy.deepcopy(result)
+    out["extracted_at"] = at
+    n = 0
+    for ev in out["events"]:
+        for m in ev.get("markets") or []:
+            for s in m.get("selections") or []:
+                n += 1
+                if every and n % every == 0 and s.get("price") is not None:
+                    s["price"] = round(float(s["price"]) + 0.05, 3)
+    return out
+
+
+def _fact_rows(conn) -> int:
+    from src.sites.betb2b import store
+    c = store.counts(conn)
+    return sum(c[t] for t in _FACTS)
+
+
+def bench(result: Dict[str, Any], backend: str, bulk: bool, workdir: Path) -> List[Dict[str, Any]]:
+    from src.sites.betb2b import store
+
+    db = workdir / f"{backend}_{'bulk' if bulk else 'rowwise'}.db"
+    if backend == "orm":
+        import src.sites.betb2b.store_orm as som
+        os.environ["DATABASE_URL"] = f"sqlite:///{db}"
+        som._engines.clear()
+    else:
+        os.environ.pop("DATABASE_URL", None)
+    conn = store.init_db(db)
+    passes = [("cold", result),
+              ("10% moved", _moved(result, "2026-07-21T12:00:15+00:00", every=10)),
+              ("unchanged", _moved(result, "2026-07-21T12:00:30+00:00", every=0))]
+    out = []
+    try:
+        for label, payload in passes:
+            before = _fact_rows(conn)
+            t0 = time.perf_counter()
+            store.persist_result(payload, conn=conn, bulk=bulk)
+            dt = time.perf_counter() - t0
+            rows = _fact_rows(conn) - before
+            selections = sum(len(m.get("selections") or []) for ev in payload["events"]
+                             for m in ev.get("markets") or [])
+            out.append({"pass": label, "seconds": dt, "rows": rows,
+                        "rows_per_sec": rows / dt, "selections_per_sec": selections / dt})
+    finally:
+        conn.close()
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--payload", type=Path, help="saved BetB2BScrapeResult JSON")
+    ap.add_argument("--events", type=int, default=500)
+    ap.add_argument("--backend", choices=("sqlite", "orm", "both"), default="both")
+    args = ap.parse_args(argv)
+
+    result = (json.loads(args.payload.read_text(encoding="utf-8")) if args.payload
+              else recorded_payload(args.events))
+    backends = ("sqlite", "orm") if args.backend == "both" else (args.backend,)
+    print(f"{len(result.get('events') or [])} events")
+    saved_url = os.environ.get("DATABASE_URL")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for backend in backends:
+                for bulk in (False, True):
+                    for r in bench(result, backend, bulk, Path(tmp)):
+                        print(f"{backend:6} {'bulk' if bulk else 'rowwise':8} {r['pass']:10} "
+                              f"{r['seconds']:7.3f}s {r['rows']:7d} rows "
+                              f"{r['rows_per_sec']:10.0f} rows/s "
+                              f"{r['selections_per_sec']:10.0f} selections/s")
+    finally:
+        if saved_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = saved_url
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,7 +24,7 @@ import os
 from typing import Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
-from . import store
+from . import store, store_pool
 from .cli.main import _load_skin
 from .scraper import BetB2BScraper
 
@@ -92,9 +92,8 @@ class ScraperService:
 
     # -- lifecycle ------------------------------------------------------- #
     async def start(self) -> None:
-        conn = store.init_db(self.path)
-        orphans = store.reset_orphan_jobs(conn)  # a crash mid-run left 'running' rows
-        conn.close()
+        with store_pool.get_pool(self.path).writer() as conn:
+            orphans = store.reset_orphan_jobs(conn)  # a crash mid-run left 'running' rows
         if orphans:
             logger.warning("scraper service: reset %d orphaned running job(s)", orphans)
         self._stopping = False
@@ -111,6 +110,7 @@ class ScraperService:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        store_pool.get_pool(self.path).close()
         logger.info("scraper service stopped")
 
     # -- public API ------------------------------------------------------ #
@@ -120,12 +120,11 @@ class ScraperService:
         created_by: Optional[str] = None,
     ) -> int:
         """Create a queued job and wake the runner. Returns the job_id."""
-        conn = store.init_db(self.path)
-        job_id = store.create_job(
-            conn, skin=skin, action=action, sport=sport,
-            subgames=subgames, count=count, created_by=created_by,
-        )
-        conn.close()
+        with store_pool.get_pool(self.path).writer() as conn:
+            job_id = store.create_job(
+                conn, skin=skin, action=action, sport=sport,
+                subgames=subgames, count=count, created_by=created_by,
+            )
         self._wake.set()
         return job_id
 
@@ -136,9 +135,8 @@ class ScraperService:
             self._wake.clear()
             # Drain every claimable job, one at a time (single-flight).
             while not self._stopping:
-                conn = store.init_db(self.path)
-                job = store.claim_next_job(conn)
-                conn.close()
+                with store_pool.get_pool(self.path).writer() as conn:
+                    job = store.claim_next_job(conn)
                 if job is None:
                     break
                 await self._run_job(dict(job))
@@ -160,8 +158,7 @@ class ScraperService:
 
     def _persist_and_finish(self, job_id: int, result: dict) -> None:
         """Blocking DB work — always called via asyncio.to_thread."""
-        conn = store.init_db(self.path)
-        try:
+        with store_pool.get_pool(self.path).writer() as conn:
             store.update_job_phase(conn, job_id, "persisting")
             run_id = store.persist_result(result, self.path, conn=conn)
             # A scrape-level error (e.g. timeout) yields an empty result — mark
@@ -177,15 +174,10 @@ class ScraperService:
                                  event_count=result.get("event_count"))
                 logger.info("scraper job %d: succeeded (%s events)",
                             job_id, result.get("event_count"))
-        finally:
-            conn.close()
 
     def _fail_job(self, job_id: int, error: str) -> None:
-        conn = store.init_db(self.path)
-        try:
+        with store_pool.get_pool(self.path).writer() as conn:
             store.finish_job(conn, job_id, status="failed", error=error)
-        finally:
-            conn.close()
 
     async def _scrape(self, job: dict) -> dict:
         skin = _load_skin(job["skin"])
@@ -199,11 +191,8 @@ class ScraperService:
         job_id = job["job_id"]
 
         def _write_phase(phase: str) -> None:
-            conn = store.init_db(self.path)
-            try:
+            with store_pool.get_pool(self.path).writer() as conn:
                 store.update_job_phase(conn, job_id, phase)
-            finally:
-                conn.close()
 
         timeout = float(os.environ.get(SCRAPE_TIMEOUT_ENV, DEFAULT_SCRAPE_TIMEOUT))
         async with BetB2BScraper(skin, proxy_manager=pm, sport=job.get("sport")) as scraper:
@@ -24,9 +24,10 @@ which point :meth:`BetB2BSessionManager.get_session` re-bootstraps.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, List, Optional
 
 from src.network.proxy import ProxyEndpoint, verify_proxy
 from src.network.session import SessionHarvester, SessionPackage, SessionValidator
@@ -53,7 +54,14 @@ class BetB2BSessionManager:
         grid_wait_ms: int = 20_000,
         proxy_verify_attempts: int = 3,
         proxy_verify_backoff: float = 3.0,
+        browser_pool: Optional[Any] = None,
     ) -> None:
+        """
+        Args:
+            browser_pool: optional started :class:`src.browser.pool.BrowserPool`
+                built with :meth:`context_options` — bootstrap and DOM-render
+                then lease a warm context instead of launching Chromium.
+        """
         self.skin = skin
         self.proxy = proxy
         self.settle_seconds = settle_seconds
@@ -61,6 +69,7 @@ class BetB2BSessionManager:
         self.grid_wait_ms = grid_wait_ms
         self.proxy_verify_attempts = proxy_verify_attempts
         self.proxy_verify_backoff = proxy_verify_backoff
+        self.browser_pool = browser_pool
 
         self._harvester = SessionHarvester()
         self._validator = SessionValidator(
@@ -124,9 +133,57 @@ class BetB2BSessionManager:
         self._session = None
         self._last_bootstrap_at = None
 
+    def context_options(self) -> dict[str, Any]:
+        """``new_context`` kwargs for this skin's stealth profile and proxy.
+
+        Also what a :class:`~src.browser.pool.BrowserPool` serving this skin
+        should be built with.
+        """
+        stealth = self.skin.stealth_profile
+        context_kwargs: dict[str, Any] = {
+            "user_agent": stealth.get("user_agent"),
+            "viewport": stealth.get("viewport", {"width": 1536, "height": 864}),
+            "locale": stealth.get("locale", "en-US"),
+            "timezone_id": stealth.get("timezone", "Europe/London"),
+        }
+        if self.proxy is not None and not self.proxy.is_direct:
+            pp = self.proxy.to_playwright_proxy()
+            if pp:
+                context_kwargs["proxy"] = pp
+        return context_kwargs
+
     # ------------------------------------------------------------------ #
     # Internals
     # ------------------------------------------------------------------ #
+    @contextlib.asynccontextmanager
+    async def _open_page(self, *, fresh_context: bool) -> AsyncIterator[Any]:
+        """Yield a page in this skin's context: leased warm, or a cold launch.
+
+        Args:
+            fresh_context: the context must start without cookies and is not
+                reused afterwards (session bootstrap).
+        """
+        if self.browser_pool is not None:
+            lease = await self.browser_pool.acquire(fresh=fresh_context)
+            try:
+                yield await lease.new_page()
+            except BaseException:
+                await lease.release(recycle=True)
+                raise
+            await lease.release(recycle=fresh_context)
+            return
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.skin.stealth_profile.get("headless", True))
+            try:
+                context = await browser.new_context(**self.context_options())
+                yield await context.new_page()
+            finally:
+                await browser.close()
+
     def _needs_bootstrap(self) -> bool:
         if self._session is None:
             return True
@@ -153,9 +210,6 @@ class BetB2BSessionManager:
                     f"country not in allowed_countries={self.skin.allowed_countries}"
                 )
 
-        from playwright.async_api import async_playwright
-
-        stealth = self.skin.stealth_profile
         logger.info(
             "skin=%s bootstrapping session via proxy=%s domain=%s",
             self.skin.name,
@@ -163,96 +217,78 @@ class BetB2BSessionManager:
             self.skin.domain,
         )
 
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=stealth.get("headless", True))
+        async with self._open_page(fresh_context=True) as page:
+            home_url = self.skin.bootstrap_url("home")
+            logger.info("skin=%s navigating to %s", self.skin.name, home_url)
+
+            # 'commit' is the earliest non-empty document state.
+            # The BetB2B SPA keeps long-poll connections open after
+            # load, so 'domcontentloaded' and 'networkidle' can hang
+            # through slow residential proxies. 'commit' fires the
+            # moment a navigable document exists.
             try:
-                context_kwargs: dict[str, Any] = {
-                    "user_agent": stealth.get("user_agent"),
-                    "viewport": stealth.get("viewport", {"width": 1536, "height": 864}),
-                    "locale": stealth.get("locale", "en-US"),
-                    "timezone_id": stealth.get("timezone", "Europe/London"),
-                }
-                if self.proxy is not None and not self.proxy.is_direct:
-                    pp = self.proxy.to_playwright_proxy()
-                    if pp:
-                        context_kwargs["proxy"] = pp
-
-                context = await browser.new_context(**context_kwargs)
-                page = await context.new_page()
-
-                home_url = self.skin.bootstrap_url("home")
-                logger.info("skin=%s navigating to %s", self.skin.name, home_url)
-
-                # 'commit' is the earliest non-empty document state.
-                # The BetB2B SPA keeps long-poll connections open after
-                # load, so 'domcontentloaded' and 'networkidle' can hang
-                # through slow residential proxies. 'commit' fires the
-                # moment a navigable document exists.
-                try:
-                    resp = await page.goto(
-                        home_url,
-                        wait_until="commit",
-                        timeout=self.bootstrap_timeout_ms,
+                resp = await page.goto(
+                    home_url,
+                    wait_until="commit",
+                    timeout=self.bootstrap_timeout_ms,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("skin=%s goto home failed: %s", self.skin.name, exc)
+                resp = None
+
+            # Detect geo/WAF block: HTTP 203 → redirect to /en/block.
+            if resp is not None:
+                status = resp.status
+                final_url = page.url
+                if status == 203 or final_url.endswith("/block"):
+                    raise RuntimeError(
+                        f"skin={self.skin.name}: geo/WAF block detected "
+                        f"(status={status}, url={final_url}). The proxy "
+                        f"egress is not in an allowed country for this skin "
+                        f"(allowed={self.skin.allowed_countries})."
                     )
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning("skin=%s goto home failed: %s", self.skin.name, exc)
-                    resp = None
-
-                # Detect geo/WAF block: HTTP 203 → redirect to /en/block.
-                if resp is not None:
-                    status = resp.status
-                    final_url = page.url
-                    if status == 203 or final_url.endswith("/block"):
-                        raise RuntimeError(
-                            f"skin={self.skin.name}: geo/WAF block detected "
-                            f"(status={status}, url={final_url}). The proxy "
-                            f"egress is not in an allowed country for this skin "
-                            f"(allowed={self.skin.allowed_countries})."
-                        )
 
-                # Best-effort consent dismissal.
-                await self._dismiss_consent(page)
+            # Best-effort consent dismissal.
+            await self._dismiss_consent(page)
 
-                # Wait for the SPA's API burst to settle (sets cookies).
-                await asyncio.sleep(self.settle_seconds)
-
-                # Visit the live page too — some cookies are only set on
-                # the live route (the SPA switches context).
-                live_url = self.skin.bootstrap_url("live")
-                try:
-                    await page.goto(
-                        live_url,
-                        wait_until="commit",
-                        timeout=self.bootstrap_timeout_ms,
-                    )
-                    await asyncio.sleep(min(self.settle_seconds, 6.0))
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("skin=%s live-page visit failed: %s", self.skin.name, exc)
+            # Wait for the SPA's API burst to settle (sets cookies).
+            await asyncio.sleep(self.settle_seconds)
 
-                # Harvest cookies + UA via the framework's SessionHarvester.
-                session = await self._harvester.harvest(
-                    page, site_name=self.skin.name,
+            # Visit the live page too — some cookies are only set on
+            # the live route (the SPA switches context).
+            live_url = self.skin.bootstrap_url("live")
+            try:
+                await page.goto(
+                    live_url,
+                    wait_until="commit",
+                    timeout=self.bootstrap_timeout_ms,
                 )
+                await asyncio.sleep(min(self.settle_seconds, 6.0))
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("skin=%s live-page visit failed: %s", self.skin.name, exc)
 
-                # Tag the session with the skin + proxy metadata.
-                session.headers = []  # we don't harvest headers (no SW replay needed)
-                logger.info(
-                    "skin=%s session harvested: %d cookies, ua=%s",
+            # Harvest cookies + UA via the framework's SessionHarvester.
+            session = await self._harvester.harvest(
+                page, site_name=self.skin.name,
+            )
+
+            # Tag the session with the skin + proxy metadata.
+            session.headers = []  # we don't harvest headers (no SW replay needed)
+            logger.info(
+                "skin=%s session harvested: %d cookies, ua=%s",
+                self.skin.name,
+                len(session.cookies),
+                (session.user_agent or "")[:60] + "…",
+            )
+
+            if not session.cookies:
+                logger.warning(
+                    "skin=%s bootstrap harvested ZERO cookies — feed "
+                    "replay will likely 406. Check the proxy + WAF.",
                     self.skin.name,
-                    len(session.cookies),
-                    (session.user_agent or "")[:60] + "…",
                 )
 
-                if not session.cookies:
-                    logger.warning(
-                        "skin=%s bootstrap harvested ZERO cookies — feed "
-                        "replay will likely 406. Check the proxy + WAF.",
-                        self.skin.name,
-                    )
-
-                return session
-            finally:
-                await browser.close()
+            return session
 
     async def _verify_proxy_country(self) -> bool:
         """Verify the proxy's egress country is in the skin's allowed list.
@@ -348,8 +384,6 @@ class BetB2BSessionManager:
             has_draw: whether the sport's main market is 3-way (1x2) or 2-way
                 (h2h). Passed through to :func:`extract_events_from_page`.
         """
-        from playwright.async_api import async_playwright
-
         from .extraction.dom import extract_events_from_page
 
         wait_s = self.settle_seconds if settle_seconds is None else settle_seconds
@@ -358,90 +392,71 @@ class BetB2BSessionManager:
         else:
             route = "live" if is_live else "line"
             url = self.skin.bootstrap_url(route)
-        stealth = self.skin.stealth_profile
 
         try:
-            async with async_playwright() as pw:
-                browser = await pw.chromium.launch(headless=stealth.get("headless", True))
+            async with self._open_page(fresh_context=False) as page:
                 try:
-                    context_kwargs: dict[str, Any] = {
-                        "user_agent": stealth.get("user_agent"),
-                        "viewport": stealth.get("viewport", {"width": 1536, "height": 864}),
-                        "locale": stealth.get("locale", "en-US"),
-                        "timezone_id": stealth.get("timezone", "Europe/London"),
-                    }
-                    if self.proxy is not None and not self.proxy.is_direct:
-                        pp = self.proxy.to_playwright_proxy()
-                        if pp:
-                            context_kwargs["proxy"] = pp
-
-                    context = await browser.new_context(**context_kwargs)
-                    page = await context.new_page()
+                    # 'commit' is the earliest non-empty document state.
+                    # linebet's SPA keeps a long-poll open after load,
+                    # so 'domcontentloaded'/'networkidle' can hang through
+                    # slow residential proxies.
+                    await page.goto(
+                        url, wait_until="commit",
+                        timeout=self.bootstrap_timeout_ms,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "skin=%s dom-render goto %s failed: %s",
+                        self.skin.name, url, exc,
+                    )
+                    # Even on timeout the page may be partially loaded —
+                    # give it a short grace period and try anyway.
 
-                    try:
-                        # 'commit' is the earliest non-empty document state.
-                        # linebet's SPA keeps a long-poll open after load,
-                        # so 'domcontentloaded'/'networkidle' can hang through
-                        # slow residential proxies.
-                        await page.goto(
-                            url, wait_until="commit",
-                            timeout=self.bootstrap_timeout_ms,
-                        )
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning(
-                            "skin=%s dom-render goto %s failed: %s",
-                            self.skin.name, url, exc,
-                        )
-                        # Even on timeout the page may be partially loaded —
-                        # give it a short grace period and try anyway.
-
-                    await self._dismiss_consent(page)
-                    await asyncio.sleep(wait_s)
-
-                    # A fixed settle is fragile across proxy speeds — the in-play
-                    # Vue grid can take >10s to render through a slow tunnel,
-                    # leaving extraction to run on a still-empty page (the
-                    # Session 25 integration finding: 0 raw rows despite a live
-                    # card). Actively wait for the game grid to attach. Best-
-                    # effort: a genuinely empty card (no live games) just falls
-                    # through to extraction, which returns [].
-                    game_sel = (
-                        dom_selectors.game if dom_selectors is not None
-                        else ".dashboard-champ__game"
+                await self._dismiss_consent(page)
+                await asyncio.sleep(wait_s)
+
+                # A fixed settle is fragile across proxy speeds — the in-play
+                # Vue grid can take >10s to render through a slow tunnel,
+                # leaving extraction to run on a still-empty page (the
+                # Session 25 integration finding: 0 raw rows despite a live
+                # card). Actively wait for the game grid to attach. Best-
+                # effort: a genuinely empty card (no live games) just falls
+                # through to extraction, which returns [].
+                game_sel = (
+                    dom_selectors.game if dom_selectors is not None
+                    else ".dashboard-champ__game"
+                )
+                try:
+                    await page.wait_for_selector(
+                        game_sel, timeout=self.grid_wait_ms, state="attached",
+                    )
+                except Exception:  # noqa: BLE001
+                    logger.debug(
+                        "skin=%s game grid %r not present after settle "
+                        "(empty card or still loading)",
+                        self.skin.name, game_sel,
                     )
+
+                # Invoke the page-ready callback (e.g. for snapshot capture)
+                # while the page is still alive.
+                if _on_page_ready is not None:
                     try:
-                        await page.wait_for_selector(
-                            game_sel, timeout=self.grid_wait_ms, state="attached",
-                        )
-                    except Exception:  # noqa: BLE001
+                        await _on_page_ready(page, is_live=is_live)
+                    except Exception as cb_exc:  # noqa: BLE001
                         logger.debug(
-                            "skin=%s game grid %r not present after settle "
-                            "(empty card or still loading)",
-                            self.skin.name, game_sel,
+                            "skin=%s _on_page_ready callback failed: %s",
+                            self.skin.name, cb_exc,
                         )
 
-                    # Invoke the page-ready callback (e.g. for snapshot capture)
-                    # while the page is still alive.
-                    if _on_page_ready is not None:
-                        try:
-                            await _on_page_ready(page, is_live=is_live)
-                        except Exception as cb_exc:  # noqa: BLE001
-                            logger.debug(
-                                "skin=%s _on_page_ready callback failed: %s",
-                                self.skin.name, cb_exc,
-                            )
-
-                    events = await extract_events_from_page(
-                        page, is_live=is_live, source_url=url, sport=sport,
-                        dom_selectors=dom_selectors, has_draw=has_draw,
-                    )
-                    logger.info(
-                        "skin=%s dom-render extracted %d events from %s",
-                        self.skin.name, len(events), url,
-                    )
-                    return events
-                finally:
-                    await browser.close()
+                events = await extract_events_from_page(
+                    page, is_live=is_live, source_url=url, sport=sport,
+                    dom_selectors=dom_selectors, has_draw=has_draw,
+                )
+                logger.info(
+                    "skin=%s dom-render extracted %d events from %s",
+                    self.skin.name, len(events), url,
+                )
+                return events
         except Exception as exc:  # noqa: BLE001
             logger.warning("skin=%s dom-render failed: %s", self.skin.name, exc)
             return []
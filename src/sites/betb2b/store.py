@@ -19,6 +19,11 @@ Schema (ADR-6, revised):
   events              h2h_games        historical head-to-head matches
   markets             statistics       flattened stat rows
 
+  current_odds — the latest ``odds_snapshots`` row per (event, skin, scope,
+  market, selection, line), upserted in the same transaction as the
+  change-only insert. "Current price" reads and change detection use it
+  instead of a ``GROUP BY … MAX`` over the ever-growing history.
+
 Input is the plain ``BetB2BScrapeResult.to_dict()`` dict, so it works on live
 scrapes and on saved JSON alike. SQLite first (stdlib, one file); the schema is
 Postgres-portable (TEXT/INTEGER/REAL, ISO-8601 timestamps, explicit FKs).
@@ -26,13 +31,17 @@ Postgres-portable (TEXT/INTEGER/REAL, ISO-8601 timestamps, explicit FKs).
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from . import store_bulk
+
 
 def _is_orm(conn: Any) -> bool:
     """A non-sqlite3 connection means the ORM/Postgres path (ADR-13)."""
@@ -68,8 +77,10 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "init_db",
+    "connect_sqlite",
     "is_read_only_error",
     "persist_result",
+    "live_state_snapshot",
     "latest_odds",
     "line_movement",
     "cross_skin_odds",
@@ -215,6 +226,23 @@ CREATE TABLE IF NOT EXISTS odds_snapshots (
     captured_at     TEXT NOT NULL
 );
 
+-- Materialized latest price per selection (one row per odds key). NULL
+-- selection/line are part of the key, hence the COALESCE unique index.
+CREATE TABLE IF NOT EXISTS current_odds (
+    id              INTEGER PRIMARY KEY,
+    event_id        TEXT NOT NULL REFERENCES events(event_id),
+    skin            TEXT NOT NULL,
+    scope           TEXT NOT NULL DEFAULT 'FULL_MATCH',
+    market_id       INTEGER NOT NULL REFERENCES markets(market_id),
+    selection_name  TEXT,
+    line            REAL,
+    price           REAL NOT NULL,
+    is_suspended    INTEGER,
+    raw_t           INTEGER,
+    run_id          INTEGER NOT NULL REFERENCES scrape_runs(run_id),
+    captured_at     TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS h2h_games (
     id                 INTEGER PRIMARY KEY,
     run_id             INTEGER NOT NULL REFERENCES scrape_runs(run_id),
@@ -278,6 +306,19 @@ CREATE TABLE IF NOT EXISTS scraper_jobs (
     created_by    TEXT                  -- optional caller label
 );
 
+-- Retention tier (retention.py): fact rows past the hot window, one
+-- compressed columnar file per (table, day). Paths are relative to the
+-- store file's directory when the archive lives under it.
+CREATE TABLE IF NOT EXISTS archive_partitions (
+    table_name   TEXT NOT NULL,
+    day          TEXT NOT NULL,         -- YYYY-MM-DD of captured_at
+    path         TEXT NOT NULL,
+    row_count    INTEGER NOT NULL,
+    bytes        INTEGER NOT NULL,
+    archived_at  TEXT NOT NULL,
+    PRIMARY KEY (table_name, day)
+);
+
 CREATE INDEX IF NOT EXISTS ix_events_league   ON events(league_id);
 CREATE INDEX IF NOT EXISTS ix_events_sport     ON events(sport_id);
 CREATE INDEX IF NOT EXISTS ix_jobs_status      ON scraper_jobs(status, created_at);
@@ -285,27 +326,109 @@ CREATE INDEX IF NOT EXISTS ix_states_event     ON event_states(event_id, capture
 CREATE INDEX IF NOT EXISTS ix_periods_event    ON period_scores(event_id, captured_at);
 CREATE INDEX IF NOT EXISTS ix_odds_event       ON odds_snapshots(event_id, skin, captured_at);
 CREATE INDEX IF NOT EXISTS ix_odds_market      ON odds_snapshots(event_id, skin, market_id, selection_name, captured_at);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_current_odds ON current_odds(
+    event_id, skin, scope, market_id, COALESCE(selection_name, ''), COALESCE(line, -1e9));
 CREATE INDEX IF NOT EXISTS ix_h2h_event        ON h2h_games(event_id);
 CREATE INDEX IF NOT EXISTS ix_sub_games_event  ON sub_games(event_id);
 """
 
 
+# Applied to every sqlite3 connection. WAL lets readers run alongside the one
+# writer; with WAL, ``synchronous=NORMAL`` is still durable across app crashes
+# (only an OS crash can lose the last commits). ``cache_size`` is negative KiB.
+SQLITE_PRAGMAS = (
+    ("foreign_keys", "ON"),
+    ("busy_timeout", "5000"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", "-16000"),
+    ("mmap_size", str(256 * 1024 * 1024)),
+    ("temp_store", "MEMORY"),
+)
+# Per-connection LRU of compiled statements (the stdlib default is 128); the
+# store's fixed SQL set fits, so a long-lived connection never re-prepares.
+SQLITE_CACHED_STATEMENTS = 256
+
+# Resolved path → the ``schema_version`` left by this process's schema run.
+_schema_ready: Dict[str, int] = {}
+_schema_lock = threading.Lock()
+
+
 def init_db(path: PathLike | None = None):
     """Open the store + ensure the schema. Returns a sqlite3 connection, OR a
-    SQLAlchemy connection when ``DATABASE_URL`` is set (ADR-13 → Supabase)."""
+    SQLAlchemy connection when ``DATABASE_URL`` is set (ADR-13 → Supabase).
+
+    The schema script, column migrations and ``current_odds`` backfill run
+    once per database per process (like ``store_orm``'s engine cache); later
+    opens only connect and apply :data:`SQLITE_PRAGMAS`. For long-lived
+    connections use :mod:`store_pool`.
+    """
     if os.environ.get("DATABASE_URL"):
         from . import store_orm
         return store_orm.connect()
     p = Path(path)
     if p.parent and not p.parent.exists():
         p.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(p))
+    conn = connect_sqlite(p)
+    key = str(p.resolve())
+    # SQLite bumps schema_version on any DDL, so a file recreated or altered
+    # since (another process, a restore) gets the schema run again.
+    if _schema_ready.get(key) == _schema_version(conn):
+        return conn
+    with _schema_lock:
+        _ensure_schema(conn)
+        _schema_ready[key] = _schema_version(conn)
+    return conn
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+
+def connect_sqlite(path: PathLike, *, read_only: bool = False) -> sqlite3.Connection:
+    """A tuned sqlite3 connection (no schema work), usable from any thread.
+
+    ``read_only`` sets ``query_only`` so a pooled reader can never write.
+    """
+    conn = sqlite3.connect(str(path), check_same_thread=False,
+                           cached_statements=SQLITE_CACHED_STATEMENTS)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for name, value in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    # WAL is a property of the file: set once here, every later connection
+    # (writer or reader, any process) opens in WAL.
+    conn.execute("PRAGMA journal_mode = WAL")
+    had_current = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='current_odds'").fetchone()
     conn.executescript(SCHEMA)
     _ensure_columns(conn)
+    if not had_current:
+        _backfill_current_odds(conn)
     conn.commit()
-    return conn
+
+
+def _backfill_current_odds(conn: sqlite3.Connection) -> None:
+    """Seed ``current_odds`` from history the first time a pre-existing store
+    is opened with it (a fresh store has no history, so this is a no-op)."""
+    n = conn.execute(
+        "INSERT OR REPLACE INTO current_odds "
+        "(event_id, skin, scope, market_id, selection_name, line, price, "
+        " is_suspended, raw_t, run_id, captured_at) "
+        "SELECT o.event_id, o.skin, COALESCE(o.scope, 'FULL_MATCH'), o.market_id, "
+        "       o.selection_name, o.line, o.price, o.is_suspended, o.raw_t, o.run_id, "
+        "       o.captured_at "
+        "FROM odds_snapshots o JOIN ("
+        "  SELECT MAX(snap_id) AS mx FROM odds_snapshots WHERE market_id IS NOT NULL "
+        "  GROUP BY event_id, skin, scope, market_id, selection_name, line"
+        ") latest ON o.snap_id = latest.mx ORDER BY o.snap_id"
+    ).rowcount
+    if n:
+        logger.info("current_odds: backfilled %d rows from odds_snapshots", n)
 
 
 # Additive columns introduced after the initial schema. `CREATE TABLE IF NOT
@@ -336,11 +459,7 @@ def _ensure_columns(conn: sqlite3.Connection) -> None:
             conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype}")
 
 
-def _as_int(v: Any) -> Optional[int]:
-    try:
-        return int(v) if v is not None and str(v) != "" else None
-    except (TypeError, ValueError):
-        return None
+_as_int = store_bulk.as_int
 
 
 # --------------------------------------------------------------------------- #
@@ -349,12 +468,7 @@ def _as_int(v: Any) -> Optional[int]:
 def _upsert_sport(conn, sport_id: Optional[int], name: Optional[str]) -> Optional[int]:
     if sport_id is None:
         return None
-    conn.execute(
-        "INSERT INTO sports (sport_id, name, slug) VALUES (?,?,?) "
-        "ON CONFLICT(sport_id) DO UPDATE SET name=COALESCE(excluded.name, sports.name), "
-        "slug=COALESCE(excluded.slug, sports.slug)",
-        (sport_id, name, (name or "").lower() or None),
-    )
+    conn.execute(_SPORT_UPSERT, (sport_id, name, (name or "").lower() or None))
     return sport_id
 
 
@@ -371,14 +485,7 @@ def _upsert_league(conn, league_id, name, sport_id, country_id) -> Optional[int]
     league_id = _as_int(league_id)
     if league_id is None:
         return None
-    conn.execute(
-        "INSERT INTO leagues (league_id, name, sport_id, country_id) VALUES (?,?,?,?) "
-        "ON CONFLICT(league_id) DO UPDATE SET "
-        "name=COALESCE(excluded.name, leagues.name), "
-        "sport_id=COALESCE(excluded.sport_id, leagues.sport_id), "
-        "country_id=COALESCE(excluded.country_id, leagues.country_id)",
-        (league_id, name, sport_id, country_id),
-    )
+    conn.execute(_LEAGUE_UPSERT, (league_id, name, sport_id, country_id))
     return league_id
 
 
@@ -448,9 +555,8 @@ def _get_or_create_market(conn, name, market_type, raw_g) -> int:
 def _last_odds(conn, event_id: str, skin: str) -> Dict[tuple, tuple]:
     """Latest (price, is_suspended) per (scope, market_id, selection, line) for a skin."""
     rows = conn.execute(
-        "SELECT scope, market_id, selection_name, line, price, is_suspended, MAX(snap_id) "
-        "FROM odds_snapshots WHERE event_id=? AND skin=? "
-        "GROUP BY scope, market_id, selection_name, line",
+        "SELECT scope, market_id, selection_name, line, price, is_suspended "
+        "FROM current_odds WHERE event_id=? AND skin=?",
         (event_id, skin),
     ).fetchall()
     return {(r["scope"], r["market_id"], r["selection_name"], r["line"]): (r["price"], r["is_suspended"])
@@ -477,216 +583,567 @@ def _last_periods(conn, event_id: str, skin: str) -> Dict[Any, tuple]:
     return {r["period_key"]: (r["period_name"], r["home_score"], r["away_score"]) for r in rows}
 
 
+# Statements shared by the row-at-a-time and set-based writers.
+_SPORT_UPSERT = (
+    "INSERT INTO sports (sport_id, name, slug) VALUES (?,?,?) "
+    "ON CONFLICT(sport_id) DO UPDATE SET name=COALESCE(excluded.name, sports.name), "
+    "slug=COALESCE(excluded.slug, sports.slug)"
+)
+_LEAGUE_UPSERT = (
+    "INSERT INTO leagues (league_id, name, sport_id, country_id) VALUES (?,?,?,?) "
+    "ON CONFLICT(league_id) DO UPDATE SET "
+    "name=COALESCE(excluded.name, leagues.name), "
+    "sport_id=COALESCE(excluded.sport_id, leagues.sport_id), "
+    "country_id=COALESCE(excluded.country_id, leagues.country_id)"
+)
+_EVENT_UPSERT = (
+    "INSERT INTO events "
+    "(event_id, sport_id, league_id, country_id, home_team_id, away_team_id, "
+    " home_name, away_name, start_time, venue, stage, first_seen, last_seen) "
+    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?) "
+    "ON CONFLICT(event_id) DO UPDATE SET "
+    "  sport_id=COALESCE(excluded.sport_id, events.sport_id), "
+    "  league_id=COALESCE(excluded.league_id, events.league_id), "
+    "  country_id=COALESCE(excluded.country_id, events.country_id), "
+    "  home_team_id=COALESCE(excluded.home_team_id, events.home_team_id), "
+    "  away_team_id=COALESCE(excluded.away_team_id, events.away_team_id), "
+    "  start_time=COALESCE(excluded.start_time, events.start_time), "
+    "  venue=COALESCE(excluded.venue, events.venue), "
+    "  stage=COALESCE(excluded.stage, events.stage), "
+    "  last_seen=excluded.last_seen"
+)
+_STATE_INSERT = (
+    "INSERT INTO event_states "
+    "(run_id, event_id, skin, status, is_live, score_home, score_away, "
+    " minute, period, time_remaining, wp_home, wp_away, captured_at) "
+    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)"
+)
+_PERIOD_INSERT = (
+    "INSERT INTO period_scores "
+    "(run_id, event_id, skin, period_key, period_name, home_score, away_score, captured_at) "
+    "VALUES (?,?,?,?,?,?,?,?)"
+)
+_ODDS_INSERT = (
+    "INSERT INTO odds_snapshots "
+    "(run_id, event_id, skin, market_id, selection_name, line, price, "
+    " is_suspended, raw_t, scope, captured_at) VALUES (?,?,?,?,?,?,?,?,?,?,?)"
+)
+# Same parameter order as _ODDS_INSERT, so one row tuple feeds both statements.
+_CURRENT_ODDS_UPSERT = (
+    "INSERT INTO current_odds "
+    "(run_id, event_id, skin, market_id, selection_name, line, price, "
+    " is_suspended, raw_t, scope, captured_at) VALUES (?,?,?,?,?,?,?,?,?,?,?) "
+    "ON CONFLICT(event_id, skin, scope, market_id, COALESCE(selection_name, ''), "
+    "            COALESCE(line, -1e9)) DO UPDATE SET "
+    "  price=excluded.price, is_suspended=excluded.is_suspended, raw_t=excluded.raw_t, "
+    "  run_id=excluded.run_id, captured_at=excluded.captured_at"
+)
+_H2H_PERIOD_INSERT = (
+    "INSERT INTO h2h_period_scores "
+    "(h2h_game_id, event_id, period_key, period_name, home_score, away_score) "
+    "VALUES (?,?,?,?,?,?)"
+)
+_SUB_GAME_UPSERT = (
+    "INSERT INTO sub_games "
+    "(sub_game_id, event_id, name, period, period_index, market_count, "
+    " sport_id, first_seen, last_seen) VALUES (?,?,?,?,?,?,?,?,?) "
+    "ON CONFLICT(sub_game_id) DO UPDATE SET "
+    "  event_id=excluded.event_id, "
+    "  name=COALESCE(excluded.name, sub_games.name), "
+    "  period=COALESCE(excluded.period, sub_games.period), "
+    "  period_index=COALESCE(excluded.period_index, sub_games.period_index), "
+    "  market_count=COALESCE(excluded.market_count, sub_games.market_count), "
+    "  sport_id=COALESCE(excluded.sport_id, sub_games.sport_id), "
+    "  last_seen=excluded.last_seen"
+)
+_STAT_INSERT = (
+    "INSERT INTO statistics (run_id, event_id, skin, name, value, captured_at) "
+    "VALUES (?,?,?,?,?,?)"
+)
+
+
+def _state_key(ev: Dict[str, Any]) -> tuple:
+    """The observable state tuple that change-only dedup compares."""
+    return (ev.get("status"), 1 if ev.get("is_live") else 0,
+            _as_int(ev.get("score_home")), _as_int(ev.get("score_away")),
+            _as_int(ev.get("minute")), ev.get("period"), ev.get("time_remaining"))
+
+
+def _h2h_game_params(run_id, event_id, skin, h2h, g, at) -> tuple:
+    return (run_id, event_id, skin, g.get("game_id"), _as_int(h2h.get("sport_id")),
+            g.get("team1_id"), g.get("team2_id"), g.get("date_start"),
+            _as_int(g.get("score1")), _as_int(g.get("score2")),
+            _as_int(g.get("sub_score1")), _as_int(g.get("sub_score2")),
+            _as_int(g.get("winner")), _as_int(g.get("status")), at)
+
+
+def _sub_game_params(sgid, event_id, sg, at) -> tuple:
+    return (sgid, event_id, sg.get("name"), sg.get("period"),
+            _as_int(sg.get("period_index")), _as_int(sg.get("market_count")),
+            _as_int(sg.get("sport_id")), at, at)
+
+
 # --------------------------------------------------------------------------- #
 # Persist
 # --------------------------------------------------------------------------- #
 def persist_result(
     result: Dict[str, Any], path: PathLike | None = None, *,
-    conn: Optional[Any] = None,
+    conn: Optional[Any] = None, bulk: bool = True,
 ) -> int:
     """Persist one ``BetB2BScrapeResult.to_dict()`` payload; return the run_id.
 
     Dimensions (sports/countries/leagues/teams/events/markets) are UPSERT-ed to
     one row per entity; the fact tables are appended (time-series per run). Pass
     an open ``conn`` to reuse a connection; otherwise one is opened + closed.
+
+    ``bulk`` (default) resolves the whole run set-based — a few ``IN (...)``
+    prefetches and one ``executemany`` per table (see :mod:`store_bulk`).
+    ``bulk=False`` keeps the original row-at-a-time path, which stores the
+    same rows; it stays as the reference the benchmark and tests compare to.
+
+    Events flagged ``unchanged`` (the scraper reused the previous parse of a
+    byte-identical GetGameZip body) write no facts; only their ``events.
+    last_seen`` advances, which the refresh window, ``live_state_snapshot``
+    and the archive's line-movement window rely on. The run row counts them.
+
+    A ``deltas_only`` result (see :mod:`odds_state`) was already diffed against
+    the last stored values by the scheduler; the bulk writers then trust it and
+    skip their "last stored value" prefetches.
     """
+    result, unchanged = _drop_unchanged(result)
     owns = conn is None
     conn = conn or init_db(path)
     if _is_orm(conn):
         from . import store_orm
         try:
-            return store_orm.persist_result(conn, result)
+            return store_orm.persist_result(conn, result, bulk=bulk, touch=unchanged)
         finally:
             if owns:
                 conn.close()
     try:
         skin = result.get("skin") or ""
-        at = result.get("extracted_at") or ""
         events: List[Dict[str, Any]] = result.get("events") or []
         sport_name = next((e.get("sport") for e in events if e.get("sport")), None)
-        odds_ins = odds_skip = 0  # change-only dedup counters
 
         run_id = int(conn.execute(
             "INSERT INTO scrape_runs "
             "(skin, action, sport, url, extracted_at, duration_seconds, "
             " event_count, success, error, template_version) VALUES (?,?,?,?,?,?,?,?,?,?)",
-            (skin, result.get("action"), sport_name, result.get("url"), at,
+            (skin, result.get("action"), sport_name, result.get("url"),
+             result.get("extracted_at") or "",
              result.get("scrape_duration_seconds"), result.get("event_count", len(events)),
              1 if result.get("success") else 0, result.get("error"),
              result.get("template_version")),
         ).lastrowid)
 
-        for ev in events:
-            event_id = str(ev.get("event_id") or "").strip()
-            if not event_id:
-                continue
+        write = _persist_events_bulk if bulk else _persist_events_rowwise
+        odds_ins, odds_skip = write(conn, run_id, result)
+        _touch_events(conn, unchanged, result.get("extracted_at") or "")
+        conn.commit()
+        logger.info(
+            "persist run %d (skin=%s): %d odds changes stored, %d unchanged skipped, "
+            "%d unchanged events skipped",
+            run_id, skin, odds_ins, odds_skip, len(unchanged),
+        )
+        return run_id
+    finally:
+        if owns:
+            conn.close()
 
-            # --- dimensions ---
-            sport_id = _upsert_sport(conn, _as_int(ev.get("sport_id")), ev.get("sport"))
-            country_id = _get_or_create_country(conn, ev.get("country"))
-            league_id = _upsert_league(
-                conn, ev.get("league_id"), ev.get("competition"), sport_id, country_id)
-            home_id = _get_or_create_team(
-                conn, ev.get("home"), sport_id, country_id=country_id,
-                feed_id=_as_int(ev.get("home_team_feed_id")),
-                image=ev.get("home_team_image"),
-                feed_country_id=_as_int(ev.get("home_team_country_id")))
-            away_id = _get_or_create_team(
-                conn, ev.get("away"), sport_id, country_id=country_id,
-                feed_id=_as_int(ev.get("away_team_feed_id")),
-                image=ev.get("away_team_image"),
-                feed_country_id=_as_int(ev.get("away_team_country_id")))
 
-            conn.execute(
-                "INSERT INTO events "
-                "(event_id, sport_id, league_id, country_id, home_team_id, away_team_id, "
-                " home_name, away_name, start_time, venue, stage, first_seen, last_seen) "
-                "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?) "
-                "ON CONFLICT(event_id) DO UPDATE SET "
-                "  sport_id=COALESCE(excluded.sport_id, events.sport_id), "
-                "  league_id=COALESCE(excluded.league_id, events.league_id), "
-                "  country_id=COALESCE(excluded.country_id, events.country_id), "
-                "  home_team_id=COALESCE(excluded.home_team_id, events.home_team_id), "
-                "  away_team_id=COALESCE(excluded.away_team_id, events.away_team_id), "
-                "  start_time=COALESCE(excluded.start_time, events.start_time), "
-                "  venue=COALESCE(excluded.venue, events.venue), "
-                "  stage=COALESCE(excluded.stage, events.stage), "
-                "  last_seen=excluded.last_seen",
-                (event_id, sport_id, league_id, country_id, home_id, away_id,
-                 ev.get("home"), ev.get("away"), ev.get("start_time"),
-                 ev.get("venue"), ev.get("stage"), at, at),
-            )
+def _drop_unchanged(result: Dict[str, Any]) -> tuple:
+    """``(result without unchanged events, the dropped events' ids)``."""
+    events = result.get("events") or []
+    kept = [e for e in events if not e.get("unchanged")]
+    if len(kept) == len(events):
+        return result, []
+    trimmed = {**result, "events": kept,
+               "event_count": result.get("event_count", len(events))}
+    dropped = {str(e.get("event_id") or "").strip() for e in events if e.get("unchanged")}
+    return trimmed, sorted(dropped - {""})
 
-            # --- facts: live state (only when it changed) ---
-            state = (ev.get("status"), 1 if ev.get("is_live") else 0,
-                     _as_int(ev.get("score_home")), _as_int(ev.get("score_away")),
-                     _as_int(ev.get("minute")), ev.get("period"), ev.get("time_remaining"))
-            if _last_state(conn, event_id, skin) != state:
-                # WP rides along on the state row (not part of the change key —
-                # it moves with odds, so it's captured whenever state changes).
-                conn.execute(
-                    "INSERT INTO event_states "
-                    "(run_id, event_id, skin, status, is_live, score_home, score_away, "
-                    " minute, period, time_remaining, wp_home, wp_away, captured_at) "
-                    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
-                    (run_id, event_id, skin, *state,
-                     ev.get("wp_home"), ev.get("wp_away"), at),
-                )
 
-            # --- facts: per-period scores (only changed periods) ---
-            last_periods = _last_periods(conn, event_id, skin)
-            for ps in ev.get("period_scores") or []:
-                pk = _as_int(ps.get("period_key"))
-                row = (ps.get("period_name"), _as_int(ps.get("home_score")), _as_int(ps.get("away_score")))
-                if last_periods.get(pk) == row:
+def _touch_events(conn, event_ids: List[str], at: str) -> None:
+    """Advance ``last_seen`` of events still listed but written no facts for."""
+    for chunk in store_bulk.chunked(event_ids):
+        conn.execute(
+            f"UPDATE events SET last_seen=? WHERE event_id IN ({','.join('?' * len(chunk))})",
+            [at, *chunk])
+
+
+def _persist_events_rowwise(conn, run_id: int, result: Dict[str, Any]) -> tuple:
+    """The original per-event, per-row writer. Returns ``(odds_ins, odds_skip)``.
+
+    Always diffs against the DB — a ``deltas_only`` payload stores the same
+    rows here, just without skipping the lookups."""
+    skin = result.get("skin") or ""
+    at = result.get("extracted_at") or ""
+    events: List[Dict[str, Any]] = result.get("events") or []
+    odds_ins = odds_skip = 0  # change-only dedup counters
+
+    for ev in events:
+        event_id = str(ev.get("event_id") or "").strip()
+        if not event_id:
+            continue
+
+        # --- dimensions ---
+        sport_id = _upsert_sport(conn, _as_int(ev.get("sport_id")), ev.get("sport"))
+        country_id = _get_or_create_country(conn, ev.get("country"))
+        league_id = _upsert_league(
+            conn, ev.get("league_id"), ev.get("competition"), sport_id, country_id)
+        home_id = _get_or_create_team(
+            conn, ev.get("home"), sport_id, country_id=country_id,
+            feed_id=_as_int(ev.get("home_team_feed_id")),
+            image=ev.get("home_team_image"),
+            feed_country_id=_as_int(ev.get("home_team_country_id")))
+        away_id = _get_or_create_team(
+            conn, ev.get("away"), sport_id, country_id=country_id,
+            feed_id=_as_int(ev.get("away_team_feed_id")),
+            image=ev.get("away_team_image"),
+            feed_country_id=_as_int(ev.get("away_team_country_id")))
+
+        conn.execute(_EVENT_UPSERT, (
+            event_id, sport_id, league_id, country_id, home_id, away_id,
+            ev.get("home"), ev.get("away"), ev.get("start_time"),
+            ev.get("venue"), ev.get("stage"), at, at))
+
+        # --- facts: live state (only when it changed) ---
+        state = _state_key(ev)
+        if _last_state(conn, event_id, skin) != state:
+            # WP rides along on the state row (not part of the change key —
+            # it moves with odds, so it's captured whenever state changes).
+            conn.execute(_STATE_INSERT, (run_id, event_id, skin, *state,
+                                         ev.get("wp_home"), ev.get("wp_away"), at))
+
+        # --- facts: per-period scores (only changed periods) ---
+        last_periods = _last_periods(conn, event_id, skin)
+        for ps in ev.get("period_scores") or []:
+            pk = _as_int(ps.get("period_key"))
+            row = (ps.get("period_name"), _as_int(ps.get("home_score")), _as_int(ps.get("away_score")))
+            if last_periods.get(pk) == row:
+                continue
+            conn.execute(_PERIOD_INSERT, (run_id, event_id, skin, pk, *row, at))
+            last_periods[pk] = row
+
+        # --- facts: odds (only when a selection's price/suspension changed) ---
+        last_odds = _last_odds(conn, event_id, skin)
+        for m in ev.get("markets") or []:
+            market_id = _get_or_create_market(conn, m.get("name"), m.get("market_type"), m.get("raw_g"))
+            scope = m.get("scope") or "FULL_MATCH"
+            for s in m.get("selections") or []:
+                price = s.get("price")
+                if price is None:
                     continue
-                conn.execute(
-                    "INSERT INTO period_scores "
-                    "(run_id, event_id, skin, period_key, period_name, home_score, away_score, captured_at) "
-                    "VALUES (?,?,?,?,?,?,?,?)",
-                    (run_id, event_id, skin, pk, *row, at),
-                )
-                last_periods[pk] = row
-
-            # --- facts: odds (only when a selection's price/suspension changed) ---
-            last_odds = _last_odds(conn, event_id, skin)
-            for m in ev.get("markets") or []:
-                market_id = _get_or_create_market(conn, m.get("name"), m.get("market_type"), m.get("raw_g"))
-                scope = m.get("scope") or "FULL_MATCH"
-                for s in m.get("selections") or []:
-                    price = s.get("price")
-                    if price is None:
-                        continue
-                    price = float(price)
-                    susp = 1 if s.get("is_suspended") else 0
-                    key = (scope, market_id, s.get("name"), s.get("line"))
-                    if last_odds.get(key) == (price, susp):
-                        odds_skip += 1
-                        continue
-                    conn.execute(
-                        "INSERT INTO odds_snapshots "
-                        "(run_id, event_id, skin, market_id, selection_name, line, price, "
-                        " is_suspended, raw_t, scope, captured_at) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
-                        (run_id, event_id, skin, market_id, s.get("name"), s.get("line"),
-                         price, susp, _as_int(s.get("raw_t")), scope, at),
-                    )
-                    last_odds[key] = (price, susp)
-                    odds_ins += 1
-
-            # --- facts: H2H (+ enrich teams dim from h2h team metadata) ---
-            h2h = ev.get("h2h_data")
-            if h2h:
-                for t in h2h.get("teams") or []:
-                    tc = t.get("country") or {}
-                    _get_or_create_team(
-                        conn, t.get("title"), _as_int(h2h.get("sport_id")) or sport_id,
-                        backend_id=str(t.get("id")) if t.get("id") else None,
-                        country_id=_get_or_create_country(conn, tc.get("title")),
-                    )
-                for g in h2h.get("game_shorts") or []:
-                    h2h_game_id = int(conn.execute(
-                        "INSERT INTO h2h_games "
-                        "(run_id, event_id, skin, game_id, sport_id, team1_backend_id, "
-                        " team2_backend_id, date_start, score1, score2, sub_score1, "
-                        " sub_score2, winner, status, captured_at) "
-                        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-                        (run_id, event_id, skin, g.get("game_id"), _as_int(h2h.get("sport_id")),
-                         g.get("team1_id"), g.get("team2_id"), g.get("date_start"),
-                         _as_int(g.get("score1")), _as_int(g.get("score2")),
-                         _as_int(g.get("sub_score1")), _as_int(g.get("sub_score2")),
-                         _as_int(g.get("winner")), _as_int(g.get("status")), at),
-                    ).lastrowid)
-                    # Per-quarter H2H breakdown → scoped ingestion (ADR-7).
-                    for ps in g.get("periods") or []:
-                        conn.execute(
-                            "INSERT INTO h2h_period_scores "
-                            "(h2h_game_id, event_id, period_key, period_name, home_score, away_score) "
-                            "VALUES (?,?,?,?,?,?)",
-                            (h2h_game_id, event_id, _as_int(ps.get("period_key")),
-                             ps.get("period_name"), _as_int(ps.get("home_score")),
-                             _as_int(ps.get("away_score"))),
-                        )
-
-            # --- dimension: sub-games (SG[] — named per-period/per-stat groups) ---
-            for sg in ev.get("sub_games") or []:
-                sgid = str(sg.get("sub_game_id") or "").strip()
-                if not sgid:
+                price = float(price)
+                susp = 1 if s.get("is_suspended") else 0
+                key = (scope, market_id, s.get("name"), s.get("line"))
+                if last_odds.get(key) == (price, susp):
+                    odds_skip += 1
                     continue
-                conn.execute(
-                    "INSERT INTO sub_games "
-                    "(sub_game_id, event_id, name, period, period_index, market_count, "
-                    " sport_id, first_seen, last_seen) VALUES (?,?,?,?,?,?,?,?,?) "
-                    "ON CONFLICT(sub_game_id) DO UPDATE SET "
-                    "  event_id=excluded.event_id, "
-                    "  name=COALESCE(excluded.name, sub_games.name), "
-                    "  period=COALESCE(excluded.period, sub_games.period), "
-                    "  period_index=COALESCE(excluded.period_index, sub_games.period_index), "
-                    "  market_count=COALESCE(excluded.market_count, sub_games.market_count), "
-                    "  sport_id=COALESCE(excluded.sport_id, sub_games.sport_id), "
-                    "  last_seen=excluded.last_seen",
-                    (sgid, event_id, sg.get("name"), sg.get("period"),
-                     _as_int(sg.get("period_index")), _as_int(sg.get("market_count")),
-                     _as_int(sg.get("sport_id")), at, at),
+                row = (run_id, event_id, skin, market_id, s.get("name"), s.get("line"),
+                       price, susp, _as_int(s.get("raw_t")), scope, at)
+                conn.execute(_ODDS_INSERT, row)
+                conn.execute(_CURRENT_ODDS_UPSERT, row)
+                last_odds[key] = (price, susp)
+                odds_ins += 1
+
+        # --- facts: H2H (+ enrich teams dim from h2h team metadata) ---
+        h2h = ev.get("h2h_data")
+        if h2h:
+            for t in h2h.get("teams") or []:
+                tc = t.get("country") or {}
+                _get_or_create_team(
+                    conn, t.get("title"), _as_int(h2h.get("sport_id")) or sport_id,
+                    backend_id=str(t.get("id")) if t.get("id") else None,
+                    country_id=_get_or_create_country(conn, tc.get("title")),
                 )
+            for g in h2h.get("game_shorts") or []:
+                h2h_game_id = int(conn.execute(
+                    "INSERT INTO h2h_games "
+                    "(run_id, event_id, skin, game_id, sport_id, team1_backend_id, "
+                    " team2_backend_id, date_start, score1, score2, sub_score1, "
+                    " sub_score2, winner, status, captured_at) "
+                    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                    _h2h_game_params(run_id, event_id, skin, h2h, g, at),
+                ).lastrowid)
+                # Per-quarter H2H breakdown → scoped ingestion (ADR-7).
+                for ps in g.get("periods") or []:
+                    conn.execute(_H2H_PERIOD_INSERT, (
+                        h2h_game_id, event_id, _as_int(ps.get("period_key")),
+                        ps.get("period_name"), _as_int(ps.get("home_score")),
+                        _as_int(ps.get("away_score"))))
+
+        # --- dimension: sub-games (SG[] — named per-period/per-stat groups) ---
+        for sg in ev.get("sub_games") or []:
+            sgid = str(sg.get("sub_game_id") or "").strip()
+            if not sgid:
+                continue
+            conn.execute(_SUB_GAME_UPSERT, _sub_game_params(sgid, event_id, sg, at))
 
-            # --- facts: statistics (flatten name/value dicts) ---
-            for st in ev.get("statistics") or []:
-                if isinstance(st, dict):
-                    for k, v in st.items():
-                        conn.execute(
-                            "INSERT INTO statistics (run_id, event_id, skin, name, value, captured_at) "
-                            "VALUES (?,?,?,?,?,?)",
-                            (run_id, event_id, skin, str(k), str(v), at),
-                        )
-        conn.commit()
-        logger.info(
-            "persist run %d (skin=%s): %d odds changes stored, %d unchanged skipped",
-            run_id, skin, odds_ins, odds_skip,
-        )
-        return run_id
-    finally:
-        if owns:
-            conn.close()
+        # --- facts: statistics (flatten name/value dicts) ---
+        for st in ev.get("statistics") or []:
+            if isinstance(st, dict):
+                for k, v in st.items():
+                    conn.execute(_STAT_INSERT, (run_id, event_id, skin, str(k), str(v), at))
+    return odds_ins, odds_skip
+
+
+# --------------------------------------------------------------------------- #
+# Set-based persist — the whole run in a handful of statements
+# --------------------------------------------------------------------------- #
+def _next_id(conn, table: str, column: str) -> int:
+    # Safe without a race: by now the run's scrape_runs INSERT holds SQLite's
+    # write lock, so no other writer can allocate ids until we commit.
+    return int(conn.execute(f"SELECT COALESCE(MAX({column}), 0) FROM {table}").fetchone()[0]) + 1
+
+
+def _in_query(conn, sql: str, keys: List[Any], *params: Any):
+    """Run ``sql`` (with one ``{}`` placeholder for the IN list) over chunks of keys."""
+    for chunk in store_bulk.chunked(keys):
+        yield from conn.execute(sql.format(",".join("?" * len(chunk))), (*params, *chunk))
+
+
+def _last_states_bulk(conn, event_ids: List[str], skin: str) -> Dict[str, tuple]:
+    return {r["event_id"]: tuple(r)[1:8] for r in _in_query(
+        conn,
+        "SELECT event_id, status, is_live, score_home, score_away, minute, period, "
+        "time_remaining, MAX(state_id) FROM event_states "
+        "WHERE skin=? AND event_id IN ({}) GROUP BY event_id",
+        event_ids, skin)}
+
+
+def _last_periods_bulk(conn, event_ids: List[str], skin: str) -> Dict[str, Dict[Any, tuple]]:
+    out: Dict[str, Dict[Any, tuple]] = {}
+    for r in _in_query(
+        conn,
+        "SELECT event_id, period_key, period_name, home_score, away_score, MAX(id) "
+        "FROM period_scores WHERE skin=? AND event_id IN ({}) GROUP BY event_id, period_key",
+        event_ids, skin,
+    ):
+        out.setdefault(r["event_id"], {})[r["period_key"]] = (
+            r["period_name"], r["home_score"], r["away_score"])
+    return out
+
+
+def _last_odds_bulk(conn, event_ids: List[str], skin: str) -> Dict[str, Dict[tuple, tuple]]:
+    out: Dict[str, Dict[tuple, tuple]] = {}
+    for r in _in_query(
+        conn,
+        "SELECT event_id, scope, market_id, selection_name, line, price, is_suspended "
+        "FROM current_odds WHERE skin=? AND event_id IN ({})",
+        event_ids, skin,
+    ):
+        out.setdefault(r["event_id"], {})[
+            (r["scope"], r["market_id"], r["selection_name"], r["line"])
+        ] = (r["price"], r["is_suspended"])
+    return out
+
+
+def live_state_snapshot(
+    conn, skin: str, *, event_ids: Optional[List[str]] = None,
+    since: Optional[datetime] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """The last stored state / periods / odds of ``skin`` per event — what
+    :class:`~.odds_state.OddsState` is rebuilt from.
+
+    Covers ``event_ids`` when given, else every event seen since ``since``.
+    Odds come back as ``(scope, (market name, type, G), selection, line, price,
+    is_suspended)`` rows, keyed by the market's natural key rather than its id.
+    """
+    if _is_orm(conn):
+        from . import store_orm
+        return store_orm.live_state_snapshot(conn, skin, event_ids=event_ids, since=since)
+    if event_ids is None:
+        event_ids = [r[0] for r in conn.execute(
+            "SELECT event_id FROM events WHERE last_seen >= ?",
+            ((since or datetime.min.replace(tzinfo=timezone.utc)).isoformat(),))]
+    ids = [str(e) for e in event_ids]
+    odds_by_id = _last_odds_bulk(conn, ids, skin) if ids else {}
+    markets = {r["market_id"]: (r["name"], r["market_type"], r["raw_g"]) for r in _in_query(
+        conn, "SELECT market_id, name, market_type, raw_g FROM markets WHERE market_id IN ({})",
+        list({k[1] for rows in odds_by_id.values() for k in rows}))}
+    return {
+        "states": _last_states_bulk(conn, ids, skin) if ids else {},
+        "periods": _last_periods_bulk(conn, ids, skin) if ids else {},
+        "odds": {eid: [(scope, markets[mid], sel, line, price, susp)
+                       for (scope, mid, sel, line), (price, susp) in rows.items()]
+                 for eid, rows in odds_by_id.items()},
+    }
+
+
+def _resolve_markets(conn, keys: List[tuple]) -> Dict[tuple, int]:
+    """``{(name, market_type, raw_g): market_id}`` — one prefetch + one batch insert."""
+    ids: Dict[tuple, int] = {}
+    cols = "SELECT market_id, name, market_type, raw_g FROM markets WHERE "
+    rows = list(_in_query(conn, cols + "name IN ({}) ORDER BY market_id",
+                          [k[0] for k in keys if k[0] is not None]))
+    if any(k[0] is None for k in keys):
+        rows += conn.execute(cols + "name IS NULL ORDER BY market_id").fetchall()
+    for r in rows:
+        ids.setdefault((r["name"], r["market_type"], r["raw_g"]), r["market_id"])
+    missing = [k for k in keys if k not in ids]
+    if missing:
+        first = _next_id(conn, "markets", "market_id")
+        conn.executemany(
+            "INSERT INTO markets (market_id, name, market_type, raw_g) VALUES (?,?,?,?)",
+            [(first + i, *k) for i, k in enumerate(missing)])
+        ids.update({k: first + i for i, k in enumerate(missing)})
+    return ids
+
+
+def _persist_events_bulk(conn, run_id: int, result: Dict[str, Any]) -> tuple:
+    """Set-based writer: same rows as :func:`_persist_events_rowwise`, but every
+    dimension is resolved for the whole run at once, the previous state/period/
+    odds snapshots for all events come from one query each, and the changed
+    fact rows go out in one ``executemany`` per table."""
+    skin = result.get("skin") or ""
+    at = result.get("extracted_at") or ""
+    evs = store_bulk.keyed_events(result.get("events") or [])
+    if not evs:
+        return 0, 0
+    odds_ins = odds_skip = 0
+
+    # --- dimensions: sports, countries, leagues ---
+    conn.executemany(_SPORT_UPSERT, [
+        (sid, name, (name or "").lower() or None)
+        for sid, name in store_bulk.sport_rows(evs).items()])
+    names = store_bulk.country_names(evs)
+    conn.executemany(
+        "INSERT INTO countries (name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+        [(n,) for n in names])
+    country_ids = {r["name"]: r["country_id"] for r in _in_query(
+        conn, "SELECT country_id, name FROM countries WHERE name IN ({})", names)}
+    conn.executemany(_LEAGUE_UPSERT, [
+        (lid, r["name"], r["sport_id"], r["country_id"])
+        for lid, r in store_bulk.league_rows(evs, country_ids).items()])
+
+    # --- dimension: teams (resolved in memory, then one insert + one update batch) ---
+    team_names, backend_ids = store_bulk.team_lookup_keys(evs)
+    team_cols = "SELECT team_id, " + ", ".join(store_bulk.TEAM_COLUMNS) + " FROM teams WHERE "
+    existing = [dict(r) for r in _in_query(conn, team_cols + "name IN ({})", team_names)]
+    existing += [dict(r) for r in _in_query(conn, team_cols + "backend_id IN ({})", backend_ids)]
+    next_team = iter(range(_next_id(conn, "teams", "team_id"), 1 << 62))
+    teams = store_bulk.TeamResolver(existing, lambda: next(next_team))
+    sides: List[tuple] = []
+    for _, ev in evs:
+        sport_id = _as_int(ev.get("sport_id"))
+        country_id = country_ids.get(ev.get("country")) if ev.get("country") else None
+        sides.append(tuple(
+            teams.resolve(
+                ev.get(side), sport_id, country_id=country_id,
+                feed_id=_as_int(ev.get(f"{side}_team_feed_id")),
+                image=ev.get(f"{side}_team_image"),
+                feed_country_id=_as_int(ev.get(f"{side}_team_country_id")))
+            for side in ("home", "away")))
+        for t in (ev.get("h2h_data") or {}).get("teams") or []:
+            title = (t.get("country") or {}).get("title")
+            teams.resolve(
+                t.get("title"), store_bulk.h2h_sport_id(ev),
+                backend_id=str(t.get("id")) if t.get("id") else None,
+                country_id=country_ids.get(title) if title else None)
+    conn.executemany(
+        "INSERT INTO teams (team_id, " + ", ".join(store_bulk.TEAM_COLUMNS) + ") "
+        "VALUES (?,?,?,?,?,?,?,?)",
+        [(tid, *(row[c] for c in store_bulk.TEAM_COLUMNS)) for tid, row in teams.inserts()])
+    conn.executemany(
+        "UPDATE teams SET " + ", ".join(f"{c}=?" for c in store_bulk.TEAM_COLUMNS)
+        + " WHERE team_id=?",
+        [(*(row[c] for c in store_bulk.TEAM_COLUMNS), tid) for tid, row in teams.updates()])
+
+    # --- dimensions: markets + events ---
+    market_ids = _resolve_markets(conn, store_bulk.market_keys(evs))
+    conn.executemany(_EVENT_UPSERT, [
+        (event_id, _as_int(ev.get("sport_id")), _as_int(ev.get("league_id")),
+         country_ids.get(ev.get("country")) if ev.get("country") else None,
+         home_id, away_id, ev.get("home"), ev.get("away"), ev.get("start_time"),
+         ev.get("venue"), ev.get("stage"), at, at)
+        for (event_id, ev), (home_id, away_id) in zip(evs, sides)])
+
+    # --- facts: change-only against one prefetch per fact table ---
+    deltas = bool(result.get("deltas_only"))
+    if deltas:
+        # Already diffed in memory by the scheduler (odds_state.OddsState):
+        # every row left is a change, so there is nothing to prefetch.
+        last_states: Dict[str, tuple] = {}
+        last_periods_all: Dict[str, Dict[Any, tuple]] = {}
+        last_odds_all: Dict[str, Dict[tuple, tuple]] = {}
+        odds_skip = sum(int(ev.get("odds_skipped") or 0) for _, ev in evs)
+    else:
+        event_ids = list(dict.fromkeys(event_id for event_id, _ in evs))
+        last_states = _last_states_bulk(conn, event_ids, skin)
+        last_periods_all = _last_periods_bulk(conn, event_ids, skin)
+        last_odds_all = _last_odds_bulk(conn, event_ids, skin)
+    next_h2h = _next_id(conn, "h2h_games", "id")
+    states, periods, odds, h2h_games, h2h_periods, sub_games, stats = ([] for _ in range(7))
+
+    for event_id, ev in evs:
+        state = _state_key(ev)
+        if (ev.get("state_changed", True) if deltas else last_states.get(event_id) != state):
+            states.append((run_id, event_id, skin, *state, ev.get("wp_home"), ev.get("wp_away"), at))
+            last_states[event_id] = state
+
+        last_periods = last_periods_all.setdefault(event_id, {})
+        for ps in ev.get("period_scores") or []:
+            pk = _as_int(ps.get("period_key"))
+            row = (ps.get("period_name"), _as_int(ps.get("home_score")), _as_int(ps.get("away_score")))
+            if last_periods.get(pk) == row:
+                continue
+            periods.append((run_id, event_id, skin, pk, *row, at))
+            last_periods[pk] = row
+
+        last_odds = last_odds_all.setdefault(event_id, {})
+        for m in ev.get("markets") or []:
+            market_id = market_ids[(m.get("name"), m.get("market_type"), _as_int(m.get("raw_g")))]
+            scope = m.get("scope") or "FULL_MATCH"
+            for s in m.get("selections") or []:
+                price = s.get("price")
+                if price is None:
+                    continue
+                price = float(price)
+                susp = 1 if s.get("is_suspended") else 0
+                key = (scope, market_id, s.get("name"), s.get("line"))
+                if last_odds.get(key) == (price, susp):
+                    odds_skip += 1
+                    continue
+                odds.append((run_id, event_id, skin, market_id, s.get("name"), s.get("line"),
+                             price, susp, _as_int(s.get("raw_t")), scope, at))
+                last_odds[key] = (price, susp)
+                odds_ins += 1
+
+        h2h = ev.get("h2h_data")
+        for g in (h2h or {}).get("game_shorts") or []:
+            # Explicit ids (see _next_id) let the period rows reference their game
+            # without a per-game INSERT round trip for lastrowid.
+            h2h_games.append((next_h2h, *_h2h_game_params(run_id, event_id, skin, h2h, g, at)))
+            for ps in g.get("periods") or []:
+                h2h_periods.append((next_h2h, event_id, _as_int(ps.get("period_key")),
+                                    ps.get("period_name"), _as_int(ps.get("home_score")),
+                                    _as_int(ps.get("away_score"))))
+            next_h2h += 1
+
+        for sg in ev.get("sub_games") or []:
+            sgid = str(sg.get("sub_game_id") or "").strip()
+            if sgid:
+                sub_games.append(_sub_game_params(sgid, event_id, sg, at))
+
+        for st in ev.get("statistics") or []:
+            if isinstance(st, dict):
+                stats.extend((run_id, event_id, skin, str(k), str(v), at) for k, v in st.items())
+
+    conn.executemany(_STATE_INSERT, states)
+    conn.executemany(_PERIOD_INSERT, periods)
+    conn.executemany(_ODDS_INSERT, odds)
+    conn.executemany(_CURRENT_ODDS_UPSERT, odds)
+    conn.executemany(
+        "INSERT INTO h2h_games "
+        "(id, run_id, event_id, skin, game_id, sport_id, team1_backend_id, "
+        " team2_backend_id, date_start, score1, score2, sub_score1, "
+        " sub_score2, winner, status, captured_at) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", h2h_games)
+    conn.executemany(_H2H_PERIOD_INSERT, h2h_periods)
+    conn.executemany(_SUB_GAME_UPSERT, sub_games)
+    conn.executemany(_STAT_INSERT, stats)
+    return odds_ins, odds_skip
 
 
 # --------------------------------------------------------------------------- #
@@ -698,34 +1155,54 @@ def latest_odds(conn, event_id: str, *, skin: Optional[str] = None):
         from . import store_orm
         return store_orm.latest_odds(conn, event_id, skin=skin)
     sql = (
-        "SELECT o.skin, m.name AS market_name, o.selection_name, o.line, o.price, "
-        "       o.is_suspended, MAX(o.captured_at) AS captured_at "
-        "FROM odds_snapshots o JOIN markets m ON m.market_id=o.market_id "
-        "WHERE o.event_id=? " + ("AND o.skin=? " if skin else "")
-        + "GROUP BY o.skin, m.name, o.selection_name, o.line "
-        "ORDER BY o.skin, m.name, o.selection_name"
+        "SELECT c.skin, m.name AS market_name, c.selection_name, c.line, c.price, "
+        "       c.is_suspended, MAX(c.captured_at) AS captured_at "
+        "FROM current_odds c JOIN markets m ON m.market_id=c.market_id "
+        "WHERE c.event_id=? " + ("AND c.skin=? " if skin else "")
+        + "GROUP BY c.skin, m.name, c.selection_name, c.line "
+        "ORDER BY c.skin, m.name, c.selection_name"
     )
     return conn.execute(sql, (event_id, skin) if skin else (event_id,)).fetchall()
 
 
 def line_movement(conn, event_id, skin, market_name, selection_name) -> List[sqlite3.Row]:
-    """Full price history for one selection — the line-movement series."""
-    return conn.execute(
+    """Full price history for one selection — the line-movement series.
+
+    Points already moved to the retention tier (:mod:`retention`) are merged
+    in, so the series is complete whichever tier holds it.
+    """
+    from . import retention
+
+    hot = (
         "SELECT o.captured_at, o.price, o.is_suspended FROM odds_snapshots o "
         "JOIN markets m ON m.market_id=o.market_id "
-        "WHERE o.event_id=? AND o.skin=? AND m.name=? AND o.selection_name=? "
-        "ORDER BY o.captured_at",
-        (event_id, skin, market_name, selection_name),
+        "WHERE o.event_id=? AND o.skin=? AND m.name=? AND o.selection_name=?"
+    )
+    params = (event_id, skin, market_name, selection_name)
+    archived = retention.archived_line_movement(conn, *params)
+    if not archived:
+        return conn.execute(hot + " ORDER BY o.captured_at", params).fetchall()
+    # One statement over both tiers keeps the sqlite3.Row result type.
+    return conn.execute(
+        "SELECT captured_at, price, is_suspended FROM ("
+        " SELECT json_extract(value, '$[0]') AS captured_at,"
+        "        json_extract(value, '$[1]') AS price,"
+        "        json_extract(value, '$[2]') AS is_suspended FROM json_each(?)"
+        " UNION ALL " + hot + ") ORDER BY captured_at",
+        (json.dumps(archived), *params),
     ).fetchall()
 
 
 def cross_skin_odds(conn, event_id, market_name, selection_name) -> List[sqlite3.Row]:
     """Latest price for one selection across every skin — ascending, best last."""
+    if _is_orm(conn):
+        from . import store_orm
+        return store_orm.cross_skin_odds(conn, event_id, market_name, selection_name)
     return conn.execute(
-        "SELECT o.skin, o.price, o.line, MAX(o.captured_at) AS captured_at "
-        "FROM odds_snapshots o JOIN markets m ON m.market_id=o.market_id "
-        "WHERE o.event_id=? AND m.name=? AND o.selection_name=? "
-        "GROUP BY o.skin ORDER BY o.price",
+        "SELECT c.skin, c.price, c.line, MAX(c.captured_at) AS captured_at "
+        "FROM current_odds c JOIN markets m ON m.market_id=c.market_id "
+        "WHERE c.event_id=? AND m.name=? AND c.selection_name=? "
+        "GROUP BY c.skin ORDER BY c.price",
         (event_id, market_name, selection_name),
     ).fetchall()
 
@@ -738,7 +1215,7 @@ def counts(conn) -> Dict[str, int]:
     tables = [
         "sports", "countries", "leagues", "teams", "events", "markets", "sub_games",
         "scrape_runs", "event_states", "period_scores", "odds_snapshots",
-        "h2h_games", "h2h_period_scores", "statistics",
+        "current_odds", "h2h_games", "h2h_period_scores", "statistics",
     ]
     return {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in tables}
 
@@ -0,0 +1,226 @@
+"""Set-based ingestion planning shared by the sqlite and ORM store paths.
+
+The per-row ``persist_result`` resolved every dimension with its own
+SELECT-then-INSERT and read each event's last-stored facts one event at a time,
+so a 300-match live pass cost tens of thousands of single-row round trips. The
+bulk path splits the work in two:
+
+* **plan** (this module, backend-agnostic) — walk the run once, collect its
+  distinct dimension keys, and resolve teams in memory with the exact
+  get-or-create/backfill rules of the per-row helpers;
+* **write** (:mod:`store` / :mod:`store_orm`) — prefetch what already exists
+  with a few ``IN (...)`` queries and write each table with one
+  ``executemany`` / multi-row statement.
+
+Everything here works on the plain ``BetB2BScrapeResult.to_dict()`` shape.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+__all__ = [
+    "TEAM_COLUMNS",
+    "TeamResolver",
+    "as_int",
+    "chunked",
+    "country_names",
+    "keyed_events",
+    "league_rows",
+    "market_keys",
+    "sport_rows",
+    "team_lookup_keys",
+]
+
+# Mutable ``teams`` columns, in the order both backends read/write them.
+TEAM_COLUMNS = ("backend_id", "name", "sport_id", "country_id",
+                "feed_id", "image", "feed_country_id")
+
+
+def as_int(v: Any) -> Optional[int]:
+    """``v`` as an int; ``None`` for ``None``, ``""`` or anything non-numeric."""
+    try:
+        return int(v) if v is not None and str(v) != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def chunked(seq: Iterable[Any], n: int = 400) -> Iterator[List[Any]]:
+    """Split ``seq`` into lists of ``n`` (well under SQLite's variable limit)."""
+    items = list(seq)
+    for i in range(0, len(items), n):
+        yield items[i:i + n]
+
+
+def keyed_events(events: Sequence[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """``(event_id, event)`` for every event with a usable id, in input order."""
+    out = []
+    for ev in events:
+        event_id = str(ev.get("event_id") or "").strip()
+        if event_id:
+            out.append((event_id, ev))
+    return out
+
+
+def h2h_sport_id(ev: Dict[str, Any]) -> Optional[int]:
+    """The sport a H2H participant is filed under (the h2h SI, else the event's)."""
+    return as_int((ev.get("h2h_data") or {}).get("sport_id")) or as_int(ev.get("sport_id"))
+
+
+def sport_rows(evs: Sequence[Tuple[str, Dict[str, Any]]]) -> Dict[int, Optional[str]]:
+    """``{sport_id: name}`` — the last non-empty name wins, as with sequential
+    ``COALESCE(excluded.name, ...)`` upserts."""
+    out: Dict[int, Optional[str]] = {}
+    for _, ev in evs:
+        sid = as_int(ev.get("sport_id"))
+        if sid is None:
+            continue
+        name = ev.get("sport")
+        out[sid] = name if name is not None else out.get(sid)
+    return out
+
+
+def country_names(evs: Sequence[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """Distinct country names (event + H2H participant countries), first-seen order."""
+    seen: Dict[str, None] = {}
+    for _, ev in evs:
+        if ev.get("country"):
+            seen.setdefault(ev["country"], None)
+        for t in (ev.get("h2h_data") or {}).get("teams") or []:
+            title = (t.get("country") or {}).get("title")
+            if title:
+                seen.setdefault(title, None)
+    return list(seen)
+
+
+def league_rows(
+    evs: Sequence[Tuple[str, Dict[str, Any]]], country_ids: Dict[str, int],
+) -> Dict[int, Dict[str, Any]]:
+    """``{league_id: {name, sport_id, country_id}}`` merged the way sequential
+    COALESCE upserts would leave them (the last non-null value per column)."""
+    out: Dict[int, Dict[str, Any]] = {}
+    for _, ev in evs:
+        lid = as_int(ev.get("league_id"))
+        if lid is None:
+            continue
+        row = {"name": ev.get("competition"), "sport_id": as_int(ev.get("sport_id")),
+               "country_id": country_ids.get(ev.get("country")) if ev.get("country") else None}
+        prev = out.get(lid)
+        if prev:
+            row = {k: v if v is not None else prev[k] for k, v in row.items()}
+        out[lid] = row
+    return out
+
+
+def team_lookup_keys(evs: Sequence[Tuple[str, Dict[str, Any]]]) -> Tuple[List[str], List[str]]:
+    """``(names, backend_ids)`` referenced by the run — the teams prefetch keys."""
+    names: Dict[str, None] = {}
+    backend_ids: Dict[str, None] = {}
+    for _, ev in evs:
+        for side in ("home", "away"):
+            if ev.get(side):
+                names.setdefault(ev[side], None)
+        for t in (ev.get("h2h_data") or {}).get("teams") or []:
+            if t.get("title"):
+                names.setdefault(t["title"], None)
+            if t.get("id"):
+                backend_ids.setdefault(str(t["id"]), None)
+    return list(names), list(backend_ids)
+
+
+def market_keys(evs: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Tuple[Any, Any, Optional[int]]]:
+    """Distinct ``(name, market_type, raw_g)`` market keys, first-seen order."""
+    seen: Dict[Tuple[Any, Any, Optional[int]], None] = {}
+    for _, ev in evs:
+        for m in ev.get("markets") or []:
+            seen.setdefault((m.get("name"), m.get("market_type"), as_int(m.get("raw_g"))), None)
+    return list(seen)
+
+
+class TeamResolver:
+    """In-memory get-or-create over the ``teams`` dimension for one run.
+
+    Seeded with every existing row the run could match (by backend id or by
+    name), it replays the per-row ``_get_or_create_team`` rules — backend-id
+    match first, then ``(name, sport_id)``, COALESCE-backfill of the feed
+    attributes — without touching the database. New teams get ids from
+    ``allocate`` (real ids on SQLite, provisional ones on the ORM path, which
+    remaps them after its ``INSERT ... RETURNING``). :meth:`inserts` and
+    :meth:`updates` then hand the writer one batch each.
+    """
+
+    def __init__(self, existing: Iterable[Dict[str, Any]], allocate: Callable[[], int]) -> None:
+        self._allocate = allocate
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._orig: Dict[int, Tuple[Any, ...]] = {}
+        self._new: List[int] = []
+        self._by_backend: Dict[str, int] = {}
+        self._by_name: Dict[Tuple[Any, Any], int] = {}
+        for r in sorted(existing, key=lambda r: r["team_id"]):
+            tid = r["team_id"]
+            if tid in self._rows:
+                continue
+            self._rows[tid] = {c: r[c] for c in TEAM_COLUMNS}
+            self._orig[tid] = tuple(r[c] for c in TEAM_COLUMNS)
+            self._index(tid)
+
+    def _index(self, tid: int) -> None:
+        row = self._rows[tid]
+        if row["backend_id"]:
+            self._by_backend.setdefault(row["backend_id"], tid)
+        self._by_name.setdefault((row["name"], row["sport_id"]), tid)
+
+    def _backfill(self, tid: int, feed_id, image, feed_country_id) -> int:
+        row = self._rows[tid]
+        for col, val in (("feed_id", feed_id), ("image", image),
+                         ("feed_country_id", feed_country_id)):
+            if row[col] is None:
+                row[col] = val
+        return tid
+
+    def resolve(
+        self, name: Optional[str], sport_id: Optional[int], *,
+        backend_id: Optional[str] = None, country_id: Optional[int] = None,
+        feed_id: Optional[int] = None, image: Optional[str] = None,
+        feed_country_id: Optional[int] = None,
+    ) -> Optional[int]:
+        if backend_id:
+            tid = self._by_backend.get(backend_id)
+            if tid is not None:
+                row = self._rows[tid]
+                if name:  # enrich name/country if we now know them
+                    if self._by_name.get((row["name"], row["sport_id"])) == tid:
+                        del self._by_name[(row["name"], row["sport_id"])]
+                    row["name"] = name
+                    if country_id is not None:
+                        row["country_id"] = country_id
+                    self._index(tid)
+                return self._backfill(tid, feed_id, image, feed_country_id)
+        if not name:
+            return None
+        tid = self._by_name.get((name, sport_id))
+        if tid is not None:
+            row = self._rows[tid]
+            if backend_id and not row["backend_id"]:  # backfill backend id/country
+                row["backend_id"] = backend_id
+                if country_id is not None:
+                    row["country_id"] = country_id
+                self._index(tid)
+            return self._backfill(tid, feed_id, image, feed_country_id)
+        tid = self._allocate()
+        self._rows[tid] = {"backend_id": backend_id, "name": name, "sport_id": sport_id,
+                           "country_id": country_id, "feed_id": feed_id, "image": image,
+                           "feed_country_id": feed_country_id}
+        self._new.append(tid)
+        self._index(tid)
+        return tid
+
+    def inserts(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """New teams, in creation order."""
+        return [(tid, self._rows[tid]) for tid in self._new]
+
+    def updates(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """Existing teams whose columns this run actually changed."""
+        return [(tid, row) for tid, row in self._rows.items()
+                if tid in self._orig
+                and tuple(row[c] for c in TEAM_COLUMNS) != self._orig[tid]]
@@ -14,16 +14,17 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import Connection, func, select
+from sqlalchemy import Connection, bindparam, func, select
 from sqlalchemy.dialects.postgresql import insert as _pg_insert
 from sqlalchemy.dialects.sqlite import insert as _sqlite_insert
 
+from . import store_bulk
 from .models import (
-    Base, Country, Event, EventState, H2HGame, H2HPeriodScore, League,
-    Market, OddsSnapshot, PeriodScore, ScrapeRun, ScraperJob, Sport,
-    Statistic, SubGame, Team,
+    CURRENT_ODDS_KEY, Base, Country, CurrentOdds, Event, EventState, H2HGame,
+    H2HPeriodScore, League, Market, OddsSnapshot, PeriodScore, ScrapeRun,
+    ScraperJob, Sport, Statistic, SubGame, Team,
 )
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ _sports, _countries, _leagues, _teams = Sport.__table__, Country.__table__, Leag
 _events, _markets, _runs = Event.__table__, Market.__table__, ScrapeRun.__table__
 _states, _periods, _odds = EventState.__table__, PeriodScore.__table__, OddsSnapshot.__table__
 _h2h, _h2hp, _stats, _jobs = H2HGame.__table__, H2HPeriodScore.__table__, Statistic.__table__, ScraperJob.__table__
-_subgames = SubGame.__table__
+_subgames, _cur = SubGame.__table__, CurrentOdds.__table__
 
 # One engine per resolved URL (pool reuse); schema ensured once.
 _engines: Dict[str, Any] = {}
@@ -87,13 +88,38 @@ def _get_engine():
     url = resolve_database_url()
     eng = _engines.get(url)
     if eng is None:
+        from sqlalchemy import inspect
+
         eng = get_engine()
+        had_current = inspect(eng).has_table(_cur.name)
         Base.metadata.create_all(eng, checkfirst=True)
         _ensure_columns(eng)
+        if not had_current:
+            _backfill_current_odds(eng)
         _engines[url] = eng
     return eng
 
 
+def _backfill_current_odds(eng) -> None:
+    """Seed ``current_odds`` from history the first time a pre-existing store
+    gets the table (fresh stores have no history → no-op)."""
+    latest = select(func.max(_odds.c.snap_id).label("mx")).where(
+        _odds.c.market_id.is_not(None)).group_by(
+        _odds.c.event_id, _odds.c.skin, _odds.c.scope, _odds.c.market_id,
+        _odds.c.selection_name, _odds.c.line).subquery()
+    cols = ("event_id", "skin", "scope", "market_id", "selection_name", "line", "price",
+            "is_suspended", "raw_t", "run_id", "captured_at")
+    src = select(*(func.coalesce(_odds.c.scope, "FULL_MATCH") if c == "scope" else _odds.c[c]
+                   for c in cols)).join(latest, _odds.c.snap_id == latest.c.mx)
+    try:
+        with eng.begin() as c:
+            n = c.execute(_cur.insert().from_select(cols, src)).rowcount
+        if n:
+            logger.info("current_odds: backfilled %d rows from odds_snapshots", n)
+    except Exception as e:  # noqa: BLE001 — read-only DB: reads fall back to empty
+        logger.warning("could not backfill current_odds (read-only DB?): %s", e)
+
+
 def connect() -> Connection:
     """A SQLAlchemy Connection (commit-as-you-go) with the schema ensured."""
     return _get_engine().connect()
@@ -103,11 +129,7 @@ def _ins(conn: Connection):
     return _pg_insert if conn.dialect.name == "postgresql" else _sqlite_insert
 
 
-def _as_int(v: Any) -> Optional[int]:
-    try:
-        return int(v) if v is not None and str(v) != "" else None
-    except (TypeError, ValueError):
-        return None
+_as_int = store_bulk.as_int
 
 
 def _dt(v: Any) -> Optional[datetime]:
@@ -243,23 +265,33 @@ def _last_periods(conn, event_id, skin):
 
 
 def _last_odds(conn, event_id, skin):
-    # Latest (price, is_suspended) per (scope, market_id, selection, line).
-    # SQLite lets bare columns ride a GROUP BY (returns the max-row's values);
-    # Postgres rejects that (GroupingError), so join the max snap_id back to the
-    # table to fetch that row's price/is_suspended — portable on both.
-    sub = select(
-        _odds.c.scope, _odds.c.market_id, _odds.c.selection_name, _odds.c.line,
-        func.max(_odds.c.snap_id).label("mx")
-    ).where(_odds.c.event_id == event_id, _odds.c.skin == skin).group_by(
-        _odds.c.scope, _odds.c.market_id, _odds.c.selection_name, _odds.c.line).subquery()
+    # Latest (price, is_suspended) per (scope, market_id, selection, line) —
+    # the materialized current_odds row, not a GROUP BY over history.
     rows = conn.execute(select(
-        _odds.c.scope, _odds.c.market_id, _odds.c.selection_name, _odds.c.line,
-        _odds.c.price, _odds.c.is_suspended
-    ).join(sub, _odds.c.snap_id == sub.c.mx)).all()
+        _cur.c.scope, _cur.c.market_id, _cur.c.selection_name, _cur.c.line,
+        _cur.c.price, _cur.c.is_suspended
+    ).where(_cur.c.event_id == event_id, _cur.c.skin == skin)).all()
     return {(r[0], r[1], r[2], r[3]): (r[4], bool(r[5]) if r[5] is not None else False)
             for r in rows}
 
 
+def _upsert_current_odds(conn, odds_rows: List[dict]) -> None:
+    """Upsert the run's changed odds rows into ``current_odds`` (same transaction
+    as the snapshot insert). A key repeated within the run keeps its last row —
+    one multi-row ``ON CONFLICT`` can't touch a row twice on Postgres."""
+    if not odds_rows:
+        return
+    latest: Dict[tuple, dict] = {}
+    for r in odds_rows:
+        latest[(r["event_id"], r["scope"], r["market_id"], r["selection_name"], r["line"])] = r
+    stmt = _ins(conn)(_cur)
+    conn.execute(stmt.on_conflict_do_update(
+        index_elements=list(CURRENT_ODDS_KEY),
+        set_={c: stmt.excluded[c]
+              for c in ("price", "is_suspended", "raw_t", "run_id", "captured_at")}),
+        list(latest.values()))
+
+
 # --- Bulk variants: one query for the whole batch of events, not one per event.
 # The change-only dedup needs each event's last-seen row; fetching them per event
 # was N network round-trips to Supabase. These fetch them all at once, keyed by
@@ -298,27 +330,44 @@ def _last_periods_bulk(conn, event_ids, skin):
 def _last_odds_bulk(conn, event_ids, skin):
     if not event_ids:
         return {}
-    sub = select(
-        _odds.c.event_id, _odds.c.scope, _odds.c.market_id, _odds.c.selection_name,
-        _odds.c.line, func.max(_odds.c.snap_id).label("mx")
-    ).where(_odds.c.event_id.in_(event_ids), _odds.c.skin == skin).group_by(
-        _odds.c.event_id, _odds.c.scope, _odds.c.market_id,
-        _odds.c.selection_name, _odds.c.line).subquery()
-    rows = conn.execute(select(
-        _odds.c.event_id, _odds.c.scope, _odds.c.market_id, _odds.c.selection_name,
-        _odds.c.line, _odds.c.price, _odds.c.is_suspended
-    ).join(sub, _odds.c.snap_id == sub.c.mx)).all()
     out: Dict[str, Dict[Any, Any]] = {}
-    for r in rows:
+    q = select(_cur.c.event_id, _cur.c.scope, _cur.c.market_id, _cur.c.selection_name,
+               _cur.c.line, _cur.c.price, _cur.c.is_suspended).where(_cur.c.skin == skin)
+    for r in _select_in(conn, q, _cur.c.event_id, event_ids):
         out.setdefault(r[0], {})[(r[1], r[2], r[3], r[4])] = (
             r[5], bool(r[6]) if r[6] is not None else False)
     return out
 
 
+def live_state_snapshot(conn, skin, *, event_ids=None, since=None):
+    """See :func:`store.live_state_snapshot` — same shape, Postgres path."""
+    if event_ids is None:
+        q = select(_events.c.event_id)
+        if since is not None:
+            q = q.where(_events.c.last_seen >= since)
+        event_ids = [r[0] for r in conn.execute(q).all()]
+    ids = [str(e) for e in event_ids]
+    odds_by_id = _last_odds_bulk(conn, ids, skin)
+    markets = {r[0]: (r[1], r[2], r[3]) for r in _select_in(
+        conn, select(_markets.c.market_id, _markets.c.name, _markets.c.market_type,
+                     _markets.c.raw_g),
+        _markets.c.market_id, list({k[1] for rows in odds_by_id.values() for k in rows}))}
+    return {
+        "states": _last_states_bulk(conn, ids, skin),
+        "periods": _last_periods_bulk(conn, ids, skin),
+        "odds": {eid: [(scope, markets[mid], sel, line, price, susp)
+                       for (scope, mid, sel, line), (price, susp) in rows.items()]
+                 for eid, rows in odds_by_id.items()},
+    }
+
+
 # --------------------------------------------------------------------------- #
 # Persist
 # --------------------------------------------------------------------------- #
-def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
+def persist_result(conn: Connection, result: Dict[str, Any], *, bulk: bool = True,
+                   touch: Sequence[str] = ()) -> int:
+    """See :func:`store.persist_result`; ``touch`` lists the unchanged events
+    whose ``last_seen`` still advances."""
     skin = result.get("skin") or ""
     at = _dt(result.get("extracted_at"))
     events: List[Dict[str, Any]] = result.get("events") or []
@@ -332,6 +381,22 @@ def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
         template_version=result.get("template_version"),
     ).returning(_runs.c.run_id)).scalar()
 
+    if bulk:
+        odds_count = _persist_events_bulk(conn, run_id, skin, at, events,
+                                          deltas_only=bool(result.get("deltas_only")))
+    else:
+        odds_count = _persist_events_rowwise(conn, run_id, skin, at, events)
+    if touch:
+        conn.execute(_events.update().where(_events.c.event_id.in_(list(touch)))
+                     .values(last_seen=at))
+    conn.commit()
+    logger.info("persist run %s (skin=%s): %d events, %d odds → Postgres",
+                run_id, skin, len(events), odds_count)
+    return run_id
+
+
+def _persist_events_rowwise(conn: Connection, run_id, skin, at, events) -> int:
+    """Per-event writer with per-persist dimension caches. Returns the odds count."""
     # Per-persist caches + batches: repeating dimensions are looked up once, and
     # the bulk facts are accumulated and inserted with one executemany each —
     # collapsing hundreds of per-row network round-trips (the Supabase-persist
@@ -437,9 +502,10 @@ def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
                 score_home=state[2], score_away=state[3], minute=state[4], period=state[5],
                 time_remaining=state[6], wp_home=ev.get("wp_home"), wp_away=ev.get("wp_away"),
                 captured_at=at))
+            last_states[event_id] = state
 
         # facts: period scores (only changed) → batch
-        last_periods = last_periods_all.get(event_id, {})
+        last_periods = last_periods_all.setdefault(event_id, {})
         for ps in ev.get("period_scores") or []:
             pk = _as_int(ps.get("period_key"))
             row = (ps.get("period_name"), _as_int(ps.get("home_score")), _as_int(ps.get("away_score")))
@@ -451,7 +517,7 @@ def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
             last_periods[pk] = row
 
         # facts: odds (only when a selection's price/suspension changed) → batch
-        last_odds = last_odds_all.get(event_id, {})
+        last_odds = last_odds_all.setdefault(event_id, {})
         for m in ev.get("markets") or []:
             market_id = _market_c(m.get("name"), m.get("market_type"), m.get("raw_g"))
             scope = m.get("scope") or "FULL_MATCH"
@@ -527,6 +593,7 @@ def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
         conn.execute(_periods.insert(), period_batch)
     if odds_batch:
         conn.execute(_odds.insert(), odds_batch)
+        _upsert_current_odds(conn, odds_batch)
     # H2H games in one batched INSERT...RETURNING (was one round-trip per game).
     # SQLAlchemy's insertmanyvalues returns ids in input order, so zip them back
     # to each game's periods to fill the FK.
@@ -539,10 +606,250 @@ def persist_result(conn: Connection, result: Dict[str, Any]) -> int:
         conn.execute(_h2hp.insert(), h2hp_batch)
     if stat_batch:
         conn.execute(_stats.insert(), stat_batch)
-    conn.commit()
-    logger.info("persist run %s (skin=%s): %d events, %d odds → Postgres",
-                run_id, skin, len(events), len(odds_batch))
-    return run_id
+    return len(odds_batch)
+
+
+# --------------------------------------------------------------------------- #
+# Set-based persist — the whole run in a handful of statements
+# --------------------------------------------------------------------------- #
+def _select_in(conn, query, col, keys):
+    """Rows of ``query`` filtered by ``col IN keys``, chunked."""
+    rows = []
+    for chunk in store_bulk.chunked(keys):
+        rows += conn.execute(query.where(col.in_(chunk))).all()
+    return rows
+
+
+def _merge_by(rows: List[dict], key: str, keep_first=()) -> List[dict]:
+    """Collapse rows sharing ``key`` the way sequential COALESCE upserts would
+    (later non-null values win; ``keep_first`` columns are insert-only). One
+    multi-row ``ON CONFLICT`` statement can't touch the same row twice on
+    Postgres, so duplicates inside a run are merged before the write."""
+    out: Dict[Any, dict] = {}
+    for r in rows:
+        prev = out.get(r[key])
+        if prev is None:
+            out[r[key]] = dict(r)
+            continue
+        for k, v in r.items():
+            if k not in keep_first and v is not None:
+                prev[k] = v
+    return list(out.values())
+
+
+def _coalesce_set(stmt, table, cols, overwrite=()):
+    return {c: stmt.excluded[c] if c in overwrite
+            else func.coalesce(stmt.excluded[c], table.c[c]) for c in cols}
+
+
+def _persist_events_bulk(conn: Connection, run_id, skin, at, events, *,
+                         deltas_only: bool = False) -> int:
+    """Set-based writer: one multi-row upsert per dimension, one prefetch per
+    change-dedup table, one executemany per fact table. Stores the same rows as
+    :func:`_persist_events_rowwise`. Returns the odds count.
+
+    ``deltas_only`` events were diffed in memory already (``odds_state``): the
+    prefetches are skipped and ``state_changed`` decides the state row."""
+    evs = store_bulk.keyed_events(events)
+    if not evs:
+        return 0
+    ins = _ins(conn)
+
+    # --- dimensions: sports, countries, leagues ---
+    sports = store_bulk.sport_rows(evs)
+    if sports:
+        stmt = ins(_sports).values([dict(sport_id=sid, name=n, slug=(n or "").lower() or None)
+                                    for sid, n in sports.items()])
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["sport_id"], set_=_coalesce_set(stmt, _sports, ("name", "slug"))))
+    names = store_bulk.country_names(evs)
+    if names:
+        conn.execute(ins(_countries).values([{"name": n} for n in names])
+                     .on_conflict_do_nothing(index_elements=["name"]))
+    country_ids = {r[1]: r[0] for r in _select_in(
+        conn, select(_countries.c.country_id, _countries.c.name), _countries.c.name, names)}
+    leagues = store_bulk.league_rows(evs, country_ids)
+    if leagues:
+        stmt = ins(_leagues).values([dict(league_id=lid, **r) for lid, r in leagues.items()])
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["league_id"],
+            set_=_coalesce_set(stmt, _leagues, ("name", "sport_id", "country_id"))))
+
+    # --- dimension: teams (resolved in memory; provisional ids remapped after insert) ---
+    team_names, backend_ids = store_bulk.team_lookup_keys(evs)
+    q = select(_teams.c.team_id, *(_teams.c[c] for c in store_bulk.TEAM_COLUMNS))
+    existing = [dict(r._mapping) for r in _select_in(conn, q, _teams.c.name, team_names)]
+    existing += [dict(r._mapping) for r in _select_in(conn, q, _teams.c.backend_id, backend_ids)]
+    provisional = iter(range(-1, -(1 << 62), -1))
+    teams = store_bulk.TeamResolver(existing, lambda: next(provisional))
+    sides = []
+    for _, ev in evs:
+        sport_id = _as_int(ev.get("sport_id"))
+        country_id = country_ids.get(ev.get("country")) if ev.get("country") else None
+        sides.append(tuple(
+            teams.resolve(
+                ev.get(side), sport_id, country_id=country_id,
+                feed_id=_as_int(ev.get(f"{side}_team_feed_id")),
+                image=ev.get(f"{side}_team_image"),
+                feed_country_id=_as_int(ev.get(f"{side}_team_country_id")))
+            for side in ("home", "away")))
+        for t in (ev.get("h2h_data") or {}).get("teams") or []:
+            title = (t.get("country") or {}).get("title")
+            teams.resolve(
+                t.get("title"), store_bulk.h2h_sport_id(ev),
+                backend_id=str(t.get("id")) if t.get("id") else None,
+                country_id=country_ids.get(title) if title else None)
+    real: Dict[int, int] = {}
+    new_teams = teams.inserts()
+    if new_teams:
+        ids = conn.execute(
+            _teams.insert().returning(_teams.c.team_id, sort_by_parameter_order=True),
+            [row for _, row in new_teams]).scalars().all()
+        real = {tid: rid for (tid, _), rid in zip(new_teams, ids)}
+    changed = teams.updates()
+    if changed:
+        conn.execute(
+            _teams.update().where(_teams.c.team_id == bindparam("b_team_id")).values(
+                **{c: bindparam(f"b_{c}") for c in store_bulk.TEAM_COLUMNS}),
+            [{"b_team_id": tid, **{f"b_{c}": row[c] for c in store_bulk.TEAM_COLUMNS}}
+             for tid, row in changed])
+
+    # --- dimensions: markets + events ---
+    keys = store_bulk.market_keys(evs)
+    mq = select(_markets.c.market_id, _markets.c.name, _markets.c.market_type, _markets.c.raw_g)
+    rows = _select_in(conn, mq, _markets.c.name, [k[0] for k in keys if k[0] is not None])
+    if any(k[0] is None for k in keys):
+        rows += conn.execute(mq.where(_markets.c.name.is_(None))).all()
+    market_ids: Dict[tuple, int] = {}
+    for r in sorted(rows, key=lambda r: r[0]):
+        market_ids.setdefault((r[1], r[2], r[3]), r[0])
+    missing = [k for k in keys if k not in market_ids]
+    if missing:
+        ids = conn.execute(
+            _markets.insert().returning(_markets.c.market_id, sort_by_parameter_order=True),
+            [dict(name=k[0], market_type=k[1], raw_g=k[2]) for k in missing]).scalars().all()
+        market_ids.update(zip(missing, ids))
+
+    event_rows = _merge_by([
+        dict(event_id=event_id, sport_id=_as_int(ev.get("sport_id")),
+             league_id=_as_int(ev.get("league_id")),
+             country_id=country_ids.get(ev.get("country")) if ev.get("country") else None,
+             home_team_id=real.get(home_id, home_id), away_team_id=real.get(away_id, away_id),
+             home_name=ev.get("home"), away_name=ev.get("away"),
+             start_time=_dt(ev.get("start_time")), venue=ev.get("venue"),
+             stage=ev.get("stage"), first_seen=at, last_seen=at)
+        for (event_id, ev), (home_id, away_id) in zip(evs, sides)
+    ], "event_id", keep_first=("home_name", "away_name", "first_seen"))
+    estmt = ins(_events)
+    conn.execute(estmt.on_conflict_do_update(index_elements=["event_id"], set_=_coalesce_set(
+        estmt, _events,
+        ("sport_id", "league_id", "country_id", "home_team_id", "away_team_id",
+         "start_time", "venue", "stage", "last_seen"), overwrite=("last_seen",))), event_rows)
+
+    # --- facts: change-only against one prefetch per fact table ---
+    event_ids = [] if deltas_only else [r["event_id"] for r in event_rows]
+    last_states = _last_states_bulk(conn, event_ids, skin)
+    last_periods_all = _last_periods_bulk(conn, event_ids, skin)
+    last_odds_all = _last_odds_bulk(conn, event_ids, skin)
+    states, periods, odds, stats, sub_games = [], [], [], [], []
+    h2h_games, h2h_periods = [], []
+
+    for event_id, ev in evs:
+        state = (ev.get("status"), bool(ev.get("is_live")), _as_int(ev.get("score_home")),
+                 _as_int(ev.get("score_away")), _as_int(ev.get("minute")),
+                 ev.get("period"), ev.get("time_remaining"))
+        if (ev.get("state_changed", True) if deltas_only
+                else last_states.get(event_id) != state):
+            states.append(dict(
+                run_id=run_id, event_id=event_id, skin=skin, status=state[0], is_live=state[1],
+                score_home=state[2], score_away=state[3], minute=state[4], period=state[5],
+                time_remaining=state[6], wp_home=ev.get("wp_home"), wp_away=ev.get("wp_away"),
+                captured_at=at))
+            last_states[event_id] = state
+
+        last_periods = last_periods_all.setdefault(event_id, {})
+        for ps in ev.get("period_scores") or []:
+            pk = _as_int(ps.get("period_key"))
+            row = (ps.get("period_name"), _as_int(ps.get("home_score")), _as_int(ps.get("away_score")))
+            if last_periods.get(pk) == row:
+                continue
+            periods.append(dict(
+                run_id=run_id, event_id=event_id, skin=skin, period_key=pk, period_name=row[0],
+                home_score=row[1], away_score=row[2], captured_at=at))
+            last_periods[pk] = row
+
+        last_odds = last_odds_all.setdefault(event_id, {})
+        for m in ev.get("markets") or []:
+            market_id = market_ids[(m.get("name"), m.get("market_type"), _as_int(m.get("raw_g")))]
+            scope = m.get("scope") or "FULL_MATCH"
+            for s in m.get("selections") or []:
+                price = s.get("price")
+                if price is None:
+                    continue
+                price = float(price)
+                susp = bool(s.get("is_suspended"))
+                key = (scope, market_id, s.get("name"), s.get("line"))
+                if last_odds.get(key) == (price, susp):
+                    continue
+                odds.append(dict(
+                    run_id=run_id, event_id=event_id, skin=skin, market_id=market_id,
+                    selection_name=s.get("name"), line=s.get("line"), price=price,
+                    is_suspended=susp, raw_t=_as_int(s.get("raw_t")), scope=scope, captured_at=at))
+                last_odds[key] = (price, susp)
+
+        h2h = ev.get("h2h_data") or {}
+        for g in h2h.get("game_shorts") or []:
+            h2h_games.append(dict(
+                run_id=run_id, event_id=event_id, skin=skin, game_id=g.get("game_id"),
+                sport_id=_as_int(h2h.get("sport_id")), team1_backend_id=g.get("team1_id"),
+                team2_backend_id=g.get("team2_id"), date_start=_dt(g.get("date_start")),
+                score1=_as_int(g.get("score1")), score2=_as_int(g.get("score2")),
+                sub_score1=_as_int(g.get("sub_score1")), sub_score2=_as_int(g.get("sub_score2")),
+                winner=_as_int(g.get("winner")), status=_as_int(g.get("status")), captured_at=at))
+            h2h_periods.append([
+                dict(event_id=event_id,
+                     period_key=_as_int(ps.get("period_key")), period_name=ps.get("period_name"),
+                     home_score=_as_int(ps.get("home_score")), away_score=_as_int(ps.get("away_score")))
+                for ps in g.get("periods") or []])
+
+        for sg in ev.get("sub_games") or []:
+            sgid = str(sg.get("sub_game_id") or "").strip()
+            if sgid:
+                sub_games.append(dict(
+                    sub_game_id=sgid, event_id=event_id, name=sg.get("name"),
+                    period=sg.get("period"), period_index=_as_int(sg.get("period_index")),
+                    market_count=_as_int(sg.get("market_count")),
+                    sport_id=_as_int(sg.get("sport_id")), first_seen=at, last_seen=at))
+
+        for st in ev.get("statistics") or []:
+            if isinstance(st, dict):
+                stats.extend(dict(run_id=run_id, event_id=event_id, skin=skin,
+                                  name=str(k), value=str(v), captured_at=at)
+                             for k, v in st.items())
+
+    if states:
+        conn.execute(_states.insert(), states)
+    if periods:
+        conn.execute(_periods.insert(), periods)
+    if odds:
+        conn.execute(_odds.insert(), odds)
+        _upsert_current_odds(conn, odds)
+    if h2h_games:
+        ids = conn.execute(_h2h.insert().returning(_h2h.c.id, sort_by_parameter_order=True),
+                           h2h_games).scalars().all()
+        h2hp = [dict(h2h_game_id=gid, **p) for gid, ps in zip(ids, h2h_periods) for p in ps]
+        if h2hp:
+            conn.execute(_h2hp.insert(), h2hp)
+    if sub_games:
+        sstmt = ins(_subgames)
+        conn.execute(sstmt.on_conflict_do_update(index_elements=["sub_game_id"], set_=_coalesce_set(
+            sstmt, _subgames,
+            ("event_id", "name", "period", "period_index", "market_count", "sport_id", "last_seen"),
+            overwrite=("event_id", "last_seen"))),
+            _merge_by(sub_games, "sub_game_id", keep_first=("first_seen",)))
+    if stats:
+        conn.execute(_stats.insert(), stats)
+    return len(odds)
 
 
 # --------------------------------------------------------------------------- #
@@ -659,15 +966,28 @@ def record_result(conn, event_id, *, stat_game_id=None, score_home=None,
 
 def counts(conn) -> Dict[str, int]:
     tables = [_sports, _countries, _leagues, _teams, _events, _markets, _subgames, _runs,
-              _states, _periods, _odds, _h2h, _h2hp, _stats]
+              _states, _periods, _odds, _cur, _h2h, _h2hp, _stats]
     return {t.name: conn.execute(select(func.count()).select_from(t)).scalar() for t in tables}
 
 
 def latest_odds(conn, event_id, *, skin=None):
-    sub = select(_odds.c.scope, _odds.c.market_id, _odds.c.selection_name, _odds.c.line,
-                 func.max(_odds.c.snap_id).label("mx")).where(_odds.c.event_id == event_id)
+    q = select(_cur).where(_cur.c.event_id == event_id)
     if skin:
-        sub = sub.where(_odds.c.skin == skin)
-    sub = sub.group_by(_odds.c.scope, _odds.c.market_id, _odds.c.selection_name, _odds.c.line).subquery()
-    q = select(_odds).join(sub, _odds.c.snap_id == sub.c.mx)
+        q = q.where(_cur.c.skin == skin)
+    q = q.order_by(_cur.c.skin, _cur.c.market_id, _cur.c.selection_name)
     return [dict(r._mapping) for r in conn.execute(q).all()]
+
+
+def cross_skin_odds(conn, event_id, market_name, selection_name):
+    """Latest price per skin for one selection — ascending, best last."""
+    rows = conn.execute(
+        select(_cur.c.skin, _cur.c.price, _cur.c.line, _cur.c.captured_at)
+        .join(_markets, _markets.c.market_id == _cur.c.market_id)
+        .where(_cur.c.event_id == event_id, _markets.c.name == market_name,
+               _cur.c.selection_name == selection_name)).all()
+    per_skin: Dict[str, dict] = {}
+    for r in rows:  # one row per skin: its most recently changed price
+        prev = per_skin.get(r[0])
+        if prev is None or r[3] > prev["captured_at"]:
+            per_skin[r[0]] = dict(r._mapping)
+    return sorted(per_skin.values(), key=lambda r: r["price"])
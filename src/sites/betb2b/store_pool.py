@@ -0,0 +1,170 @@
+"""Long-lived store connections: one writer plus a small reader pool per DB.
+
+``store.init_db`` opens a fresh connection per call, which the job service
+and the control API used to do for every claim, phase update and request.
+:class:`StorePool` keeps the connections instead:
+
+* **one writer connection**, serialised by a lock — SQLite allows a single
+  writer anyway, so sharing one connection only removes the per-call open and
+  keeps its statement cache warm;
+* **up to** ``readers`` **reader connections** (``query_only``), opened on
+  demand and handed out one borrower at a time. The store runs in WAL mode
+  (:data:`store.SQLITE_PRAGMAS`), so API reads never wait behind a scheduler
+  or job write — they see the last committed state;
+* a failed writer job is rolled back, and a connection that cannot roll back
+  is dropped and reopened on the next use (as in :mod:`writer`).
+
+:func:`get_pool` returns the process-wide pool for a path, so every caller in
+the process shares it; :func:`close_pools` closes them on shutdown (the
+scheduler CLI calls it, and it is registered with :mod:`atexit` for every
+other entry point). With
+``DATABASE_URL`` set (ADR-13) SQLAlchemy already pools connections — both
+context managers then just check one out via :func:`store.init_db`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from . import store
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["StorePool", "close_pools", "get_pool"]
+
+DEFAULT_READERS = 4
+
+
+class StorePool:
+    """The writer connection and reader pool for one SQLite database."""
+
+    def __init__(self, path: Optional[store.PathLike], *, readers: int = DEFAULT_READERS) -> None:
+        if readers < 1:
+            raise ValueError("readers must be >= 1")
+        self.path = path
+        self.readers = readers
+        self._writer: Any = None
+        self._write_lock = threading.Lock()
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(readers)
+        self._closed = False
+
+    @contextmanager
+    def writer(self) -> Iterator[Any]:
+        """Exclusive use of the writer connection; rolled back on error."""
+        if os.environ.get("DATABASE_URL"):
+            with _orm_connection() as conn:
+                yield conn
+            return
+        with self._write_lock:
+            if self._closed:
+                raise RuntimeError("store pool is closed")
+            if self._writer is None:
+                self._writer = store.init_db(self.path)
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer = _recover(self._writer)
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[Any]:
+        """A read-only connection for the duration of the block.
+
+        Blocks while all ``readers`` connections are borrowed.
+        """
+        if os.environ.get("DATABASE_URL"):
+            with _orm_connection() as conn:
+                yield conn
+            return
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                store.init_db(self.path).close()        # schema first (once per process)
+                conn = store.connect_sqlite(self.path, read_only=True)
+            ok = False
+            try:
+                yield conn
+                ok = True
+            finally:
+                if ok and not self._closed:
+                    self._idle.put(conn)
+                else:
+                    conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close every idle connection; borrowed readers close on return."""
+        with self._write_lock:
+            self._closed = True
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools: Dict[str, StorePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path: Optional[store.PathLike], *,
+             readers: int = DEFAULT_READERS) -> StorePool:
+    """The process-wide :class:`StorePool` for ``path`` (created on first use).
+
+    ``path`` may be ``None`` when ``DATABASE_URL`` selects the ORM store.
+    """
+    key = str(Path(path).resolve()) if path else ""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = StorePool(path, readers=readers)
+        return pool
+
+
+def close_pools() -> None:
+    """Close every pool :func:`get_pool` handed out."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
+@contextmanager
+def _orm_connection() -> Iterator[Any]:
+    conn = store.init_db()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _recover(conn: Any) -> Any:
+    """Roll back a failed job; drop the connection if even that fails."""
+    try:
+        conn.rollback()
+        return conn
+    except Exception:  # noqa: BLE001 — broken connection → reopen on next use
+        logger.warning("store pool: dropping writer connection after failed rollback")
+        try:
+            conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+        return None
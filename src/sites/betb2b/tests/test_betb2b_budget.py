@@ -0,0 +1,219 @@
+"""Shared request budget + concurrent scheduler passes (no network).
+
+Pins the properties the concurrent mode exists for: a live request is served
+ahead of a queued prematch sweep, the budget never exceeds its concurrency or
+rate, and a long scheduled pass no longer holds the live pass off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.sites.betb2b import store
+from src.sites.betb2b.budget import (
+    Priority, RequestBudget, TokenBucket, current_priority, pass_priority,
+)
+from src.sites.betb2b.scheduler import BetB2BScheduler
+
+
+def test_live_request_jumps_a_queued_prematch_sweep():
+    order = []
+
+    async def _go():
+        budget = RequestBudget(1)
+        release = asyncio.Event()
+
+        async def _holder():
+            async with budget.slot(Priority.SCHEDULED):
+                await release.wait()
+
+        async def _req(tag, prio):
+            async with budget.slot(prio):
+                order.append(tag)
+
+        holder = asyncio.create_task(_holder())
+        await asyncio.sleep(0)
+        sweep = [asyncio.create_task(_req(f"s{i}", Priority.SCHEDULED)) for i in range(5)]
+        results = asyncio.create_task(_req("r", Priority.RESULTS))
+        await asyncio.sleep(0)
+        live = asyncio.create_task(_req("live", Priority.LIVE))
+        await asyncio.sleep(0)
+        assert budget.depth() == {"live": 1, "scheduled": 5, "results": 1}
+        release.set()
+        await asyncio.gather(holder, *sweep, results, live)
+        stats = budget.stats()
+        assert stats["priorities"]["scheduled"]["max_depth"] == 5
+        assert stats["in_flight"] == 0
+
+    asyncio.run(_go())
+    assert order == ["live", "s0", "s1", "s2", "s3", "s4", "r"]
+
+
+def test_concurrency_cap_is_shared_and_cancelled_waiters_are_skipped():
+    async def _go():
+        budget = RequestBudget(2)
+        in_flight = peak = 0
+
+        async def _req():
+            nonlocal in_flight, peak
+            async with budget.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        doomed = [asyncio.create_task(_req()) for _ in range(3)]
+        await asyncio.sleep(0)
+        doomed[-1].cancel()                       # still queued → must not leak a slot
+        await asyncio.gather(*[_req() for _ in range(10)], *doomed[:-1])
+        with pytest.raises(asyncio.CancelledError):
+            await doomed[-1]
+        assert peak == 2
+        assert budget.stats()["in_flight"] == 0
+
+    asyncio.run(_go())
+
+
+def test_rate_per_minute_spaces_requests():
+    async def _go():
+        budget = RequestBudget(1, rate_per_minute=600)   # 10/s, burst 1
+        t0 = time.monotonic()
+        for _ in range(4):
+            async with budget.slot():
+                pass
+        return time.monotonic() - t0
+
+    assert asyncio.run(_go()) >= 0.25                     # 3 refills × 0.1s
+
+
+def test_token_bucket_queues_gathered_tasks_behind_the_burst():
+    now = [0.0]
+    slept = []
+
+    async def _sleep(seconds):
+        slept.append(round(seconds, 3))
+        await asyncio.sleep(0)
+
+    async def _go():
+        bucket = TokenBucket(60, burst=2, clock=lambda: now[0], sleep=_sleep)
+        waits = await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        assert [round(w, 3) for w in waits] == [0.0, 0.0, 1.0, 2.0, 3.0]
+
+        now[0] += 10.0                      # refills up to the burst, not beyond
+        assert await bucket.acquire() == 0.0
+        assert await bucket.acquire() == 0.0
+        assert round(await bucket.acquire(), 3) == 1.0
+        return bucket.stats()
+
+    stats = asyncio.run(_go())
+    assert slept == [1.0, 2.0, 3.0, 1.0]
+    assert (stats["acquired"], stats["waited"]) == (8, 4)
+    assert asyncio.run(TokenBucket(0).acquire()) == 0.0      # disabled
+
+
+def test_token_bucket_try_acquire_reports_when_the_next_token_is_due():
+    now = [0.0]
+    bucket = TokenBucket(60, burst=2, clock=lambda: now[0])
+    assert bucket.try_acquire() == 0.0 and bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(1.0)
+    assert bucket.try_acquire() == pytest.approx(1.0)     # nothing was reserved
+    now[0] += 0.5
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    now[0] += 0.5
+    assert bucket.try_acquire() == 0.0
+    assert bucket.stats()["acquired"] == 3
+    assert TokenBucket(0).try_acquire() == 0.0              # disabled
+
+
+def test_token_bucket_cancelled_waiter_returns_its_reservation():
+    async def _go():
+        bucket = TokenBucket(60, burst=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await bucket.acquire()
+
+    assert 0.9 < asyncio.run(_go()) <= 1.0          # not 2s: the reservation came back
+
+
+def test_pass_priority_is_scoped_to_the_pass_task():
+    async def _go():
+        seen = {}
+
+        async def _pass(name, prio):
+            with pass_priority(prio):
+                await asyncio.sleep(0)
+                seen[name] = await asyncio.create_task(_child())   # children inherit
+
+        async def _child():
+            return current_priority()
+
+        await asyncio.gather(_pass("live", Priority.LIVE), _pass("results", Priority.RESULTS))
+        return seen, current_priority()
+
+    seen, outside = asyncio.run(_go())
+    assert seen == {"live": Priority.LIVE, "results": Priority.RESULTS}
+    assert outside == Priority.SCHEDULED
+
+
+class _DummyScraper:
+    async def close(self):
+        pass
+
+
+def _run_both(s, sweep_seconds):
+    """Scheduled pass holds a request for ``sweep_seconds``; count live passes."""
+    live_runs = []
+
+    async def _sched():
+        await asyncio.sleep(sweep_seconds)
+
+    async def _live():
+        live_runs.append(time.monotonic())
+        if len(live_runs) >= 3:
+            s.stop()
+
+    s._scheduled_pass = _sched
+    s._live_pass = _live
+
+    async def _go():
+        try:
+            await asyncio.wait_for(s.run(), timeout=sweep_seconds + 2)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(_go())
+    return live_runs
+
+
+def test_concurrent_mode_keeps_live_cadence_during_a_sweep(tmp_path):
+    db = str(tmp_path / "c.db")
+    store.init_db(db).close()
+    s = BetB2BScheduler("linebet", db_path=db, scheduled_interval=3600,
+                        live_interval=0.05, results_interval=0, concurrent_passes=True)
+    s._scraper = _DummyScraper()
+    t0 = time.monotonic()
+    live = _run_both(s, sweep_seconds=1.0)
+    assert len(live) >= 3 and live[2] - t0 < 0.9     # did not wait for the sweep
+    m = s.metrics()
+    assert m["mode"] == "concurrent"
+    assert m["passes"]["live"]["runs"] >= 2
+    assert m["passes"]["live"]["max_lag_s"] < 0.5
+
+
+def test_single_flight_mode_reports_the_live_lag(tmp_path):
+    db = str(tmp_path / "sf.db")
+    store.init_db(db).close()
+    s = BetB2BScheduler("linebet", db_path=db, scheduled_interval=3600,
+                        live_interval=0.05, results_interval=0)
+    s._scraper = _DummyScraper()
+    _run_both(s, sweep_seconds=0.3)
+    m = s.metrics()
+    assert m["mode"] == "single-flight"
+    assert m["passes"]["live"]["max_lag_s"] >= 0.2   # held off by the scheduled pass
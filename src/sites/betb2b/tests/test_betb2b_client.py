@@ -0,0 +1,85 @@
+"""BetB2BFeedClient request pacing (no network — the httpx client is faked)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from src.sites.betb2b.client import BetB2BFeedClient
+from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+from src.sites.betb2b.scraper import BetB2BScraper
+
+
+class _SM:
+    def record_auth_failure(self, status):
+        return False
+
+
+class _Resp:
+    status_code = 200
+    headers = {"content-type": "application/json"}
+    content = b'{"Success":true,"Value":[]}'
+
+
+class _SlowClient:
+    """Answers every GET after ``rtt`` seconds; tracks peak concurrency."""
+
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.urls = []
+        self.in_flight = self.peak = 0
+
+    async def get(self, url, headers=None):
+        self.urls.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.rtt)
+        self.in_flight -= 1
+        return _Resp()
+
+
+def _client(**kw) -> BetB2BFeedClient:
+    client = BetB2BFeedClient(DEFAULT_SKIN_CONFIG, session_manager=_SM(), direct=True, **kw)
+    client._client = _SlowClient(0.05)
+    return client
+
+
+def test_fetch_many_runs_concurrently_in_feed_order():
+    client = _client(concurrency=5, rate_limit_per_minute=0)
+    feeds = ["game", "champ", "sports_all"] * 4
+
+    t0 = time.monotonic()
+    caps = asyncio.run(client.fetch_many(feeds, root="line"))
+    elapsed = time.monotonic() - t0
+
+    assert elapsed < 0.05 * len(feeds) / 2          # not the sum of the round trips
+    assert client._client.peak == 5
+    assert [c.url.split("?")[0].rsplit("/", 1)[-1] for c in caps] == [
+        {"game": "GetGameZip", "champ": "GetChampZip", "sports_all": "GetSportsZip"}[f]
+        for f in feeds]
+
+
+def test_fetch_many_is_bounded_by_the_shared_token_bucket():
+    # 1200/min = 20/s with a burst of 4: 8 requests need ~0.2s of tokens even
+    # though 8 could be in flight at once.
+    client = _client(concurrency=8, rate_limit_per_minute=1200, rate_burst=4)
+    t0 = time.monotonic()
+    asyncio.run(client.fetch_many(["game"] * 8))
+    elapsed = time.monotonic() - t0
+
+    assert 0.18 <= elapsed < 0.6
+    assert client.rate_limiter.stats()["waited"] == 4
+
+
+def test_fetch_many_takes_a_root_per_feed():
+    client = _client(concurrency=2, rate_limit_per_minute=0)
+    caps = asyncio.run(client.fetch_many(["events_top"] * 2, roots=["live", "line"]))
+    assert ["LiveFeed" in c.url for c in caps] == [True, False]
+    assert "LineFeed" in caps[1].url
+
+
+def test_concurrent_scraper_paces_its_pass_on_the_client_bucket():
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, telemetry_enabled=False, direct=True,
+                            concurrency=8, rate_limit_per_minute=30)
+    bucket = scraper.feed_client.rate_limiter
+    assert (bucket.rate_per_minute, bucket.burst) == (120, 8)
@@ -0,0 +1,59 @@
+"""Feed-body decoding (src/sites/betb2b/extraction/decode.py).
+
+Decoding from bytes must give exactly what the old text-then-``json.loads``
+path gave — including the lenient handling of invalid UTF-8 — projection keeps
+only the requested keys, and the real GetGameZip capture extracts the same
+event as the full-tree walk did.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+from src.sites.betb2b.extraction import rules as rules_mod
+from src.sites.betb2b.extraction.decode import CHAMP_PROJECTION, SPORTS_PROJECTION, loads, project
+from src.sites.betb2b.extraction.rules import BetB2BExtractionRules
+from src.sites.betb2b.harvest import extract_leagues_from_sports
+
+_FIXTURE = Path(__file__).parent / "fixtures" / "getgamezip_basketball.json"
+
+
+def test_bytes_decode_matches_the_text_decode():
+    body = _FIXTURE.read_bytes()
+    assert loads(body) == json.loads(body.decode("utf-8"))
+    bad = b'{"Success": true, "Value": {"N": "caf\xe9"}}'        # latin-1 byte
+    assert loads(bad) == {"Success": True, "Value": {"N": "caf�"}}
+
+    rules = BetB2BExtractionRules(DEFAULT_SKIN_CONFIG)
+    assert rules.decode_response("u", 200, "", b"[1, 2]").decoded == {"_root_list": [1, 2]}
+    assert rules.decode_response("u", 200, "", b"<html>").decoded == {}
+
+
+def test_projection_keeps_only_the_read_keys():
+    sports = {"Success": True, "Id": 7, "Value": [
+        {"I": 3, "N": "Basketball", "L": [
+            {"LI": 10, "GC": 4, "L": "NBA", "SC": [{"LI": 1}], "CN": "USA"},
+            {"LI": 11, "GC": 0, "L": "Empty"}]}]}
+    projected = project(sports, SPORTS_PROJECTION)
+    assert projected == {"Success": True, "Value": [{"I": 3, "L": [
+        {"LI": 10, "GC": 4, "L": "NBA"}, {"LI": 11, "GC": 0, "L": "Empty"}]}]}
+    assert extract_leagues_from_sports(projected) == extract_leagues_from_sports(sports)
+
+    game = json.loads(_FIXTURE.read_text(encoding="utf-8"))["Value"]
+    champ = {"Value": {"LI": 1, "G": [game, {**game, "I": 5}]}}
+    assert project(champ, CHAMP_PROJECTION) == {"Value": {"G": [
+        {"I": game["I"], "S": game["S"]}, {"I": 5, "S": game["S"]}]}}
+
+
+def test_event_walk_skips_market_subtrees_without_losing_events(monkeypatch):
+    rules = BetB2BExtractionRules(DEFAULT_SKIN_CONFIG)
+    cap = rules.decode_response("https://linebet.com/service-api/LineFeed/GetGameZip",
+                                200, "application/json", _FIXTURE.read_bytes())
+    fast = [e.to_dict() for e in rules.extract_from_captured(cap)]
+    monkeypatch.setattr(rules_mod, "_NO_EVENT_KEYS", frozenset())
+    full = [e.to_dict() for e in rules.extract_from_captured(cap)]
+    for ev in fast + full:
+        ev.pop("extracted_at", None)
+    assert fast == full and fast[0]["markets"]
@@ -0,0 +1,231 @@
+"""Unit tests for the statisticfeed enrichment cache.
+
+Covers the TTL/negative/LRU/SQLite behaviour of :class:`EnrichmentCache` and
+the scraper wiring: a second live pass over the same events must not touch
+statisticfeed at all. No network — the shared HTTP pool is faked.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+from src.sites.betb2b.enrichment_cache import EnrichmentCache, enrichment_cache_path
+from src.sites.betb2b.extraction.models import Event, EventStatus, Sport
+from src.sites.betb2b.scraper import BetB2BScraper
+
+_H2H = {
+    "teams": [{"id": "t1", "name": "Home"}, {"id": "t2", "name": "Away"}],
+    "gameShorts": [{"id": "g1", "team1": "t1", "team2": "t2", "periods": []}],
+    "sportId": 3,
+}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# Cache semantics
+# ---------------------------------------------------------------------------
+def test_ttl_and_negative_entries_expire_per_endpoint():
+    clock = _Clock()
+    cache = EnrichmentCache(ttls={"h2h": 100}, negative_ttls={"stats": 10}, clock=clock)
+
+    assert cache.get("linebet", "1", "h2h") is None
+    cache.put("linebet", "1", "h2h", _H2H)
+    cache.put_negative("linebet", "1", "stats")
+
+    assert cache.get("linebet", "1", "h2h").payload == _H2H
+    assert cache.get("linebet", "1", "stats").negative is True
+    assert cache.get("melbet", "1", "h2h") is None      # family is part of the key
+
+    clock.now += 50
+    assert cache.get("linebet", "1", "stats") is None   # negative TTL is shorter
+    assert cache.get("linebet", "1", "h2h") is not None
+    clock.now += 60
+    assert cache.get("linebet", "1", "h2h") is None
+
+    stats = cache.stats()
+    assert stats["endpoints"]["h2h"]["hits"] == 2
+    assert stats["endpoints"]["stats"]["negative_hits"] == 1
+    assert stats["endpoints"]["h2h"]["expired"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 4
+
+
+def test_sqlite_backing_survives_eviction_and_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = EnrichmentCache(path, max_entries=2)
+    for eid in ("1", "2", "3"):
+        cache.put("linebet", eid, "h2h", {"id": eid})
+    assert cache.stats()["entries"] == 2
+    assert cache.get("linebet", "1", "h2h").payload == {"id": "1"}   # evicted, not flushed
+    assert cache.flush() == 3
+    cache.put_negative("linebet", "4", "h2h")
+    cache.close()
+
+    warm = EnrichmentCache(path)
+    assert warm.get("linebet", "2", "h2h").payload == {"id": "2"}
+    assert warm.get("linebet", "4", "h2h").negative is True
+    assert warm.stats()["endpoints"]["h2h"]["disk_hits"] == 2
+    warm.close()
+
+
+def test_purge_expired_and_cache_path(tmp_path, monkeypatch):
+    clock = _Clock()
+    cache = EnrichmentCache(str(tmp_path / "c.db"), ttls={"h2h": 5}, clock=clock)
+    cache.put("linebet", "1", "h2h", _H2H)
+    cache.put("linebet", "2", "stats", {"x": 1})
+    clock.now += 10
+    assert cache.purge_expired() == 1
+    assert cache.stats()["entries"] == 1
+    cache.close()
+
+    monkeypatch.delenv("BETB2B_ENRICHMENT_CACHE_PATH", raising=False)
+    assert enrichment_cache_path(str(tmp_path / "odds.db")) == str(tmp_path / "enrichment_cache.db")
+    assert enrichment_cache_path("postgresql://u@h/db") == "data/betb2b/enrichment_cache.db"
+
+
+def test_periodic_and_closing_purges_bound_the_file(tmp_path):
+    clock = _Clock()
+    path = str(tmp_path / "c.db")
+    cache = EnrichmentCache(path, ttls={"h2h": 5}, clock=clock, purge_interval=60)
+    cache.put("linebet", "1", "h2h", _H2H)
+    cache.flush()
+    clock.now += 10
+    assert cache.maybe_purge() == 0                      # interval not up yet
+    clock.now += 60
+    cache.put("linebet", "2", "h2h", _H2H)
+    assert cache.maybe_purge() == 1
+    assert cache.maybe_purge() == 0                      # ran: the clock restarts
+    clock.now += 10
+    cache.close()                                        # "2" expired: purged on close
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM enrichment_cache").fetchone()[0] == 0
+    conn.close()
+
+
+def test_memory_operations_do_not_wait_for_disk_io(tmp_path):
+    cache = EnrichmentCache(str(tmp_path / "c.db"))
+    cache.put("linebet", "1", "h2h", _H2H)
+    done = threading.Event()
+
+    def _memory_only():
+        cache.put("linebet", "2", "h2h", _H2H)
+        assert cache.get("linebet", "1", "h2h").payload == _H2H
+        done.set()
+
+    with cache._db_lock:                     # a flush or purge holds the connection
+        worker = threading.Thread(target=_memory_only)
+        worker.start()
+        assert done.wait(2.0)
+    worker.join()
+    assert cache.flush() == 2
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_writes_run_off_the_event_loop(tmp_path, monkeypatch):
+    cache = EnrichmentCache(str(tmp_path / "c.db"))
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, telemetry_enabled=False, direct=True,
+                            enrichment_cache=cache)
+    threads = []
+    flush = cache.flush
+    monkeypatch.setattr(cache, "flush", lambda: threads.append(
+        threading.current_thread()) or flush())
+
+    await scraper._flush_enrichment_cache()
+    assert threads and threads[0] is not threading.main_thread()
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_lookups_run_off_the_event_loop(tmp_path, monkeypatch):
+    cache = EnrichmentCache(str(tmp_path / "c.db"))
+    cache.put("linebet", "1", "h2h", _H2H)
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, telemetry_enabled=False, direct=True,
+                            enrichment_cache=cache)
+    threads = []
+    get_many = cache.get_many
+    monkeypatch.setattr(cache, "get_many", lambda *a: threads.append(
+        threading.current_thread()) or get_many(*a))
+
+    found = await scraper._cached_enrichments([_event("1"), _event("x2")], "h2h")
+    assert found["1"].payload == _H2H and "x2" not in found
+    assert threads and threads[0] is not threading.main_thread()
+    cache.close()
+
+
+# ---------------------------------------------------------------------------
+# Scraper wiring
+# ---------------------------------------------------------------------------
+class _Resp:
+    def __init__(self, status_code: int, payload: Any = None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.text = "{}" if payload is not None else ""
+
+    def json(self) -> Any:
+        return self._payload
+
+
+class _FakeClient:
+    """Answers statisticfeed by (endpoint, id) and records every request."""
+
+    def __init__(self, answers: Dict[tuple, _Resp]) -> None:
+        self.answers = answers
+        self.calls: List[tuple] = []
+
+    async def get(self, url: str, params=None, headers=None) -> _Resp:
+        endpoint = "h2h" if url.endswith("/h2h") else "stats"
+        self.calls.append((endpoint, params["id"]))
+        return self.answers.get((endpoint, params["id"]), _Resp(204))
+
+
+class _FakePool:
+    def __init__(self, client: _FakeClient) -> None:
+        self._client = client
+
+    def client(self, url: str, *, proxy=None) -> _FakeClient:
+        return self._client
+
+
+def _event(eid: str) -> Event:
+    return Event(event_id=eid, sport=Sport.BASKETBALL, competition="L", home="Home",
+                 away="Away", status=EventStatus.LIVE, is_live=True, markets=[])
+
+
+@pytest.mark.asyncio
+async def test_second_live_pass_is_served_from_cache(tmp_path):
+    client = _FakeClient({("h2h", "1"): _Resp(200, _H2H),
+                          ("stats", "1"): _Resp(200, {"unexpected": "shape"})})
+    cache = EnrichmentCache(str(tmp_path / "c.db"))
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, telemetry_enabled=False, direct=True,
+                            http_pool=_FakePool(client), enrichment_cache=cache)
+
+    first = [_event("1"), _event("2")]
+    await scraper._enrich_with_h2h(first)
+    await scraper._enrich_with_stats(first)
+    assert len(client.calls) == 4
+    assert first[0].h2h_data is not None and first[1].h2h_data is None
+
+    second = [_event("1"), _event("2")]
+    await scraper._enrich_with_h2h(second)
+    await scraper._enrich_with_stats(second)
+    assert len(client.calls) == 4                        # no request on the second pass
+    assert second[0].h2h_data is not None
+    assert len(second[0].h2h_data.game_shorts) == 1
+
+    stats = cache.stats()
+    assert stats["endpoints"]["h2h"]["negative_hits"] == 1
+    assert stats["hit_ratio"] == 0.5
+    cache.close()
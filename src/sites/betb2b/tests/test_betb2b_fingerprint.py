@@ -0,0 +1,98 @@
+"""GetGameZip payload fingerprinting: unchanged games are neither re-parsed
+nor persisted.
+
+Uses the real ``getgamezip_basketball.json`` capture; the feed client is
+faked, so no network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from src.sites.betb2b.config import DEFAULT_SKIN_CONFIG
+from src.sites.betb2b.extraction.rules import BetB2BExtractionRules, payload_fingerprint
+from src.sites.betb2b.scraper import BetB2BScraper
+from src.sites.betb2b.store import init_db, persist_result
+
+_FIXTURE = Path(__file__).parent / "fixtures" / "getgamezip_basketball.json"
+
+
+def _body(guid: str = "a", price_bump: float = 0.0) -> bytes:
+    payload = json.loads(_FIXTURE.read_text(encoding="utf-8"))
+    payload["Guid"] = guid
+    if price_bump:
+        payload["Value"]["E"][0]["C"] += price_bump
+    ordered = {k: v for k, v in payload.items() if k != "Value"}
+    ordered["Value"] = payload["Value"]         # the feed serialises Value last
+    return json.dumps(ordered).encode()
+
+
+def test_fingerprint_ignores_envelope_but_not_value():
+    assert payload_fingerprint(_body("a")) == payload_fingerprint(_body("b"))
+    assert payload_fingerprint(_body("a")) != payload_fingerprint(_body("a", price_bump=0.05))
+
+
+class _Feed:
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.rules = BetB2BExtractionRules(DEFAULT_SKIN_CONFIG)
+
+    async def fetch_game(self, event_id, *, root="line", **kw):
+        return self.rules.decode_response(
+            url=f"https://linebet.com/service-api/LiveFeed/GetGameZip?id={event_id}",
+            status=200, content_type="application/json", raw_bytes=self.bodies.pop(0))
+
+
+def test_unchanged_game_reuses_previous_parse():
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, direct=True, telemetry_enabled=False)
+    scraper.feed_client = _Feed([_body("a"), _body("b"), _body("c", price_bump=0.05)])
+    parsed = []
+    extract = scraper.extraction_rules.extract_from_captured
+    scraper.extraction_rules.extract_from_captured = lambda cap: parsed.append(1) or extract(cap)
+
+    first = asyncio.run(scraper.fetch_events(["352940650"], is_live=True))
+    second = asyncio.run(scraper.fetch_events(["352940650"], is_live=True))
+    third = asyncio.run(scraper.fetch_events(["352940650"], is_live=True))
+
+    assert len(parsed) == 2                               # the second body was never parsed
+    assert second[0] is not first[0] and second[0].unchanged is True
+    assert second[0].markets is first[0].markets          # a flagged copy, not a re-parse
+    assert first[0].unchanged is False                    # last pass's object untouched
+    assert third[0].unchanged is False
+    assert second[0].to_dict()["unchanged"] is True
+    assert "unchanged" not in third[0].to_dict()
+
+
+def test_persist_result_skips_unchanged_events(tmp_path, monkeypatch):
+    from src.sites.betb2b import store
+
+    scraper = BetB2BScraper(DEFAULT_SKIN_CONFIG, direct=True, telemetry_enabled=False)
+    scraper.feed_client = _Feed([_body("a")])
+    event = asyncio.run(scraper.fetch_events(["352940650"], is_live=True))[0]
+
+    written = []
+    bulk = store._persist_events_bulk
+    monkeypatch.setattr(store, "_persist_events_bulk", lambda conn, run_id, result: (
+        written.append(len(result["events"])) or bulk(conn, run_id, result)))
+
+    conn = init_db(tmp_path / "odds.db")
+    try:
+        result = {"skin": "linebet", "action": "list_live", "url": "", "success": True,
+                  "extracted_at": "2026-07-21T12:00:00+00:00", "events": [event.to_dict()]}
+        persist_result(result, conn=conn)
+        assert conn.execute("SELECT COUNT(*) FROM odds_snapshots").fetchone()[0] > 0
+
+        event.unchanged = True
+        result["events"] = [event.to_dict()]
+        result["extracted_at"] = "2026-07-21T12:05:00+00:00"
+        persist_result(result, conn=conn)
+        assert written == [1, 0]
+        # No facts, but the event is still listed: last_seen advances.
+        assert conn.execute("SELECT last_seen FROM events WHERE event_id=?",
+                            (event.event_id,)).fetchone()[0] == "2026-07-21T12:05:00+00:00"
+        runs = conn.execute("SELECT event_count FROM scrape_runs ORDER BY run_id").fetchall()
+        assert [r[0] for r in runs] == [1, 1]
+    finally:
+        conn.close()
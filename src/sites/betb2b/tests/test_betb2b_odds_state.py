@@ -0,0 +1,153 @@
+"""Unit tests for the in-memory odds state (src/sites/betb2b/odds_state.py).
+
+The contract: persisting the scheduler's in-memory deltas stores exactly the
+rows the store's own DB-backed change detection would have stored, the state
+rebuilds from the DB, and a tracked selection stays well under 200 bytes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from src.sites.betb2b import store
+from src.sites.betb2b.extraction.models import (
+    BetB2BScrapeResult, Event, EventStatus, Market, MarketType, Selection, Sport,
+)
+from src.sites.betb2b.odds_state import OddsState
+from src.sites.betb2b.scheduler import BetB2BScheduler
+
+_FACTS = ("event_states", "period_scores", "odds_snapshots", "current_odds")
+
+
+def _event(eid, *, prices=(1.5, 2.5), score=(10, 8), suspended=False, totals=(1.9, 1.9)):
+    return {
+        "event_id": eid, "sport": "basketball", "sport_id": 3, "league_id": 99,
+        "competition": "Test League", "home": f"H{eid}", "away": f"A{eid}",
+        "status": "live", "is_live": True, "score_home": score[0], "score_away": score[1],
+        "period": "Q2",
+        "period_scores": [{"period_key": 1, "period_name": "Q1", "home_score": 20,
+                           "away_score": 18}],
+        "markets": [
+            {"name": "To Win Match", "market_type": "moneyline_h2h", "raw_g": 1,
+             "selections": [
+                 {"name": "1", "price": prices[0], "line": None, "is_suspended": suspended},
+                 {"name": "2", "price": prices[1], "line": None, "is_suspended": False},
+             ]},
+            {"name": "Total", "market_type": "total", "raw_g": 17, "scope": "Q2",
+             "selections": [
+                 {"name": "Over", "price": totals[0], "line": 40.5},
+                 {"name": "Under", "price": totals[1], "line": 40.5},
+             ]},
+        ],
+    }
+
+
+def _result(*events, skin="linebet", at="2026-07-21T12:00:00+00:00"):
+    return {"skin": skin, "action": "list_live", "extracted_at": at, "success": True,
+            "event_count": len(events), "events": list(events)}
+
+
+_PASSES = [
+    [_event("1"), _event("2")],
+    [_event("1"), _event("2")],                                   # nothing moved
+    [_event("1", prices=(1.6, 2.3)), _event("2", suspended=True)],
+    [_event("1", prices=(1.6, 2.3), score=(12, 8)), _event("2", totals=(1.8, 2.0))],
+]
+
+
+def _counts(conn):
+    return {t: store.counts(conn)[t] for t in _FACTS}
+
+
+def test_deltas_store_the_same_rows_as_db_change_detection(tmp_path):
+    reference = store.init_db(tmp_path / "ref.db")
+    deltas = store.init_db(tmp_path / "delta.db")
+    state = OddsState()
+    state.load("linebet", {}, ["1", "2"])
+    for events in _PASSES:
+        store.persist_result(_result(*events), conn=reference)
+        store.persist_result(state.diff(_result(*events)), conn=deltas)
+
+    assert _counts(deltas) == _counts(reference)
+    assert _counts(deltas)["odds_snapshots"] == 8 + 3 + 3       # pass 4 also lifts the suspension
+    assert _counts(deltas)["event_states"] == 2 + 1
+
+    second = state.diff(_result(*_PASSES[-1]))
+    assert all(ev["markets"] == [] and ev["period_scores"] == [] for ev in second["events"])
+    assert not any(ev["state_changed"] for ev in second["events"])
+    assert state.stats()["selections"] == 8
+    reference.close()
+    deltas.close()
+
+
+def test_rebuild_from_db_and_footprint(tmp_path):
+    conn = store.init_db(tmp_path / "odds.db")
+    for events in _PASSES:
+        store.persist_result(_result(*events), conn=conn)
+
+    state = OddsState()
+    snapshot = store.live_state_snapshot(conn, "linebet", since=None)
+    assert state.load("linebet", snapshot) == 2
+    replay = state.diff(_result(*_PASSES[-1]))
+    assert sum(ev["odds_skipped"] for ev in replay["events"]) == 8
+    assert not any(ev["markets"] or ev["state_changed"] for ev in replay["events"])
+    assert state.unknown("linebet", ["1", "3"]) == ["3"]
+    assert state.unknown("melbet", ["1"]) == ["1"]          # per skin
+    conn.close()
+
+    big = OddsState()
+    for i in range(200):
+        ev = _event(str(i))
+        ev["markets"] = [
+            {"name": f"M{m}", "market_type": "total", "raw_g": m,
+             "selections": [{"name": side, "price": 1.9, "line": m + 0.5}
+                            for side in ("Over", "Under")]}
+            for m in range(50)]
+        big.diff(_result(ev))
+    stats = big.stats()
+    assert stats["selections"] == 200 * 100
+    assert stats["bytes_per_selection"] < 200
+
+
+def _live_event(price):
+    return Event(event_id="1", sport=Sport.BASKETBALL, competition="L", home="H", away="A",
+                 status=EventStatus.LIVE, is_live=True, markets=[Market(
+                     name="To Win Match", market_type=MarketType.MONEYLINE_H2H, raw_g=1,
+                     selections=[Selection("1", price), Selection("2", 2.5)])])
+
+
+def test_scheduler_loads_unknown_events_and_forgets_failed_writes(tmp_path, monkeypatch):
+    db = str(tmp_path / "sched.db")
+    conn = store.init_db(db)
+    store.persist_result(BetB2BScrapeResult(skin="linebet", action="list_live", url="u",
+                                            events=[_live_event(1.5)]).to_dict(), conn=conn)
+    conn.close()                                             # stored by an earlier process
+
+    s = BetB2BScheduler("linebet", db_path=db)
+    s._scraper = SimpleNamespace(skin=SimpleNamespace(name="linebet", base_url="u"))
+    sent = []
+    persist = store.persist_result
+
+    def _spy(result, path=None, **kw):
+        sent.append(result)
+        if len(sent) == 2:
+            raise RuntimeError("disk full")
+        return persist(result, path, **kw)
+
+    monkeypatch.setattr(store, "persist_result", _spy)
+
+    async def _go():
+        await s._persist("list_live", [_live_event(1.5)])
+        await s._persist("list_live", [_live_event(1.7)])
+        await s._writer.close()
+
+    asyncio.run(_go())
+    assert sent[0]["deltas_only"] is True
+    assert sent[0]["events"][0]["markets"] == []             # diffed against the stored row
+    assert sent[0]["events"][0]["state_changed"] is False
+    assert [s_["price"] for s_ in sent[1]["events"][0]["markets"][0]["selections"]] == [1.7]
+    stats = s.metrics()["odds_state"]
+    assert stats["events_loaded"] == 1
+    assert stats["events_forgotten"] == 1                    # failed write → reload next time
+    assert s.odds_state.unknown("linebet", ["1"]) == ["1"]
@@ -0,0 +1,136 @@
+"""Retention tier (src/sites/betb2b/retention.py).
+
+The contract: archiving moves old fact rows into per-day files and out of the
+hot tables, ``line_movement`` returns the same series before and after, and
+change detection is unaffected because the newest state rows stay hot.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.sites.betb2b import retention, store
+
+_NOW = datetime(2026, 7, 21, 12, 0, tzinfo=timezone.utc)
+
+
+def _result(at, price, score=(10, 8)):
+    return {
+        "skin": "linebet", "action": "list_live", "extracted_at": at, "success": True,
+        "event_count": 1,
+        "events": [{
+            "event_id": "738047045", "sport": "basketball", "sport_id": 3,
+            "competition": "NBA", "home": "Phoenix", "away": "Boston", "status": "live",
+            "is_live": True, "score_home": score[0], "score_away": score[1], "period": "Q2",
+            "period_scores": [{"period_key": 1, "period_name": "Q1",
+                               "home_score": score[0], "away_score": score[1]}],
+            "statistics": [{"rebounds": str(score[0])}],
+            "markets": [{"name": "To Win Match", "market_type": "moneyline_h2h", "raw_g": 1,
+                         "selections": [{"name": "1", "price": price},
+                                        {"name": "2", "price": 2.5}]}],
+        }],
+    }
+
+
+_RUNS = [("2026-06-01T10:00:00+00:00", 1.5, (10, 8)),
+         ("2026-06-01T10:05:00+00:00", 1.6, (12, 8)),
+         ("2026-06-02T10:00:00+00:00", 1.7, (14, 8)),
+         ("2026-07-21T11:00:00+00:00", 1.8, (16, 8))]
+
+
+def _series(conn, selection="1"):
+    return [tuple(r) for r in store.line_movement(
+        conn, "738047045", "linebet", "To Win Match", selection)]
+
+
+def test_archive_moves_old_days_and_line_movement_reads_both_tiers(tmp_path):
+    conn = store.init_db(tmp_path / "odds.db")
+    for at, price, score in _RUNS:
+        store.persist_result(_result(at, price, score), conn=conn)
+    before, before_2 = _series(conn), _series(conn, "2")
+    hot = store.counts(conn)
+
+    moved = retention.archive_old_facts(conn, older_than_days=30, now=_NOW)
+    assert moved == {"odds_snapshots": 4, "event_states": 3, "period_scores": 3,
+                     "statistics": 3}
+    after = store.counts(conn)
+    assert after["odds_snapshots"] == hot["odds_snapshots"] - 4
+    assert after["event_states"] == 1                    # the newest row stays hot
+    assert _series(conn) == before and len(before) == 4
+    assert _series(conn, "2") == before_2
+
+    files = sorted(p.name for p in (tmp_path / "odds_archive" / "odds_snapshots").iterdir())
+    assert files == ["2026-06-01.json.gz", "2026-06-02.json.gz"]
+    doc = json.loads(gzip.decompress(
+        (tmp_path / "odds_archive" / "odds_snapshots" / "2026-06-01.json.gz").read_bytes()))
+    assert doc["data"]["event_id"] == {"dict": ["738047045"], "codes": [0, 0, 0]}
+    assert retention.archive_old_facts(conn, older_than_days=30, now=_NOW) == dict.fromkeys(
+        retention.ARCHIVE_TABLES, 0)
+
+    # Change detection still sees the last stored values: nothing moved → no rows.
+    store.persist_result(_result("2026-07-21T11:30:00+00:00", 1.8, (16, 8)), conn=conn)
+    assert store.counts(conn)["odds_snapshots"] == after["odds_snapshots"]
+    assert store.counts(conn)["event_states"] == 1
+    conn.close()
+
+
+def test_a_late_row_for_an_archived_day_is_merged(tmp_path):
+    conn = store.init_db(tmp_path / "odds.db")
+    for at, price, score in _RUNS[:2]:
+        store.persist_result(_result(at, price, score), conn=conn)
+    retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["odds_snapshots"])
+    store.persist_result(_result("2026-06-01T23:00:00+00:00", 1.9), conn=conn)
+    store.persist_result(_result("2026-07-21T11:00:00+00:00", 2.0), conn=conn)
+    retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["odds_snapshots"])
+
+    assert [p for _, p, _ in _series(conn)] == [1.5, 1.6, 1.9, 2.0]
+    row = conn.execute("SELECT row_count FROM archive_partitions "
+                       "WHERE table_name='odds_snapshots' AND day='2026-06-01'").fetchone()
+    assert row[0] == 4                                   # 3 + 1, deduplicated on snap_id
+    conn.close()
+
+
+def test_a_day_archived_before_a_column_was_added_keeps_its_rows(tmp_path):
+    conn = store.init_db(tmp_path / "odds.db")
+    for at, price, score in _RUNS[:2]:
+        store.persist_result(_result(at, price, score), conn=conn)
+    store.persist_result(_result("2026-07-21T11:00:00+00:00", 2.0, (20, 8)), conn=conn)
+    retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["statistics"])
+    path = tmp_path / "odds_archive" / "statistics" / "2026-06-01.json.gz"
+    assert len(retention.load_partition(path).rows()) == 2
+
+    conn.execute("ALTER TABLE statistics ADD COLUMN source TEXT")
+    store.persist_result(_result("2026-06-01T23:00:00+00:00", 1.9, (30, 8)), conn=conn)
+    store.persist_result(_result("2026-07-21T11:30:00+00:00", 2.0, (40, 8)), conn=conn)
+    retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["statistics"])
+
+    part = retention.load_partition(path)
+    assert part.columns[-1] == "source"
+    assert len(part.rows()) == 3                         # the two old rows survive
+    assert part.column("source") == [None, None, None]
+    conn.close()
+
+
+def test_a_partition_with_a_column_the_table_lost_is_not_overwritten(tmp_path):
+    conn = store.init_db(tmp_path / "odds.db")
+    for at, price, score in _RUNS[:2]:
+        store.persist_result(_result(at, price, score), conn=conn)
+    retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["statistics"])
+    path = tmp_path / "odds_archive" / "statistics" / "2026-06-01.json.gz"
+    doc = json.loads(gzip.decompress(path.read_bytes()))
+    doc["columns"].append("legacy")
+    doc["data"]["legacy"] = {"values": [1] * doc["rows"]}
+    path.write_bytes(gzip.compress(json.dumps(doc).encode("utf-8")))
+
+    store.persist_result(_result("2026-06-01T23:00:00+00:00", 1.9, (30, 8)), conn=conn)
+    store.persist_result(_result("2026-07-21T11:30:00+00:00", 2.0, (40, 8)), conn=conn)
+    hot = store.counts(conn)["statistics"]
+    with pytest.raises(ValueError, match="refusing to overwrite"):
+        retention.archive_old_facts(conn, older_than_days=30, now=_NOW, tables=["statistics"])
+    assert store.counts(conn)["statistics"] == hot       # nothing deleted
+    assert len(retention.load_partition(path).rows()) == doc["rows"]
+    conn.close()
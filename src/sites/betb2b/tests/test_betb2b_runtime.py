@@ -0,0 +1,181 @@
+"""Multi-skin scheduler runtime — shared pool, per-host budgets, one writer.
+
+No network: scrapers are started (which only builds clients) or replaced by
+dummies; the assertions are about what is shared and what is closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.sites.betb2b import store
+from src.sites.betb2b.cli.main import _list_skins, _load_skin, _parse_skin_intervals
+from src.sites.betb2b.http_pool import HostClientPool
+from src.sites.betb2b.runtime import MultiSkinScheduler
+from src.sites.betb2b.scraper import BetB2BScraper
+
+
+def test_pool_hands_out_one_client_and_budget_per_host():
+    async def _go():
+        pool = HostClientPool(concurrency=4, http2=False)
+        a = pool.client("https://linebet.com/service-api/LineFeed/GetGameZip")
+        b = pool.client("https://LINEBET.com/service-api/statisticfeed/api/v1/Game")
+        c = pool.client("https://melbet.com/")
+        d = pool.client("https://linebet.com/", proxy="http://proxy:8080")
+        assert a is b and a is not c and a is not d
+        assert pool.budget("https://linebet.com/x") is pool.budget("https://linebet.com/y")
+        assert pool.budget("https://linebet.com/") is not pool.budget("https://melbet.com/")
+        assert pool.stats()["clients"] == 3
+        await pool.aclose()
+        assert a.is_closed and c.is_closed and d.is_closed
+
+    asyncio.run(_go())
+
+
+def test_scrapers_on_a_pool_share_clients_and_leave_them_open():
+    skins = _list_skins()
+    hosts = {_load_skin(name).base_url for name in skins}
+
+    async def _go():
+        pool = HostClientPool(http2=False)
+        scrapers = [BetB2BScraper(_load_skin(name), direct=True, telemetry_enabled=False,
+                                  http_pool=pool)
+                    for name in skins + skins]          # two scrapers per skin
+        for sc in scrapers:
+            await sc.start()
+        assert pool.stats()["clients"] == len(hosts)    # not one per scraper
+        async with scrapers[0]._statfeed_client(None) as client:
+            assert client is scrapers[0].feed_client._client
+        for sc in scrapers:
+            await sc.close()
+        assert not any(c.is_closed for c in pool._clients.values())
+        await pool.aclose()
+
+    asyncio.run(_go())
+
+
+def test_runtime_shares_writer_pool_and_host_budgets(tmp_path):
+    rt = MultiSkinScheduler(["linebet", "melbet", "linebet"], db_path=str(tmp_path / "m.db"),
+                            overrides={"melbet": {"live_interval": 30}}, live_interval=15)
+    assert rt.skins == ["linebet", "melbet"]
+    lb, mb = rt.schedulers["linebet"], rt.schedulers["melbet"]
+    assert lb._writer is rt.writer and mb._writer is rt.writer
+    assert lb.http_pool is rt.pool and mb.http_pool is rt.pool
+    assert lb._shared_budget is rt.pool.budget(_load_skin("linebet").base_url)
+    assert lb._shared_budget is not mb._shared_budget
+    assert (lb.live_interval, mb.live_interval) == (15, 30)
+    with pytest.raises(ValueError):
+        MultiSkinScheduler(["linebet"], db_path=str(tmp_path / "x.db"),
+                           overrides={"melbet": {"live_interval": 30}})
+
+
+def test_runtime_persists_every_skin_through_one_writer(tmp_path):
+    db = str(tmp_path / "multi.db")
+    rt = MultiSkinScheduler(["linebet", "melbet"], db_path=db, scheduled_interval=3600,
+                            live_interval=0, results_interval=0)
+
+    class _DummyScraper:
+        async def close(self):
+            pass
+
+    done = []
+    for name, s in rt.schedulers.items():
+        s._scraper = _DummyScraper()
+
+        async def _sched(s=s, name=name):
+            res = {"skin": name, "action": "list_prematch", "url": "u",
+                   "extracted_at": datetime.now(timezone.utc).isoformat(), "success": True,
+                   "event_count": 1, "events": [{"event_id": "E1", "sport_id": 3,
+                                                 "home": "A", "away": "B"}]}
+            await rt.writer.persist(res)
+            done.append(name)
+            if len(done) == len(rt.schedulers):
+                rt.stop()
+
+        s._scheduled_pass = _sched
+    asyncio.run(asyncio.wait_for(rt.run(), timeout=5))
+    assert sorted(done) == ["linebet", "melbet"]
+    assert rt.writer.stats()["submitted"] >= 2
+    with pytest.raises(RuntimeError):                   # closed once, by the runtime
+        asyncio.run(rt.writer.persist({}))
+    conn = store.init_db(db)
+    assert store.counts(conn)["scrape_runs"] == 2
+    conn.close()
+
+
+def test_parse_skin_intervals():
+    assert _parse_skin_intervals(["melbet:live=30", "melbet:scheduled=0", "22bet:results=60"]) == {
+        "melbet": {"live_interval": 30.0, "scheduled_interval": 0.0},
+        "22bet": {"results_interval": 60.0},
+    }
+    for bad in ("melbet", "melbet:live", "melbet:nope=3", ":live=3", "melbet:live=x"):
+        with pytest.raises(ValueError):
+            _parse_skin_intervals([bad])
+
+
+def test_runtime_rejects_a_per_scheduler_budget_rate(tmp_path):
+    with pytest.raises(ValueError, match="host_rate_per_minute"):
+        MultiSkinScheduler(["linebet", "melbet"], db_path=str(tmp_path / "m.db"),
+                           request_budget_per_minute=120)
+    rt = MultiSkinScheduler(["linebet", "melbet"], db_path=str(tmp_path / "m.db"),
+                            host_rate_per_minute=120, request_budget_per_minute=0)
+    assert rt.pool.budget(_load_skin("melbet").base_url).rate_per_minute == 120
+
+
+def test_schedule_cli_maps_the_budget_flag_and_rejects_unknown_skin_intervals(monkeypatch):
+    from src.sites.betb2b import runtime, scheduler
+    from src.sites.betb2b.cli.main import BetB2BCLI
+
+    built = {}
+
+    class _Sched:
+        def __init__(self, *args, **kwargs):
+            built.update(args=args, kwargs=kwargs)
+
+        async def run(self):
+            pass
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(runtime, "MultiSkinScheduler", _Sched)
+    monkeypatch.setattr(scheduler, "BetB2BScheduler", _Sched)
+    cli = BetB2BCLI()
+
+    assert asyncio.run(cli.run(["schedule", "linebet,melbet",
+                                "--request-budget-per-minute", "90"])) == 0
+    assert built["kwargs"]["host_rate_per_minute"] == 90
+    assert "request_budget_per_minute" not in built["kwargs"]
+
+    built.clear()
+    assert asyncio.run(cli.run(["schedule", "linebet", "--skin-interval", "melbet:live=30"])) == 2
+    assert not built
+    assert asyncio.run(cli.run(["schedule", "linebet", "--skin-interval", "linebet:live=30"])) == 0
+    assert built["kwargs"]["live_interval"] == 30
+
+
+def test_schedule_cli_closes_the_store_pools_on_exit(monkeypatch, tmp_path):
+    from src.sites.betb2b import scheduler, store_pool
+    from src.sites.betb2b.cli.main import BetB2BCLI
+
+    pool = store_pool.get_pool(tmp_path / "odds.db")
+
+    class _Sched:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def run(self):
+            with pool.reader():
+                pass
+            raise asyncio.CancelledError
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(scheduler, "BetB2BScheduler", _Sched)
+    assert asyncio.run(BetB2BCLI().run(["schedule", "linebet"])) == 0
+    assert pool._closed and store_pool.get_pool(tmp_path / "odds.db") is not pool
+    store_pool.close_pools()
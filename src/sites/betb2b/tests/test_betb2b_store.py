@@ -7,9 +7,12 @@ time-series across runs).
 
 from __future__ import annotations
 
+import sqlite3
+
 import pytest
 
 from src.sites.betb2b.store import (
+    SCHEMA,
     cross_skin_odds,
     init_db,
     latest_odds,
@@ -135,6 +138,39 @@ def test_latest_odds_takes_most_recent(db, tmp_path):
     assert max(r["captured_at"] for r in rows) == "2026-07-21T12:10:00+00:00"
 
 
+def test_current_odds_is_one_row_per_selection_with_latest_price(db, tmp_path):
+    for at, price in (("2026-07-21T12:00:00+00:00", (1.5, 2.5)),
+                      ("2026-07-21T12:05:00+00:00", (1.7, 2.5)),
+                      ("2026-07-21T12:10:00+00:00", (1.8, 2.5))):
+        persist_result(_result("linebet", price_1x2=price, at=at), conn=db)
+    assert db.execute("SELECT COUNT(*) FROM odds_snapshots").fetchone()[0] == 4
+    cur = db.execute("SELECT selection_name, price, captured_at FROM current_odds "
+                     "ORDER BY selection_name").fetchall()
+    # NULL line is part of the key, yet never duplicates the row.
+    assert [tuple(r) for r in cur] == [("1", 1.8, "2026-07-21T12:10:00+00:00"),
+                                       ("2", 2.5, "2026-07-21T12:00:00+00:00")]
+
+
+def test_current_odds_backfilled_for_existing_store(tmp_path):
+    path = tmp_path / "old.db"
+    conn = init_db(path)
+    persist_result(_result("linebet", price_1x2=(1.5, 2.5)), conn=conn)
+    persist_result(_result("linebet", price_1x2=(1.6, 2.5),
+                           at="2026-07-21T12:05:00+00:00"), conn=conn)
+    persist_result(_result("melbet", price_1x2=(1.4, 2.6)), conn=conn)
+    expected = latest_odds(conn, "738047045")
+    conn.execute("DROP TABLE current_odds")          # a store from before the table
+    conn.commit()
+    conn.close()
+
+    conn = init_db(path)
+    assert conn.execute("SELECT COUNT(*) FROM current_odds").fetchone()[0] == 4
+    assert latest_odds(conn, "738047045") == expected
+    assert [r["skin"] for r in cross_skin_odds(conn, "738047045", "To Win Match", "1")] == [
+        "melbet", "linebet"]
+    conn.close()
+
+
 # ---------------------------------------------------------------------------
 # Full-model coverage: dimensions, period scores, H2H (the non-odds data)
 # ---------------------------------------------------------------------------
@@ -413,3 +449,78 @@ def test_init_db_adds_columns_to_legacy_db(tmp_path):
     assert conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 1  # data kept
     conn.close()
     init_db(p).close()  # idempotent — no error on second open
+
+
+# ---------------------------------------------------------------------------
+# Set-based bulk path: same rows as the row-at-a-time path, far fewer statements
+# ---------------------------------------------------------------------------
+def _multi_result(at, *, shift=0.0, n=4):
+    """Several events sharing teams/leagues/markets, with H2H and sub-games."""
+    r = _rich_result(at=at)
+    base = r["events"][0]
+    events = []
+    for i in range(n):
+        ev = {**base, "event_id": str(738047045 + i),
+              "home": "Phoenix" if i % 2 == 0 else f"Home {i}", "away": f"Away {i}",
+              "score_home": 62 + i, "home_team_feed_id": 51775 if i == 2 else None,
+              "sub_games": [{"sub_game_id": f"sg{i}", "name": None, "period": "1st quarter",
+                             "period_index": 1, "market_count": 10 + i, "sport_id": 3}],
+              "statistics": [{"rebounds": str(40 + i)}]}
+        ev["markets"] = [
+            {"name": "To Win Match", "market_type": "moneyline_h2h", "raw_g": 1,
+             "selections": [{"name": "1", "price": 1.5 + shift * i, "is_suspended": False},
+                            {"name": "2", "price": 2.5, "is_suspended": i == 3}]},
+            {"name": None, "market_type": "other", "raw_g": None,
+             "selections": [{"name": "X", "price": 3.0 + i}]},
+        ]
+        events.append(ev)
+    events.append({**events[0]})  # the same event reported twice in one run
+    r["events"] = events
+    return r
+
+
+def _dump(conn):
+    return {t: [tuple(row) for row in conn.execute(f"SELECT * FROM {t} ORDER BY 1")]
+            for t in counts(conn)}
+
+
+def test_bulk_and_rowwise_store_identical_rows(tmp_path):
+    dumps = []
+    for bulk in (False, True):
+        conn = init_db(tmp_path / f"bulk_{bulk}.db")
+        for at, shift in (("2026-07-21T12:00:00+00:00", 0.0),
+                          ("2026-07-21T12:00:15+00:00", 0.1),
+                          ("2026-07-21T12:00:30+00:00", 0.1)):
+            persist_result(_multi_result(at, shift=shift), conn=conn, bulk=bulk)
+        dumps.append(_dump(conn))
+        conn.close()
+    assert dumps[0] == dumps[1]
+    assert dumps[1]["odds_snapshots"]  # and there was something to compare
+
+
+class _CountingConnection(sqlite3.Connection):
+    calls = 0
+
+    def execute(self, *a, **kw):
+        type(self).calls += 1
+        return super().execute(*a, **kw)
+
+    def executemany(self, *a, **kw):
+        type(self).calls += 1
+        return super().executemany(*a, **kw)
+
+
+def _round_trips(tmp_path, n, bulk):
+    conn = sqlite3.connect(tmp_path / f"rt_{n}_{bulk}.db", factory=_CountingConnection)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    _CountingConnection.calls = 0
+    persist_result(_multi_result("2026-07-21T12:00:00+00:00", n=n), conn=conn, bulk=bulk)
+    conn.close()
+    return _CountingConnection.calls
+
+
+def test_bulk_statement_count_is_flat_in_event_count(tmp_path):
+    bulk = _round_trips(tmp_path, 40, True)
+    assert bulk == _round_trips(tmp_path, 4, True)         # no per-event statements
+    assert _round_trips(tmp_path, 40, False) > 20 * bulk   # the per-row path scales
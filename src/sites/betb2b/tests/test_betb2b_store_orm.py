@@ -69,7 +69,7 @@ def test_orm_persist_populates_all_tables(orm_conn):
     assert c == {
         "sports": 1, "countries": 1, "leagues": 1, "teams": 2, "events": 1,
         "markets": 1, "sub_games": 2, "scrape_runs": 1, "event_states": 1,
-        "period_scores": 1, "odds_snapshots": 2, "h2h_games": 1,
+        "period_scores": 1, "odds_snapshots": 2, "current_odds": 2, "h2h_games": 1,
         "h2h_period_scores": 1, "statistics": 2,
     }
 
@@ -162,6 +162,25 @@ def test_orm_latest_odds(orm_conn):
     assert over["price"] == 1.85 and over["line"] == 216.5
 
 
+def test_orm_current_odds_tracks_latest_price(orm_conn):
+    store.persist_result(_rich_result(), conn=orm_conn)
+    moved = _rich_result(at="2026-07-27T12:00:20+00:00")
+    moved["events"][0]["markets"][0]["selections"][0]["price"] = 1.95
+    store.persist_result(moved, conn=orm_conn)
+    store.persist_result(_rich_result(skin="melbet"), conn=orm_conn)
+    c = store.counts(orm_conn)
+    assert (c["odds_snapshots"], c["current_odds"]) == (5, 4)   # history vs one per key
+    rows = store.latest_odds(orm_conn, "739052498", skin="linebet")
+    assert {r["selection_name"]: r["price"] for r in rows}["Over"] == 1.95
+    best = store.cross_skin_odds(orm_conn, "739052498", _market_name(orm_conn), "Over")
+    assert [(r["skin"], r["price"]) for r in best] == [("melbet", 1.85), ("linebet", 1.95)]
+
+
+def _market_name(conn):
+    from sqlalchemy import text
+    return conn.execute(text("SELECT name FROM markets")).scalar()
+
+
 def test_orm_team_feed_fields_persisted(orm_conn):
     store.persist_result(_rich_result(), conn=orm_conn)
     from sqlalchemy import text
@@ -244,3 +263,49 @@ def test_backfill_market_names(orm_conn, monkeypatch):
 
     # Idempotent: re-running finds only the unknown.
     assert bf.run(apply=True, verbose=False) == {"renamed": 0, "merged": 0, "skipped": 1}
+
+
+def test_orm_bulk_and_rowwise_store_identical_rows(tmp_path, monkeypatch):
+    """The set-based path writes exactly what the per-event path writes —
+    including teams backfilled from H2H and an event repeated within one run."""
+    import src.sites.betb2b.store_orm as som
+    from sqlalchemy import text
+
+    def _run(at, price):
+        r = _rich_result(at=at)
+        ev = r["events"][0]
+        ev["markets"][0]["selections"][0]["price"] = price
+        other = {**ev, "event_id": "739052499", "home": "San Miguel", "away": "Nlex",
+                 "home_team_feed_id": None, "sub_games": []}
+        r["events"] = [ev, other, {**ev, "venue": None}]
+        return r
+
+    dumps = []
+    for bulk in (False, True):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / f'orm_{bulk}.db'}")
+        som._engines.clear()
+        conn = store.init_db()
+        for at, price in (("2026-07-27T12:00:00+00:00", 1.85),
+                          ("2026-07-27T12:00:15+00:00", 1.9)):
+            store.persist_result(_run(at, price), conn=conn, bulk=bulk)
+        dumps.append({t: [tuple(r) for r in conn.execute(text(f"SELECT * FROM {t} ORDER BY 1"))]
+                      for t in store.counts(conn)})
+        conn.close()
+    assert dumps[0] == dumps[1]
+
+
+def test_orm_odds_state_rebuild_and_deltas(orm_conn):
+    from src.sites.betb2b.odds_state import OddsState
+
+    store.persist_result(_rich_result(), conn=orm_conn)
+    state = OddsState()
+    state.load("linebet", store.live_state_snapshot(orm_conn, "linebet", since=None))
+    assert state.stats()["selections"] > 0
+
+    second = _rich_result(at="2026-07-27T12:00:15+00:00")
+    second["events"][0]["markets"][0]["selections"][0]["price"] = 1.99
+    before = store.counts(orm_conn)
+    store.persist_result(state.diff(second), conn=orm_conn)
+    after = store.counts(orm_conn)
+    assert after["odds_snapshots"] == before["odds_snapshots"] + 1
+    assert after["event_states"] == before["event_states"]      # state did not move
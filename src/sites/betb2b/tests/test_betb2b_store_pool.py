@@ -0,0 +1,75 @@
+"""SQLite connection handling: schema once per process, WAL, the store pool.
+
+The contract: ``init_db`` runs the schema script only once per database (and
+again after outside DDL), every connection is tuned and in WAL mode, and a
+pooled reader sees committed data while a write transaction is open.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.sites.betb2b import store, store_pool
+
+
+def test_schema_runs_once_per_process(tmp_path, monkeypatch):
+    calls = []
+    ensure = store._ensure_schema
+    monkeypatch.setattr(store, "_ensure_schema", lambda c: (calls.append(1), ensure(c)))
+    path = tmp_path / "odds.db"
+    for _ in range(3):
+        store.init_db(path).close()
+    assert len(calls) == 1
+
+    conn = store.init_db(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1       # NORMAL
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    conn.execute("DROP TABLE current_odds")                              # outside DDL
+    conn.commit()
+    conn.close()
+    store.init_db(path).close()
+    assert len(calls) == 2
+
+
+def test_pooled_reader_is_not_blocked_by_an_open_write(tmp_path):
+    pool = store_pool.StorePool(tmp_path / "odds.db", readers=2)
+    with pool.writer() as conn:
+        job_id = store.create_job(conn, skin="linebet", action="list_live")
+    with pool.writer() as conn:
+        conn.execute("UPDATE scraper_jobs SET status='running' WHERE job_id=?", (job_id,))
+        seen = []                                   # write txn still open
+        t = threading.Thread(target=lambda: seen.append(_status(pool, job_id)))
+        t.start()
+        t.join(timeout=2)
+        assert seen == ["queued"]                   # last committed state, no wait
+        conn.commit()
+    assert _status(pool, job_id) == "running"
+
+    with pool.reader() as r1, pool.reader() as r2:
+        assert r1 is not r2
+        with pytest.raises(sqlite3.OperationalError):
+            r1.execute("DELETE FROM scraper_jobs")  # query_only
+    with pool.reader() as again:
+        assert again in (r1, r2)                    # reused, not reopened
+    pool.close()
+
+
+def test_writer_rolls_back_a_failed_job(tmp_path):
+    pool = store_pool.get_pool(tmp_path / "odds.db")
+    with pytest.raises(RuntimeError):
+        with pool.writer() as conn:
+            store.create_job(conn, skin="linebet", action="list_live")
+            conn.execute("UPDATE scraper_jobs SET status='running'")
+            raise RuntimeError("boom")
+    assert _status(pool, 1) == "queued"
+    assert store_pool.get_pool(tmp_path / "odds.db") is pool
+    store_pool.close_pools()
+
+
+def _status(pool, job_id):
+    with pool.reader() as conn:
+        return store.get_job(conn, job_id)["status"]
@@ -0,0 +1,144 @@
+"""Write-behind store writer (scheduler persistence off the event loop).
+
+The writer thread owns one connection and drains a bounded queue; these tests
+pin the ordering, backpressure, flush-on-close/shutdown and read-only latch
+without any network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.shutdown import ShutdownCoordinator
+from src.sites.betb2b import store
+from src.sites.betb2b.scheduler import BetB2BScheduler
+from src.sites.betb2b.writer import StoreWriter
+
+
+def _result(event_id="E1"):
+    return {
+        "skin": "linebet", "action": "list_live", "url": "u",
+        "extracted_at": datetime.now(timezone.utc).isoformat(), "success": True,
+        "event_count": 1, "events": [{"event_id": event_id, "sport": "basketball",
+                                      "sport_id": 3, "home": "A", "away": "B"}],
+    }
+
+
+def test_persist_then_read_sees_the_write(tmp_path):
+    async def _go():
+        w = StoreWriter(str(tmp_path / "w.db"))
+        fut = await w.persist(_result("E1"))
+        seen = await w.call(store.events_last_seen, ["E1", "E2"])  # queued after the write
+        assert await fut == 1
+        await w.close()
+        return seen
+
+    assert set(asyncio.run(_go())) == {"E1"}
+
+
+def test_full_queue_applies_backpressure_without_blocking_the_loop(tmp_path):
+    gate = threading.Event()
+    ticks = []
+
+    async def _go():
+        w = StoreWriter(str(tmp_path / "bp.db"), maxsize=1)
+        first = await w.submit(lambda conn: gate.wait(5))       # occupies the only slot
+
+        async def _ticker():
+            while not gate.is_set():
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(_ticker())
+        second = asyncio.create_task(w.submit(lambda conn: "second"))
+        await asyncio.sleep(0.1)
+        assert not second.done()             # waiting for a slot …
+        assert ticks                         # … while the loop keeps running
+        gate.set()
+        assert await (await second) == "second"
+        await first
+        await ticker
+        assert w.stats()["waited"] == 1
+        await w.close()
+
+    asyncio.run(_go())
+
+
+def test_close_flushes_pending_writes(tmp_path):
+    db = str(tmp_path / "flush.db")
+
+    async def _go():
+        w = StoreWriter(db, maxsize=8)
+        for i in range(5):
+            await w.persist(_result(f"E{i}"))
+        await w.close()
+        assert w.depth == 0
+        with pytest.raises(RuntimeError):
+            await w.persist(_result("late"))
+
+    asyncio.run(_go())
+    conn = store.init_db(db)
+    assert store.counts(conn)["events"] == 5
+    conn.close()
+
+
+def test_read_only_error_is_latched_for_the_scheduler(tmp_path):
+    class _RO(Exception):
+        sqlstate = "25006"
+
+    def _doomed(conn):
+        raise _RO("cannot execute INSERT in a read-only transaction")
+
+    async def _go():
+        w = StoreWriter(str(tmp_path / "ro.db"))
+        with pytest.raises(_RO):
+            await w.call(_doomed)
+        assert isinstance(w.take_error(), _RO)
+        assert w.take_error() is None        # cleared once surfaced
+        assert await w.call(lambda conn: "still usable") == "still usable"
+        await w.close()
+
+    asyncio.run(_go())
+
+
+def test_shutdown_coordinator_flushes_the_writer(tmp_path):
+    db = str(tmp_path / "sd.db")
+    coordinator = ShutdownCoordinator()
+
+    async def _go():
+        w = StoreWriter(db)
+        w.register_shutdown_cleanup(coordinator)
+        await w.submit(lambda conn: time.sleep(0.05))
+        await w.persist(_result("E1"))
+        assert await coordinator.shutdown()
+
+    asyncio.run(_go())
+    conn = store.init_db(db)
+    assert store.counts(conn)["events"] == 1
+    conn.close()
+
+
+def test_scheduler_persist_enqueues_and_returns(tmp_path):
+    db = str(tmp_path / "sched.db")
+    s = BetB2BScheduler("linebet", db_path=db)
+    s._scraper = SimpleNamespace(skin=SimpleNamespace(name="linebet", base_url="u"))
+    gate = threading.Event()
+
+    async def _go():
+        await s._writer.submit(lambda conn: gate.wait(5))   # writer busy with a slow commit
+        t0 = time.perf_counter()
+        await s._persist("list_live", [])
+        assert time.perf_counter() - t0 < 0.5                  # did not wait for it
+        gate.set()
+        await s._writer.close()
+
+    asyncio.run(_go())
+    conn = store.init_db(db)
+    assert store.counts(conn)["scrape_runs"] == 1
+    conn.close()
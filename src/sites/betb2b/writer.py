@@ -0,0 +1,192 @@
+"""Write-behind persistence for the betb2b scheduler.
+
+``store.init_db`` / ``store.persist_result`` are synchronous; called from a
+scheduler pass they block the event loop — and every in-flight ``httpx`` poll
+with it — for the whole commit, which takes seconds against Supabase. The
+:class:`StoreWriter` moves that work off the loop:
+
+* **one writer thread** owns **one long-lived connection** (opened on first
+  use, reopened only after a failure), so there is no per-pass ``init_db``;
+* jobs go through a FIFO queue **bounded** by ``maxsize`` slots — a full queue
+  makes :meth:`StoreWriter.submit` wait (backpressure) instead of growing
+  memory without limit while the DB is slow;
+* reads (``events_last_seen``, ``events_needing_results``) ride the same queue,
+  so a pass always sees every write enqueued before it;
+* :meth:`StoreWriter.close` flushes the queue; :meth:`register_shutdown_cleanup`
+  hooks that into :class:`src.core.shutdown.ShutdownCoordinator`.
+
+A read-only DB (Supabase over quota, ADR-21/22) is latched by the writer and
+re-raised by :meth:`StoreWriter.take_error`, so the scheduler's back-off still
+sees it even though the write failed on another thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from . import store
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["StoreWriter"]
+
+_STOP = object()
+
+
+class StoreWriter:
+    """Bounded write-behind queue drained by a single connection-owning thread.
+
+    Jobs are ``fn(conn, *args, **kwargs)`` — the store helpers' own calling
+    convention — so any ``store`` function can be queued as-is.
+    """
+
+    def __init__(
+        self, db_path: Optional[str] = None, *, maxsize: int = 32,
+        name: str = "betb2b-store-writer",
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.db_path = db_path
+        self.maxsize = maxsize
+        self.name = name
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        # Each counter has a single writer (the loop or the thread) — no lock.
+        self._stats: Dict[str, int] = {"submitted": 0, "completed": 0, "failed": 0, "waited": 0}
+
+    # -- lifecycle ------------------------------------------------------- #
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    async def flush(self) -> None:
+        """Wait until every job enqueued so far has finished."""
+        if self._thread is not None and self._thread.is_alive():
+            await self.call(lambda conn: None)
+
+    async def close(self, timeout: float = 30.0) -> None:
+        """Flush pending writes, stop the thread and close its connection."""
+        if self._closed:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("store writer: %d job(s) still queued after %.0fs flush",
+                           self.depth, timeout)
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            await asyncio.to_thread(self._thread.join, timeout)
+
+    def register_shutdown_cleanup(self, shutdown_coordinator, *, priority: int = 5,
+                                  timeout_seconds: float = 30.0) -> None:
+        """Flush the queue during a coordinated shutdown (before browsers/network)."""
+        if shutdown_coordinator is None:
+            return
+        shutdown_coordinator.register_cleanup(
+            self.close, priority=priority, name=f"{self.name}_flush",
+            timeout_seconds=timeout_seconds)
+
+    # -- submission ------------------------------------------------------ #
+    async def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Future[Any]":
+        """Enqueue ``fn(conn, *args, **kwargs)``; return a future of its result.
+
+        Waits for a free slot when ``maxsize`` jobs are already pending — the
+        backpressure that keeps a slow DB from buffering passes without bound.
+        """
+        if self._closed:
+            raise RuntimeError("store writer is closed")
+        self.start()
+        loop = asyncio.get_running_loop()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.maxsize)
+        if self._slots.locked():
+            self._stats["waited"] += 1
+        await self._slots.acquire()
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+        self._stats["submitted"] += 1
+        self._queue.put((fn, args, kwargs, fut, loop))
+        return asyncio.wrap_future(fut)
+
+    async def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Enqueue ``fn`` and wait for its result (reads, or writes that must land)."""
+        return await (await self.submit(fn, *args, **kwargs))
+
+    async def persist(self, result: Dict[str, Any]) -> "asyncio.Future[Any]":
+        """Enqueue one ``BetB2BScrapeResult.to_dict()``; the future yields the run_id."""
+        return await self.submit(_persist, result)
+
+    def take_error(self) -> Optional[BaseException]:
+        """Return (and clear) a latched read-only-DB error from the writer thread."""
+        err, self._error = self._error, None
+        return err
+
+    @property
+    def depth(self) -> int:
+        """Jobs enqueued but not yet finished."""
+        s = self._stats
+        return s["submitted"] - s["completed"] - s["failed"]
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "depth": self.depth}
+
+    # -- writer thread --------------------------------------------------- #
+    def _run(self) -> None:
+        conn = None
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+            fn, args, kwargs, fut, loop = job
+            try:
+                if fut.set_running_or_notify_cancel():
+                    if conn is None:
+                        conn = store.init_db(self.db_path)
+                    fut.set_result(fn(conn, *args, **kwargs))
+                self._stats["completed"] += 1   # done, or cancelled before it ran
+            except BaseException as exc:  # noqa: BLE001 — handed to the submitter
+                self._stats["failed"] += 1
+                if store.is_read_only_error(exc):
+                    self._error = exc
+                conn = _recover(conn)
+                fut.set_exception(exc)
+            finally:
+                try:
+                    loop.call_soon_threadsafe(self._release)
+                except RuntimeError:
+                    pass  # the submitting loop is gone (interpreter shutdown)
+        if conn is not None:
+            conn.close()
+
+    def _release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+
+def _persist(conn, result: Dict[str, Any]) -> int:
+    return store.persist_result(result, conn=conn)
+
+
+def _recover(conn):
+    """Roll back a failed job; drop the connection if even that fails."""
+    if conn is None:
+        return None
+    try:
+        conn.rollback()
+        return conn
+    except Exception:  # noqa: BLE001 — broken connection → reopen on next job
+        try:
+            conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+        return None
@@ -174,11 +174,11 @@ class FileSystemStorageAdapter(IStorageAdapter):
                 logger.debug("HTML path resolved", html_path=str(html_path), dom_content_length=len(snapshot.dom_content) if snapshot.dom_content else 0)
                 
                 # Write HTML content
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(snapshot.dom_content)
+                artifacts.append(await self.snapshot_storage.write_artifact(
+                    bundle_path, f"html/{html_filename}", snapshot.dom_content
+                ))
                 
-                logger.debug("HTML file written", html_path=str(html_path), exists=html_path.exists())
-                artifacts.append(f"html/{html_filename}")
+                logger.debug("HTML artifact written", html_path=str(html_path))
             else:
                 logger.debug("No DOM content found in snapshot", snapshot_id=snapshot.id)
             
@@ -187,12 +187,11 @@ class FileSystemStorageAdapter(IStorageAdapter):
                 screenshots_dir = bundle_path / "screenshots"
                 screenshots_dir.mkdir(parents=True, exist_ok=True)
                 screenshot_filename = f"viewport_{datetime.now().strftime('%H%M%S')}.png"
-                screenshot_path = screenshots_dir / screenshot_filename
                 
                 # Write screenshot content
-                with open(screenshot_path, 'wb') as f:
-                    f.write(screenshot)
-                artifacts.append(f"screenshots/{screenshot_filename}")
+                artifacts.append(await self.snapshot_storage.write_artifact(
+                    bundle_path, f"screenshots/{screenshot_filename}", screenshot
+                ))
             
             bundle = SnapshotBundle(
                 context=context,
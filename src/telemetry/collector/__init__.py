@@ -12,6 +12,7 @@ from .quality_collector import QualityCollector
 from .strategy_collector import StrategyCollector
 from .error_collector import ErrorCollector
 from .context_collector import ContextCollector
+from .columnar import ColumnarRingBuffer, TimingRecorder, TimingRecorderStats
 
 __all__ = [
     "MetricsCollector",
@@ -21,4 +22,7 @@ __all__ = [
     "StrategyCollector",
     "ErrorCollector",
     "ContextCollector",
+    "ColumnarRingBuffer",
+    "TimingRecorder",
+    "TimingRecorderStats",
 ]
@@ -0,0 +1,381 @@
+"""
+Columnar Timing Recorder
+
+Low-overhead recording path for selector and network timings. Building a
+validated ``TelemetryEvent`` (uuid generation plus every pydantic validator)
+and queueing it under asyncio locks costs tens of microseconds per event;
+``TimingRecorder`` instead writes each sample as one row of a preallocated,
+struct-of-arrays ``ColumnarRingBuffer`` with a plain synchronous call, and
+defers event construction and validation to ``flush``.
+"""
+
+import asyncio
+import math
+import random
+import time
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from ..models import TelemetryEvent
+from ..configuration.telemetry_config import TelemetryConfiguration
+from ..configuration.logging import get_logger
+
+
+# (column name, array typecode); "O" columns hold Python objects in a list
+SELECTOR_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "d"),
+    ("selector_name", "O"),
+    ("operation_type", "O"),
+    ("correlation_id", "O"),
+    ("resolution_time_ms", "d"),
+    ("strategy_execution_time_ms", "d"),
+    ("total_duration_ms", "d"),
+    ("confidence_score", "d"),      # NaN: not measured
+    ("elements_found", "q"),        # -1: not measured
+    ("success", "b"),
+    ("primary_strategy", "O"),
+    ("sample_rate", "d"),
+)
+
+NETWORK_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "d"),
+    ("method", "O"),
+    ("url", "O"),
+    ("status_code", "i"),
+    ("duration_ms", "d"),
+    ("response_bytes", "q"),
+    ("correlation_id", "O"),
+    ("sample_rate", "d"),
+)
+
+
+class ColumnarRingBuffer:
+    """
+    Fixed-capacity ring buffer stored as one preallocated array per column.
+
+    Appending writes one slot per column and never allocates; when the buffer
+    is full the oldest row is overwritten. It is not locked: ``append`` and
+    ``drain`` never await, so on one event loop they cannot interleave.
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, str]], capacity: int = 8192):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.names = tuple(name for name, _ in columns)
+        self.capacity = capacity
+        self._columns = tuple(
+            [None] * capacity if code == "O" else array(code, bytes(array(code).itemsize * capacity))
+            for _, code in columns
+        )
+        self._head = 0          # next slot to write
+        self._size = 0
+        self.overwritten = 0
+
+    def append(self, *values: Any) -> None:
+        """Write one row; ``values`` follow the column order."""
+        index = self._head
+        for column, value in zip(self._columns, values):
+            column[index] = value
+        self._head = index + 1 if index + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self.overwritten += 1
+
+    def drain(self) -> Dict[str, List[Any]]:
+        """Remove every row; returns ``{column: values}``, oldest row first."""
+        start = (self._head - self._size) % self.capacity
+        end = start + self._size
+        if end <= self.capacity:
+            ranges = [(start, end)]
+        else:
+            ranges = [(start, self.capacity), (0, end - self.capacity)]
+        drained = {}
+        for name, column in zip(self.names, self._columns):
+            values: List[Any] = []
+            for lo, hi in ranges:
+                values.extend(column[lo:hi])
+                if isinstance(column, list):
+                    # Drop the references so drained objects can be freed
+                    column[lo:hi] = [None] * (hi - lo)
+            drained[name] = values
+        self._size = 0
+        return drained
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns and the object-column slot arrays."""
+        total = 0
+        for column in self._columns:
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += 8 * len(column)
+        return total
+
+
+@dataclass
+class TimingRecorderStats:
+    """Statistics for the columnar recording path."""
+    selector_recorded: int = 0
+    network_recorded: int = 0
+    sampled_out: int = 0
+    overwritten: int = 0
+    events_flushed: int = 0
+    rows_flushed: int = 0
+    invalid_rows: int = 0
+    flush_errors: int = 0
+    last_flush: Optional[datetime] = None
+
+
+EventSink = Callable[[List[TelemetryEvent]], Awaitable[Any]]
+RowSink = Callable[[List[Dict[str, Any]]], Awaitable[Any]]
+
+
+class TimingRecorder:
+    """
+    Fast recording mode for selector and network timings.
+
+    ``record_selector`` and ``record_network`` are synchronous and cheap:
+    sampling, then one ring-buffer row. ``flush`` (or the background loop
+    started with ``start``) turns selector rows into ``TelemetryEvent`` models,
+    validating them there, and hands them to ``event_sink``; network rows,
+    which have no event model, go to ``network_sink`` as dictionaries.
+    Failed selector operations are always recorded regardless of sampling,
+    and every row carries the sample rate it was kept at so consumers can
+    re-weight counts.
+    """
+
+    def __init__(
+        self,
+        config: TelemetryConfiguration,
+        event_sink: Optional[EventSink] = None,
+        network_sink: Optional[RowSink] = None
+    ):
+        """
+        Initialize timing recorder.
+
+        Args:
+            config: Telemetry configuration
+            event_sink: Async callable receiving each flushed batch of events,
+                e.g. ``EventRecorder.record_events_batch``
+            network_sink: Async callable receiving flushed network rows
+        """
+        self.config = config
+        self.event_sink = event_sink
+        self.network_sink = network_sink
+        self.logger = get_logger("timing_recorder")
+
+        capacity = config.get("fast_recording_capacity", 8192)
+        self.sample_rate = self._check_rate(config.get("fast_recording_sample_rate", 1.0))
+        self.network_sample_rate = self._check_rate(
+            config.get("fast_recording_network_sample_rate", self.sample_rate)
+        )
+        self._flush_interval = config.get_flush_interval()
+
+        self._selectors = ColumnarRingBuffer(SELECTOR_COLUMNS, capacity)
+        self._network = ColumnarRingBuffer(NETWORK_COLUMNS, capacity)
+        self._random = random.random
+
+        self._stats = TimingRecorderStats()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._shutdown_event = asyncio.Event()
+
+    def record_selector(
+        self,
+        selector_name: str,
+        resolution_time_ms: float,
+        operation_type: str = "resolution",
+        strategy_execution_time_ms: float = 0.0,
+        total_duration_ms: Optional[float] = None,
+        confidence_score: Optional[float] = None,
+        elements_found: Optional[int] = None,
+        success: bool = True,
+        primary_strategy: Optional[str] = None,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Record one selector operation timing.
+
+        Returns:
+            True if the sample was kept, False if sampling dropped it
+        """
+        rate = self.sample_rate
+        if success and rate < 1.0 and self._random() >= rate:
+            self._stats.sampled_out += 1
+            return False
+        self._selectors.append(
+            time.time(),
+            selector_name,
+            operation_type,
+            correlation_id,
+            resolution_time_ms,
+            strategy_execution_time_ms,
+            resolution_time_ms if total_duration_ms is None else total_duration_ms,
+            math.nan if confidence_score is None else confidence_score,
+            -1 if elements_found is None else elements_found,
+            success,
+            primary_strategy,
+            rate if success else 1.0,
+        )
+        self._stats.selector_recorded += 1
+        return True
+
+    def record_network(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        duration_ms: float,
+        response_bytes: int = 0,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Record one network request timing.
+
+        Returns:
+            True if the sample was kept, False if sampling dropped it
+        """
+        rate = self.network_sample_rate
+        if rate < 1.0 and status_code < 400 and self._random() >= rate:
+            self._stats.sampled_out += 1
+            return False
+        self._network.append(
+            time.time(), method, url, status_code, duration_ms, response_bytes,
+            correlation_id, rate if status_code < 400 else 1.0,
+        )
+        self._stats.network_recorded += 1
+        return True
+
+    async def flush(self) -> Tuple[List[TelemetryEvent], List[Dict[str, Any]]]:
+        """
+        Drain both buffers, build and validate events, and pass them to the sinks.
+
+        Returns:
+            Tuple of (valid selector events, network rows)
+        """
+        self._stats.overwritten = self._selectors.overwritten + self._network.overwritten
+        events = self._build_events(self._selectors.drain())
+        rows = self._build_network_rows(self._network.drain())
+
+        if events and self.event_sink:
+            await self._deliver(self.event_sink, events)
+        if rows and self.network_sink:
+            await self._deliver(self.network_sink, rows)
+
+        self._stats.events_flushed += len(events)
+        self._stats.rows_flushed += len(rows)
+        self._stats.last_flush = datetime.utcnow()
+        return events, rows
+
+    async def start(self) -> None:
+        """Start flushing every flush interval."""
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._shutdown_event.clear()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush whatever is still buffered."""
+        self._shutdown_event.set()
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    def get_statistics(self) -> TimingRecorderStats:
+        """Get recorder statistics."""
+        self._stats.overwritten = self._selectors.overwritten + self._network.overwritten
+        return TimingRecorderStats(**self._stats.__dict__)
+
+    def get_buffer_status(self) -> Dict[str, Any]:
+        """Get ring buffer occupancy and memory footprint."""
+        return {
+            "selector_rows": len(self._selectors),
+            "network_rows": len(self._network),
+            "capacity": self._selectors.capacity,
+            "memory_usage_bytes": self._selectors.nbytes + self._network.nbytes,
+        }
+
+    # Private methods
+
+    @staticmethod
+    def _check_rate(rate: float) -> float:
+        if not 0.0 < rate <= 1.0:
+            raise ValueError("sample rate must be in (0, 1]")
+        return float(rate)
+
+    def _build_events(self, columns: Dict[str, List[Any]]) -> List[TelemetryEvent]:
+        """Turn drained selector rows into validated TelemetryEvents."""
+        events = []
+        for (timestamp, selector_name, operation_type, correlation_id, resolution_ms,
+             strategy_ms, total_ms, confidence, elements, success, strategy,
+             rate) in zip(*(columns[name] for name, _ in SELECTOR_COLUMNS)):
+            quality_metrics: Dict[str, Any] = {"success": bool(success)}
+            if not math.isnan(confidence):
+                quality_metrics["confidence_score"] = confidence
+            if elements >= 0:
+                quality_metrics["elements_found"] = elements
+            try:
+                events.append(TelemetryEvent(
+                    event_id=str(uuid.uuid4()),
+                    correlation_id=correlation_id or uuid.uuid4().hex,
+                    selector_name=selector_name,
+                    timestamp=datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None),
+                    operation_type=operation_type,
+                    performance_metrics={
+                        "resolution_time_ms": resolution_ms,
+                        "strategy_execution_time_ms": strategy_ms,
+                        "total_duration_ms": total_ms,
+                    },
+                    quality_metrics=quality_metrics,
+                    strategy_metrics={"primary_strategy": strategy} if strategy else None,
+                    context_data={"sample_rate": rate} if rate < 1.0 else None,
+                ))
+            except (ValidationError, ValueError, TypeError) as e:
+                self._stats.invalid_rows += 1
+                self.logger.debug(
+                    "Dropped invalid timing row",
+                    selector_name=selector_name,
+                    error=str(e)
+                )
+        return events
+
+    @staticmethod
+    def _build_network_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Turn drained network rows into dictionaries."""
+        names = [name for name, _ in NETWORK_COLUMNS]
+        rows = [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
+        for row in rows:
+            row["timestamp"] = datetime.fromtimestamp(row["timestamp"], timezone.utc).replace(tzinfo=None)
+        return rows
+
+    async def _deliver(self, sink: Callable[[List[Any]], Awaitable[Any]], batch: List[Any]) -> None:
+        try:
+            await sink(batch)
+        except Exception as e:
+            self._stats.flush_errors += 1
+            self.logger.error(
+                "Timing recorder flush failed",
+                batch_size=len(batch),
+                error=str(e)
+            )
+
+    async def _flush_loop(self) -> None:
+        """Flush every flush interval until stopped."""
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(),
+                    timeout=self._flush_interval.total_seconds()
+                )
+            except asyncio.TimeoutError:
+                await self.flush()
@@ -35,6 +35,8 @@ class TelemetryConfiguration:
         "retention_days": 30,
         "compression_enabled": True,
         "encryption_enabled": False,
+        "json_layout": "day_files",  # day_files, segments (append-only NDJSON)
+        "segment_max_bytes": 8 * 1024 * 1024,
         
         # Processing settings
         "processing_enabled": True,
@@ -97,6 +99,7 @@ class TelemetryConfiguration:
             "TELEMETRY_ENABLED": ("collection_enabled", self._parse_bool),
             "TELEMETRY_STORAGE_TYPE": ("storage_type", str),
             "TELEMETRY_STORAGE_PATH": ("storage_path", str),
+            "TELEMETRY_JSON_LAYOUT": ("json_layout", str),
             "TELEMETRY_RETENTION_DAYS": ("retention_days", int),
             "TELEMETRY_BUFFER_SIZE": ("buffer_size", int),
             "TELEMETRY_FLUSH_INTERVAL": ("flush_interval_seconds", int),
@@ -203,6 +206,9 @@ class TelemetryConfiguration:
         if not isinstance(self._config.get("retention_days"), int) or self._config.get("retention_days") <= 0:
             errors.append("retention_days must be positive integer")
         
+        if self._config.get("json_layout") not in ["day_files", "segments"]:
+            errors.append("json_layout must be 'day_files' or 'segments'")
+        
         # Validate performance settings
         overhead = self._config.get("performance_overhead_threshold")
         if not isinstance(overhead, (int, float)) or not 0 <= overhead <= 1:
@@ -31,16 +31,19 @@ class SelectorTelemetryIntegration(ISelectorTelemetryIntegration):
     correlation tracking without modifying selector logic.
     """
     
-    def __init__(self, config: TelemetryConfiguration, collector=None):
+    def __init__(self, config: TelemetryConfiguration, collector=None, recorder=None):
         """
         Initialize selector telemetry integration.
         
         Args:
             config: Telemetry configuration
             collector: Optional telemetry collector
+            recorder: Optional TimingRecorder; when set, resolution timings are
+                recorded through its columnar fast path instead of the collector
         """
         self.config = config
         self.collector = collector
+        self.recorder = recorder
         self.logger = get_logger("selector_integration")
         
         # Integration state
@@ -393,7 +396,19 @@ class SelectorTelemetryIntegration(ISelectorTelemetryIntegration):
             quality_metrics = {k: v for k, v in quality_metrics.items() if v is not None}
             
             # Create telemetry event
-            if self.collector:
+            if self.recorder is not None:
+                # Without a measurement there is no timing to record; a 0 ms
+                # row would drag the resolution percentiles down
+                if measurement:
+                    self.recorder.record_selector(
+                        selector_name,
+                        performance_metrics["resolution_time_ms"],
+                        confidence_score=confidence_score,
+                        elements_found=elements_found,
+                        success=success,
+                        correlation_id=correlation_id
+                    )
+            elif self.collector:
                 await self.collector.collect_event(
                     selector_name=selector_name,
                     operation_type="resolution",
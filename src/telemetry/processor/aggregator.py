@@ -21,6 +21,20 @@ from ..configuration.telemetry_config import TelemetryConfiguration
 from ..exceptions import TelemetryProcessingError
 from ..configuration.logging import get_logger
 from .metrics_processor import ProcessedMetric, AggregationType, TimeWindow
+from src.observability.quantiles import QuantileSketch, WindowedQuantiles
+
+# Width of each TimeWindow, for the per-window percentile sketches
+_WINDOW_SPANS = {
+    TimeWindow.MINUTE_1: timedelta(minutes=1),
+    TimeWindow.MINUTE_5: timedelta(minutes=5),
+    TimeWindow.MINUTE_15: timedelta(minutes=15),
+    TimeWindow.MINUTE_30: timedelta(minutes=30),
+    TimeWindow.HOUR_1: timedelta(hours=1),
+    TimeWindow.HOUR_6: timedelta(hours=6),
+    TimeWindow.HOUR_12: timedelta(hours=12),
+    TimeWindow.DAY_1: timedelta(days=1),
+    TimeWindow.WEEK_1: timedelta(weeks=1),
+}
 
 
 class GroupingType(Enum):
@@ -57,6 +71,7 @@ class AggregationRule:
     custom_grouping_function: Optional[str] = None
     filters: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
+    description: str = ""
 
 
 @dataclass
@@ -113,11 +128,15 @@ class Aggregator(ITelemetryProcessor):
         self.max_aggregated_metrics = config.get("max_aggregated_metrics", 50000)
         self.batch_size = config.get("aggregation_batch_size", 1000)
         self.aggregation_interval_seconds = config.get("aggregation_interval_seconds", 300)
+        self.sketch_retention_windows = config.get("sketch_retention_windows", 24)
         
         # Storage
         self._aggregation_rules: Dict[str, AggregationRule] = {}
         self._aggregated_metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.max_aggregated_metrics))
         self._aggregation_lock = asyncio.Lock()
+        # Percentile sketches per (rule, group), one per time window: fed
+        # incrementally, so percentiles never need the raw values again
+        self._sketches: Dict[Tuple[str, str], WindowedQuantiles] = {}
         
         # Statistics
         self._statistics = AggregationStatistics()
@@ -339,8 +358,16 @@ class Aggregator(ITelemetryProcessor):
             elif aggregation_type == AggregationType.MEDIAN:
                 aggregated_value = statistics.median(values)
             elif aggregation_type == AggregationType.PERCENTILE:
-                # Default to 95th percentile
-                aggregated_value = self._calculate_percentile(values, 95)
+                # Default to 95th percentile. Merging the groups' sketches gives
+                # the percentile of the underlying samples, not of the group p95s
+                sketches = [m.metadata["sketch"] for m in filtered_metrics if "sketch" in m.metadata]
+                if sketches:
+                    merged = QuantileSketch()
+                    for sketch in sketches:
+                        merged.merge(QuantileSketch.from_dict(sketch))
+                    aggregated_value = merged.percentile(95)
+                else:
+                    aggregated_value = self._calculate_percentile(values, 95)
             elif aggregation_type == AggregationType.RATE:
                 # Calculate rate per second
                 time_span = (filtered_metrics[-1].end_time - filtered_metrics[0].start_time).total_seconds()
@@ -430,6 +457,8 @@ class Aggregator(ITelemetryProcessor):
             async with self._aggregation_lock:
                 if rule_id in self._aggregation_rules:
                     del self._aggregation_rules[rule_id]
+                    for key in [k for k in self._sketches if k[0] == rule_id]:
+                        del self._sketches[key]
                     
                     self.logger.info(
                         "Aggregation rule removed",
@@ -757,8 +786,9 @@ class Aggregator(ITelemetryProcessor):
             elif rule.aggregation_type == AggregationType.MEDIAN:
                 aggregated_value = statistics.median(values)
             elif rule.aggregation_type == AggregationType.PERCENTILE:
-                # Default to 95th percentile
-                aggregated_value = self._calculate_percentile(values, 95)
+                # Default to 95th percentile, from the group's windowed sketch
+                window_sketch = self._update_sketch(rule, group_key, group_metrics).sketch(start_time, end_time)
+                aggregated_value = window_sketch.percentile(95)
             elif rule.aggregation_type == AggregationType.RATE:
                 # Calculate rate per second
                 if time_span.total_seconds() > 0:
@@ -772,6 +802,15 @@ class Aggregator(ITelemetryProcessor):
                 self.logger.warning(f"Unsupported aggregation type: {rule.aggregation_type.value}")
                 return None
             
+            metadata = {
+                "rule_name": rule.name,
+                "group_count": len(group_metrics),
+                "time_span_seconds": time_span.total_seconds()
+            }
+            if rule.aggregation_type == AggregationType.PERCENTILE:
+                metadata["percentiles"] = window_sketch.percentiles()
+                metadata["sketch"] = window_sketch.to_dict()
+            
             return AggregatedMetric(
                 aggregation_id=f"agg_{rule.rule_id}_{group_key}_{int(datetime.utcnow().timestamp())}",
                 rule_id=rule.rule_id,
@@ -786,11 +825,7 @@ class Aggregator(ITelemetryProcessor):
                 timestamp=end_time,
                 start_time=start_time,
                 end_time=end_time,
-                metadata={
-                    "rule_name": rule.name,
-                    "group_count": len(group_metrics),
-                    "time_span_seconds": time_span.total_seconds()
-                }
+                metadata=metadata
             )
             
         except Exception as e:
@@ -892,8 +927,21 @@ class Aggregator(ITelemetryProcessor):
         else:
             return now - timedelta(minutes=1)  # Default to 1 minute
     
+    def _update_sketch(self, rule: AggregationRule, group_key: str,
+                       group_metrics: List[ProcessedMetric]) -> WindowedQuantiles:
+        """Feed a group's values into its windowed sketch and return the sketch."""
+        key = (rule.rule_id, group_key)
+        sketches = self._sketches.get(key)
+        if sketches is None:
+            span = _WINDOW_SPANS.get(rule.time_windows[0], timedelta(minutes=1))
+            sketches = self._sketches[key] = WindowedQuantiles(span, self.sketch_retention_windows)
+        for metric in group_metrics:
+            if isinstance(metric.value, (int, float)):
+                sketches.add(metric.value, metric.timestamp)
+        return sketches
+    
     def _calculate_percentile(self, values: List[float], percentile: float) -> float:
-        """Calculate percentile value."""
+        """Calculate percentile value of a one-off list (rules use sketches)."""
         if not values:
             return 0.0
         
@@ -940,5 +988,5 @@ class Aggregator(ITelemetryProcessor):
         total_aggregations = self._statistics.total_aggregations
         if total_aggregations > 0:
             self._statistics.average_aggregation_time_ms = (
-                self._statistics.average_aggregation_time_ms * (total_aggregations - 1) + aggregation_time
+                self._statistics.average_aggregation_time_ms * (total_aggregations - 1) + aggregation_time_ms
             ) / total_aggregations
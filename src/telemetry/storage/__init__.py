@@ -7,6 +7,7 @@ JSON-based storage, retention management, and data lifecycle operations.
 
 from .storage_manager import StorageManager
 from .json_storage import JSONStorage
+from .segmented_storage import SegmentedJSONStorage
 from .retention_manager import RetentionManager
 from .cleanup import DataCleanup
 from .archival import DataArchival
@@ -20,6 +21,7 @@ from .logging import StorageTelemetryLogger, get_storage_logger, setup_storage_l
 __all__ = [
     "StorageManager",
     "JSONStorage",
+    "SegmentedJSONStorage",
     "RetentionManager",
     "DataCleanup",
     "DataArchival",
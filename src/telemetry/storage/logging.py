@@ -516,6 +516,11 @@ def get_storage_logger() -> StorageTelemetryLogger:
     return _storage_logger
 
 
+def get_telemetry_logger() -> StorageTelemetryLogger:
+    """Get the global storage logger (the name the storage modules import)"""
+    return get_storage_logger()
+
+
 def setup_storage_logging(
     name: str = "telemetry_storage",
     log_level: LogLevel = LogLevel.INFO,
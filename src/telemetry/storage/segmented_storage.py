@@ -0,0 +1,965 @@
+"""
+Segmented JSON Storage Backend
+
+Append-only storage mode for :class:`JSONStorage`. The day-file layout loads,
+re-sorts and rewrites the whole day's JSON array for every event, so a busy
+scraper's writes are O(n²) over a day. This backend instead appends one JSON
+line per event to the active segment:
+
+* ``segments/seg-00000001.ndjson`` — newline-delimited events in arrival
+  order; once a segment reaches ``segment_max_bytes`` it is sealed (gzipped
+  when ``compression_enabled``) and a new one is started;
+* ``segments/seg-00000001.idx.json`` — a small sidecar written at seal time
+  with the segment's time bounds, event count, and the selectors and
+  correlation IDs it contains. The active segment's index is rebuilt in
+  memory on startup from the (bounded) active file.
+
+Queries consult the sidecars first and only open the segments that can match:
+a time-range query reads the segments whose bounds overlap the range, and a
+selector or correlation lookup reads the segments that contain that key.
+Deletes rewrite only the affected segments, and retention drops whole
+segments that are entirely older than the cutoff.
+
+Segment file I/O (appends, reads, rewrites, seals) runs in the default
+executor, so a telemetry write or a full scan never blocks the event loop.
+
+Existing day files are converted with :meth:`SegmentedJSONStorage.migrate_day_files`
+or ``python -m src.telemetry.storage.segmented_storage migrate``.
+"""
+
+import argparse
+import asyncio
+import functools
+import gzip
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models import TelemetryEvent
+from ..configuration.telemetry_config import TelemetryConfiguration
+from ..exceptions import TelemetryStorageError
+from .json_storage import JSONStorage
+
+
+DEFAULT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+
+_SEGMENT_RE = re.compile(r"^seg-(\d{8})\.ndjson(\.gz)?$")
+_DAY_FILE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.json(\.gz)?$")
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an event timestamp as written by ``json.dumps(default=str)``."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+@dataclass
+class SegmentInfo:
+    """Sidecar index entry for one segment."""
+    seq: int
+    compressed: bool = False
+    sealed: bool = False
+    count: int = 0
+    size_bytes: int = 0
+    min_ts: Optional[datetime] = None
+    max_ts: Optional[datetime] = None
+    selectors: Set[str] = field(default_factory=set)
+    correlations: Set[str] = field(default_factory=set)
+
+    @property
+    def file_name(self) -> str:
+        return f"seg-{self.seq:08d}.ndjson" + (".gz" if self.compressed else "")
+
+    @property
+    def index_name(self) -> str:
+        return f"seg-{self.seq:08d}.idx.json"
+
+    def add(self, record: Dict[str, Any], timestamp: datetime, line_bytes: int) -> None:
+        """Account for one appended record."""
+        self.count += 1
+        self.size_bytes += line_bytes
+        if self.min_ts is None or timestamp < self.min_ts:
+            self.min_ts = timestamp
+        if self.max_ts is None or timestamp > self.max_ts:
+            self.max_ts = timestamp
+        if record.get("selector_name"):
+            self.selectors.add(record["selector_name"])
+        if record.get("correlation_id"):
+            self.correlations.add(record["correlation_id"])
+
+    def overlaps(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> bool:
+        """Whether any event in the segment can fall inside [start_time, end_time]."""
+        if self.count == 0:
+            return False
+        if start_time is not None and self.max_ts < start_time:
+            return False
+        if end_time is not None and self.min_ts > end_time:
+            return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "file": self.file_name,
+            "compressed": self.compressed,
+            "count": self.count,
+            "size_bytes": self.size_bytes,
+            "min_ts": self.min_ts.isoformat() if self.min_ts else None,
+            "max_ts": self.max_ts.isoformat() if self.max_ts else None,
+            "selectors": sorted(self.selectors),
+            "correlations": sorted(self.correlations),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SegmentInfo":
+        return cls(
+            seq=int(data["seq"]),
+            compressed=bool(data.get("compressed")),
+            sealed=True,
+            count=int(data.get("count", 0)),
+            size_bytes=int(data.get("size_bytes", 0)),
+            min_ts=_parse_timestamp(data["min_ts"]) if data.get("min_ts") else None,
+            max_ts=_parse_timestamp(data["max_ts"]) if data.get("max_ts") else None,
+            selectors=set(data.get("selectors", [])),
+            correlations=set(data.get("correlations", [])),
+        )
+
+
+class SegmentedJSONStorage(JSONStorage):
+    """
+    Append-only, segmented variant of the JSON storage backend.
+
+    Selected with ``json_layout: "segments"`` in the telemetry configuration;
+    shares the directory layout, interface and error codes of :class:`JSONStorage`.
+    """
+
+    def __init__(self, config: TelemetryConfiguration):
+        """
+        Initialize segmented JSON storage backend.
+
+        Args:
+            config: Telemetry configuration (``segment_max_bytes`` sets the
+                rollover size, ``compression_enabled`` gzips sealed segments)
+        """
+        self.segment_max_bytes = int(
+            config.get("segment_max_bytes", DEFAULT_SEGMENT_MAX_BYTES)
+        )
+        self._segments: List[SegmentInfo] = []
+        self._write_lock = asyncio.Lock()
+        super().__init__(config)
+
+    def _initialize_storage(self) -> None:
+        """Initialize directories and load the segment indexes."""
+        self.segments_dir = self.storage_path / "segments"
+        super()._initialize_storage()
+        try:
+            self.segments_dir.mkdir(parents=True, exist_ok=True)
+            self._load_segment_indexes()
+        except Exception as e:
+            raise TelemetryStorageError(
+                f"Failed to initialize segmented storage: {e}",
+                error_code="TEL-238"
+            ) from e
+
+    # Writes
+
+    async def store_event(self, event: TelemetryEvent) -> bool:
+        """
+        Append a telemetry event to the active segment.
+
+        Args:
+            event: TelemetryEvent to store
+
+        Returns:
+            True if successfully stored
+
+        Raises:
+            TelemetryStorageError: If storage fails
+        """
+        try:
+            await self._append_records([(event.dict(), event.timestamp)])
+            return True
+        except Exception as e:
+            self.logger.error(
+                "Failed to store event",
+                event_id=getattr(event, 'event_id', 'unknown'),
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to store event: {e}",
+                error_code="TEL-219"
+            ) from e
+
+    async def store_events_batch(self, events: List[TelemetryEvent]) -> int:
+        """
+        Append multiple telemetry events with one write per segment touched.
+
+        Args:
+            events: List of TelemetryEvents to store
+
+        Returns:
+            Number of events successfully stored
+
+        Raises:
+            TelemetryStorageError: If storage fails
+        """
+        if not events:
+            return 0
+
+        try:
+            return await self._append_records(
+                [(event.dict(), event.timestamp) for event in events]
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to store event batch",
+                batch_size=len(events),
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to store event batch: {e}",
+                error_code="TEL-220"
+            ) from e
+
+    # Reads
+
+    async def get_event(self, event_id: str) -> Optional[TelemetryEvent]:
+        """
+        Retrieve a telemetry event by ID, newest segments first.
+
+        Args:
+            event_id: Unique event identifier
+
+        Returns:
+            TelemetryEvent if found, None otherwise
+
+        Raises:
+            TelemetryStorageError: If retrieval fails
+        """
+        try:
+            for segment in reversed(list(self._segments)):
+                for event_data in await self._load_segment(segment):
+                    if event_data.get("event_id") == event_id:
+                        return TelemetryEvent(**event_data)
+            return None
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve event",
+                event_id=event_id,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to retrieve event {event_id}: {e}",
+                error_code="TEL-221"
+            ) from e
+
+    async def get_events_by_selector(
+        self,
+        selector_name: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[TelemetryEvent]:
+        """
+        Retrieve events for a selector from the segments that contain it.
+
+        Args:
+            selector_name: Name/identifier of the selector
+            start_time: Start time for query range
+            end_time: End time for query range
+            limit: Maximum number of events to return
+
+        Returns:
+            List of TelemetryEvents, oldest first
+
+        Raises:
+            TelemetryStorageError: If retrieval fails
+        """
+        try:
+            segments = [
+                s for s in self._segments
+                if selector_name in s.selectors and s.overlaps(start_time, end_time)
+            ]
+            return await self._query(
+                segments,
+                lambda d: d.get("selector_name") == selector_name,
+                start_time, end_time, limit
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve events by selector",
+                selector_name=selector_name,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to retrieve events for selector {selector_name}: {e}",
+                error_code="TEL-222"
+            ) from e
+
+    async def get_events_by_correlation(
+        self,
+        correlation_id: str,
+        limit: Optional[int] = None
+    ) -> List[TelemetryEvent]:
+        """
+        Retrieve events by correlation ID from the segments that contain it.
+
+        Args:
+            correlation_id: Correlation ID for operation tracking
+            limit: Maximum number of events to return
+
+        Returns:
+            List of TelemetryEvents, oldest first
+
+        Raises:
+            TelemetryStorageError: If retrieval fails
+        """
+        try:
+            segments = [s for s in self._segments if correlation_id in s.correlations]
+            return await self._query(
+                segments,
+                lambda d: d.get("correlation_id") == correlation_id,
+                None, None, limit
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve events by correlation",
+                correlation_id=correlation_id,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to retrieve events for correlation {correlation_id}: {e}",
+                error_code="TEL-223"
+            ) from e
+
+    async def get_events_by_time_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        selector_name: Optional[str] = None,
+        operation_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[TelemetryEvent]:
+        """
+        Retrieve events within a time range, reading only overlapping segments.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+            selector_name: Optional selector filter
+            operation_type: Optional operation type filter
+            limit: Maximum number of events to return
+
+        Returns:
+            List of TelemetryEvents, oldest first
+
+        Raises:
+            TelemetryStorageError: If retrieval fails
+        """
+        try:
+            segments = [
+                s for s in self._segments
+                if s.overlaps(start_time, end_time)
+                and (not selector_name or selector_name in s.selectors)
+            ]
+
+            def _match(event_data: Dict[str, Any]) -> bool:
+                if selector_name and event_data.get("selector_name") != selector_name:
+                    return False
+                if operation_type and event_data.get("operation_type") != operation_type:
+                    return False
+                return True
+
+            return await self._query(segments, _match, start_time, end_time, limit)
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve events by time range",
+                start_time=start_time,
+                end_time=end_time,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to retrieve events for time range: {e}",
+                error_code="TEL-224"
+            ) from e
+
+    async def get_failed_events(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[TelemetryEvent]:
+        """
+        Retrieve failed events.
+
+        Args:
+            start_time: Start time for query range
+            end_time: End time for query range
+            limit: Maximum number of events to return
+
+        Returns:
+            List of failed TelemetryEvents, oldest first
+
+        Raises:
+            TelemetryStorageError: If retrieval fails
+        """
+        try:
+            segments = [s for s in self._segments if s.overlaps(start_time, end_time)]
+            return await self._query(
+                segments,
+                lambda d: not (d.get("quality_metrics") or {}).get("success", True),
+                start_time, end_time, limit
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve failed events",
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to retrieve failed events: {e}",
+                error_code="TEL-225"
+            ) from e
+
+    # Deletes
+
+    async def delete_event(self, event_id: str) -> bool:
+        """
+        Delete a telemetry event by rewriting the segment that holds it.
+
+        Args:
+            event_id: Unique event identifier
+
+        Returns:
+            True if successfully deleted, False otherwise
+
+        Raises:
+            TelemetryStorageError: If deletion fails
+        """
+        try:
+            async with self._write_lock:
+                for segment in reversed(list(self._segments)):
+                    removed = await self._rewrite_segment(
+                        segment, lambda d, _ts: d.get("event_id") != event_id
+                    )
+                    if removed:
+                        return True
+            return False
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete event",
+                event_id=event_id,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to delete event {event_id}: {e}",
+                error_code="TEL-228"
+            ) from e
+
+    async def delete_events_by_selector(
+        self,
+        selector_name: str,
+        before_time: Optional[datetime] = None
+    ) -> int:
+        """
+        Delete events for a selector.
+
+        Args:
+            selector_name: Name/identifier of the selector
+            before_time: Delete events before this time
+
+        Returns:
+            Number of events deleted
+
+        Raises:
+            TelemetryStorageError: If deletion fails
+        """
+        try:
+            def _keep(event_data: Dict[str, Any], ts: datetime) -> bool:
+                if event_data.get("selector_name") != selector_name:
+                    return True
+                return before_time is not None and ts >= before_time
+
+            deleted_count = 0
+            async with self._write_lock:
+                for segment in list(self._segments):
+                    if selector_name not in segment.selectors:
+                        continue
+                    if before_time is not None and segment.min_ts >= before_time:
+                        continue
+                    deleted_count += await self._rewrite_segment(segment, _keep)
+            return deleted_count
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete events by selector",
+                selector_name=selector_name,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to delete events for selector {selector_name}: {e}",
+                error_code="TEL-229"
+            ) from e
+
+    async def delete_events_by_time_range(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> int:
+        """
+        Delete events within a time range.
+
+        Segments entirely inside the range are unlinked without being read;
+        segments that straddle a bound are rewritten.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            Number of events deleted
+
+        Raises:
+            TelemetryStorageError: If deletion fails
+        """
+        try:
+            deleted_count = 0
+            async with self._write_lock:
+                for segment in list(self._segments):
+                    if not segment.overlaps(start_time, end_time):
+                        continue
+                    if (segment.sealed and start_time <= segment.min_ts
+                            and segment.max_ts <= end_time):
+                        deleted_count += segment.count
+                        self._drop_segment(segment)
+                        continue
+                    deleted_count += await self._rewrite_segment(
+                        segment, lambda _d, ts: not (start_time <= ts <= end_time)
+                    )
+            return deleted_count
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete events by time range",
+                start_time=start_time,
+                end_time=end_time,
+                error=str(e)
+            )
+            raise TelemetryStorageError(
+                f"Failed to delete events for time range: {e}",
+                error_code="TEL-230"
+            ) from e
+
+    # Maintenance
+
+    async def get_storage_statistics(self) -> Dict[str, Any]:
+        """
+        Get storage statistics from the segment indexes (no segment is read).
+
+        Returns:
+            Storage statistics including total events, size, etc.
+        """
+        try:
+            total_size = sum(
+                (self.segments_dir / s.file_name).stat().st_size
+                for s in self._segments
+                if (self.segments_dir / s.file_name).exists()
+            )
+            return {
+                "total_events": sum(s.count for s in self._segments),
+                "total_size_bytes": total_size,
+                "total_size_mb": total_size / (1024 * 1024),
+                "file_count": len(self._segments),
+                "sealed_segments": sum(1 for s in self._segments if s.sealed),
+                "segment_max_bytes": self.segment_max_bytes,
+                "compression_enabled": self.compression_enabled,
+                "storage_path": str(self.storage_path),
+                "layout": "segments",
+                "index_loaded": True
+            }
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to get storage statistics",
+                error=str(e)
+            )
+            return {}
+
+    async def migrate_day_files(self, remove_source: bool = False) -> Dict[str, int]:
+        """
+        Append every legacy day file (``events/YYYY-MM-DD.json[.gz]``) to the segments.
+
+        Files are migrated oldest day first and renamed to ``*.migrated`` (or
+        deleted with ``remove_source``) once appended, so a re-run only
+        picks up what is left.
+
+        Args:
+            remove_source: Delete day files instead of renaming them
+
+        Returns:
+            Counts of files and events migrated and records skipped
+
+        Raises:
+            TelemetryStorageError: If migration fails
+        """
+        results = {"files_migrated": 0, "events_migrated": 0, "records_skipped": 0}
+        day_files = sorted(
+            p for p in self.events_dir.iterdir() if _DAY_FILE_RE.match(p.name)
+        )
+
+        try:
+            for file_path in day_files:
+                records = []
+                for event_data in await self._run_io(self._read_day_file, file_path):
+                    try:
+                        records.append((event_data, _parse_timestamp(event_data["timestamp"])))
+                    except (KeyError, TypeError, ValueError):
+                        results["records_skipped"] += 1
+                records.sort(key=lambda r: r[1])
+                results["events_migrated"] += await self._append_records(records)
+
+                if remove_source:
+                    file_path.unlink()
+                else:
+                    file_path.rename(file_path.with_name(file_path.name + ".migrated"))
+                results["files_migrated"] += 1
+
+            self.logger.info("Day files migrated to segments", **results)
+            return results
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to migrate day files",
+                error=str(e),
+                **results
+            )
+            raise TelemetryStorageError(
+                f"Failed to migrate day files: {e}",
+                error_code="TEL-239"
+            ) from e
+
+    # Private methods
+
+    async def _ensure_index_loaded(self) -> None:
+        """Segment indexes are loaded at construction."""
+
+    async def _rebuild_indexes(self) -> None:
+        """Rebuild every segment sidecar from the segment files."""
+        async with self._write_lock:
+            for index_file in self.segments_dir.glob("seg-*.idx.json"):
+                index_file.unlink()
+            await self._run_io(self._load_segment_indexes)
+
+    def _get_event_files(self) -> List[Path]:
+        """Get all segment files, oldest first."""
+        return [self.segments_dir / s.file_name for s in self._segments]
+
+    async def _load_events_file(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Load events from a segment file (or a legacy file via the base loader)."""
+        match = _SEGMENT_RE.match(file_path.name)
+        if not match:
+            return await super()._load_events_file(file_path)
+        return await self._run_io(
+            lambda: list(self._iter_lines(file_path, bool(match.group(2))))
+        )
+
+    async def _cleanup_empty_files(self) -> int:
+        """Remove empty sealed segments."""
+        removed_count = 0
+        async with self._write_lock:
+            for segment in list(self._segments):
+                if segment.sealed and segment.count == 0:
+                    self._drop_segment(segment)
+                    removed_count += 1
+        return removed_count
+
+    def _active_segment(self) -> SegmentInfo:
+        if not self._segments or self._segments[-1].sealed:
+            next_seq = self._segments[-1].seq + 1 if self._segments else 1
+            self._segments.append(SegmentInfo(seq=next_seq))
+        return self._segments[-1]
+
+    async def _append_records(self, records: Iterable[Tuple[Dict[str, Any], datetime]]) -> int:
+        """Append records to the active segment, rolling over at ``segment_max_bytes``."""
+        stored_count = 0
+        async with self._write_lock:
+            pending: List[str] = []
+            segment = self._active_segment()
+            for record, timestamp in records:
+                line = json.dumps(record, default=str, separators=(",", ":")) + "\n"
+                pending.append(line)
+                segment.add(record, timestamp, len(line.encode("utf-8")))
+                stored_count += 1
+                if segment.size_bytes >= self.segment_max_bytes:
+                    await self._run_io(self._write_lines, segment, pending)
+                    pending = []
+                    await self._seal(segment)
+                    segment = self._active_segment()
+            if pending:
+                await self._run_io(self._write_lines, segment, pending)
+        return stored_count
+
+    async def _run_io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking file I/O in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(fn, *args)
+        )
+
+    def _write_lines(self, segment: SegmentInfo, lines: List[str]) -> None:
+        with open(self.segments_dir / segment.file_name, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+
+    async def _seal(self, segment: SegmentInfo) -> None:
+        """Close a segment: compress it if configured and write its sidecar."""
+        if self.compression_enabled and not segment.compressed:
+            plain = self.segments_dir / segment.file_name
+            await self._run_io(self._gzip_file, plain)
+            segment.compressed = True
+        segment.sealed = True
+        await self._run_io(self._write_sidecar, segment)
+        self.logger.debug(
+            "Segment sealed",
+            segment=segment.file_name,
+            events=segment.count,
+            size_bytes=segment.size_bytes
+        )
+
+    @staticmethod
+    def _gzip_file(plain: Path) -> None:
+        with open(plain, "rb") as src, gzip.open(f"{plain}.gz.tmp", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(f"{plain}.gz.tmp", f"{plain}.gz")
+        plain.unlink()
+
+    def _write_sidecar(self, segment: SegmentInfo) -> None:
+        index_file = self.segments_dir / segment.index_name
+        tmp = index_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(segment.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, index_file)
+
+    def _drop_segment(self, segment: SegmentInfo) -> None:
+        for name in (segment.file_name, segment.index_name):
+            (self.segments_dir / name).unlink(missing_ok=True)
+        self._segments.remove(segment)
+
+    async def _rewrite_segment(
+        self,
+        segment: SegmentInfo,
+        keep: Callable[[Dict[str, Any], datetime], bool]
+    ) -> int:
+        """Rewrite a segment with only the records ``keep`` accepts; returns the number removed."""
+        kept: List[Tuple[Dict[str, Any], datetime]] = []
+        removed = 0
+        for event_data in await self._load_segment(segment):
+            try:
+                ts = _parse_timestamp(event_data["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                kept.append((event_data, None))
+                continue
+            if keep(event_data, ts):
+                kept.append((event_data, ts))
+            else:
+                removed += 1
+        if not removed:
+            return 0
+
+        path = self.segments_dir / segment.file_name
+        rebuilt = SegmentInfo(seq=segment.seq, compressed=segment.compressed, sealed=segment.sealed)
+        lines = []
+        for event_data, ts in kept:
+            line = json.dumps(event_data, default=str, separators=(",", ":")) + "\n"
+            lines.append(line)
+            if ts is not None:
+                rebuilt.add(event_data, ts, len(line.encode("utf-8")))
+
+        await self._run_io(self._replace_file, path, "".join(lines), segment.compressed)
+
+        self._segments[self._segments.index(segment)] = rebuilt
+        if rebuilt.sealed:
+            await self._run_io(self._write_sidecar, rebuilt)
+        return removed
+
+    @staticmethod
+    def _replace_file(path: Path, text: str, compressed: bool) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        opener = gzip.open if compressed else open
+        with opener(tmp, "wt", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    async def _query(
+        self,
+        segments: List[SegmentInfo],
+        match: Callable[[Dict[str, Any]], bool],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int]
+    ) -> List[TelemetryEvent]:
+        """Scan ``segments`` oldest first, collecting matching events in time order."""
+        events = []
+        ordered = sorted(segments, key=lambda s: (s.min_ts, s.seq))
+        for position, segment in enumerate(ordered):
+            for event_data in await self._load_segment(segment):
+                if not match(event_data):
+                    continue
+                if start_time or end_time:
+                    event_time = _parse_timestamp(event_data["timestamp"])
+                    if start_time and event_time < start_time:
+                        continue
+                    if end_time and event_time > end_time:
+                        continue
+                events.append(TelemetryEvent(**event_data))
+            # Segments are visited in min_ts order: once ``limit`` events are
+            # in hand, a segment starting after the limit-th oldest cannot
+            # contribute, and neither can any after it.
+            if limit and len(events) >= limit:
+                events.sort(key=lambda x: x.timestamp)
+                events = events[:limit]
+                following = ordered[position + 1:position + 2]
+                if not following or following[0].min_ts > events[-1].timestamp:
+                    break
+
+        events.sort(key=lambda x: x.timestamp)
+        return events[:limit] if limit else events
+
+    async def _load_segment(self, segment: SegmentInfo) -> List[Dict[str, Any]]:
+        """Every record of a segment, read in the executor."""
+        return await self._run_io(lambda: list(self._read_segment(segment)))
+
+    def _read_segment(self, segment: SegmentInfo) -> Iterable[Dict[str, Any]]:
+        return self._iter_lines(self.segments_dir / segment.file_name, segment.compressed)
+
+    def _iter_lines(self, path: Path, compressed: bool) -> Iterable[Dict[str, Any]]:
+        """Yield records from a segment, skipping a torn trailing line."""
+        if not path.exists():
+            return
+        opener = gzip.open if compressed else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                # No newline yet: an append still in flight in another
+                # executor thread (or a torn tail) — not a record
+                if not line.endswith("\n") or not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(
+                        "Skipping unreadable segment line",
+                        file_path=str(path)
+                    )
+
+    def _read_day_file(self, file_path: Path) -> List[Dict[str, Any]]:
+        if file_path.name.endswith(".gz"):
+            with gzip.open(file_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _load_segment_indexes(self) -> None:
+        """Load sidecars; rebuild the index of any segment that has none."""
+        segments: Dict[int, SegmentInfo] = {}
+        for path in self.segments_dir.iterdir():
+            match = _SEGMENT_RE.match(path.name)
+            if not match:
+                continue
+            seq, compressed = int(match.group(1)), bool(match.group(2))
+            index_file = self.segments_dir / f"seg-{seq:08d}.idx.json"
+            info = None
+            if index_file.exists():
+                try:
+                    info = SegmentInfo.from_dict(json.loads(index_file.read_text(encoding="utf-8")))
+                except (ValueError, KeyError):
+                    self.logger.warning("Rebuilding unreadable segment index", file_path=str(index_file))
+            if info is None:
+                info = self._scan_segment(path, seq, compressed)
+            segments[seq] = info
+
+        self._segments = [segments[seq] for seq in sorted(segments)]
+        # Everything but the newest plain segment is sealed: a crash between a
+        # rollover and its sidecar write leaves an unindexed older segment.
+        for segment in self._segments[:-1]:
+            if not segment.sealed:
+                segment.sealed = True
+                self._write_sidecar(segment)
+        if self._segments and self._segments[-1].compressed and not self._segments[-1].sealed:
+            self._segments[-1].sealed = True
+            self._write_sidecar(self._segments[-1])
+        if self._segments and not self._segments[-1].sealed:
+            # A crash mid-append leaves a torn last line; the next append
+            # would be glued onto it and lost with it.
+            self._truncate_torn_tail(self.segments_dir / self._segments[-1].file_name)
+        self._index_loaded = True
+
+    def _truncate_torn_tail(self, path: Path) -> None:
+        """Cut the active segment back to its last complete line."""
+        with open(path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            if position < end:
+                f.truncate(position)
+                self.logger.warning(
+                    "Truncated torn segment tail",
+                    file_path=str(path),
+                    bytes_removed=end - position
+                )
+
+    def _scan_segment(self, path: Path, seq: int, compressed: bool) -> SegmentInfo:
+        info = SegmentInfo(seq=seq, compressed=compressed)
+        for event_data in self._iter_lines(path, compressed):
+            try:
+                ts = _parse_timestamp(event_data["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            line_bytes = len(json.dumps(event_data, default=str, separators=(",", ":"))) + 1
+            info.add(event_data, ts, line_bytes)
+        return info
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: ``migrate`` legacy day files into segments."""
+    parser = argparse.ArgumentParser(
+        description="Segmented telemetry storage maintenance"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="Convert day files into append-only segments")
+    migrate.add_argument("--storage-path", help="Telemetry storage path (default: configured)")
+    migrate.add_argument("--segment-max-bytes", type=int, default=DEFAULT_SEGMENT_MAX_BYTES)
+    migrate.add_argument("--no-compression", action="store_true",
+                         help="Keep sealed segments uncompressed")
+    migrate.add_argument("--remove-source", action="store_true",
+                         help="Delete day files instead of renaming them to *.migrated")
+    args = parser.parse_args(argv)
+
+    overrides: Dict[str, Any] = {"segment_max_bytes": args.segment_max_bytes}
+    if args.storage_path:
+        overrides["storage_path"] = args.storage_path
+    if args.no_compression:
+        overrides["compression_enabled"] = False
+    storage = SegmentedJSONStorage(TelemetryConfiguration(overrides))
+    results = asyncio.run(storage.migrate_day_files(remove_source=args.remove_source))
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
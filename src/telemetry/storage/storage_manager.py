@@ -57,19 +57,26 @@ class StorageManager(ITelemetryStorage):
         # Initialize backends
         self._initialize_backends()
     
+    @staticmethod
+    def _create_json_backend(config: TelemetryConfiguration) -> ITelemetryStorage:
+        """Create the JSON backend for the configured ``json_layout``."""
+        if config.get("json_layout", "day_files") == "segments":
+            from .segmented_storage import SegmentedJSONStorage
+            return SegmentedJSONStorage(config)
+        from .json_storage import JSONStorage
+        return JSONStorage(config)
+    
     def _initialize_backends(self) -> None:
         """Initialize storage backends based on configuration."""
         storage_type = self.config.get("storage_type", "json")
         
         try:
             if storage_type == "json":
-                from .json_storage import JSONStorage
-                self._primary_backend = JSONStorage(self.config)
+                self._primary_backend = self._create_json_backend(self.config)
             elif storage_type == "influxdb":
                 # InfluxDB backend would be implemented here
                 self.logger.warning("InfluxDB backend not yet implemented, using JSON fallback")
-                from .json_storage import JSONStorage
-                self._primary_backend = JSONStorage(self.config)
+                self._primary_backend = self._create_json_backend(self.config)
             else:
                 raise TelemetryStorageError(
                     f"Unsupported storage type: {storage_type}",
@@ -78,9 +85,8 @@ class StorageManager(ITelemetryStorage):
             
             # Add JSON storage as fallback
             if storage_type != "json":
-                from .json_storage import JSONStorage
                 fallback_config = TelemetryConfiguration({"storage_type": "json"})
-                self._fallback_backends.append(JSONStorage(fallback_config))
+                self._fallback_backends.append(self._create_json_backend(fallback_config))
             
             self.logger.info(
                 "Storage backends initialized",
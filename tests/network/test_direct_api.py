@@ -14,6 +14,7 @@ from src.network.direct_api.client import (
     RateLimiter,
     PreparedRequest,
     gather_requests,
+    stream_requests,
 )
 from src.network.direct_api.interfaces import AuthConfig
 from src.network.direct_api.metadata import ResponseMetadata
@@ -733,3 +734,99 @@ class TestGatherConcurrency:
         # We assert < 0.4s to verify concurrent execution (0.5s sequential would fail)
         assert elapsed < 0.4, f"Requests took {elapsed}s, expected < 0.4s for concurrent execution"
         assert len(results) == 5
+
+
+@pytest.mark.unit
+class TestBoundedConcurrency:
+    """Tests for max_concurrency and the streaming stream_requests variant."""
+
+    @staticmethod
+    def _client_with_delays(delays: dict[str, float]) -> tuple[AsyncHttpClient, dict]:
+        """A client whose requests sleep per-URL and record the peak in-flight count."""
+        client = AsyncHttpClient()
+        stats = {"in_flight": 0, "peak": 0, "started": []}
+
+        async def mock_request(**kwargs):
+            url = kwargs.get("url", "")
+            stats["started"].append(url)
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            try:
+                await asyncio.sleep(delays.get(url, 0.01))
+            finally:
+                stats["in_flight"] -= 1
+            mock_response = MagicMock(spec=httpx.Response)
+            mock_response.status_code = 200
+            mock_response.headers = {"x-url": url}
+            return mock_response
+
+        client._client.request = mock_request
+        return client, stats
+
+    @pytest.mark.asyncio
+    async def test_gather_caps_in_flight_and_keeps_order(self) -> None:
+        """Test that gather with max_concurrency never exceeds the cap and keeps input order."""
+        urls = [f"https://example{i}.com/" for i in range(12)]
+        client, stats = self._client_with_delays({urls[0]: 0.05})
+        prepared = [client.get(u).prepare() for u in urls]
+
+        results = await gather_requests(*prepared, max_concurrency=3)
+
+        assert stats["peak"] == 3
+        assert [r[0].headers["x-url"] for r in results] == urls
+        # Per-domain rate limiting still applies to every request
+        assert len(client._rate_limiter._buckets) == 12
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self) -> None:
+        """Test that stream_requests yields (index, result) as each request completes."""
+        urls = ["https://slow.com/", "https://fast.com/", "https://fail.com/"]
+        client, _ = self._client_with_delays({urls[0]: 0.1})
+        original = client._client.request
+
+        async def failing(**kwargs):
+            if "fail" in kwargs.get("url", ""):
+                raise httpx.ConnectError("refused")
+            return await original(**kwargs)
+
+        client._client.request = failing
+        prepared = [client.get(u).prepare() for u in urls]
+
+        seen = [(i, r) async for i, r in stream_requests(prepared, max_concurrency=3)]
+
+        assert [i for i, _ in seen][-1] == 0                 # the slow one finishes last
+        assert sorted(i for i, _ in seen) == [0, 1, 2]
+        failed = dict(seen)[2]
+        assert isinstance(failed, NetworkError) and failed.url == urls[2]
+
+    @pytest.mark.asyncio
+    async def test_stream_consumes_lazily_and_cancels_on_break(self) -> None:
+        """Test that breaking out of stream_requests cancels in-flight requests and starts no more."""
+        delays = {f"https://example{i}.com/": 1.0 for i in range(1, 8)}
+        client, stats = self._client_with_delays(delays)
+        pulled = []
+
+        def requests():
+            for i in range(1000):
+                pulled.append(i)
+                yield client.get(f"https://example{i}.com/").prepare()
+
+        stream = stream_requests(requests(), max_concurrency=4)
+        async for _index, _result in stream:
+            break
+        await stream.aclose()
+
+        assert stats["in_flight"] == 0
+        assert len(pulled) == 5                              # the cap, plus one refill
+        assert len(stats["started"]) <= len(pulled)
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_concurrency_raises(self) -> None:
+        """Test that max_concurrency below 1 is rejected."""
+        client = AsyncHttpClient()
+        prepared = client.get("https://example.com/").prepare()
+        with pytest.raises(ValueError):
+            await gather_requests(prepared, max_concurrency=0)
+        with pytest.raises(ValueError):
+            async for _ in stream_requests([prepared], max_concurrency=0):
+                pass
@@ -0,0 +1,176 @@
+"""Unit tests for the HTTP response cache (src/network/direct_api/http_cache.py)."""
+
+import httpx
+import pytest
+
+from src.network.direct_api.client import AsyncHttpClient
+from src.network.direct_api.http_cache import CacheStatus, HttpCache, parse_cache_control
+from src.network.direct_api.wrapper import DirectApi, OutputFormat
+
+
+class FakeServer:
+    """Records requests and answers them from a per-URL handler."""
+
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        self.requests: list[dict] = []
+
+    async def request(self, **kwargs) -> httpx.Response:
+        self.requests.append(kwargs)
+        status, headers, body = self.handler(kwargs)
+        return httpx.Response(
+            status,
+            headers=headers,
+            content=body,
+            request=httpx.Request(kwargs["method"], kwargs["url"]),
+        )
+
+
+class Clock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(handler, **cache_kwargs) -> tuple[AsyncHttpClient, FakeServer, Clock]:
+    clock = Clock()
+    client = AsyncHttpClient(cache=HttpCache(clock=clock, **cache_kwargs))
+    server = FakeServer(handler)
+    client._client.request = server.request
+    return client, server, clock
+
+
+@pytest.mark.unit
+class TestHttpCacheFreshness:
+    """Tests for Cache-Control driven freshness."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_without_a_request(self) -> None:
+        """Test that a response within max-age is answered from cache."""
+        client, server, clock = _client(lambda r: (200, {"cache-control": "max-age=60"}, b"sports"))
+
+        first, meta1 = await client.get("https://feed.example.com/sports").execute()
+        clock.now += 30
+        second, meta2 = await client.get("https://feed.example.com/sports").execute()
+
+        assert len(server.requests) == 1
+        assert second.content == first.content == b"sports"
+        assert (meta1.cache_status, meta2.cache_status) == ("miss", "hit")
+        assert (meta2.cache_hits, meta2.cache_revalidations, meta2.cache_misses) == (1, 0, 1)
+        # A hit consumes no rate limit token
+        assert client._rate_limiter._buckets["feed.example.com"].tokens == pytest.approx(9, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_revalidated_with_validators(self) -> None:
+        """Test that a stale entry sends If-None-Match/If-Modified-Since and serves a 304."""
+        last_modified = "Mon, 01 Jun 2026 10:00:00 GMT"
+
+        def handler(request):
+            if request["headers"].get("If-None-Match") == '"v1"':
+                return 304, {"etag": '"v1"', "cache-control": "max-age=10"}, b""
+            return 200, {"etag": '"v1"', "last-modified": last_modified,
+                         "cache-control": "max-age=10"}, b"page"
+
+        client, server, clock = _client(handler)
+        await client.get("https://en.wikipedia.org/wiki/Main").execute()
+        clock.now += 11
+        response, metadata = await client.get("https://en.wikipedia.org/wiki/Main").execute()
+
+        assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert server.requests[1]["headers"]["If-Modified-Since"] == last_modified
+        assert response.status_code == 200 and response.content == b"page"
+        assert metadata.cache_status == CacheStatus.REVALIDATED.value
+        assert metadata.cache_revalidations == 1
+        # The 304 restarted the freshness clock
+        clock.now += 5
+        _, metadata = await client.get("https://en.wikipedia.org/wiki/Main").execute()
+        assert metadata.cache_status == "hit" and len(server.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_control_directives_are_honoured(self) -> None:
+        """Test no-store responses, request no-cache and unsafe-method invalidation."""
+        def handler(request):
+            if "private" in request["url"]:
+                return 200, {"cache-control": "no-store", "etag": '"x"'}, b"secret"
+            if request["headers"].get("If-None-Match"):
+                return 304, {}, b""
+            return 200, {"cache-control": "max-age=300", "etag": '"x"'}, b"list"
+
+        client, server, _ = _client(handler)
+        for _ in range(2):
+            await client.get("https://api.example.com/private").execute()
+        assert len(server.requests) == 2
+
+        await client.get("https://api.example.com/list").execute()
+        _, metadata = await client.get("https://api.example.com/list").header(
+            "Cache-Control", "no-cache").execute()
+        assert metadata.cache_status == "revalidated"
+
+        await client.post("https://api.example.com/list").body("x").execute()
+        _, metadata = await client.get("https://api.example.com/list").execute()
+        assert metadata.cache_status == "miss"
+        assert "If-None-Match" not in server.requests[-1]["headers"]
+
+    @pytest.mark.asyncio
+    async def test_entries_are_keyed_by_vary_headers(self) -> None:
+        """Test that requests differing in a Vary header get separate entries."""
+        def handler(request):
+            lang = request["headers"].get("Accept-Language", "")
+            return 200, {"cache-control": "max-age=60", "vary": "Accept-Language"}, lang.encode()
+
+        client, server, _ = _client(handler)
+        for lang in ("en", "de", "en", "de"):
+            response, _ = await client.get("https://api.example.com/x").header(
+                "Accept-Language", lang).execute()
+            assert response.content == lang.encode()
+        assert len(server.requests) == 2
+
+    def test_parse_cache_control(self) -> None:
+        """Test Cache-Control parsing of flags and quoted arguments."""
+        assert parse_cache_control('No-Cache, max-age="60" , private') == {
+            "no-cache": None, "max-age": "60", "private": None}
+        assert parse_cache_control(None) == {}
+
+
+@pytest.mark.unit
+class TestHttpCacheStorage:
+    """Tests for the memory bound, the disk store and DirectApi integration."""
+
+    @pytest.mark.asyncio
+    async def test_disk_store_survives_a_new_cache_and_memory_is_bounded(self, tmp_path) -> None:
+        """Test that evicted and restarted caches are served from disk."""
+        headers = {"cache-control": "max-age=600", "content-encoding": "identity"}
+        client, server, clock = _client(lambda r: (200, headers, r["url"].encode()),
+                                        max_entries=2, directory=tmp_path)
+        urls = [f"https://api.example.com/{i}" for i in range(3)]
+        for url in urls:
+            await client.get(url).execute()
+        assert len(client._cache) == 2
+
+        fresh = HttpCache(directory=tmp_path, clock=clock)
+        client._cache = fresh
+        for url in urls:
+            response, metadata = await client.get(url).execute()
+            assert metadata.cache_status == "hit" and response.content == url.encode()
+            assert "content-encoding" not in response.headers
+        assert len(server.requests) == 3
+
+        fresh.clear()
+        assert not list(tmp_path.glob("*.entry"))
+
+    @pytest.mark.asyncio
+    async def test_direct_api_uses_the_cache(self) -> None:
+        """Test that DirectApi passes its cache to the client and keeps it across sessions."""
+        cache = HttpCache()
+        server = FakeServer(lambda r: (200, {"cache-control": "max-age=60"}, b'{"ok": true}'))
+        api = DirectApi(cache=cache, output=OutputFormat.STATUS)
+        for _ in range(2):
+            async with api:
+                api._client._client.request = server.request
+                assert await api.get("https://api.github.com/repos/x/y") == 200
+        assert len(server.requests) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
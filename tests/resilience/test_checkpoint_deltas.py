@@ -0,0 +1,142 @@
+"""
+Delta Checkpoint Tests
+
+Tests for delta chains, compaction, replay and persisted sequence numbers
+in the checkpoint manager.
+"""
+
+import copy
+import json
+import random
+
+import pytest
+
+from src.resilience.checkpoint.checkpoint_manager import CheckpointManager
+from src.resilience.config import get_configuration
+from src.resilience.exceptions import CheckpointCorruptionError
+
+
+def _job_state(step: int) -> dict:
+    rng = random.Random(0)
+    return {
+        "progress": {"page": step, "total": 500},
+        "state": {
+            f"match_{i}": {"odds": [round(rng.uniform(1, 10), 2) for _ in range(3)], "seen": i <= step}
+            for i in range(200)
+        },
+        "configuration": {"site": "flashscore"},
+        "metrics": {"requests": step * 10},
+        "artifacts": [f"page_{i}.html" for i in range(step)],
+    }
+
+
+@pytest.fixture
+async def manager(tmp_path, monkeypatch):
+    # The default resilience configuration is saved to the working directory
+    monkeypatch.chdir(tmp_path)
+    manager = CheckpointManager(str(tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_deltas_store_changed_keys_and_replay_from_disk(manager, tmp_path):
+    states, ids = [], []
+    state = _job_state(1)
+    for step in range(1, 6):
+        state = copy.deepcopy(state)
+        state["progress"]["page"] = step
+        state["state"][f"match_{step}"]["seen"] = True
+        state["artifacts"].append(f"extra_{step}.html")
+        if step == 4:
+            del state["metrics"]["requests"]
+        states.append(state)
+        ids.append(await manager.create_checkpoint("job-1", state))
+
+    full, *deltas = [manager._active_checkpoints[cid] for cid in ids]
+    assert full.checkpoint_type.value == "full"
+    assert all(cp.checkpoint_type.value == "incremental" for cp in deltas)
+    assert all(cp.base_checkpoint_id == full.id for cp in deltas)
+    assert deltas[0].delta["state"]["set"] == {"match_2": {**state["state"]["match_2"], "seen": True}}
+    assert deltas[0].delta["artifacts"] == {"append": ["extra_2.html"]}
+    assert deltas[2].delta["metrics"] == {"set": {}, "unset": ["requests"]}
+    assert max(cp.compressed_size_bytes for cp in deltas) * 4 < full.compressed_size_bytes
+
+    # A fresh manager restores every checkpoint from its base plus the deltas
+    restored = CheckpointManager(str(tmp_path))
+    for cid, expected in zip(ids, states):
+        assert await restored.load_checkpoint(cid) == json.loads(json.dumps(expected))
+    await restored.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_compaction_starts_a_new_full_checkpoint(manager, monkeypatch):
+    monkeypatch.setattr(get_configuration().checkpoint, "compaction_interval", 2)
+    ids = [await manager.create_checkpoint("job-2", _job_state(step)) for step in range(1, 8)]
+    types = [manager._active_checkpoints[cid].checkpoint_type.value[0] for cid in ids]
+    assert "".join(types) == "fiifiif"
+
+    # Rewriting most of the state compacts early
+    monkeypatch.setattr(get_configuration().checkpoint, "compaction_interval", 20)
+    state = _job_state(1)
+    state["state"] = {key: {"odds": []} for key in state["state"]}
+    cid = await manager.create_checkpoint("job-2", state)
+    assert manager._active_checkpoints[cid].checkpoint_type.value == "incremental"
+    cid = await manager.create_checkpoint("job-2", _job_state(1))
+    assert manager._active_checkpoints[cid].checkpoint_type.value == "full"
+    assert await manager.load_checkpoint(cid) == _job_state(1)
+
+
+@pytest.mark.asyncio
+async def test_sequence_counter_is_persisted_and_broken_chains_are_detected(manager, tmp_path):
+    ids = [await manager.create_checkpoint("job-3", _job_state(step)) for step in range(1, 4)]
+    assert (tmp_path / "job-3.seq").read_text() == "3"
+
+    async def no_listing(*args, **kwargs):
+        raise AssertionError("sequence allocation must not list checkpoints")
+
+    restarted = CheckpointManager(str(tmp_path))
+    restarted.list_checkpoints = no_listing
+    new_id = await restarted.create_checkpoint("job-3", _job_state(4))
+    assert restarted._active_checkpoints[new_id].sequence_number == 4
+    # A restarted manager has no chain to extend, so it starts with a full checkpoint
+    assert restarted._active_checkpoints[new_id].checkpoint_type.value == "full"
+
+    # A base that later deltas replay from is not deleted...
+    assert not await restarted.delete_checkpoint(ids[0])
+    assert await restarted.load_checkpoint(ids[2]) == _job_state(3)
+    # ...but a chain broken out of band is detected
+    (tmp_path / f"{ids[0]}.json").unlink()
+    restarted._active_checkpoints.pop(ids[0], None)
+    with pytest.raises(CheckpointCorruptionError):
+        await restarted.load_checkpoint(ids[2])
+    await restarted.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_missing_counter_is_seeded_from_the_checkpoint_files(manager, tmp_path):
+    for step in range(1, 4):
+        await manager.create_checkpoint("job-4", _job_state(step))
+    await manager.create_checkpoint("job-5", _job_state(1))
+    (tmp_path / "job-4.seq").unlink()
+
+    restarted = CheckpointManager(str(tmp_path))
+    new_id = await restarted.create_checkpoint("job-4", _job_state(4))
+    assert restarted._active_checkpoints[new_id].sequence_number == 4
+    assert (tmp_path / "job-4.seq").read_text() == "4"
+    listed = await restarted.list_checkpoints("job-4")
+    assert [cp["sequence_number"] for cp in listed] == [4, 3, 2, 1]
+    assert listed[0]["id"] == new_id
+    await restarted.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chains_are_deleted_newest_first(manager):
+    ids = [await manager.create_checkpoint("job-6", _job_state(step)) for step in range(1, 4)]
+
+    assert not await manager.delete_checkpoint(ids[1])          # mid-chain delta
+    assert await manager.delete_checkpoint(ids[2])
+    assert await manager.delete_checkpoint(ids[1])
+    assert await manager.delete_checkpoint(ids[0])
+    assert await manager.list_checkpoints("job-6") == []
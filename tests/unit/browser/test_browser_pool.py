@@ -0,0 +1,269 @@
+"""
+Unit tests for the warm browser pool.
+
+Fake browsers/contexts stand in for Playwright; a memory probe dict stands in
+for the browser process RSS.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from src.browser.pool import BrowserPool, BrowserPoolConfig
+from src.browser.session import BrowserSession
+from src.utils.exceptions import BrowserManagerError
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.warmed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, name):
+        self.name = name
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeLauncher:
+    def __init__(self):
+        self.browsers = []
+
+    async def __call__(self):
+        browser = FakeBrowser(f"b{len(self.browsers)}")
+        self.browsers.append(browser)
+        return browser
+
+
+async def _warmup(context):
+    context.warmed = True
+
+
+async def _settle():
+    # Let the replenish task react to the wakeup.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _pool(memory=None, **config):
+    launcher = FakeLauncher()
+    memory = memory if memory is not None else {}
+    pool = BrowserPool(
+        pool_config=BrowserPoolConfig(**{"browsers": 1, "warm_contexts": 2,
+                                         "memory_threshold_mb": 500, **config}),
+        context_options={"locale": "en-GB"},
+        warmup=_warmup,
+        launcher=launcher,
+        memory_probe=lambda browser: memory.get(browser.name),
+    )
+    return pool, launcher
+
+
+@pytest.mark.asyncio
+async def test_start_prelaunches_and_leases_are_warm():
+    pool, launcher = _pool()
+    await pool.start()
+    try:
+        assert len(launcher.browsers) == 1
+        assert pool.stats()["idle_contexts"] == 2
+
+        lease = await pool.acquire()
+        assert lease.warm is True
+        assert lease.context.warmed is True
+        assert lease.context.options == {"locale": "en-GB"}
+
+        await _settle()
+        assert pool.stats()["idle_contexts"] == 2   # replenished in the background
+        page = await lease.new_page()
+        await lease.release()
+        assert page.closed is True and lease.context.closed is False
+    finally:
+        await pool.close()
+    assert all(b.closed for b in launcher.browsers)
+
+
+@pytest.mark.asyncio
+async def test_cold_lease_when_no_context_is_idle():
+    pool, _ = _pool(warm_contexts=0)
+    await pool.start()
+    try:
+        lease = await pool.acquire()
+        assert lease.warm is False
+        await lease.release()
+        assert pool.stats()["cold_leases"] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_context_recycled_after_max_uses():
+    pool, _ = _pool(warm_contexts=1, max_context_uses=2)
+    await pool.start()
+    try:
+        first = await pool.acquire()
+        context = first.context
+        await first.release()
+        second = await pool.acquire()
+        assert second.context is context
+        await second.release()
+        assert context.closed is True
+        assert pool.stats()["contexts_recycled"] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_fresh_lease_skips_used_contexts_and_failures_recycle():
+    pool, _ = _pool(warm_contexts=1, check_interval=60)
+    await pool.start()
+    try:
+        lease = await pool.acquire()
+        used = lease.context
+        await lease.release()
+
+        fresh = await pool.acquire(fresh=True)
+        assert fresh.context is not used
+        await fresh.release(recycle=True)
+        assert fresh.context.closed is True
+
+        with pytest.raises(RuntimeError):
+            async with await pool.acquire() as failing:
+                raise RuntimeError("navigation failed")
+        assert failing.context.closed is True
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_over_memory_threshold_is_replaced_and_drained():
+    memory = {"b0": 100}
+    pool, launcher = _pool(memory=memory, warm_contexts=1, check_interval=0.01)
+    await pool.start()
+    try:
+        lease = await pool.acquire()
+        memory["b0"] = 900
+        await asyncio.sleep(0.05)
+
+        assert len(launcher.browsers) == 2
+        old = launcher.browsers[0]
+        assert old.closed is False                  # a leased context still lives on it
+        assert all(c.options for c in launcher.browsers[1].contexts)
+        assert pool.stats()["retired_browsers"] == 1
+
+        await lease.release()
+        assert lease.context.closed is True
+        assert old.closed is True
+        assert pool.stats()["browsers_recycled"] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_borrowed_browser_and_not_running():
+    pool, launcher = _pool(warm_contexts=0)
+    with pytest.raises(BrowserManagerError):
+        await pool.acquire()
+    await pool.start()
+    try:
+        browser = await pool.browser()
+        assert browser is launcher.browsers[0]
+        await pool.return_browser(browser)
+        assert browser.closed is False
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_session_borrows_from_pool():
+    pool, launcher = _pool(warm_contexts=1)
+    await pool.start()
+    try:
+        session = BrowserSession()
+        session.set_browser_pool(pool)
+        await session.initialize()
+        assert session.browser is launcher.browsers[0]
+
+        context = await session.create_context()
+        assert context.warmed is True
+        await session.close()
+
+        assert launcher.browsers[0].closed is False
+        assert pool.stats()["leased_contexts"] == 0
+        assert context.closed is False              # back in the pool, still warm
+    finally:
+        await pool.close()
+
+
+class FakeCDPSession:
+    def __init__(self, pids):
+        self.pids = pids
+        self.detached = False
+
+    async def send(self, method):
+        assert method == "SystemInfo.getProcessInfo"
+        return {"processInfo": [{"id": pid, "type": "browser", "cpuTime": 0} for pid in self.pids]}
+
+    async def detach(self):
+        self.detached = True
+
+
+@pytest.mark.asyncio
+async def test_default_memory_probe_measures_the_cdp_reported_processes():
+    session = FakeCDPSession([os.getpid()])
+
+    class ChromiumBrowser(FakeBrowser):
+        async def new_browser_cdp_session(self):
+            return session
+
+    memory_mb = await BrowserPool._process_memory_mb(ChromiumBrowser("b0"))
+    assert memory_mb is not None and memory_mb > 0
+    assert session.detached
+
+    # Without CDP (Firefox/WebKit) the memory is unknown, never an error
+    assert await BrowserPool._process_memory_mb(FakeBrowser("b1")) is None
+
+
+@pytest.mark.asyncio
+async def test_async_memory_probe_retires_the_browser():
+    launcher = FakeLauncher()
+
+    async def probe(browser):
+        return 900.0 if browser.name == "b0" else 100.0
+
+    pool = BrowserPool(
+        pool_config=BrowserPoolConfig(browsers=1, warm_contexts=1, memory_threshold_mb=500),
+        context_options={}, launcher=launcher, memory_probe=probe,
+    )
+    await pool.start()
+    await pool._retire_over_threshold()
+    await pool._replenish()
+    assert launcher.browsers[0].closed
+    assert pool.stats()["browsers_recycled"] == 1
+    await pool.close()
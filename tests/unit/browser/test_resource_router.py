@@ -0,0 +1,177 @@
+"""
+Unit tests for the resource-blocking request router.
+
+Fake routes, requests and contexts stand in for Playwright.
+"""
+
+import pytest
+
+from src.browser.models.enums import SessionStatus
+from src.browser.resource_router import (
+    BLOCK,
+    CONTINUE,
+    STUB,
+    ResourceRouter,
+    StaticStubCache,
+)
+from src.browser.session import BrowserSession
+from src.sites.base.site_config import SiteConfig
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class FakeResponse:
+    def __init__(self, body, status=200):
+        self._body = body
+        self.status = status
+        self.headers = {"content-type": "text/javascript", "content-encoding": "gzip"}
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, response=None):
+        self.response = response
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = ("abort", error_code)
+
+    async def fallback(self):
+        self.outcome = ("fallback",)
+
+    async def fetch(self):
+        return self.response
+
+    async def fulfill(self, **kwargs):
+        self.outcome = ("fulfill", kwargs)
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def unroute(self, pattern, handler):
+        self.routes.remove((pattern, handler))
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def _router(**kwargs):
+    return ResourceRouter(
+        block_url_patterns=["googletagmanager.com", "^https://[^/]*\\.hotjar\\.com/"],
+        capture_patterns=["^https://d\\.flashscore\\.com/"],
+        **kwargs,
+    )
+
+
+def test_decide_blocks_by_type_and_pattern_but_never_captured_urls():
+    router = _router(block_resource_types=["image", "font", "document", "xhr"])
+    assert router.decide("https://www.flashscore.com/", "document") == CONTINUE
+    assert router.decide("https://static.flashscore.com/logo.png", "image") == BLOCK
+    assert router.decide("https://www.googletagmanager.com/gtm.js", "script") == BLOCK
+    assert router.decide("https://in.hotjar.com/api", "fetch") == BLOCK
+    # xhr is blocked by type, except the feeds NetworkInterceptor captures
+    assert router.decide("https://www.flashscore.com/x/other", "xhr") == BLOCK
+    assert router.decide("https://d.flashscore.com/x/feed/f_1", "xhr") == CONTINUE
+    assert router.decide("https://static.flashscore.com/app.js", "script") == CONTINUE
+
+
+@pytest.mark.asyncio
+async def test_handle_aborts_stubs_and_falls_back():
+    cache = StaticStubCache(max_bytes=1000)
+    router = _router(stub_cache=cache)
+    assert router.decide("https://static.example.com/app.js", "script") == STUB
+    assert router.decide("https://static.example.com/app.css", "stylesheet") == STUB
+    assert router.decide("https://d.flashscore.com/x/feed", "xhr") == CONTINUE
+
+    blocked = FakeRoute()
+    await router._handle(blocked, FakeRequest("https://cdn.example.com/a.png", "image"))
+    assert blocked.outcome == ("abort", "blockedbyclient")
+
+    first = FakeRoute(FakeResponse(b"var app = 1;"))
+    await router._handle(first, FakeRequest("https://static.example.com/app.js", "script"))
+    assert first.outcome[0] == "fulfill" and first.outcome[1]["body"] == b"var app = 1;"
+    second = FakeRoute()
+    await router._handle(second, FakeRequest("https://static.example.com/app.js", "script"))
+    assert second.outcome[1]["body"] == b"var app = 1;"
+    assert "content-encoding" not in second.outcome[1]["headers"]
+
+    passed = FakeRoute()
+    await router._handle(passed, FakeRequest("https://d.flashscore.com/x/feed", "xhr"))
+    assert passed.outcome == ("fallback",)
+
+    metrics = router.metrics.to_dict()
+    assert (metrics["requests"], metrics["blocked"], metrics["stubbed"], metrics["continued"]) == (4, 1, 1, 1)
+    assert metrics["blocked_by_type"] == {"image": 1}
+    assert metrics["bytes_saved_stubbed"] == len(b"var app = 1;")
+    assert metrics["bytes_saved"] == metrics["bytes_saved_stubbed"] + metrics["bytes_saved_estimated"]
+
+
+def test_stub_cache_is_size_bounded():
+    cache = StaticStubCache(max_bytes=10)
+    cache.put("a", 200, {}, b"12345")
+    cache.put("b", 200, {}, b"12345")
+    cache.get("a")
+    cache.put("c", 200, {}, b"123")
+    assert cache.get("b") is None and cache.get("a") is not None
+    assert cache.size_bytes <= 10
+    assert cache.put("huge", 200, {}, b"x" * 11) is False
+
+
+def test_router_from_site_config():
+    config = SiteConfig(
+        endpoint="https://www.flashscore.com",
+        intercepted={"url_patterns": ["^https://d\\.flashscore\\.com/.*"]},
+        resource_blocking={"block_resource_types": ["image"], "stub_static": True},
+    )
+    router = ResourceRouter.from_site_config(config, site="flashscore")
+    assert router.allow_url_patterns == ["^https://d\\.flashscore\\.com/.*"]
+    assert router.block_resource_types == frozenset({"image"})
+    assert router.stub_cache is ResourceRouter.from_site_config(config, site="flashscore").stub_cache
+
+    config.resource_blocking.enabled = False
+    assert ResourceRouter.from_site_config(config) is None
+    assert ResourceRouter.for_site("flashscore") is not None
+    assert ResourceRouter.for_site(None) is None
+
+
+@pytest.mark.asyncio
+async def test_browser_session_routes_the_contexts_it_creates():
+    session = BrowserSession()
+    router = _router()
+    session.set_resource_router(router)
+    session.browser = FakeBrowser()
+    session.status = SessionStatus.ACTIVE
+
+    context = await session.create_context()
+    assert context.routes == [("**/*", router._handle)]
+    assert router.is_attached(context)
+
+    await router.attach(context)                    # idempotent
+    assert len(context.routes) == 1
+    await router.detach(context)
+    assert context.routes == [] and not router.is_attached(context)
+
+    session.set_resource_router(None)
+    assert (await session.create_context()).routes == []
@@ -0,0 +1,116 @@
+"""Tests for the content-addressed blob store behind snapshot artifacts."""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+from src.core.snapshot.blobstore import BLOB_DIRNAME, BlobStore, iter_chunks
+from src.core.snapshot.capture import SnapshotCapture
+from src.core.snapshot.catalog import directory_size
+from src.core.snapshot.models import SnapshotConfig, SnapshotContext, SnapshotMode
+from src.core.snapshot.storage import SnapshotStorage
+
+
+def _page_html(revision: int) -> str:
+    rng = random.Random(7)
+    rows = "".join(
+        f'<tr data-id="{i}"><td class="team">Team {rng.randint(1, 500)}</td>'
+        f'<td class="odds">{rng.random() * 5:.2f}</td></tr>\n'
+        for i in range(3000)
+    )
+    # Each capture changes a session token and one row
+    rows = rows.replace(f'data-id="{revision * 11}">', f'data-id="{revision * 11}" class="live">', 1)
+    return f"<html><head><script>var token='{revision}';</script></head><body><table>{rows}</table></body></html>"
+
+
+class FakePage:
+    def __init__(self, html: str, screenshot: bytes):
+        self._html = html
+        self._screenshot = screenshot
+
+    async def content(self) -> str:
+        return self._html
+
+    async def screenshot(self, type: str = "png") -> bytes:
+        return self._screenshot
+
+
+async def _capture(storage, revision, session=None, screenshot=b"\x89PNG" + bytes(4096)):
+    context = SnapshotContext(site="flashscore", module="live", component="odds",
+                              session_id=session or f"s{revision}")
+    config = SnapshotConfig(mode=SnapshotMode.FULL_PAGE, capture_screenshot=True)
+    return await SnapshotCapture(storage).capture_snapshot(FakePage(_page_html(revision), screenshot), context, config)
+
+
+@pytest.mark.asyncio
+async def test_repeated_captures_share_chunks_and_read_back_transparently(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    bundles = [await _capture(storage, revision) for revision in range(20)]
+
+    logical = sum(len(_page_html(revision).encode()) + 4100 for revision in range(20))
+    stored = directory_size(tmp_path / BLOB_DIRNAME / "chunks")
+    assert logical / stored > 10
+
+    bundle = bundles[3]
+    html_artifact = next(a for a in bundle.artifacts if a.startswith("html/"))
+    assert not os.path.exists(os.path.join(bundle.bundle_path, html_artifact))
+    assert set(bundle.metadata["blob_artifacts"]) == set(bundle.artifacts)
+    assert await storage.read_artifact(bundle.bundle_path, html_artifact) == _page_html(3).encode()
+
+    loaded = await storage.load_bundle(bundle.bundle_path)
+    assert loaded.metadata["blob_artifacts"] == bundle.metadata["blob_artifacts"]
+    assert await storage.materialize_artifacts(bundle.bundle_path) == sorted(bundle.artifacts)
+    with open(os.path.join(bundle.bundle_path, html_artifact), encoding="utf-8") as f:
+        assert f.read() == _page_html(3)
+
+
+def test_chunk_boundaries_realign_after_an_edit_and_chunks_round_trip(tmp_path):
+    original = _page_html(0).encode()
+    edited = original[:50000] + b"<b>inserted</b>" + original[50000:]
+    before, after = list(iter_chunks(original)), list(iter_chunks(edited))
+    assert b"".join(after) == edited
+    assert all(len(chunk) <= 65536 for chunk in after)
+    assert len(set(before) & set(after)) >= len(before) - 2
+
+    store = BlobStore(tmp_path / "blobs", compression="zlib")
+    noise = random.Random(1).randbytes(100000)
+    for name, data in (("page", original), ("noise", noise), ("empty", b"")):
+        blob_hash = store.put("bundle", name, data)
+        assert store.get(blob_hash) == data and store.read("bundle", name) == data
+    # Incompressible chunks are stored raw rather than grown by compression
+    assert store.get_statistics()["stored_bytes"] < len(original) // 3 + len(noise) + 64
+
+
+@pytest.mark.asyncio
+async def test_delete_and_garbage_collection_follow_reference_counts(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    first = await _capture(storage, 1, session="a")
+    second = await _capture(storage, 1, session="b")
+    shared = first.metadata["blob_artifacts"]
+    assert shared == second.metadata["blob_artifacts"]
+
+    await storage.delete_bundle(first.bundle_path)
+    assert (await storage.collect_garbage())["blobs_deleted"] == 0
+    for artifact in second.artifacts:
+        assert await storage.read_artifact(second.bundle_path, artifact)
+
+    await storage.delete_bundle(second.bundle_path)
+    result = await storage.collect_garbage()
+    assert result["blobs_deleted"] == len(shared) and result["bytes_freed"] > 0
+    assert not any(storage.blob_store.contains(blob_hash) for blob_hash in shared.values())
+    assert storage.blob_store.get_statistics()["chunks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_blob_store_can_be_disabled(tmp_path):
+    storage = SnapshotStorage(str(tmp_path), use_blob_store=False)
+    bundle = await _capture(storage, 2)
+
+    assert "blob_artifacts" not in bundle.metadata
+    for artifact in bundle.artifacts:
+        assert os.path.isfile(os.path.join(bundle.bundle_path, artifact))
+    assert not (tmp_path / BLOB_DIRNAME).exists()
+    assert await storage.load_bundle(bundle.bundle_path) is not None
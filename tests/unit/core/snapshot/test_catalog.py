@@ -0,0 +1,120 @@
+"""Tests for the SQLite snapshot catalog behind SnapshotStorage."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.snapshot.catalog import CATALOG_FILENAME
+from src.core.snapshot.models import SnapshotBundle, SnapshotConfig, SnapshotContext, SnapshotMode
+from src.core.snapshot.storage import SnapshotStorage
+
+
+def _bundle(storage, site, module, minutes, tags=None, session="s1"):
+    timestamp = datetime(2026, 6, 1, 12, 0) + timedelta(minutes=minutes)
+    context = SnapshotContext(site=site, module=module, component="odds", session_id=f"{session}{minutes}")
+    return SnapshotBundle(
+        context=context,
+        timestamp=timestamp,
+        config=SnapshotConfig(mode=SnapshotMode.MINIMAL),
+        bundle_path=str(storage.get_bundle_path(context, timestamp)),
+        metadata={"tags": tags or []},
+    )
+
+
+async def _save(storage, *args, **kwargs):
+    bundle = _bundle(storage, *args, **kwargs)
+    await storage.save_bundle(bundle)
+    return bundle
+
+
+@pytest.mark.asyncio
+async def test_listing_filters_sorts_and_paginates_from_the_catalog(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    for minutes in (5, 1, 9, 3):
+        await _save(storage, "flashscore", "live", minutes, tags=["live"] if minutes > 2 else [])
+    await _save(storage, "flashscore", "results", 7, tags=["live", "error"])
+    await _save(storage, "betb2b", "live", 8)
+
+    page1 = await storage.list_bundles(site="flashscore", limit=2)
+    page2 = await storage.list_bundles(site="flashscore", limit=2, offset=2)
+    minutes = [b.timestamp.minute for b in page1 + page2]
+    assert minutes == [9, 7, 5, 3]
+    assert [b.timestamp.minute for b in await storage.list_bundles("flashscore", "live")] == [9, 5, 3, 1]
+    assert {b.context.site for b in await storage.list_bundles(tags=["live"])} == {"flashscore"}
+    assert [b.timestamp.minute for b in await storage.list_bundles(tags=["live", "error"])] == [7]
+    assert await storage.count_bundles(site="flashscore") == 5
+    assert await storage.count_bundles(since=datetime(2026, 6, 1, 12, 6)) == 3
+
+    # Listing does not read bundle directories
+    shutil.rmtree(tmp_path / "betb2b")
+    assert [b.context.site for b in await storage.list_bundles(site="betb2b")] == ["betb2b"]
+
+
+@pytest.mark.asyncio
+async def test_delete_and_retention_keep_the_catalog_in_sync(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    old = await _save(storage, "flashscore", "live", 1)
+    recent = await _save(storage, "flashscore", "live", 2)
+    gone = await _save(storage, "flashscore", "live", 3)
+
+    await storage.delete_bundle(gone.bundle_path)
+    assert await storage.count_bundles() == 2
+
+    # Age the first bundle past retention: the catalog keeps the write time
+    storage.catalog.upsert(old, written_at=time.time() - 40 * 24 * 3600)
+    dry = await storage.cleanup_old_bundles(days_to_keep=30, dry_run=True)
+    assert dry["deleted_count"] == 1 and dry["size_freed_bytes"] > 0
+    assert os.path.exists(old.bundle_path)
+
+    result = await storage.cleanup_old_bundles(days_to_keep=30)
+    assert result["deleted_count"] == 1 and not result["errors"]
+    assert not os.path.exists(old.bundle_path)
+    assert [b.bundle_path for b in await storage.list_bundles()] == [recent.bundle_path]
+
+
+@pytest.mark.asyncio
+async def test_catalog_rebuilds_from_disk(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    for minutes in range(3):
+        await _save(storage, "flashscore", "live", minutes, tags=["nightly"])
+    storage.catalog.close()
+
+    # A fresh catalog over an existing tree indexes it on first use
+    for name in os.listdir(tmp_path):
+        if name.startswith(CATALOG_FILENAME):
+            os.remove(tmp_path / name)
+    reopened = SnapshotStorage(str(tmp_path))
+    assert reopened.catalog.is_new
+    assert [b.timestamp.minute for b in await reopened.list_bundles(tags=["nightly"])] == [2, 1, 0]
+
+    # Out-of-band deletes are picked up by an explicit rebuild
+    shutil.rmtree(tmp_path / "flashscore" / "live" / "odds" / "20260601" / "120100_s11")
+    assert await reopened.rebuild_catalog() == 2
+    assert await reopened.count_bundles() == 2
+
+
+@pytest.mark.asyncio
+async def test_bundles_from_before_the_catalog_survive_a_save_only_run(tmp_path):
+    storage = SnapshotStorage(str(tmp_path))
+    for minutes in range(3):
+        await _save(storage, "flashscore", "live", minutes)
+    storage.catalog.close()
+    for name in os.listdir(tmp_path):
+        if name.startswith(CATALOG_FILENAME):
+            os.remove(tmp_path / name)
+
+    # The first process on the new code only saves, never lists
+    writer = SnapshotStorage(str(tmp_path))
+    await _save(writer, "flashscore", "live", 5)
+    writer.catalog.close()
+
+    reader = SnapshotStorage(str(tmp_path))
+    assert reader.catalog.is_new
+    assert [b.timestamp.minute for b in await reader.list_bundles()] == [5, 2, 1, 0]
+    reader.catalog.close()
+    assert not SnapshotStorage(str(tmp_path)).catalog.is_new
@@ -0,0 +1,193 @@
+"""
+Unit tests for the element snapshot primitive and the strategies built on it.
+
+A fake page counts Playwright round trips: materializing a match must cost
+one evaluate for all elements, not one call per property per element.
+"""
+
+import pytest
+from datetime import datetime
+
+from src.models.selector_models import SemanticSelector
+from src.selectors.context import DOMContext
+from src.selectors.strategies.attribute_match import AttributeMatchStrategy
+from src.selectors.strategies.css import CSSStrategy
+from src.selectors.strategies.role_based import RoleBasedStrategy
+from src.selectors.strategies.snapshot import snapshot_elements, snapshot_selector
+from src.selectors.strategies.text_anchor import TextAnchorStrategy
+from src.selectors.strategies.xpath import XPathStrategy
+
+
+def _raw(tag, text="", attributes=None, visible=True, style_visible=None, interactable=None):
+    attributes = attributes or {}
+    return {
+        "tag": tag, "text": text, "classes": attributes.get("class", "").split(),
+        "attributes": attributes, "visible": visible,
+        "styleVisible": visible if style_visible is None else style_visible,
+        "interactable": visible if interactable is None else interactable,
+        "box": {"x": 0, "y": 0, "width": 10, "height": 10} if visible else None,
+        "domPath": f"body > {tag}",
+    }
+
+
+class FakeHandle:
+    def __init__(self, raw):
+        self.raw = raw
+
+
+class FakePage:
+    """Answers the snapshot scripts from canned element data and counts calls."""
+
+    def __init__(self, raws):
+        self.handles = [FakeHandle(r) for r in raws]
+        self.calls = []
+
+    async def wait_for_selector(self, selector, **kwargs):
+        self.calls.append("wait_for_selector")
+        return self.handles[0] if self.handles else None
+
+    async def query_selector(self, selector):
+        self.calls.append("query_selector")
+        return self.handles[0] if self.handles else None
+
+    async def query_selector_all(self, selector):
+        self.calls.append("query_selector_all")
+        return list(self.handles)
+
+    async def eval_on_selector_all(self, selector, script, opts):
+        self.calls.append("eval_on_selector_all")
+        return [self._apply(h.raw, opts) for h in self.handles]
+
+    async def evaluate(self, script, arg):
+        self.calls.append("evaluate")
+        handles, opts = arg
+        return [self._apply(h.raw, opts) for h in handles]
+
+    @staticmethod
+    def _apply(raw, opts):
+        needle = opts.get("textContains")
+        if needle is not None:
+            text = raw["text"] if opts["caseSensitive"] else raw["text"].lower()
+            if (needle if opts["caseSensitive"] else needle.lower()) not in text:
+                return None
+        return raw
+
+
+def _context(page):
+    return DOMContext(page=page, tab_context="summary",
+                      url="https://test.example.com/match/1", timestamp=datetime.utcnow())
+
+
+def _selector():
+    return SemanticSelector(name="home_team_name", description="Home team name",
+                            context="summary", strategies=[], validation_rules=[],
+                            confidence_threshold=0.5)
+
+
+PAGE = [
+    _raw("html", "Home Manchester United Away Chelsea"),
+    _raw("span", "Manchester United", {"class": "team-name home", "data-testid": "home-team",
+                                        "role": "heading", "aria-label": "home"}),
+    _raw("span", "Chelsea", {"class": "team-name away", "data-testid": "away-team"}),
+    _raw("span", "Manchester United", {"class": "team-name hidden",
+                                        "data-testid": "home-team-copy"}, visible=False),
+]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_elements_keeps_order_and_handles():
+    page = FakePage(PAGE)
+    handles = await page.query_selector_all("span")
+    snapshots = await snapshot_elements(page, handles, text_contains="manchester")
+    assert page.calls == ["query_selector_all", "evaluate"]
+    assert [s is None for s in snapshots] == [False, False, True, False]
+    assert snapshots[1].element is handles[1]
+    assert snapshots[1].get_attribute("data-testid") == "home-team"
+    assert snapshots[1].to_element_info().css_classes == ["team-name", "home"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_selector_is_one_round_trip():
+    page = FakePage(PAGE)
+    snapshots = await snapshot_selector(page, ".team-name")
+    assert page.calls == ["eval_on_selector_all"]
+    assert [s.index for s in snapshots] == [0, 1, 2, 3]
+    assert snapshots[3].visible is False and snapshots[3].bounding_box is None
+
+
+@pytest.mark.asyncio
+async def test_css_strategy_materializes_first_match_in_two_round_trips():
+    page = FakePage(PAGE[1:])
+    strategy = CSSStrategy("css_home", config={"selector": ".team-name"})
+    result = await strategy.attempt_resolution(_selector(), _context(page))
+    assert result.success is True
+    assert page.calls == ["wait_for_selector", "eval_on_selector_all"]
+    info = result.element_info
+    assert (info.tag_name, info.text_content, info.dom_path) == (
+        "span", "Manchester United", ".team-name")
+    assert info.element is page.handles[0]
+
+
+@pytest.mark.asyncio
+async def test_xpath_strategy_uses_snapshot():
+    page = FakePage(PAGE[1:])
+    strategy = XPathStrategy("xpath_home", config={"selector": "//span"})
+    result = await strategy.attempt_resolution(_selector(), _context(page))
+    assert result.success is True
+    assert page.calls == ["eval_on_selector_all", "query_selector"]
+    assert result.element_info.dom_path == "xpath://span"
+
+
+@pytest.mark.asyncio
+async def test_text_anchor_prefers_tightest_match_without_per_element_calls():
+    page = FakePage(PAGE)
+    strategy = TextAnchorStrategy("anchor_home", config={"anchor_text": "Manchester United"})
+    result = await strategy.attempt_resolution(_selector(), _context(page))
+    assert result.success is True
+    assert page.calls == ["query_selector_all", "evaluate"]
+    assert result.element_info.text_content == "Manchester United"
+    assert result.element_info.tag_name == "span"
+
+
+@pytest.mark.asyncio
+async def test_attribute_match_skips_hidden_elements():
+    page = FakePage(PAGE[1:])
+    strategy = AttributeMatchStrategy("attr_home", config={
+        "attribute": "data-testid", "value_pattern": "home-team"})
+    result = await strategy.attempt_resolution(_selector(), _context(page))
+    assert result.success is True
+    assert page.calls == ["query_selector_all", "evaluate"]
+    assert result.element_info.get_attribute("data-testid") == "home-team"
+
+
+@pytest.mark.asyncio
+async def test_role_based_scores_from_snapshot_attributes():
+    page = FakePage(PAGE[1:])
+    strategy = RoleBasedStrategy("role_home", config={"role": "heading"})
+    result = await strategy.attempt_resolution(_selector(), _context(page))
+    assert result.success is True
+    assert page.calls == ["query_selector_all", "evaluate"]
+    assert result.element_info.get_attribute("aria-label") == "home"
+
+
+@pytest.mark.asyncio
+async def test_visibility_semantics_match_the_calls_they_replace():
+    # opacity: 0 — is_visible() says visible, the computed-style check does not
+    faded = [_raw("span", "Manchester United", {"class": "team-name"},
+                  style_visible=False, interactable=False)]
+
+    css = CSSStrategy("css_home", config={"selector": ".team-name"})
+    info = (await css.attempt_resolution(_selector(), _context(FakePage(faded)))).element_info
+    assert (info.visibility, info.interactable) == (True, True)
+    assert css._calculate_base_confidence(info, []) == pytest.approx(0.6)
+
+    anchor = TextAnchorStrategy("anchor_home", config={"anchor_text": "Manchester United"})
+    info = (await anchor.attempt_resolution(_selector(), _context(FakePage(faded)))).element_info
+    assert (info.visibility, info.interactable) == (False, False)
+    assert anchor._calculate_base_confidence(info, []) == 0.0
+
+    # A plain visible span is not interactable by the tag/role heuristic
+    plain = [_raw("span", "Manchester United", interactable=False)]
+    info = (await anchor.attempt_resolution(_selector(), _context(FakePage(plain)))).element_info
+    assert (info.visibility, info.interactable) == (True, False)
+    assert anchor._calculate_base_confidence(info, []) == pytest.approx(0.2)
@@ -0,0 +1,123 @@
+"""
+Unit tests for memoized selector validation and sampled quality evaluation.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from src.models.selector_models import (
+    SemanticSelector, SelectorResult, StrategyPattern, StrategyType
+)
+from src.selectors.cache_invalidation import invalidate_selector_definitions
+from src.selectors.context import DOMContext
+from src.selectors.engine import SelectorEngine
+
+
+def _selector(name="home_team", css=".home"):
+    return SemanticSelector(
+        name=name, description=name, context="summary",
+        strategies=[
+            StrategyPattern(id=f"{name}_css", type=StrategyType.CSS, priority=1,
+                            config={"selector": css}),
+            StrategyPattern(id=f"{name}_attr", type=StrategyType.ATTRIBUTE_MATCH, priority=2,
+                            config={"attribute": "data-testid", "value_pattern": name}),
+            StrategyPattern(id=f"{name}_text", type=StrategyType.TEXT_ANCHOR, priority=3,
+                            config={"anchor_text": name}),
+        ],
+        validation_rules=[], confidence_threshold=0.8)
+
+
+def _success(selector, context, attempt):
+    return SelectorResult(selector_name=selector.name, strategy_used=f"{selector.name}_css",
+                          element_info=None, confidence_score=1.0, resolution_time=1.0,
+                          validation_results=[], success=True, timestamp=datetime.utcnow())
+
+
+def _context():
+    return DOMContext(page=MagicMock(), tab_context="summary",
+                      url="https://test.example.com/match/1", timestamp=datetime.utcnow())
+
+
+@pytest.mark.asyncio
+async def test_validation_is_memoized_by_content():
+    engine = SelectorEngine()
+    selector = _selector()
+
+    assert await engine.validate_selector(selector) == []
+    assert await engine.validate_selector(_selector()) == []
+    stats = engine.get_statistics()["validation_cache"]
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    # A changed definition misses and replaces the entry for that name
+    changed = _selector(css=".home .name")
+    assert await engine.validate_selector(changed) == []
+    assert engine.get_statistics()["validation_cache"]["misses"] == 2
+    assert engine.get_statistics()["validation_cache"]["entries"] == 1
+
+    # Invalid selectors are memoized too, and callers get their own list
+    broken = SemanticSelector(name="broken", description="", context="summary",
+                              strategies=[], validation_rules=[])
+    issues = await engine.validate_selector(broken)
+    issues.append("mutated")
+    assert "mutated" not in await engine.validate_selector(broken)
+
+
+@pytest.mark.asyncio
+async def test_yaml_reload_invalidation_drops_entries():
+    engine = SelectorEngine()
+    await engine.validate_selector(_selector("home_team"))
+    await engine.validate_selector(_selector("away_team"))
+
+    invalidate_selector_definitions(["home_team"], reason="test")
+    assert engine.get_statistics()["validation_cache"]["entries"] == 1
+    await engine.validate_selector(_selector("home_team"))
+    assert engine.get_statistics()["validation_cache"]["misses"] == 3
+
+    invalidate_selector_definitions(reason="test")
+    assert engine.get_statistics()["validation_cache"]["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_quality_evaluation_is_sampled_and_off_the_hot_path():
+    engine = SelectorEngine()
+    engine._selector_registry["home_team"] = _selector()
+    engine._resolve_with_strategies = AsyncMock(side_effect=_success)
+    engine._quality_control_manager = MagicMock()
+    engine._quality_control_manager.evaluate_quality = AsyncMock(
+        return_value=MagicMock(passed=True, confidence_score=1.0, violations=[]))
+
+    engine._quality_sample_rate = 0.0
+    for _ in range(3):
+        assert (await engine.resolve("home_team", _context())).success
+    engine._quality_control_manager.evaluate_quality.assert_not_awaited()
+
+    engine._quality_sample_rate = 1.0
+    await engine.resolve("home_team", _context())
+    await engine.drain_quality_evaluations()
+    engine._quality_control_manager.evaluate_quality.assert_awaited_once()
+
+    quality = engine.get_statistics()["quality_evaluation"]
+    assert (quality["sampled"], quality["skipped"], quality["completed"]) == (1, 3, 1)
+    assert engine.get_statistics()["validation_cache"]["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_resolutions_made_by_quality_evaluation_are_not_sampled():
+    engine = SelectorEngine()
+    engine._selector_registry["home_team"] = _selector()
+    engine._resolve_with_strategies = AsyncMock(side_effect=_success)
+    engine._quality_sample_rate = 1.0
+    calls = []
+
+    async def evaluate_quality(selector, context, gate_name):
+        calls.append(selector.name)
+        await engine.resolve(selector.name, context)   # as QualityControlManager does
+        return MagicMock(passed=True, confidence_score=1.0, violations=[])
+
+    engine._quality_control_manager = MagicMock()
+    engine._quality_control_manager.evaluate_quality = evaluate_quality
+
+    await engine.resolve("home_team", _context())
+    await engine.drain_quality_evaluations()
+    assert calls == ["home_team"]
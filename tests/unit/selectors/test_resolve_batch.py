@@ -0,0 +1,159 @@
+"""
+Unit tests for SelectorEngine.resolve_batch.
+
+Every CSS/XPath primary strategy in the batch is answered by one in-page
+evaluation; only the misses (and selectors whose primary cannot be probed)
+go through per-selector ``resolve``. Results come back in input order.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from src.models.selector_models import (
+    SemanticSelector, SelectorResult, StrategyPattern, StrategyType
+)
+from src.selectors.context import DOMContext
+from src.selectors.engine import SelectorEngine
+
+
+def _raw(tag, text):
+    return {"tag": tag, "text": text, "classes": [], "attributes": {}, "visible": True,
+            "interactable": False, "box": {"x": 0, "y": 0, "width": 1, "height": 1},
+            "domPath": None}
+
+
+class FakeElementHandle:
+    def __init__(self, query):
+        self.query = query
+
+
+class FakeJSHandle:
+    def __init__(self, value):
+        self.value = value
+        self.disposed = False
+
+    def as_element(self):
+        return self.value
+
+    async def get_properties(self):
+        return {str(i): FakeJSHandle(v) for i, v in enumerate(self.value)}
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    """Resolves probe queries from a dict and counts round trips."""
+
+    url = "https://test.example.com/match/1"
+
+    def __init__(self, dom, delay=0.0):
+        self.dom = dom
+        self.delay = delay
+        self.calls = []
+
+    async def evaluate(self, script, arg):
+        self.calls.append("evaluate")
+        await asyncio.sleep(self.delay)
+        probes, _opts = arg
+        return [self.dom.get(p["query"]) for p in probes]
+
+    async def evaluate_handle(self, script, probes):
+        self.calls.append("evaluate_handle")
+        return FakeJSHandle([FakeElementHandle(p["query"]) if p["query"] in self.dom else None
+                             for p in probes])
+
+
+def _selector(name, primary_type, primary_config):
+    return SemanticSelector(
+        name=name, description=name, context="summary",
+        strategies=[
+            StrategyPattern(id=f"{name}_primary", type=primary_type, priority=1,
+                            config=primary_config),
+            StrategyPattern(id=f"{name}_attr", type=StrategyType.ATTRIBUTE_MATCH, priority=2,
+                            config={"attribute": "data-testid", "value_pattern": name}),
+            StrategyPattern(id=f"{name}_text", type=StrategyType.TEXT_ANCHOR, priority=3,
+                            config={"anchor_text": name}),
+        ],
+        validation_rules=[], confidence_threshold=0.8)
+
+
+def _fallback_result(name, context):
+    return SelectorResult(selector_name=name, strategy_used=f"{name}_attr", element_info=None,
+                          confidence_score=0.9, resolution_time=5.0, validation_results=[],
+                          success=True, timestamp=datetime.utcnow())
+
+
+@pytest.fixture
+def engine():
+    engine = SelectorEngine()
+    for selector in (
+        _selector("home_team", StrategyType.CSS, {"selector": ".home .name"}),
+        _selector("away_team", StrategyType.XPATH, {"selector": "//div[@class='away']"}),
+        _selector("score", StrategyType.CSS, {"selector": ".score"}),
+        _selector("venue", StrategyType.TEXT_ANCHOR, {"anchor_text": "Stadium"}),
+    ):
+        engine._selector_registry[selector.name] = selector
+    engine.resolve = AsyncMock(side_effect=_fallback_result)
+    return engine
+
+
+def _context(page):
+    return DOMContext(page=page, tab_context="summary", url=page.url,
+                      timestamp=datetime.utcnow())
+
+
+@pytest.mark.asyncio
+async def test_primary_hits_share_one_probe_and_only_misses_fall_back(engine):
+    page = FakePage({".home .name": _raw("span", "Arsenal"),
+                     "//div[@class='away']": _raw("div", "Chelsea")})
+    names = ["venue", "home_team", "score", "away_team"]
+
+    results = await engine.resolve_batch(names, _context(page))
+
+    assert [r.selector_name for r in results] == names
+    assert page.calls == ["evaluate", "evaluate_handle"]
+    fallen_back = sorted(call.args[0] for call in engine.resolve.await_args_list)
+    assert fallen_back == ["score", "venue"]
+
+    home, away = results[1], results[3]
+    assert (home.success, home.strategy_used, home.confidence_score) == (
+        True, "home_team_primary", 1.0)
+    assert home.element_info.text_content == "Arsenal"
+    assert home.element_info.dom_path == ".home .name"
+    assert home.element_info.element.query == ".home .name"
+    assert away.element_info.dom_path == "xpath://div[@class='away']"
+    assert results[2].strategy_used == "score_attr"
+
+
+@pytest.mark.asyncio
+async def test_batched_hits_report_resolution_time_in_seconds(engine):
+    page = FakePage({".home .name": _raw("span", "Arsenal"),
+                     "//div[@class='away']": _raw("div", "Chelsea")}, delay=0.02)
+
+    results = await engine.resolve_batch(["home_team", "away_team"], _context(page))
+
+    # 20 ms probe shared by two hits: ~0.01 s each, as the strategies report
+    assert all(0.005 <= r.resolution_time < 1.0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_fallback_exceptions_become_failure_results(engine):
+    engine.resolve = AsyncMock(side_effect=RuntimeError("boom"))
+    page = FakePage({})
+
+    results = await engine.resolve_batch(["home_team", "venue"], _context(page))
+
+    assert [r.selector_name for r in results] == ["home_team", "venue"]
+    assert all(not r.success and r.failure_reason == "boom" for r in results)
+    assert page.calls == ["evaluate"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_selector_fails_whole_batch(engine):
+    results = await engine.resolve_batch(["home_team", "missing"], _context(FakePage({})))
+    assert [r.selector_name for r in results] == ["home_team", "missing"]
+    assert all(not r.success for r in results)
+    engine.resolve.assert_not_awaited()
@@ -0,0 +1,126 @@
+"""Tests for the streaming quantile sketches (src/observability/quantiles.py)
+and the collectors that maintain them."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.observability.metrics import MetricsCollector
+from src.observability.quantiles import QuantileSketch, WindowedQuantiles
+from src.telemetry.configuration.telemetry_config import TelemetryConfiguration
+from src.telemetry.processor.aggregator import (
+    AggregationLevel, AggregationRule, Aggregator, GroupingType,
+)
+from src.telemetry.processor.metrics_processor import AggregationType, ProcessedMetric, TimeWindow
+
+
+def _exact(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def _latencies(n, seed):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(4.0, 0.8) for _ in range(n)]
+
+
+def test_sketch_tracks_tail_percentiles_in_bounded_memory():
+    values = _latencies(50_000, seed=1)
+    sketch = QuantileSketch.of(values)
+
+    for p, tolerance in ((50, 0.01), (95, 0.01), (99, 0.02)):
+        assert sketch.percentile(p) == pytest.approx(_exact(values, p), rel=tolerance)
+    assert sketch.centroid_count < sketch.compression
+    assert (sketch.count, sketch.min, sketch.max) == (len(values), min(values), max(values))
+    assert set(sketch.percentiles()) == {"p50", "p95", "p99"}
+    assert QuantileSketch().percentile(95) == 0.0
+
+
+def test_sketches_merge_across_processes():
+    shards = [_latencies(10_000, seed=s) for s in range(4)]
+    # Each "process" ships its sketch as a dict
+    merged = QuantileSketch()
+    for shard in shards:
+        merged.merge(QuantileSketch.from_dict(QuantileSketch.of(shard).to_dict()))
+
+    everything = [v for shard in shards for v in shard]
+    assert merged.count == len(everything)
+    assert merged.mean == pytest.approx(sum(everything) / len(everything))
+    assert merged.percentile(99) == pytest.approx(_exact(everything, 99), rel=0.02)
+    assert merged.percentile(50) == pytest.approx(QuantileSketch.of(everything).percentile(50), rel=0.01)
+
+
+def test_windowed_quantiles_query_ranges_and_drop_old_windows():
+    windows = WindowedQuantiles(window=timedelta(minutes=1), retention=3)
+    start = datetime(2026, 6, 1, 12, 0, 0)
+    for minute in range(5):
+        for value in range(100):
+            windows.add(minute * 1000 + value, start + timedelta(minutes=minute, seconds=value % 60))
+
+    assert [s for s, _ in windows.windows()] == [start + timedelta(minutes=m) for m in (2, 3, 4)]
+    assert windows.sketch().count == 300
+    last = windows.sketch(start + timedelta(minutes=4, seconds=30), start + timedelta(minutes=5))
+    assert (last.count, last.min, last.max) == (100, 4000, 4099)
+    # Samples older than retention are dropped rather than reopening a window
+    windows.add(1.0, start)
+    assert windows.sketch().count == 300
+
+
+@pytest.mark.asyncio
+async def test_metrics_collector_percentiles_cover_every_sample():
+    collector = MetricsCollector(max_points=100)
+    for value in range(1, 1001):
+        await collector.record_metric("odds_table", "resolution_time", float(value))
+
+    now = datetime.utcnow()
+    last_minute = (now - timedelta(minutes=1), now)
+    assert len(collector.get_metrics("odds_table", "resolution_time", last_minute)) == 100
+    percentiles = collector.get_percentiles("odds_table", "resolution_time")
+    assert percentiles["p50"] == pytest.approx(500, rel=0.01)
+    assert percentiles["p99"] == pytest.approx(990, rel=0.01)
+
+    recent = collector.get_sketch("odds_table", "resolution_time", last_minute)
+    assert recent.count == 1000
+    assert collector.get_percentiles("missing", "resolution_time") == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+
+class _Aggregator(Aggregator):
+    pass
+
+
+_Aggregator.__abstractmethods__ = frozenset()
+
+
+@pytest.mark.asyncio
+async def test_aggregator_percentile_rules_use_windowed_sketches():
+    aggregator = _Aggregator(TelemetryConfiguration())
+    rule = AggregationRule(
+        rule_id="resolution_time_p95",
+        name="Resolution time p95",
+        metric_name="resolution_time",
+        aggregation_type=AggregationType.PERCENTILE,
+        grouping_type=GroupingType.TIME_BASED,
+        aggregation_level=AggregationLevel.MINUTE,
+        time_windows=[TimeWindow.MINUTE_1],
+    )
+    now = datetime.utcnow()
+    try:
+        assert await aggregator.add_aggregation_rule(rule)
+        for batch in (range(1, 501), range(501, 1001)):
+            metrics = [
+                ProcessedMetric("resolution_time", AggregationType.AVERAGE, TimeWindow.MINUTE_1,
+                                float(v), now, 1)
+                for v in batch
+            ]
+            [aggregated] = await aggregator.aggregate_metrics(metrics, [rule])
+
+        # The second batch is folded into the same window's sketch
+        assert aggregated.value == pytest.approx(950, rel=0.01)
+        assert aggregated.metadata["percentiles"]["p99"] == pytest.approx(990, rel=0.01)
+        assert QuantileSketch.from_dict(aggregated.metadata["sketch"]).count == 1000
+
+        await aggregator.remove_aggregation_rule(rule.rule_id)
+        assert not aggregator._sketches
+    finally:
+        await aggregator.cleanup()
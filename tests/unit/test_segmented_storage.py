@@ -0,0 +1,166 @@
+"""Tests for the append-only segmented telemetry storage (src/telemetry/storage/segmented_storage.py)."""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.telemetry.configuration.telemetry_config import TelemetryConfiguration
+from src.telemetry.models import TelemetryEvent
+from src.telemetry.storage.segmented_storage import SegmentedJSONStorage
+
+_T0 = datetime(2026, 6, 1, 12, 0)
+
+
+def _config(tmp_path, **values):
+    config = TelemetryConfiguration()
+    values = {"storage_path": str(tmp_path), "compression_enabled": False,
+              "segment_max_bytes": 1000, **values}
+    for key, value in values.items():
+        config.set(key, value)
+    return config
+
+
+def _event(minutes, selector="odds_table", correlation="corr-1"):
+    return TelemetryEvent(
+        event_id=str(uuid.uuid4()),
+        correlation_id=correlation,
+        selector_name=selector,
+        timestamp=_T0 + timedelta(minutes=minutes),
+        operation_type="resolution",
+        performance_metrics={"resolution_time_ms": float(minutes)},
+    )
+
+
+def _segment_files(tmp_path, pattern="seg-*.ndjson*"):
+    return sorted(p.name for p in (tmp_path / "segments").glob(pattern))
+
+
+@pytest.mark.asyncio
+async def test_segments_roll_over_and_seal_with_a_sidecar(tmp_path):
+    storage = SegmentedJSONStorage(_config(tmp_path, compression_enabled=True))
+    assert await storage.store_events_batch([_event(m) for m in range(13)]) == 13
+
+    stats = await storage.get_storage_statistics()
+    assert stats["total_events"] == 13
+    assert stats["file_count"] > 2 and stats["sealed_segments"] == stats["file_count"] - 1
+    files = _segment_files(tmp_path)
+    assert all(name.endswith(".gz") for name in files[:-1])       # sealed segments gzipped
+    assert files[-1].endswith(".ndjson")                          # the active one is plain
+    sidecars = _segment_files(tmp_path, "seg-*.idx.json")
+    assert len(sidecars) == len(files) - 1
+    first = json.loads((tmp_path / "segments" / sidecars[0]).read_text())
+    assert first["count"] > 0 and first["min_ts"] <= first["max_ts"]
+    assert first["selectors"] == ["odds_table"]
+
+    events = await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))
+    assert [e.performance_metrics["resolution_time_ms"] for e in events] == list(range(13))
+
+
+@pytest.mark.asyncio
+async def test_time_range_and_key_lookups_read_only_matching_segments(tmp_path):
+    storage = SegmentedJSONStorage(_config(tmp_path))
+    for minutes in range(9):
+        await storage.store_event(_event(minutes, selector=f"sel{minutes // 3}",
+                                         correlation=f"corr{minutes // 3}"))
+
+    read = []
+    original = storage._read_segment
+    storage._read_segment = lambda segment: read.append(segment.seq) or original(segment)
+
+    window = await storage.get_events_by_time_range(_T0 + timedelta(minutes=7),
+                                                    _T0 + timedelta(minutes=8))
+    assert [e.timestamp.minute for e in window] == [7, 8]
+    assert len(read) < len(storage._segments)
+
+    read.clear()
+    by_selector = await storage.get_events_by_selector("sel1")
+    assert sorted(e.timestamp.minute for e in by_selector) == [3, 4, 5]
+    assert read and all("sel1" in s.selectors for s in storage._segments if s.seq in read)
+
+    read.clear()
+    by_correlation = await storage.get_events_by_correlation("corr0")
+    assert sorted(e.timestamp.minute for e in by_correlation) == [0, 1, 2]
+    assert all("corr0" in s.correlations for s in storage._segments if s.seq in read)
+
+    limited = await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1), limit=2)
+    assert [e.timestamp.minute for e in limited] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_reopen_recovers_indexes_and_skips_a_torn_last_line(tmp_path):
+    storage = SegmentedJSONStorage(_config(tmp_path))
+    await storage.store_events_batch([_event(m) for m in range(7)])
+    segments = len(storage._segments)
+
+    # A crash mid-append leaves half a line in the active segment, and a
+    # crash mid-seal leaves a sealed segment without its sidecar.
+    active = tmp_path / "segments" / storage._segments[-1].file_name
+    with open(active, "a", encoding="utf-8") as f:
+        f.write('{"event_id": "torn", "timest')
+    (tmp_path / "segments" / storage._segments[0].index_name).unlink()
+
+    reopened = SegmentedJSONStorage(_config(tmp_path))
+    assert len(reopened._segments) == segments
+    assert all(s.sealed for s in reopened._segments[:-1])
+    assert (tmp_path / "segments" / reopened._segments[0].index_name).exists()
+    events = await reopened.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))
+    assert [e.timestamp.minute for e in events] == list(range(7))
+
+    # Appends after recovery stay readable
+    await reopened.store_event(_event(30))
+    assert len(await reopened.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))) == 8
+
+
+@pytest.mark.asyncio
+async def test_retention_drops_whole_old_segments_and_rewrites_straddling_ones(tmp_path):
+    storage = SegmentedJSONStorage(_config(tmp_path))
+    await storage.store_events_batch([_event(m) for m in range(12)])
+    first = storage._segments[0]
+    first_file = tmp_path / "segments" / first.file_name
+    cutoff = first.max_ts + timedelta(minutes=1)        # inside the second segment
+
+    deleted = await storage.delete_events_by_time_range(datetime.min, cutoff)
+    assert deleted == cutoff.minute + 1
+    assert not first_file.exists()                      # unlinked, not rewritten
+    remaining = await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))
+    assert [e.timestamp.minute for e in remaining] == list(range(cutoff.minute + 1, 12))
+    assert (await storage.get_storage_statistics())["total_events"] == len(remaining)
+
+    # The configured retention window goes through the same path
+    storage.config.set("retention_days", 0)
+    assert await storage.apply_retention_policy() == len(remaining)
+    assert await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1)) == []
+
+
+@pytest.mark.asyncio
+async def test_segment_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    storage = SegmentedJSONStorage(_config(tmp_path, compression_enabled=True))
+    threads = set()
+    for name in ("_write_lines", "_read_segment", "_replace_file", "_write_sidecar"):
+        original = getattr(storage, name)
+        monkeypatch.setattr(storage, name, lambda *a, _f=original, _n=name: (
+            threads.add((_n, threading.current_thread() is threading.main_thread())) or _f(*a)))
+
+    await storage.store_events_batch([_event(m) for m in range(13)])
+    await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))
+    await storage.delete_events_by_selector("odds_table", before_time=_T0 + timedelta(minutes=2))
+
+    assert {name for name, _ in threads} == {
+        "_write_lines", "_read_segment", "_replace_file", "_write_sidecar"}
+    assert not any(on_loop for _, on_loop in threads)
+
+
+@pytest.mark.asyncio
+async def test_a_line_still_being_appended_is_not_read(tmp_path):
+    storage = SegmentedJSONStorage(_config(tmp_path))
+    await storage.store_events_batch([_event(m) for m in range(2)])
+    active = tmp_path / "segments" / storage._segments[-1].file_name
+    with open(active, "a", encoding="utf-8") as f:
+        f.write('{"event_id": "half-written"')
+
+    events = await storage.get_events_by_time_range(_T0, _T0 + timedelta(hours=1))
+    assert [e.timestamp.minute for e in events] == [0, 1]
@@ -0,0 +1,128 @@
+"""Tests for the columnar timing recorder (src/telemetry/collector/columnar.py)."""
+
+import httpx
+import pytest
+
+from src.network.direct_api.client import AsyncHttpClient
+from src.telemetry.collector.columnar import ColumnarRingBuffer, TimingRecorder
+from src.telemetry.configuration.telemetry_config import TelemetryConfiguration
+from src.telemetry.integration.selector_integration import SelectorTelemetryIntegration
+
+
+def _config(**values):
+    config = TelemetryConfiguration()
+    for key, value in values.items():
+        config.set(key, value)
+    return config
+
+
+def test_ring_buffer_overwrites_oldest_and_drains_in_order():
+    buffer = ColumnarRingBuffer([("value", "d"), ("name", "O")], capacity=3)
+    for i in range(5):
+        buffer.append(float(i), f"row{i}")
+
+    assert len(buffer) == 3 and buffer.overwritten == 2
+    assert buffer.drain() == {"value": [2.0, 3.0, 4.0], "name": ["row2", "row3", "row4"]}
+    assert len(buffer) == 0 and buffer.drain() == {"value": [], "name": []}
+    # Drained object slots no longer pin their values
+    assert buffer._columns[1] == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_flush_builds_validated_events_and_drops_invalid_rows():
+    batches = []
+
+    async def sink(events):
+        batches.append(events)
+
+    recorder = TimingRecorder(_config(), event_sink=sink)
+    recorder.record_selector("odds_table", 12.5, confidence_score=0.9, elements_found=3,
+                             primary_strategy="css", correlation_id="corr-1")
+    recorder.record_selector("odds_table", 4.0, success=False)
+    recorder.record_selector("odds_table", 1.0, operation_type="bogus")
+    recorder.record_selector("odds_table", 1.0, confidence_score=1.5)
+
+    events, rows = await recorder.flush()
+
+    assert batches == [events] and rows == []
+    assert len(events) == 2
+    first, failed = events
+    assert first.correlation_id == "corr-1"
+    assert first.get_resolution_time() == 12.5 and first.get_confidence_score() == 0.9
+    assert first.quality_metrics["elements_found"] == 3
+    assert first.get_primary_strategy() == "css"
+    assert not failed.is_successful() and failed.get_confidence_score() is None
+    stats = recorder.get_statistics()
+    assert (stats.selector_recorded, stats.events_flushed, stats.invalid_rows) == (4, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_sampling_keeps_failures_and_tags_the_rate():
+    recorder = TimingRecorder(_config(fast_recording_sample_rate=0.25,
+                                      fast_recording_network_sample_rate=0.5))
+    draws = iter([0.1, 0.9, 0.3, 0.6])
+    recorder._random = lambda: next(draws)
+
+    assert recorder.record_selector("odds_table", 1.0)                   # 0.1 < 0.25
+    assert not recorder.record_selector("odds_table", 1.0)               # 0.9 sampled out
+    assert recorder.record_selector("odds_table", 1.0, success=False)    # never sampled
+    assert recorder.record_network("GET", "https://api.example.com/a", 200, 80.0)   # 0.3 < 0.5
+    assert not recorder.record_network("GET", "https://api.example.com/b", 200, 80.0)
+    assert recorder.record_network("GET", "https://api.example.com/c", 503, 80.0)
+
+    events, rows = await recorder.flush()
+    assert [e.context_data for e in events] == [{"sample_rate": 0.25}, None]
+    assert [(r["url"][-1], r["sample_rate"]) for r in rows] == [("a", 0.5), ("c", 1.0)]
+    assert recorder.get_statistics().sampled_out == 2
+
+    with pytest.raises(ValueError):
+        TimingRecorder(_config(fast_recording_sample_rate=0))
+
+
+@pytest.mark.asyncio
+async def test_selector_integration_records_through_the_fast_path():
+    recorder = TimingRecorder(_config())
+    integration = SelectorTelemetryIntegration(_config(auto_registration=False), recorder=recorder)
+
+    event_id = await integration.on_selector_resolution_start("odds_table", "corr-2")
+    assert await integration.on_selector_resolution_complete(
+        event_id, "odds_table", success=True, confidence_score=0.8, correlation_id="corr-2")
+
+    assert recorder.get_buffer_status()["selector_rows"] == 1
+    [event], _ = await recorder.flush()
+    assert event.selector_name == "odds_table" and event.correlation_id == "corr-2"
+    assert event.get_confidence_score() == 0.8
+    assert event.get_resolution_time() >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_selector_integration_skips_rows_without_a_measurement():
+    recorder = TimingRecorder(_config())
+    integration = SelectorTelemetryIntegration(_config(auto_registration=False), recorder=recorder)
+
+    # No matching start: there is no timing, so no 0 ms row either
+    assert await integration.on_selector_resolution_complete(
+        "evt-unknown", "odds_table", success=True, correlation_id="corr-3")
+    assert recorder.get_buffer_status()["selector_rows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_direct_api_client_records_network_timings():
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404, content=b"nope")
+        return httpx.Response(200, content=b'{"ok": true}')
+
+    recorder = TimingRecorder(_config())
+    async with AsyncHttpClient(base_url="https://api.example.com", recorder=recorder) as client:
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await client.get("/odds").execute()
+        await client.get("/missing").execute()
+
+    _, rows = await recorder.flush()
+    assert [(r["method"], r["url"], r["status_code"]) for r in rows] == [
+        ("GET", "https://api.example.com/odds", 200),
+        ("GET", "https://api.example.com/missing", 404),
+    ]
+    assert rows[0]["response_bytes"] == len(b'{"ok": true}')
+    assert all(r["duration_ms"] >= 0.0 for r in rows)